@@ -3,18 +3,82 @@
 import base64
 import datetime
 import errno
+import hashlib
 from http import HTTPStatus
-from io import FileIO
+from io import FileIO, TextIOWrapper
 import os
 from pathlib import Path
+import re
 from shutil import copy, copy2
 import stat
+import struct
 import threading
 import time
 import traceback
+from typing import NamedTuple
 
 import orjson
-from tornado.websocket import WebSocketHandler
+from tornado.websocket import WebSocketClosedError, WebSocketHandler
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+
+# Size prefix of the JSON header of binary chunk messages
+CHUNK_HEADER = struct.Struct("!I")
+
+# Size of the blocks read to compute checksums
+CHECKSUM_BLOCK_SIZE = 1024 * 1024
+
+# Searched files with null bytes in their first bytes are considered binary
+BINARY_CHECK_SIZE = 8192
+
+# Searched files bigger than this are read line by line instead of at once,
+# so that big ones (e.g. datasets) are not loaded in memory
+SEARCH_READ_SIZE = 32 * 1024**2
+
+# Maximum number of characters read at once from the lines of big files
+SEARCH_LINE_READ_SIZE = 1024**2
+
+# Lines longer than this (e.g. in minified files) are cropped around their
+# matches, so that search messages have a bounded size
+MAX_MATCH_LINE_LENGTH = 10000
+
+# Changes in these directories are not reported by the watch handler
+IGNORED_WATCH_DIRS = {"__pycache__"}
+
+
+class FileChunk(NamedTuple):
+    """Chunk of a file read at a given offset."""
+
+    offset: int
+    data: bytes
+
+
+def pack_chunk(header: dict, data: bytes) -> bytes:
+    """Pack a chunk message with a JSON header and raw data."""
+    header = orjson.dumps(header)
+    return CHUNK_HEADER.pack(len(header)) + header + data
+
+
+def unpack_chunk(message: bytes) -> tuple[dict, bytes]:
+    """Unpack a chunk message packed by `pack_chunk`."""
+    (header_size,) = CHUNK_HEADER.unpack_from(message)
+    header_end = CHUNK_HEADER.size + header_size
+    return orjson.loads(message[CHUNK_HEADER.size:header_end]), message[header_end:]
+
+
+def file_checksum(file, size: int = -1) -> str:
+    """Get the SHA-256 checksum of the first `size` bytes of `file`."""
+    checksum = hashlib.sha256()
+    while size != 0:
+        block_size = CHECKSUM_BLOCK_SIZE if size < 0 else min(size, CHECKSUM_BLOCK_SIZE)
+        block = file.read(block_size)
+        if not block:
+            break
+        checksum.update(block)
+        if size > 0:
+            size -= len(block)
+    return checksum.hexdigest()
 
 
 class FileWebSocketHandler(WebSocketHandler):
@@ -35,6 +99,22 @@ class FileWebSocketHandler(WebSocketHandler):
         "error": {"message": "error message",  (required)
                   "traceback": ["line1", "line2", ...]  (optional)}  # if an error occurred  (optional)
       }
+
+    Files opened in binary mode can also be transferred in raw binary
+    chunks, to avoid encoding large amounts of data. Chunk messages are binary
+    frames with a JSON header, prefixed by its size as a 4 bytes big-endian
+    integer, followed by the data:
+
+      - "write_chunk" requests are sent as chunk messages, with "offset" and
+        "sha256" (checksum of the data) in their header. They're answered
+        with a regular JSON message.
+      - "read_chunk" requests are regular JSON messages with "offset" and
+        "size". They're answered with a chunk message with "status",
+        "offset" and "sha256" in its header, or with a regular JSON message
+        if an error occurred.
+
+    Messages are handled in the order they're received, so several requests
+    can be sent before reading their responses.
     """
 
     LOCK_TIMEOUT = 100  # seconds
@@ -97,8 +177,14 @@ async def on_message(self, raw_message):
     # Internal Helpers
     # ----------------------------------------------------------------
     async def handle_message(self, raw_message):
-        msg = self._decode_json(raw_message)
-        method, kwargs = await self._parse_message(msg)
+        if isinstance(raw_message, bytes):
+            # Binary frames are only used for chunk messages
+            kwargs, data = unpack_chunk(raw_message)
+            method = kwargs.pop("method", None)
+            kwargs["data"] = data
+        else:
+            msg = self._decode_json(raw_message)
+            method, kwargs = await self._parse_message(msg)
         await self._run_method(method, kwargs)
 
     async def _open_file(self):
@@ -212,7 +298,19 @@ async def _send_msg_error(self, message):
         )
 
     async def _send_result(self, result):
-        if result is None:
+        if isinstance(result, FileChunk):
+            await self.write_message(
+                pack_chunk(
+                    {
+                        "status": HTTPStatus.OK.value,
+                        "offset": result.offset,
+                        "sha256": hashlib.sha256(result.data).hexdigest(),
+                    },
+                    result.data,
+                ),
+                binary=True,
+            )
+        elif result is None:
             await self._send_json(HTTPStatus.NO_CONTENT)
         elif isinstance(result, list):
             await self._send_json(
@@ -245,6 +343,11 @@ def _load_path(self, path_str: str) -> Path:
         """Convert path string to a Path object."""
         return Path(path_str).expanduser()
 
+    def _check_binary_mode(self):
+        """Check that the file was opened in binary mode."""
+        if "b" not in self.mode:
+            raise ValueError("Chunks can only be transferred in binary mode")
+
     # ----------------------------------------------------------------
     # File Operation
     # ----------------------------------------------------------------
@@ -300,6 +403,543 @@ async def _handle_writable(self) -> bool:
         """Check if the file is writable."""
         return self.file.writable()
 
+    async def _handle_read_chunk(self, offset: int, size: int) -> FileChunk:
+        """Read a chunk of `size` bytes starting at `offset`."""
+        self._check_binary_mode()
+        self.file.seek(offset)
+        return FileChunk(offset, self.file.read(size))
+
+    async def _handle_write_chunk(
+        self, data: bytes, offset: int, sha256: str
+    ) -> int:
+        """Write a chunk at `offset`, checking that it wasn't corrupted."""
+        self._check_binary_mode()
+        if hashlib.sha256(data).hexdigest() != sha256:
+            raise ValueError(f"Corrupted chunk at offset {offset}")
+        self.file.seek(offset)
+        return self.file.write(data)
+
+    async def _handle_checksum(self, size: int = -1) -> str:
+        """Get the SHA-256 checksum of the first `size` bytes of the file."""
+        self._check_binary_mode()
+        position = self.file.tell()
+        self.file.seek(0)
+        try:
+            # Big files can take a while, so don't block the server
+            return await asyncio.get_running_loop().run_in_executor(
+                None, file_checksum, self.file, size
+            )
+        finally:
+            self.file.seek(position)
+
+
+def iter_search_files(root: Path, exclude: re.Pattern | None, stop_event):
+    """
+    Generate the files to search in `root`.
+
+    Hidden directories and the ones matched by `exclude` are skipped.
+    """
+    dirs = [root]
+    while dirs and not stop_event.is_set():
+        dirpath = dirs.pop()
+        try:
+            entries = sorted(os.scandir(dirpath), key=lambda entry: entry.name)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                is_file = not is_dir and entry.is_file()
+            except OSError:
+                continue
+
+            if is_dir:
+                if entry.name.startswith("."):
+                    continue
+                if exclude and exclude.search(entry.path + os.sep):
+                    continue
+                subdirs.append(entry.path)
+            elif is_file:
+                if exclude and exclude.search(entry.path):
+                    continue
+                yield entry.path
+
+        # Search subdirectories in the same order as os.walk
+        dirs.extend(reversed(subdirs))
+
+
+def search_file(filename: str, pattern: re.Pattern) -> list:
+    """
+    Search `pattern` in the lines of a text file.
+
+    Returns
+    -------
+    list
+        List of [lineno, start, end, line] lists, with one-based line
+        numbers. Binary files have no matches. Lines longer than
+        `MAX_MATCH_LINE_LENGTH` are cropped, with start and end relative
+        to the cropped line.
+    """
+    with open(filename, "rb") as f:
+        if b"\0" in f.read(BINARY_CHECK_SIZE):
+            return []
+
+        f.seek(0)
+        if os.fstat(f.fileno()).st_size > SEARCH_READ_SIZE:
+            text_file = TextIOWrapper(f, encoding="utf-8", errors="replace")
+            return search_lines(iter_file_lines(text_file), pattern)
+
+        text = f.read().decode("utf-8", errors="replace")
+
+    # Most files don't have matches, so it's faster to check that first
+    if pattern.search(text) is None:
+        return []
+
+    return search_lines(enumerate(text.splitlines(keepends=True), 1), pattern)
+
+
+def search_lines(lines, pattern: re.Pattern) -> list:
+    """Search `pattern` in the (lineno, line) pairs of `lines`."""
+    matches = []
+    for lineno, line in lines:
+        for match in pattern.finditer(line):
+            matches.append(
+                [lineno, *crop_match_line(line, match.start(), match.end())]
+            )
+    return matches
+
+
+def iter_file_lines(text_file):
+    """
+    Iterate the (lineno, line) pairs of a text file without loading it.
+
+    Lines longer than `SEARCH_LINE_READ_SIZE` are returned in several pieces
+    with the same line number, so matches across them are not found and the
+    positions of matches are relative to their piece, like for cropped lines.
+    """
+    lineno = 1
+    while True:
+        piece = text_file.readline(SEARCH_LINE_READ_SIZE)
+        if not piece:
+            break
+
+        for line in piece.splitlines(keepends=True):
+            yield lineno, line
+            if line.splitlines()[0] != line:
+                lineno += 1
+
+
+def crop_match_line(line: str, start: int, end: int) -> tuple:
+    """Crop `line` around the match between `start` and `end` if it's long."""
+    if len(line) <= MAX_MATCH_LINE_LENGTH:
+        return start, end, line
+
+    offset = max(0, start - MAX_MATCH_LINE_LENGTH // 2)
+    line = line[offset:offset + MAX_MATCH_LINE_LENGTH]
+    return start - offset, min(end - offset, len(line)), line
+
+
+class FileSearchWebSocketHandler(WebSocketHandler):
+    """
+    WebSocket handler for searching text in the files of a directory.
+
+    The search starts when the connection is opened, with the arguments of
+    the request:
+      - path: Directory where to search.
+      - text: Searched text.
+      - regexp: Whether text is a regular expression ("true" or "false").
+      - case_sensitive: Whether the search is case sensitive.
+      - exclude: Regular expression of the paths to exclude (optional).
+      - max_results: Maximum number of matches.
+
+    Files are scanned in a thread and their matches are streamed in batches
+    (JSON messages):
+      {
+        "status": 200,
+        "data": [[path, lineno, start, end, line], ...],
+      }
+
+    A last message is sent when the search finishes, after which the
+    connection is closed:
+      {"status": 200, "done": true, "errors": <number of unreadable files>}
+
+    The search is stopped if the client closes the connection.
+    """
+
+    # Maximum number of matches sent in a message
+    BATCH_SIZE = 256
+
+    # Maximum number of characters of the lines sent in a message
+    BATCH_MAX_LENGTH = 256 * 1024
+
+    # Maximum time (in seconds) matches are held before sending them
+    BATCH_INTERVAL = 0.2
+
+    async def open(self):
+        """Start the search."""
+        self._stop_event = threading.Event()
+        try:
+            root = Path(self.get_path_argument("path")).expanduser()
+            if not root.is_dir():
+                raise NotADirectoryError(
+                    errno.ENOTDIR, os.strerror(errno.ENOTDIR), str(root)
+                )
+
+            pattern = self._get_pattern()
+            exclude = self.get_argument("exclude", default="")
+            exclude = re.compile(exclude) if exclude else None
+            max_results = int(self.get_argument("max_results", default="1000"))
+        except OSError as e:
+            self.close(1002, self._parse_json(
+                HTTPStatus.EXPECTATION_FAILED,
+                strerror=e.strerror,
+                filename=e.filename,
+                errno=e.errno,
+            ))
+            return
+        except (re.error, ValueError) as e:
+            self.close(1002, self._parse_json(
+                HTTPStatus.BAD_REQUEST,
+                type=str(type(e)),
+                message=str(e),
+            ))
+            return
+
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        search = loop.run_in_executor(
+            None,
+            self._search,
+            root,
+            pattern,
+            exclude,
+            max_results,
+            lambda batch: loop.call_soon_threadsafe(queue.put_nowait, batch),
+        )
+        self._send_task = asyncio.ensure_future(
+            self._send_results(search, queue)
+        )
+
+    def on_close(self):
+        """Stop the search."""
+        self._stop_event.set()
+
+    def on_message(self, message):
+        """Messages from the client are not expected."""
+
+    def _get_pattern(self) -> re.Pattern:
+        text = self.get_argument("text")
+        if self.get_argument("regexp", default="false") != "true":
+            text = re.escape(text)
+
+        flags = re.MULTILINE
+        if self.get_argument("case_sensitive", default="true") != "true":
+            flags |= re.IGNORECASE
+        return re.compile(text, flags)
+
+    def _parse_json(self, status: HTTPStatus, **data) -> bytes:
+        return orjson.dumps({"status": status.value, **data})
+
+    def _search(self, root, pattern, exclude, max_results, send_batch):
+        """Scan the files in `root`, sending their matches in batches."""
+        batch = []
+        batch_length = 0
+        num_matches = 0
+        errors = 0
+        last_sent = time.monotonic()
+        for filename in iter_search_files(root, exclude, self._stop_event):
+            # Errors in a file (e.g. it can't be read or it's too big for the
+            # available memory) must not stop the search
+            try:
+                matches = search_file(filename, pattern)
+            except Exception:
+                errors += 1
+                continue
+
+            for match in matches[:max_results - num_matches]:
+                batch.append([filename, *match])
+                batch_length += len(match[-1])
+
+                # Files can have a lot of matches, so batches are limited
+                # while adding them
+                if (
+                    len(batch) >= self.BATCH_SIZE
+                    or batch_length >= self.BATCH_MAX_LENGTH
+                ):
+                    send_batch(batch)
+                    batch = []
+                    batch_length = 0
+                    last_sent = time.monotonic()
+            num_matches += len(matches)
+
+            if batch and (
+                time.monotonic() - last_sent > self.BATCH_INTERVAL
+                or num_matches >= max_results
+            ):
+                send_batch(batch)
+                batch = []
+                batch_length = 0
+                last_sent = time.monotonic()
+
+            if num_matches >= max_results:
+                break
+
+        if batch:
+            send_batch(batch)
+        return errors
+
+    async def _send_results(self, search, queue):
+        """Send the batches of matches as they're found."""
+        try:
+            while not (search.done() and queue.empty()):
+                get_batch = asyncio.ensure_future(queue.get())
+                await asyncio.wait(
+                    [get_batch, search], return_when=asyncio.FIRST_COMPLETED
+                )
+                if not get_batch.done():
+                    get_batch.cancel()
+                    continue
+
+                await self.write_message(
+                    self._parse_json(HTTPStatus.OK, data=get_batch.result()),
+                    binary=True,
+                )
+
+            errors = search.result()
+            await self.write_message(
+                self._parse_json(HTTPStatus.OK, done=True, errors=errors),
+                binary=True,
+            )
+        except WebSocketClosedError:
+            self._stop_event.set()
+            return
+        except Exception as e:
+            self.log.exception("Error searching files")
+            self.close(1011, str(e))
+            return
+
+        self.close(1000)
+
+
+def coalesce_events(events: list) -> list:
+    """
+    Collapse a sequence of filesystem events to the changes they produce.
+
+    Events and changes are [event_type, src_path, dest_path, is_dir] lists.
+    There is at most one creation, deletion or modification per path. For
+    instance, a file that was created and modified is reported as created,
+    and a file that was created and deleted is not reported.
+    """
+    # Moves are keyed by their position instead of a path
+    changes = {}
+    for i, (event_type, src_path, dest_path, is_dir) in enumerate(events):
+        key = (src_path, is_dir)
+        previous = changes.get(key, (None,))[0]
+
+        if event_type == "created":
+            if previous == "deleted":
+                # The file was replaced
+                del changes[key]
+                event_type = "modified"
+            elif previous is not None:
+                continue
+        elif event_type == "modified":
+            if previous is not None:
+                continue
+        elif event_type == "deleted":
+            if previous == "created":
+                del changes[key]
+                continue
+            changes.pop(key, None)
+        elif event_type == "moved":
+            if previous == "created":
+                # Files saved through a temporary one are reported as created
+                # in their final location.
+                del changes[key]
+                dest_key = (dest_path, is_dir)
+                dest_previous = changes.pop(dest_key, (None,))[0]
+                event_type = (
+                    "modified" if dest_previous == "deleted" else "created"
+                )
+                changes[dest_key] = [event_type, dest_path, None, is_dir]
+            else:
+                changes.pop(key, None)
+                changes[i] = [event_type, src_path, dest_path, is_dir]
+            continue
+
+        changes[key] = [event_type, src_path, None, is_dir]
+
+    return list(changes.values())
+
+
+class _WatchEventHandler(FileSystemEventHandler):
+    """Pass the events of a watchdog observer to a callback."""
+
+    def __init__(self, root: Path, add_event):
+        super().__init__()
+        self._root = root
+        self._add_event = add_event
+
+    def _is_ignored(self, path: str) -> bool:
+        try:
+            parts = Path(path).relative_to(self._root).parts
+        except ValueError:
+            return False
+        return any(
+            part.startswith(".") or part in IGNORED_WATCH_DIRS
+            for part in parts
+        )
+
+    def on_any_event(self, event):
+        event_type = event.event_type
+        src_path = os.fsdecode(event.src_path)
+        dest_path = getattr(event, "dest_path", None)
+        dest_path = os.fsdecode(dest_path) if dest_path else None
+        is_dir = event.is_directory
+
+        if event_type not in ("created", "deleted", "modified", "moved"):
+            return
+
+        # Directories are reported as modified when their contents change,
+        # which is already notified by the events of their files.
+        if event_type == "modified" and is_dir:
+            return
+
+        # Moves from or to ignored directories are seen as creations or
+        # deletions, respectively.
+        if event_type == "moved":
+            if self._is_ignored(src_path):
+                event_type, src_path, dest_path = "created", dest_path, None
+            elif self._is_ignored(dest_path):
+                event_type, dest_path = "deleted", None
+
+        if not self._is_ignored(src_path):
+            self._add_event([event_type, src_path, dest_path, is_dir])
+
+
+class FileWatchWebSocketHandler(WebSocketHandler):
+    """
+    WebSocket handler for watching the changes in a directory.
+
+    The directory is watched while the connection is open, with the
+    arguments of the request:
+      - path: Watched directory.
+      - recursive: Whether to watch its subdirectories too ("true" or
+        "false").
+
+    Changes are collected for a short time, coalesced and sent in batches
+    (JSON messages):
+      {
+        "status": 200,
+        "data": [[event_type, src_path, dest_path, is_dir], ...],
+      }
+
+    where event_type is "created", "deleted", "modified" or "moved", and
+    dest_path is only set for moves. Changes in hidden directories and in
+    the ones in IGNORED_WATCH_DIRS are not reported.
+    """
+
+    # Time (in seconds) changes are collected before sending them
+    BATCH_INTERVAL = 0.2
+
+    # Maximum number of changes sent in a single message, so that messages stay
+    # well below the size limit of clients even for very long paths
+    BATCH_MAX_CHANGES = 256
+
+    async def open(self):
+        """Start watching the directory."""
+        self._events = []
+        self._lock = threading.Lock()
+        self._observer = None
+        self._send_task = None
+        try:
+            root = Path(self.get_path_argument("path")).expanduser()
+            if not root.is_dir():
+                raise NotADirectoryError(
+                    errno.ENOTDIR, os.strerror(errno.ENOTDIR), str(root)
+                )
+
+            recursive = self.get_argument("recursive", default="true")
+            loop = asyncio.get_running_loop()
+            events_available = asyncio.Event()
+
+            def add_event(event):
+                with self._lock:
+                    notify = not self._events
+                    self._events.append(event)
+                if notify:
+                    loop.call_soon_threadsafe(events_available.set)
+
+            self._observer = Observer()
+            self._observer.schedule(
+                _WatchEventHandler(root, add_event),
+                str(root),
+                recursive=recursive == "true",
+            )
+            self._observer.start()
+        except OSError as e:
+            # This happens too when the limit of watched directories of the
+            # system is reached.
+            self._stop_observer()
+            self.close(1002, self._parse_json(
+                HTTPStatus.EXPECTATION_FAILED,
+                strerror=e.strerror,
+                filename=e.filename,
+                errno=e.errno,
+            ))
+            return
+
+        self._send_task = asyncio.ensure_future(
+            self._send_changes(events_available)
+        )
+
+    def on_close(self):
+        """Stop watching the directory."""
+        self._stop_observer()
+        if self._send_task is not None:
+            self._send_task.cancel()
+            self._send_task = None
+
+    def on_message(self, message):
+        """Messages from the client are not expected."""
+
+    def _parse_json(self, status: HTTPStatus, **data) -> bytes:
+        return orjson.dumps({"status": status.value, **data})
+
+    def _stop_observer(self):
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+
+    async def _send_changes(self, events_available):
+        """Send the changes in batches as they happen."""
+        try:
+            while True:
+                await events_available.wait()
+                await asyncio.sleep(self.BATCH_INTERVAL)
+                with self._lock:
+                    events = self._events
+                    self._events = []
+                    events_available.clear()
+
+                changes = coalesce_events(events)
+                for i in range(0, len(changes), self.BATCH_MAX_CHANGES):
+                    await self.write_message(
+                        self._parse_json(
+                            HTTPStatus.OK,
+                            data=changes[i:i + self.BATCH_MAX_CHANGES],
+                        ),
+                        binary=True,
+                    )
+        except WebSocketClosedError:
+            self._stop_observer()
+        except Exception as e:
+            self.log.exception("Error watching files")
+            self._stop_observer()
+            self.close(1011, str(e))
+
 
 class FilesRESTMixin:
     """
@@ -311,6 +951,10 @@ class FilesRESTMixin:
         - fs_exists(path_str)
         - fs_isfile(path_str)
         - fs_isdir(path_str)
+        - fs_info_batch(path_strs)
+        - fs_exists_batch(path_strs)
+        - fs_isfile_batch(path_strs)
+        - fs_isdir_batch(path_strs)
         - fs_mkdir(path_str, create_parents=True, exist_ok=False)
         - fs_rmdir(path_str)
         - fs_rm_file(path_str, missing_ok=False)
@@ -391,6 +1035,41 @@ def fs_isdir(self, path_str: str) -> bool:
         path = self._load_path(path_str)
         return path.is_dir()
 
+    def fs_info_batch(self, path_strs: list[str]) -> list[dict]:
+        """
+        Get info about several paths at once.
+
+        Each result has the same form as the responses of fs_info: a
+        "status" of 200 with the info in "data" or, if the path couldn't be
+        accessed, a "status" of 417 with the details of the OSError.
+        """
+        results = []
+        for path_str in path_strs:
+            try:
+                info = self.fs_info(path_str)
+            except OSError as e:
+                results.append({
+                    "status": HTTPStatus.EXPECTATION_FAILED.value,
+                    "strerror": e.strerror,
+                    "errno": e.errno,
+                    "filename": e.filename,
+                })
+            else:
+                results.append({"status": HTTPStatus.OK.value, "data": info})
+        return results
+
+    def fs_exists_batch(self, path_strs: list[str]) -> list[bool]:
+        """Like fs_exists() for several paths at once."""
+        return [self.fs_exists(path_str) for path_str in path_strs]
+
+    def fs_isfile_batch(self, path_strs: list[str]) -> list[bool]:
+        """Like fs_isfile() for several paths at once."""
+        return [self.fs_isfile(path_str) for path_str in path_strs]
+
+    def fs_isdir_batch(self, path_strs: list[str]) -> list[bool]:
+        """Like fs_isdir() for several paths at once."""
+        return [self.fs_isdir(path_str) for path_str in path_strs]
+
     def fs_mkdir(self, path_str: str, create_parents: bool = True, exist_ok: bool = False):
         """Like fsspec.mkdir()."""
         path = self._load_path(path_str)
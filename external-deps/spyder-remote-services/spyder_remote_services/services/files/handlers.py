@@ -14,6 +14,8 @@
 
 from spyder_remote_services.services.files.base import (
     FilesRESTMixin,
+    FileSearchWebSocketHandler,
+    FileWatchWebSocketHandler,
     FileWebSocketHandler,
 )
 
@@ -60,6 +62,36 @@ async def get(self, *args, **kwargs):
         await super().get(*args, **kwargs)
 
 
+class SearchWebsocketHandler(
+    WebSocketMixin,
+    FileSearchWebSocketHandler,
+    JupyterHandler,
+):
+    auth_resource = "spyder-services"
+
+    get_path_argument = ReadWriteWebsocketHandler.get_path_argument
+
+    @ws_authenticated
+    async def get(self, *args, **kwargs):
+        """Handle the initial websocket upgrade GET request."""
+        await super().get(*args, **kwargs)
+
+
+class WatchWebsocketHandler(
+    WebSocketMixin,
+    FileWatchWebSocketHandler,
+    JupyterHandler,
+):
+    auth_resource = "spyder-services"
+
+    get_path_argument = ReadWriteWebsocketHandler.get_path_argument
+
+    @ws_authenticated
+    async def get(self, *args, **kwargs):
+        """Handle the initial websocket upgrade GET request."""
+        await super().get(*args, **kwargs)
+
+
 class BaseFSHandler(FilesRESTMixin, JupyterHandler):
     auth_resource = "spyder-services"
 
@@ -92,6 +124,44 @@ def get_path_argument(self, name: str) -> str:
             )
         return match.group("path")
 
+    def get_path_list_argument(self, name: str) -> list[str]:
+        """Get a list of path arguments from the JSON body of the request.
+
+        Args
+        ----
+            name (str): Name of the list in the body.
+
+        Returns
+        -------
+            list[str]: The path arguments.
+
+        Raises
+        ------
+            HTTPError: If the list is missing or any path is invalid.
+        """
+        try:
+            paths = orjson.loads(self.request.body)[name]
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            raise web.HTTPError(
+                HTTPStatus.BAD_REQUEST,
+                reason=f"Missing {name} argument",
+            )
+        if not isinstance(paths, list):
+            raise web.HTTPError(
+                HTTPStatus.BAD_REQUEST,
+                reason=f"Invalid {name} argument",
+            )
+        result = []
+        for path in paths:
+            match = isinstance(path, str) and re.match(_path_regex, path)
+            if not match:
+                raise web.HTTPError(
+                    HTTPStatus.BAD_REQUEST,
+                    reason=f"Invalid {name} argument",
+                )
+            result.append(match.group("path"))
+        return result
+
     def write_json(self, data, status=200):
         self.set_status(status)
         self.set_header("Content-Type", "application/json")
@@ -172,6 +242,12 @@ def get(self):
         result = self.fs_info(self.get_path_argument("path"))
         self.write_json(result)
 
+    @web.authenticated
+    @authorized
+    def post(self):
+        result = self.fs_info_batch(self.get_path_list_argument("paths"))
+        self.write_json({"data": result})
+
 
 class ExistsHandler(BaseFSHandler):
     @web.authenticated
@@ -180,6 +256,12 @@ def get(self):
         result = self.fs_exists(self.get_path_argument("path"))
         self.write_json({"exists": result})
 
+    @web.authenticated
+    @authorized
+    def post(self):
+        result = self.fs_exists_batch(self.get_path_list_argument("paths"))
+        self.write_json({"exists": result})
+
 
 class IsFileHandler(BaseFSHandler):
     @web.authenticated
@@ -188,6 +270,12 @@ def get(self):
         result = self.fs_isfile(self.get_path_argument("path"))
         self.write_json({"isfile": result})
 
+    @web.authenticated
+    @authorized
+    def post(self):
+        result = self.fs_isfile_batch(self.get_path_list_argument("paths"))
+        self.write_json({"isfile": result})
+
 
 class IsDirHandler(BaseFSHandler):
     @web.authenticated
@@ -196,6 +284,12 @@ def get(self):
         result = self.fs_isdir(self.get_path_argument("path"))
         self.write_json({"isdir": result})
 
+    @web.authenticated
+    @authorized
+    def post(self):
+        result = self.fs_isdir_batch(self.get_path_list_argument("paths"))
+        self.write_json({"isdir": result})
+
 
 class MkdirHandler(BaseFSHandler):
     @web.authenticated
@@ -251,11 +345,13 @@ def post(self):
 
 handlers = [
     (r"/fs/open", ReadWriteWebsocketHandler),  # WebSocket
+    (r"/fs/search", SearchWebsocketHandler),   # WebSocket
+    (r"/fs/watch", WatchWebsocketHandler),     # WebSocket
     (r"/fs/ls", LsHandler),                  # GET
-    (r"/fs/info", InfoHandler),              # GET
-    (r"/fs/exists", ExistsHandler),          # GET
-    (r"/fs/isfile", IsFileHandler),          # GET
-    (r"/fs/isdir", IsDirHandler),            # GET
+    (r"/fs/info", InfoHandler),              # GET, POST (batch)
+    (r"/fs/exists", ExistsHandler),          # GET, POST (batch)
+    (r"/fs/isfile", IsFileHandler),          # GET, POST (batch)
+    (r"/fs/isdir", IsDirHandler),            # GET, POST (batch)
     (r"/fs/mkdir", MkdirHandler),            # POST
     (r"/fs/rmdir", RmdirHandler),            # DELETE
     (r"/fs/file", RemoveFileHandler),        # DELETE
@@ -2681,14 +2681,8 @@ def example_def_2():
 
 @flaky(max_runs=3)
 @pytest.mark.skipif(running_in_ci(), reason="Can't run on CI")
-def test_switcher_projects_integration(main_window, pytestconfig, qtbot,
-                                       tmp_path):
+def test_switcher_projects_integration(main_window, qtbot, tmp_path):
     """Test integration between the Switcher and Projects plugins."""
-    # Disable pytest stdin capture to make calls to fzf work. Idea taken from:
-    # https://github.com/pytest-dev/pytest/issues/2189#issuecomment-449512764
-    capmanager = pytestconfig.pluginmanager.getplugin('capturemanager')
-    capmanager.suspend_global_capture(in_=True)
-
     # Wait until the console is fully up
     shell = main_window.ipyconsole.get_current_shellwidget()
     qtbot.waitUntil(
@@ -2721,9 +2715,9 @@ def test_switcher_projects_integration(main_window, pytestconfig, qtbot,
     with qtbot.waitSignal(projects.sig_project_loaded):
         projects.create_project(str(project_dir))
 
-    # Check that the switcher has been populated in Projects
+    # Check that the project files have been indexed
     qtbot.waitUntil(
-        lambda: projects.get_widget()._default_switcher_paths != [],
+        lambda: projects.get_widget().file_index.ready,
         timeout=1000
     )
 
@@ -2784,21 +2778,14 @@ def test_switcher_projects_integration(main_window, pytestconfig, qtbot,
     assert switcher.count() == n_files_open + n_files_project - 1
     switcher.on_close()
 
-    # Check the switcher works without fzf
-    fzf = projects.get_widget()._fzf
-    projects.get_widget()._fzf = None
-    projects.get_widget()._default_switcher_paths = []
-
+    # Check that files created in the project are found
+    (project_dir / 'test_new_file.py').touch()
+    qtbot.wait(1000)
     switcher.open_switcher()
-    switcher.set_search_text('0')
+    switcher.set_search_text('new_file')
     qtbot.waitUntil(lambda: switcher.count() == 1)
     switcher.on_close()
 
-    projects.get_widget()._fzf = fzf
-
-    # Resume capturing
-    capmanager.resume_global_capture()
-
 
 @flaky(max_runs=3)
 @pytest.mark.skipif(sys.platform == 'darwin',
@@ -5419,17 +5406,22 @@ def test_goto_find(main_window, qtbot, tmpdir):
     with qtbot.waitSignal(findinfiles.sig_finished, timeout=SHELL_TIMEOUT):
         findinfiles.find()
 
-    results = findinfiles.result_browser.data
-    assert len(results) == 5
-    assert len(findinfiles.result_browser.files) == 1
+    result_browser = findinfiles.result_browser
+    assert result_browser.num_matches == 5
+    assert len(result_browser.get_matches()) == 5
+    assert len(result_browser.files) == 1
+
+    file_results = list(result_browser.files.values())[0]
+    assert len(file_results) == 5
 
-    file_item = list(findinfiles.result_browser.files.values())[0]
-    assert file_item.childCount() == 5
+    results_model = result_browser.results_model
+    file_index = results_model.index(file_results.row, 0)
+    assert results_model.rowCount(file_index) == 5
 
     for i in range(5):
-        item = file_item.child(i)
-        findinfiles.result_browser.setCurrentItem(item)
-        findinfiles.result_browser.on_item_activated(item)
+        index = results_model.index(i, 0, file_index)
+        result_browser.setCurrentIndex(index)
+        result_browser.on_item_activated(index)
         cursor = code_editor.textCursor()
         position = (cursor.selectionStart(), cursor.selectionEnd())
         assert position == match_positions[i]
@@ -27,6 +27,7 @@
     'port': 2087,
     'external': False,
     'stdio': False,
+    'workers': 1,
     'configurations': {
         'pylsp': {
             'configurationSources': [
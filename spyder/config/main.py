@@ -260,6 +260,7 @@
               'automatic_completions_after_chars': 1,
               'completions_hint': True,
               'completions_hint_after_ms': 500,
+              'completions_prefetch': False,
               'underline_errors': False,
               'highlight_current_line': True,
               'highlight_current_cell': True,
@@ -345,6 +346,7 @@
               'type_column': False,
               'date_column': False,
               'search_files_in_switcher': True,
+              'search_symbols_in_switcher': True,
               }),
             ('explorer',
              {
@@ -371,7 +373,11 @@
               'more_options': False,
               'case_sensitive': False,
               'exclude_case_sensitive': False,
-              'max_results': 1000,
+              'max_results': 10000,
+              'project_index': False,
+              'use_ignore_files': True,
+              'replace_mode': False,
+              'replace_text': [''],
               }),
             ('completions',
              {
@@ -635,6 +641,7 @@
         ('find_in_files', [
             'path_history'
             'search_text',
+            'replace_text',
             'exclude_index',
             'search_in_index',
             ]
@@ -702,4 +709,4 @@
 #    or if you want to *rename* options, then you need to do a MAJOR update in
 #    version, e.g. from 3.0.0 to 4.0.0
 # 3. You don't need to touch this value if you're just adding a new option
-CONF_VERSION = '87.2.0'
+CONF_VERSION = '87.3.0'
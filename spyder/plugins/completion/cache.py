@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Response cache for position-based completion requests.
+
+Hover, signature help and go to definition requests only depend on the
+document contents and the cursor position. This module provides a bounded
+LRU cache for their responses, keyed by the document version reported by the
+editor, so that repeated requests for the same position (e.g. mouse hover
+jitter or repeated Ctrl+click) don't need to reach the providers again.
+"""
+
+# Standard library imports
+from collections import OrderedDict
+import copy
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+class CompletionResponseCache:
+    """
+    Bounded LRU cache of completion responses.
+
+    Entries are keyed by request type, file name, document version and
+    position. Entries for a file are dropped as soon as a newer version of it
+    is registered, and entries of cross-file request types (e.g. go to
+    definition) are dropped for all files when any file is saved.
+    """
+
+    def __init__(self, cacheable_types, cross_file_types=None, maxsize=256):
+        """
+        Parameters
+        ----------
+        cacheable_types: set of str
+            Request types whose responses can be cached.
+        cross_file_types: set of str, optional
+            Request types whose responses can depend on other files and need
+            to be invalidated when any file is saved.
+        maxsize: int, optional
+            Maximum number of responses kept in the cache.
+        """
+        self.cacheable_types = set(cacheable_types)
+        self.cross_file_types = set(cross_file_types or [])
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._versions = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    # ---- Public API
+    # -------------------------------------------------------------------------
+    def get_key(self, req_type, req):
+        """
+        Return the cache key for request `req`, or None if it can't be cached.
+        """
+        if req_type not in self.cacheable_types:
+            return None
+
+        filename = req.get('file')
+        version = self._versions.get(filename)
+        if filename is None or version is None:
+            # We don't know which version of the file the server has, so we
+            # can't trust cached responses.
+            return None
+
+        return (
+            req_type,
+            filename,
+            version,
+            req.get('line'),
+            req.get('column'),
+        )
+
+    def get(self, key):
+        """Return a copy of the response stored for `key` or None."""
+        if key is None or key not in self._entries:
+            return None
+
+        self._entries.move_to_end(key)
+        return copy.deepcopy(self._entries[key])
+
+    def put(self, key, response):
+        """Store `response` for `key`, evicting old entries if needed."""
+        if key is None:
+            return
+
+        __, filename, version, *__ = key
+        if self._versions.get(filename) != version:
+            # The file changed while the request was in flight.
+            return
+
+        self._entries[key] = copy.deepcopy(response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def update_version(self, filename, version):
+        """Register a new version of `filename` and drop its old entries."""
+        if filename is None:
+            return
+
+        if self._versions.get(filename) != version:
+            self._versions[filename] = version
+            self.invalidate_file(filename)
+
+    def invalidate_file(self, filename):
+        """Drop all entries computed for `filename`."""
+        for key in [k for k in self._entries if k[1] == filename]:
+            del self._entries[key]
+
+    def invalidate_cross_file(self):
+        """Drop entries of request types that can depend on other files."""
+        for key in [k for k in self._entries
+                    if k[0] in self.cross_file_types]:
+            del self._entries[key]
+
+    def forget_file(self, filename):
+        """Stop tracking `filename`, e.g. after it was closed."""
+        self._versions.pop(filename, None)
+        self.invalidate_file(filename)
+
+    def clear(self):
+        """Drop all entries and known file versions."""
+        logger.debug("Clearing completion response cache")
+        self._entries.clear()
+        self._versions.clear()
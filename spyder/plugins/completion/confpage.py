@@ -47,6 +47,13 @@ def setup_page(self):
             _("Show completions on the fly"),
             'automatic_completions',
             section='editor')
+        completions_prefetch_box = newcb(
+            _("Request completions in advance after trigger characters"),
+            'completions_prefetch',
+            tip=_("Request completions as soon as <tt>.</tt>, <tt>(</tt> "
+                  "or <tt>import</tt> are typed and filter them while "
+                  "typing instead of requesting them again"),
+            section='editor')
         completions_after_characters = self.create_spinbox(
             _("Show automatic completions after characters entered:"), None,
             'automatic_completions_after_chars', min_=1, step=1,
@@ -69,6 +76,7 @@ def setup_page(self):
             completions_after_characters.spinbox, 3, 1)
         completions_layout.addWidget(
             completions_after_characters.help_label, 3, 2)
+        completions_layout.addWidget(completions_prefetch_box, 4, 0)
         completions_layout.addWidget(completions_hint_after_idle.plabel, 5, 0)
         completions_layout.addWidget(completions_hint_after_idle.spinbox, 5, 1)
         completions_layout.addWidget(
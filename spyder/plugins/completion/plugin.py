@@ -32,6 +32,7 @@
 from spyder.plugins.completion.api import (CompletionRequestTypes,
                                            SpyderCompletionProvider,
                                            COMPLETION_ENTRYPOINT)
+from spyder.plugins.completion.cache import CompletionResponseCache
 from spyder.plugins.completion.confpage import CompletionConfigPage
 from spyder.plugins.completion.container import CompletionContainer
 
@@ -197,6 +198,23 @@ class CompletionPlugin(SpyderPluginV2):
         CompletionRequestTypes.DOCUMENT_COMPLETION
     }
 
+    # Requests whose responses only depend on the document version and
+    # position, so they can be served from the response cache.
+    CACHED_RESPONSES = {
+        CompletionRequestTypes.DOCUMENT_HOVER,
+        CompletionRequestTypes.DOCUMENT_SIGNATURE,
+        CompletionRequestTypes.DOCUMENT_DEFINITION,
+    }
+
+    # Cached responses that can point to other files and need to be dropped
+    # when any file is saved.
+    CROSS_FILE_RESPONSES = {
+        CompletionRequestTypes.DOCUMENT_DEFINITION
+    }
+
+    # Maximum number of responses kept in the response cache
+    RESPONSE_CACHE_SIZE = 256
+
     def __init__(self, parent, configuration=None):
         super().__init__(parent, configuration)
 
@@ -220,6 +238,18 @@ def __init__(self, parent, configuration=None):
         # Lock to prevent concurrent access to requests mapping
         self.collection_mutex = QRecursiveMutex()
 
+        # Cache of responses for position-based requests
+        self.response_cache = CompletionResponseCache(
+            self.CACHED_RESPONSES,
+            cross_file_types=self.CROSS_FILE_RESPONSES,
+            maxsize=self.RESPONSE_CACHE_SIZE
+        )
+
+        # Cached responses are not valid anymore if the environment in which
+        # they were computed changes.
+        self.sig_pythonpath_changed.connect(self._clear_response_cache)
+        self._sig_interpreter_changed.connect(self._clear_response_cache)
+
         # Completion request priority
         self.source_priority = {}
 
@@ -922,6 +952,7 @@ def start_provider_instance(self, provider_name: str):
         """Start a given provider."""
         provider_info = self.providers[provider_name]
         if provider_info['status'] == self.STOPPED:
+            self.response_cache.clear()
             provider_instance = provider_info['instance']
             provider_instance.start()
             for language in self.language_status:
@@ -936,6 +967,7 @@ def shutdown_provider_instance(self, provider_name: str):
         """Shutdown a given provider."""
         provider_info = self.providers[provider_name]
         if provider_info['status'] == self.RUNNING:
+            self.response_cache.clear()
             provider_info['instance'].shutdown()
             provider_info['status'] = self.STOPPED
             for language in self.language_status:
@@ -1005,6 +1037,23 @@ def send_request(self, language: str, req_type: str, req: dict):
                 **kwargs: request-specific parameters
             }
         """
+        self._update_response_cache(req_type, req)
+        cache_key = self.response_cache.get_key(req_type, req)
+        cached_response = self.response_cache.get(cache_key)
+        if cached_response is not None:
+            logger.debug(
+                "Completion plugin: Serving {0} from cache".format(req_type)
+            )
+            try:
+                req['response_instance'].handle_response(
+                    req_type, cached_response
+                )
+            except RuntimeError:
+                # This is triggered when a codeeditor instance has been
+                # removed before the response can be processed.
+                pass
+            return
+
         req_id = self.req_id
         self.req_id += 1
 
@@ -1014,6 +1063,7 @@ def send_request(self, language: str, req_type: str, req: dict):
             'response_instance': weakref.ref(req['response_instance']),
             'sources': {},
             'timed_out': False,
+            'cache_key': cache_key,
         }
 
         # Check if there are two or more slow completion providers
@@ -1264,6 +1314,9 @@ def gather_and_reply(self, request_responses: dict):
             responses = self.gather_completions(req_id_responses)
         else:
             responses = self.gather_responses(req_type, req_id_responses)
+            self.response_cache.put(
+                request_responses.get('cache_key'), responses
+            )
 
         try:
             if response_instance:
@@ -1273,6 +1326,21 @@ def gather_and_reply(self, request_responses: dict):
             # removed before the response can be processed.
             pass
 
+    def _clear_response_cache(self, *args):
+        """Drop all cached responses."""
+        self.response_cache.clear()
+
+    def _update_response_cache(self, req_type: str, req: dict):
+        """Invalidate cached responses according to document events."""
+        filename = req.get('file')
+        if req_type in {CompletionRequestTypes.DOCUMENT_DID_OPEN,
+                        CompletionRequestTypes.DOCUMENT_DID_CHANGE}:
+            self.response_cache.update_version(filename, req.get('version'))
+        elif req_type == CompletionRequestTypes.DOCUMENT_DID_SAVE:
+            self.response_cache.invalidate_cross_file()
+        elif req_type == CompletionRequestTypes.DOCUMENT_DID_CLOSE:
+            self.response_cache.forget_file(filename)
+
     def gather_completions(self, req_id_responses: dict):
         """Gather completion responses from providers."""
         priorities = self.source_priority[
@@ -1283,6 +1351,10 @@ def gather_completions(self, req_id_responses: dict):
         merge_stats = {source: 0 for source in req_id_responses}
         responses = []
         dedupe_set = set()
+        is_incomplete = any(
+            response.get('isIncomplete', False)
+            for response in req_id_responses.values()
+        )
         for priority, source in enumerate(priorities):
             if source not in req_id_responses:
                 continue
@@ -1297,7 +1369,7 @@ def gather_completions(self, req_id_responses: dict):
                 merge_stats[source] += 1
 
         logger.debug('Responses statistics: {0}'.format(merge_stats))
-        responses = {'params': responses}
+        responses = {'params': responses, 'isIncomplete': is_incomplete}
         return responses
 
     def gather_responses(self, req_type: int, responses: dict):
@@ -27,11 +27,15 @@
 from spyder.plugins.completion.api import CompletionItemKind
 from spyder.plugins.completion.api import CompletionRequestTypes
 from spyder.plugins.completion.providers.fallback.utils import (
-    get_keywords, get_words, is_prefix_valid)
+    get_import_prefix, get_keywords, get_words, is_prefix_valid)
+from spyder.utils.introspection.module_completion import ModuleIndex
 
 
 FALLBACK_COMPLETION = "Fallback"
 
+# Message sent to the actor when the module index was updated on disk
+MODULE_INDEX_UPDATED = 'spyder/moduleIndexUpdated'
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,6 +51,7 @@ def __init__(self, parent):
         self.daemon = True
         self.mutex = QMutex()
         self.file_tokens = {}
+        self.module_index = None
         self.diff_patch = diff_match_patch()
         self.thread = QThread(None)
         self.moveToThread(self.thread)
@@ -54,11 +59,37 @@ def __init__(self, parent):
         self.thread.started.connect(self.started)
         self.sig_mailbox.connect(self.handle_msg)
 
+    def get_module_completions(self, prefix, offset):
+        """Return the modules in the module index that start with `prefix`."""
+        # Only the last component of the module name is replaced
+        partial = prefix.rsplit('.', 1)[-1]
+        text_edit_range = {'start': offset - len(partial), 'end': offset}
+
+        modules = []
+        for module in self.module_index.get_modules(prefix):
+            name = module.rsplit('.', 1)[-1]
+            modules.append({
+                'kind': CompletionItemKind.MODULE,
+                'insertText': name,
+                'label': name,
+                'sortText': name,
+                'filterText': name,
+                'textEdit': {'newText': name, 'range': text_edit_range},
+                'documentation': '',
+                'provider': FALLBACK_COMPLETION,
+            })
+        return modules
+
     def tokenize(self, text, offset, language, current_word):
         """
         Return all tokens in `text` and all keywords associated by
         Pygments to `language`.
         """
+        if language.lower() == 'python' and self.module_index is not None:
+            prefix = get_import_prefix(text, offset)
+            if prefix is not None:
+                return self.get_module_completions(prefix, offset)
+
         valid = is_prefix_valid(text, offset, language)
         if not valid:
             return []
@@ -144,6 +175,10 @@ def handle_msg(self, message):
             self.file_tokens[file]['text'] = text
         elif msg_type == CompletionRequestTypes.DOCUMENT_DID_CLOSE:
             self.file_tokens.pop(file, {})
+        elif msg_type == MODULE_INDEX_UPDATED:
+            module_index = ModuleIndex(msg['interpreter'])
+            if module_index.load():
+                self.module_index = module_index
         elif msg_type == CompletionRequestTypes.DOCUMENT_COMPLETION:
             tokens = []
             if file in self.file_tokens:
@@ -12,11 +12,18 @@
 
 # Standard library imports
 import logging
+import os
+import os.path as osp
+import sys
 
 # Local imports
-from spyder.config.base import _
+from spyder.config.base import _, get_module_path
 from spyder.plugins.completion.api import SpyderCompletionProvider
-from spyder.plugins.completion.providers.fallback.actor import FallbackActor
+from spyder.plugins.completion.providers.fallback.actor import (
+    FallbackActor, MODULE_INDEX_UPDATED)
+from spyder.utils.introspection.module_completion import (
+    get_module_index_command)
+from spyder.utils.workers import WorkerManager
 
 
 logger = logging.getLogger(__name__)
@@ -38,6 +45,12 @@ def __init__(self, parent, config):
         self.started = False
         self.requests = {}
 
+        # Module index used for import completions. It's updated in a
+        # separate process because that requires scanning all directories
+        # in sys.path.
+        self._interpreter = sys.executable
+        self._worker_manager = WorkerManager(self)
+
     def get_name(self):
         return _('Fallback')
 
@@ -48,12 +61,62 @@ def start(self):
         if not self.started:
             self.fallback_actor.start()
             self.started = True
+            self.update_module_index()
 
     def shutdown(self):
         if self.started:
+            self._worker_manager.terminate_all()
             self.fallback_actor.stop()
             self.started = False
 
+    def interpreter_changed(self, interpreter):
+        if interpreter != self._interpreter:
+            self._interpreter = interpreter
+            if self.started:
+                self.update_module_index()
+
+    def update_module_index(self):
+        """Update the module index of the current interpreter."""
+        interpreter = self._interpreter
+
+        # Load the index saved by a previous session right away and then
+        # update it in the background.
+        self._notify_module_index_updated(interpreter)
+
+        # Make sure Spyder can be imported by the worker process
+        environ = os.environ.copy()
+        environ['PYTHONPATH'] = os.pathsep.join(
+            [osp.dirname(get_module_path('spyder'))]
+            + [p for p in environ.get('PYTHONPATH', '').split(os.pathsep)
+               if p]
+        )
+
+        self._worker_manager.terminate_all()
+        worker = self._worker_manager.create_process_worker(
+            get_module_index_command(interpreter),
+            environ
+        )
+        worker.sig_finished.connect(self._on_module_index_worker_finished)
+        worker.start()
+
+    def _on_module_index_worker_finished(self, worker, output, error):
+        """Reload the module index after the worker updated it."""
+        if error:
+            logger.debug(f"Error when updating the module index: {error}")
+        self._notify_module_index_updated(self._interpreter)
+
+    def _notify_module_index_updated(self, interpreter):
+        """Tell the actor to reload the module index of `interpreter`."""
+        if interpreter != self._interpreter:
+            return
+
+        self.fallback_actor.sig_mailbox.emit({
+            'type': MODULE_INDEX_UPDATED,
+            'file': None,
+            'id': None,
+            'msg': {'interpreter': interpreter}
+        })
+
     def send_request(self, language, req_type, req, req_id=None):
         request = {
             'type': req_type,
@@ -35,6 +35,12 @@
 # followed by a sequence of letters, numbers or underscores of length > 0
 all_regex = re.compile(r'[^\W\d_]\w+')
 
+# Module name typed after `from` or `import` at the start of a line, e.g.
+# `import numpy.li`, `from numpy.li` or `import os, numpy.li`
+import_regex = re.compile(
+    r'^\s*(?:from\s+|import\s+(?:[\w.]+(?:\s+as\s+\w+)?\s*,\s*)*)([\w.]*)$'
+)
+
 # CamelCase, snake_case and kebab-case regex:
 # Same as above, but it also considers words separated by "-"
 kebab_regex = re.compile(r'[^\W\d_]\w+[-\w]*')
@@ -146,6 +152,27 @@ def is_prefix_valid(text, offset, language):
     return valid
 
 
+def get_import_prefix(text, offset):
+    """
+    Return the module name typed in an import statement before `offset`.
+
+    Returns None if `offset` is not in the module name of an import
+    statement.
+    """
+    # Account for length differences in text when using characters
+    # such as emojis in the editor.
+    utf16_diff = qstring_length(text) - len(text)
+    offset = offset - utf16_diff
+    if offset > len(text) or offset < 0:
+        return None
+
+    line_start = text.rfind('\n', 0, offset) + 1
+    match = import_regex.match(text[line_start:offset])
+    if match is None:
+        return None
+    return match.group(1)
+
+
 @memoize
 def get_parent_until(path):
     """
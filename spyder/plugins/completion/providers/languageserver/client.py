@@ -99,6 +99,11 @@ def __init__(self, parent,
         self.server_unresponsive = False
         self.transport_unresponsive = False
 
+        # Whether diagnostics published by the server are passed to the
+        # editor. This is disabled for workers of a server pool that don't
+        # lint files.
+        self.report_diagnostics = True
+
         # Select a free port to start the server.
         # NOTE: Don't use the new value to set server_setttings['port']!!
         # That's not required because this doesn't really correspond to a
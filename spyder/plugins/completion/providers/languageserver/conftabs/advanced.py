@@ -59,6 +59,12 @@ def __init__(self, parent):
         self.use_stdio = self.create_checkbox(
             _("Use stdio pipes to communicate with server"),
             'advanced/stdio')
+        self.advanced_workers = self.create_spinbox(
+            _("Number of server processes: "), "", 'advanced/workers',
+            min_=1, max_=8, step=1,
+            tip=_("Additional processes handle linting, formatting, "
+                  "references and symbols, so that they don't delay "
+                  "completions. This is not used for external servers."))
         self.use_stdio.checkbox.stateChanged.connect(self.disable_tcp)
         self.external_server.checkbox.stateChanged.connect(self.disable_stdio)
 
@@ -73,6 +79,8 @@ def __init__(self, parent):
         advanced_host_port_g_layout.addWidget(self.advanced_port.plabel, 1, 1)
         advanced_host_port_g_layout.addWidget(self.advanced_port.spinbox, 1, 2)
         advanced_g_layout.addLayout(advanced_host_port_g_layout, 2, 1)
+        advanced_g_layout.addWidget(self.advanced_workers.plabel, 3, 0)
+        advanced_g_layout.addWidget(self.advanced_workers.spinbox, 3, 1)
 
         # External server and stdio options layout
         advanced_server_layout = QVBoxLayout()
@@ -10,6 +10,7 @@
 """
 
 # Standard library imports
+import copy
 import functools
 import logging
 import os
@@ -29,10 +30,13 @@
 from spyder.config.lsp import PYTHON_CONFIG
 from spyder.utils.misc import check_connection_port
 from spyder.plugins.completion.api import (SUPPORTED_LANGUAGES,
+                                           CompletionRequestTypes,
                                            SpyderCompletionProvider,
                                            WorkspaceUpdateKind)
 from spyder.plugins.completion.providers.languageserver.client import LSPClient
 from spyder.plugins.completion.providers.languageserver.conftabs import TABS
+from spyder.plugins.completion.providers.languageserver.providers import (
+    utils as lsp_utils)
 from spyder.plugins.completion.providers.languageserver.widgets import (
     ClientStatus, LSPStatusWidget, ServerDisabledMessageBox)
 from spyder.utils.introspection.module_completion import PREFERRED_MODULES
@@ -41,6 +45,10 @@
 # Modules to be preloaded for Rope and Jedi
 PRELOAD_MDOULES = ', '.join(PREFERRED_MODULES)
 
+# PyLSP plugins that publish diagnostics
+LINTING_PLUGINS = ['flake8', 'mccabe', 'pycodestyle', 'pydocstyle', 'pyflakes',
+                   'pyls_flake8', 'pylint', 'ruff']
+
 logger = logging.getLogger(__name__)
 
 
@@ -79,7 +87,8 @@ class LanguageServerProvider(SpyderCompletionProvider):
         ('advanced/host', '127.0.0.1'),
         ('advanced/port', 2087),
         ('advanced/external', False),
-        ('advanced/stdio', False)
+        ('advanced/stdio', False),
+        ('advanced/workers', 1)
     ]
 
     # IMPORTANT NOTES:
@@ -100,6 +109,28 @@ class LanguageServerProvider(SpyderCompletionProvider):
     TIME_BETWEEN_RESTARTS = 10000  # ms
     TIME_HEARTBEAT = 3000  # ms
 
+    # Requests sent to all workers of a server pool to keep the document
+    # state in sync among them.
+    POOL_MIRRORED_REQUESTS = {
+        CompletionRequestTypes.DOCUMENT_DID_OPEN,
+        CompletionRequestTypes.DOCUMENT_DID_CHANGE,
+        CompletionRequestTypes.DOCUMENT_WILL_SAVE,
+        CompletionRequestTypes.DOCUMENT_DID_SAVE,
+        CompletionRequestTypes.DOCUMENT_DID_CLOSE,
+    }
+
+    # Requests routed to the secondary workers of a server pool, so that they
+    # don't delay latency-sensitive ones (e.g. completions or signatures),
+    # which are always handled by the main client.
+    POOL_WORKER_REQUESTS = {
+        CompletionRequestTypes.DOCUMENT_FORMATTING,
+        CompletionRequestTypes.DOCUMENT_RANGE_FORMATTING,
+        CompletionRequestTypes.DOCUMENT_REFERENCES,
+        CompletionRequestTypes.DOCUMENT_SYMBOL,
+        CompletionRequestTypes.DOCUMENT_FOLDING_RANGE,
+        CompletionRequestTypes.WORKSPACE_SYMBOL,
+    }
+
     # --- Signals
     # ------------------------------------------------------------------------
     sig_exception_occurred = Signal(dict)
@@ -136,6 +167,9 @@ def __init__(self, parent, config):
         self.clients_restarting = {}
         self.clients_hearbeat = {}
         self.clients_statusbar = {}
+        self.clients_workers = {}
+        self.clients_workers_turn = {}
+        self.open_documents = {}
         self.requests = set({})
         self.register_queue = {}
         self.update_lsp_configuration()
@@ -200,6 +234,7 @@ def restart_lsp(self, language: str, force=False):
                     client['instance'].stop()
                 except (TypeError, KeyError, RuntimeError):
                     pass
+                self.stop_pool_workers(language)
                 self.report_lsp_down(language)
 
     def create_statusbar(self, parent):
@@ -241,6 +276,13 @@ def check_heartbeat(self, language):
         if instance is not None:
             if instance.is_down() or status != self.RUNNING:
                 instance.sig_went_down.emit(language)
+                return
+
+        # The whole pool is restarted if any of its workers is down
+        for worker in self.clients_workers.get(language, []):
+            if worker.is_down():
+                worker.sig_went_down.emit(language)
+                return
 
     def update_status(self, language, status):
         """
@@ -299,7 +341,8 @@ def register_file(self, language, filename, codeeditor):
             if language_client is None:
                 self.register_queue[language].append((filename, codeeditor))
             else:
-                language_client.register_file(filename, codeeditor)
+                for instance in self.get_instances(language):
+                    instance.register_file(filename, codeeditor)
 
     def get_languages(self):
         """
@@ -361,11 +404,12 @@ def project_path_update(self, project_path, update_kind, projects):
                 instance = language_client['instance']
                 if (instance.support_multiple_workspaces and
                         instance.support_workspace_update):
-                    instance.send_workspace_folders_change({
-                        'folder': project_path,
-                        'instance': projects,
-                        'kind': update_kind
-                    })
+                    for pool_instance in self.get_instances(language):
+                        pool_instance.send_workspace_folders_change({
+                            'folder': project_path,
+                            'instance': projects,
+                            'kind': update_kind
+                        })
                 else:
                     logger.debug(
                         "{0}: LSP does not support multiple workspaces, "
@@ -501,6 +545,8 @@ def start_completion_services_for_language(self, language):
                     folder=self.get_root_path(language),
                     language=language
                 )
+                language_client['instance'].configurations = (
+                    self.get_worker_configurations(language, 0))
 
                 self.register_client_instance(language_client['instance'])
 
@@ -509,8 +555,10 @@ def start_completion_services_for_language(self, language):
                 language_client['instance'].start()
                 language_client['status'] = self.RUNNING
                 started = True
+                self.start_pool_workers(language)
                 for entry in queue:
-                    language_client['instance'].register_file(*entry)
+                    for instance in self.get_instances(language):
+                        instance.register_file(*entry)
                 self.register_queue[language] = []
 
         return started
@@ -523,6 +571,152 @@ def register_client_instance(self, instance):
         instance.sig_initialize.connect(
             self.sig_language_completions_available)
 
+    # ---- Server pool
+    def get_pool_size(self, language):
+        """
+        Get the number of server processes to start for `language`.
+
+        Only the main client is started for external servers because all
+        requests need to go to the same address.
+        """
+        config = self.clients[language]['config']
+        if config.get('external', False):
+            return 1
+        return max(config.get('workers', 1), 1)
+
+    def get_instances(self, language):
+        """Get the main client and the pool workers of `language`."""
+        instance = self.clients[language]['instance']
+        if instance is None:
+            return []
+        return [instance] + self.clients_workers.get(language, [])
+
+    def get_worker_configurations(self, language, index):
+        """
+        Get the server configurations for the pool worker at `index`.
+
+        The main client (index 0) handles completions, so linting is moved to
+        the first secondary worker when there's a pool. Linting is disabled on
+        all other workers to avoid computing diagnostics more than once.
+        """
+        configurations = self.clients[language]['config'].get(
+            'configurations', {})
+        if self.get_pool_size(language) == 1 or index == 1:
+            return configurations
+
+        configurations = copy.deepcopy(configurations)
+        plugins = configurations.get('pylsp', {}).get('plugins', {})
+        for plugin in LINTING_PLUGINS:
+            if plugin in plugins:
+                plugins[plugin]['enabled'] = False
+        return configurations
+
+    def start_pool_workers(self, language):
+        """Start the secondary workers of the server pool for `language`."""
+        pool_size = self.get_pool_size(language)
+        if pool_size == 1:
+            return
+
+        config = self.clients[language]['config']
+        instance = self.clients[language]['instance']
+
+        # Diagnostics are only published by the linting worker
+        instance.report_diagnostics = False
+
+        self.open_documents[language] = {}
+        self.clients_workers[language] = []
+        self.clients_workers_turn[language] = 0
+
+        # Servers are started asynchronously, so we need to look for free
+        # ports after the ones already taken by the other workers.
+        port = instance.server_port
+        for index in range(1, pool_size):
+            worker = LSPClient(
+                parent=self,
+                server_settings=dict(config, port=port + 1),
+                folder=instance.folder,
+                language=language
+            )
+            worker.configurations = self.get_worker_configurations(
+                language, index)
+            worker.report_diagnostics = index == 1
+            port = worker.server_port
+
+            worker.sig_went_down.connect(self.handle_lsp_down)
+            worker.sig_server_error.connect(self.report_server_error)
+            worker.sig_initialize.connect(
+                functools.partial(self.on_worker_initialize, worker))
+
+            logger.info("Starting LSP worker {} for {}...".format(
+                index, language))
+            worker.start()
+            self.clients_workers[language].append(worker)
+
+    def stop_pool_workers(self, language):
+        """Stop the secondary workers of the server pool for `language`."""
+        for worker in self.clients_workers.pop(language, []):
+            try:
+                if PYSIDE2 or PYSIDE6:
+                    worker.disconnect(None, None, None)
+                else:
+                    worker.disconnect()
+            except TypeError:
+                pass
+            worker.stop()
+        self.open_documents.pop(language, None)
+
+    def on_worker_initialize(self, worker, options, language):
+        """
+        Send the documents opened before a worker was ready to it.
+
+        Notifications are dropped by clients that are not initialized, so
+        this is necessary to keep the document state mirrored on all workers.
+        """
+        for params in self.open_documents.get(language, {}).values():
+            worker.perform_request(
+                CompletionRequestTypes.DOCUMENT_DID_OPEN, params)
+
+    def get_instance_for_request(self, language, request):
+        """Get the pool client that needs to handle `request`."""
+        instance = self.clients[language]['instance']
+        if request not in self.POOL_WORKER_REQUESTS:
+            return instance
+
+        workers = [
+            worker for worker in self.clients_workers.get(language, [])
+            if worker.initialized
+        ]
+        if not workers:
+            return instance
+
+        # Distribute requests among workers in a round-robin fashion
+        turn = self.clients_workers_turn[language]
+        self.clients_workers_turn[language] = turn + 1
+        return workers[turn % len(workers)]
+
+    def update_open_documents(self, language, request, params):
+        """Keep track of the documents opened in a server pool."""
+        documents = self.open_documents.get(language)
+        if documents is None or 'file' not in params:
+            return
+
+        filename = params['file']
+        if request == CompletionRequestTypes.DOCUMENT_DID_OPEN:
+            documents[filename] = {
+                key: params[key]
+                for key in ['file', 'language', 'version', 'text',
+                            'codeeditor']
+            }
+        elif request == CompletionRequestTypes.DOCUMENT_DID_CHANGE:
+            if filename in documents:
+                documents[filename]['version'] = params['version']
+                documents[filename]['text'] = params['text']
+        elif request == CompletionRequestTypes.DOCUMENT_DID_CLOSE:
+            # The file could still be open in other editors
+            instance = self.clients[language]['instance']
+            if lsp_utils.path_as_uri(filename) not in instance.watched_files:
+                documents.pop(filename, None)
+
     def start(self):
         self.sig_provider_ready.emit(self.COMPLETION_PROVIDER_NAME)
 
@@ -618,9 +812,11 @@ def update_lsp_configuration(self, python_only=False):
                 current_lang_config = self.clients[language]['config']
                 new_lang_config = client_config['config']
                 restart_diff = ['cmd', 'args', 'host',
-                                'port', 'external', 'stdio']
-                restart = any([current_lang_config[x] != new_lang_config[x]
-                               for x in restart_diff])
+                                'port', 'external', 'stdio', 'workers']
+                restart = any([
+                    current_lang_config.get(x) != new_lang_config.get(x)
+                    for x in restart_diff
+                ])
                 if restart:
                     logger.debug("Restart required for {} client!".format(
                         language))
@@ -635,10 +831,15 @@ def update_lsp_configuration(self, python_only=False):
                     elif self.clients[language]['status'] == self.RUNNING:
                         self.restart_client(language, client_config)
                 else:
+                    self.clients[language]['config'] = new_lang_config
                     if self.clients[language]['status'] == self.RUNNING:
-                        client = self.clients[language]['instance']
-                        client.send_configurations(
-                            new_lang_config['configurations'])
+                        instances = self.get_instances(language)
+                        for index, instance in enumerate(instances):
+                            instance.configurations = (
+                                self.get_worker_configurations(
+                                    language, index))
+                            instance.send_configurations(
+                                instance.configurations)
 
     def restart_client(self, language, config):
         """Restart a client."""
@@ -672,6 +873,7 @@ def stop_completion_services_for_language(self, language):
                 except (TypeError, KeyError, RuntimeError):
                     pass
                 language_client['instance'].stop()
+                self.stop_pool_workers(language)
             language_client['status'] = self.STOPPED
             self.sig_stop_completions.emit(language)
 
@@ -686,10 +888,16 @@ def send_request(self, language, request, params, req_id):
             language_client = self.clients[language]
             if language_client['status'] == self.RUNNING:
                 self.requests.add(req_id)
-                client = self.clients[language]['instance']
+                client = self.get_instance_for_request(language, request)
                 params['response_callback'] = functools.partial(
                     self.receive_response, language=language, req_id=req_id)
                 client.perform_request(request, params)
+
+                # Document state is mirrored on all pool workers
+                if request in self.POOL_MIRRORED_REQUESTS:
+                    for worker in self.clients_workers.get(language, []):
+                        worker.perform_request(request, params)
+                    self.update_open_documents(language, request, params)
                 return
         self.sig_response_ready.emit(self.COMPLETION_PROVIDER_NAME,
                                      req_id, {})
@@ -698,8 +906,8 @@ def send_notification(self, language, request, params):
         if language in self.clients:
             language_client = self.clients[language]
             if language_client['status'] == self.RUNNING:
-                client = self.clients[language]['instance']
-                client.perform_request(request, params)
+                for client in self.get_instances(language):
+                    client.perform_request(request, params)
 
     def broadcast_notification(self, request, params):
         """Send notification/request to all available LSP servers."""
@@ -846,6 +1054,7 @@ def generate_python_config(self):
         python_config['stdio'] = stdio
         python_config['host'] = host
         python_config['port'] = port
+        python_config['workers'] = self.get_conf('advanced/workers', 1)
 
         # Updating options
         plugins = python_config['configurations']['pylsp']['plugins']
@@ -33,6 +33,9 @@ def register_file(self, filename, codeeditor):
 
     @handles(CompletionRequestTypes.DOCUMENT_PUBLISH_DIAGNOSTICS)
     def process_document_diagnostics(self, response, *args):
+        if not self.report_diagnostics:
+            return
+
         uri = response['uri']
         diagnostics = response['diagnostics']
         if uri in self.watched_files:
@@ -90,7 +93,9 @@ def document_completion_request(self, params):
 
     @handles(CompletionRequestTypes.DOCUMENT_COMPLETION)
     def process_document_completion(self, response, req_id):
+        is_incomplete = False
         if isinstance(response, dict):
+            is_incomplete = response.get('isIncomplete', False)
             response = response['items']
 
         must_resolve = self.server_capabilites['completionProvider'].get(
@@ -111,7 +116,7 @@ def process_document_completion(self, response, req_id):
         if req_id in self.req_reply:
             self.req_reply[req_id](
                 CompletionRequestTypes.DOCUMENT_COMPLETION,
-                {'params': response}
+                {'params': response, 'isIncomplete': is_incomplete}
             )
 
     @send_request(method=CompletionRequestTypes.COMPLETION_RESOLVE)
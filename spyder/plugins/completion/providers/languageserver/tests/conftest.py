@@ -34,7 +34,7 @@ def get_conf(self, option, default=None, section=None):
             return CONF.get(section, option, default)
 
 
-def lsp_context(is_stdio):
+def lsp_context(is_stdio, workers=1):
     @pytest.fixture(scope='module')
     def wrapper(qtbot_module, request):
         # Activate pycodestyle and pydocstyle
@@ -42,6 +42,7 @@ def wrapper(qtbot_module, request):
         conf['pycodestyle'] = True
         conf['pydocstyle'] = True
         conf['stdio'] = is_stdio
+        conf['advanced/workers'] = workers
 
         # Create the manager
         provider = LanguageServerProvider(CompletionPluginMock(conf), conf)
@@ -66,3 +67,4 @@ def teardown():
 
 lsp_provider = lsp_context(is_stdio=False)
 lsp_stdio_provider = lsp_context(is_stdio=True)
+lsp_pool_provider = lsp_context(is_stdio=False, workers=3)
@@ -12,6 +12,8 @@
 
 from spyder.plugins.completion.api import (
     CompletionRequestTypes, WorkspaceUpdateKind)
+from spyder.plugins.completion.providers.languageserver.providers import (
+    utils as lsp_utils)
 
 
 class CompletionManager(QObject):
@@ -242,3 +244,66 @@ def test_send_workspace_folders_change(lsp_client_and_completion, qtbot):
 
     client.send_workspace_folders_change(params)
     assert folder not in client.watched_folders
+
+
+@pytest.mark.order(3)
+def test_server_pool(lsp_pool_provider, qtbot):
+    """Test that requests are routed to the right server pool workers."""
+    provider = lsp_pool_provider
+    client = provider.clients['python']['instance']
+    workers = provider.clients_workers['python']
+    assert len(workers) == 2
+
+    # Wait for workers to be ready
+    qtbot.waitUntil(
+        lambda: all([worker.initialized for worker in workers]),
+        timeout=30000
+    )
+
+    # Each worker has its own server
+    ports = [instance.server_port for instance in [client] + workers]
+    assert len(set(ports)) == 3
+
+    # Only the first worker lints files
+    assert not client.report_diagnostics
+    assert workers[0].report_diagnostics
+    assert not workers[1].report_diagnostics
+
+    plugins = [
+        instance.configurations['pylsp']['plugins']
+        for instance in [client] + workers
+    ]
+    assert [p['pyflakes']['enabled'] for p in plugins] == [False, True, False]
+
+    # Latency-sensitive requests are handled by the main client
+    for request in [CompletionRequestTypes.DOCUMENT_COMPLETION,
+                    CompletionRequestTypes.DOCUMENT_SIGNATURE,
+                    CompletionRequestTypes.DOCUMENT_HOVER]:
+        assert provider.get_instance_for_request('python', request) is client
+
+    # Heavy requests are distributed among workers
+    request = CompletionRequestTypes.DOCUMENT_FOLDING_RANGE
+    assert provider.get_instance_for_request('python', request) in workers
+    assert {
+        provider.get_instance_for_request('python', request)
+        for __ in range(2)
+    } == set(workers)
+
+    # Documents are mirrored on all workers
+    completion = CompletionManager()
+    params = {
+        'file': 'test_pool.py',
+        'language': 'python',
+        'version': 1,
+        'text': "import os\n",
+        'codeeditor': completion,
+        'requires_response': False
+    }
+    with qtbot.waitSignal(completion.sig_response, timeout=30000):
+        provider.send_request(
+            'python', CompletionRequestTypes.DOCUMENT_DID_OPEN, params, 0)
+
+    uri = lsp_utils.path_as_uri('test_pool.py')
+    assert all([uri in instance.watched_files
+                for instance in [client] + workers])
+    assert provider.open_documents['python']['test_pool.py']['version'] == 1
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright © Spyder Project Contributors
+#
+# Licensed under the terms of the MIT License
+# ----------------------------------------------------------------------------
+
+"""Tests for the completion response cache."""
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.completion.api import CompletionRequestTypes
+from spyder.plugins.completion.cache import CompletionResponseCache
+
+
+HOVER = CompletionRequestTypes.DOCUMENT_HOVER
+DEFINITION = CompletionRequestTypes.DOCUMENT_DEFINITION
+
+
+@pytest.fixture
+def cache():
+    return CompletionResponseCache(
+        {HOVER, DEFINITION}, cross_file_types={DEFINITION}, maxsize=2
+    )
+
+
+def test_cache_requires_known_version(cache):
+    """Requests for files without a known version are not cached."""
+    req = {'file': 'a.py', 'line': 1, 'column': 2}
+    assert cache.get_key(HOVER, req) is None
+
+    cache.update_version('a.py', 1)
+    assert cache.get_key(HOVER, req) is not None
+
+    # Other request types are never cached
+    assert cache.get_key(CompletionRequestTypes.DOCUMENT_COMPLETION,
+                         req) is None
+
+
+def test_cache_invalidated_by_version(cache):
+    """Entries are dropped when a new version of the file is registered."""
+    req = {'file': 'a.py', 'line': 1, 'column': 2}
+    cache.update_version('a.py', 1)
+    key = cache.get_key(HOVER, req)
+    cache.put(key, {'params': 'foo'})
+    assert cache.get(key) == {'params': 'foo'}
+
+    # Same version doesn't invalidate anything
+    cache.update_version('a.py', 1)
+    assert cache.get(key) == {'params': 'foo'}
+
+    cache.update_version('a.py', 2)
+    assert cache.get(key) is None
+    assert cache.get(cache.get_key(HOVER, req)) is None
+
+    # Responses for outdated versions are not stored
+    cache.put(key, {'params': 'foo'})
+    assert len(cache) == 0
+
+
+def test_cache_cross_file_invalidation(cache):
+    """Definition entries are dropped for all files on save."""
+    cache.update_version('a.py', 1)
+    hover_key = cache.get_key(HOVER, {'file': 'a.py', 'line': 0,
+                                      'column': 0})
+    definition_key = cache.get_key(DEFINITION, {'file': 'a.py', 'line': 0,
+                                                'column': 0})
+    cache.put(hover_key, {'params': 'foo'})
+    cache.put(definition_key, {'params': {'file': 'b.py'}})
+
+    cache.invalidate_cross_file()
+    assert hover_key in cache
+    assert definition_key not in cache
+
+
+def test_cache_lru_eviction(cache):
+    """The least recently used entry is evicted first."""
+    cache.update_version('a.py', 1)
+    keys = [
+        cache.get_key(HOVER, {'file': 'a.py', 'line': i, 'column': 0})
+        for i in range(3)
+    ]
+    cache.put(keys[0], {'params': 0})
+    cache.put(keys[1], {'params': 1})
+
+    # Use the first entry so the second one is evicted
+    assert cache.get(keys[0]) == {'params': 0}
+    cache.put(keys[2], {'params': 2})
+
+    assert keys[0] in cache
+    assert keys[1] not in cache
+    assert keys[2] in cache
+
+
+def test_cache_returns_copies(cache):
+    """Handlers mutating a response don't corrupt the cache."""
+    cache.update_version('a.py', 1)
+    key = cache.get_key(HOVER, {'file': 'a.py', 'line': 0, 'column': 0})
+    cache.put(key, {'params': {'value': 'foo'}})
+
+    response = cache.get(key)
+    response['params']['value'] = 'bar'
+    assert cache.get(key) == {'params': {'value': 'foo'}}
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -705,12 +705,14 @@ def on_projects_available(self):
         projects = self.get_plugin(Plugins.Projects)
         projects.sig_project_loaded.connect(self._on_project_loaded)
         projects.sig_project_closed.connect(self._on_project_closed)
+        projects.sig_files_changed.connect(self._on_project_files_changed)
 
     @on_plugin_teardown(plugin=Plugins.Projects)
     def on_projects_teardown(self):
         projects = self.get_plugin(Plugins.Projects)
         projects.sig_project_loaded.disconnect(self._on_project_loaded)
         projects.sig_project_closed.disconnect(self._on_project_closed)
+        projects.sig_files_changed.disconnect(self._on_project_files_changed)
 
     @on_plugin_available(plugin=Plugins.Application)
     def on_application_available(self):
@@ -1239,6 +1241,10 @@ def _on_project_loaded(self, path):
     def _on_project_closed(self):
         self.get_widget().update_active_project_path(None)
 
+    def _on_project_files_changed(self, changes):
+        paths = [src_path for __, src_path, __, __ in changes]
+        self.get_widget().vcs_status.invalidate_vcs(paths)
+
     # ---- Debugger related methods
     def _debugger_close_file(self, filename):
         debugger = self.get_plugin(Plugins.Debugger, error=False)
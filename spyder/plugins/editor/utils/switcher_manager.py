@@ -205,7 +205,9 @@ def handle_switcher_selection(self, item, mode, search_text):
         """Handle item selection of the switcher."""
         data = item.get_data()
         if mode == '@':
-            self.symbol_switcher_handler(data)
+            # Symbols in other files are handled by the Projects plugin
+            if item.get_section() == self._section:
+                self.symbol_switcher_handler(data)
         elif mode == ':':
             self.line_switcher_handler(data, search_text)
         elif mode == '':
@@ -239,7 +241,11 @@ def handle_switcher_item_change(self, current):
         """Handle item selection change."""
         mode = self._switcher.get_mode()
 
-        if mode == '@' and current is not None:
+        if (
+            mode == '@'
+            and current is not None
+            and current.get_section() == self._section
+        ):
             editorstack = self._editorstack()
             data = current.get_data()
             if isinstance(data, dict):
@@ -736,6 +736,7 @@ def setup_editor(self,
                      automatic_completions_after_chars=3,
                      completions_hint=True,
                      completions_hint_after_ms=500,
+                     completions_prefetch=False,
                      hover_hints=True,
                      code_snippets=True,
                      highlight_current_line=True,
@@ -795,6 +796,8 @@ def setup_editor(self,
             Default True.
         completions_hint_after_ms: Number of milliseconds over a completion
             item to show the documentation hint. Default 500.
+        completions_prefetch: Enable/Disable requesting completions in advance
+            after trigger characters (e.g. `.` or `(`). Default False.
         hover_hints: Enable/Disable documentation hover hints. Default True.
         code_snippets: Enable/Disable code snippets completions. Default True.
         highlight_current_line: Enable/Disable current line highlighting.
@@ -924,6 +927,9 @@ def setup_editor(self,
         self.toggle_completions_hint(completions_hint)
         self.set_completions_hint_after_ms(completions_hint_after_ms)
 
+        # Completions prefetch
+        self.toggle_completions_prefetch(completions_prefetch)
+
         # Hover hints
         self.toggle_hover_hints(hover_hints)
 
@@ -1020,6 +1026,12 @@ def toggle_completions_hint(self, state):
         """Enable/disable completion hint."""
         self.completions_hint = state
 
+    def toggle_completions_prefetch(self, state):
+        """Enable/disable requesting completions after trigger characters."""
+        self.completions_prefetch = state
+        if not state:
+            self._prefetched_completions = None
+
     def set_automatic_completions_after_chars(self, number):
         """
         Set the number of characters after which auto completion is fired.
@@ -9,6 +9,7 @@
 """
 
 # Standard library imports
+import copy
 import functools
 import logging
 import random
@@ -52,6 +53,16 @@
 # Regexp to detect noqa inline comments.
 NOQA_INLINE_REGEXP = re.compile(r"#?noqa", re.IGNORECASE)
 
+# Regexp to detect positions after which completions can be prefetched, i.e.
+# attribute access, calls and import statements.
+PREFETCH_TRIGGER_REGEXP = re.compile(
+    r"(?:[\w)\]}]\.|\(|^\s*(?:import|from)\s)$"
+)
+
+# Regexp to check that prefetched completions are still valid for the text
+# typed after their position.
+PREFETCH_WORD_REGEXP = re.compile(r"\w*")
+
 
 def schedule_request(req=None, method=None, requires_response=True):
     """Call function req and then emit its results to the completion server."""
@@ -147,6 +158,14 @@ def __init__(self, *args, **kwargs):
         self._server_requests_timer.timeout.connect(
             self._process_server_requests)
 
+        # Prefetch completions once the current edit is finished.
+        # See prefetch_completions
+        self._completions_prefetch_timer = QTimer(self)
+        self._completions_prefetch_timer.setSingleShot(True)
+        self._completions_prefetch_timer.setInterval(0)
+        self._completions_prefetch_timer.timeout.connect(
+            self.prefetch_completions)
+
         # Code Folding
         self.code_folding = True
         self.update_folding_thread = QThread(None)
@@ -196,6 +215,8 @@ def __init__(self, *args, **kwargs):
         self.document_symbols_enabled = False
         self.formatting_characters = []
         self.completion_args = None
+        self.completions_prefetch = False
+        self._prefetched_completions = None
         self.folding_supported = False
         self._folding_info = None
         self.is_cloned = False
@@ -423,6 +444,9 @@ def _schedule_document_did_change(self):
         self._server_requests_timer.setInterval(self.LSP_REQUESTS_LONG_DELAY)
         self._server_requests_timer.start()
 
+        if self.completions_prefetch:
+            self._completions_prefetch_timer.start()
+
     @request(
         method=CompletionRequestTypes.DOCUMENT_DID_CHANGE,
         requires_response=False,
@@ -649,9 +673,8 @@ def _process_code_analysis(self, underline):
 
     # ---- Completion
     # -------------------------------------------------------------------------
-    @schedule_request(method=CompletionRequestTypes.DOCUMENT_COMPLETION)
-    def do_completion(self, automatic=False):
-        """Trigger completion."""
+    def _get_completion_params(self):
+        """Get the parameters of a completion request at the cursor."""
         cursor = self.textCursor()
         current_word = self.get_current_word(
             completion=True, valid_python_variable=False
@@ -666,19 +689,170 @@ def do_completion(self, automatic=False):
             "selection_end": cursor.selectionEnd(),
             "current_word": current_word,
         }
-        self.completion_args = (self.textCursor().position(), automatic)
         return params
 
+    @schedule_request(method=CompletionRequestTypes.DOCUMENT_COMPLETION)
+    def do_completion(self, automatic=False):
+        """Trigger completion."""
+        if automatic:
+            # The current results are still valid for the word under the
+            # cursor, so there's no need to ask the providers again.
+            if self.completion_widget.can_refilter():
+                self.completion_widget.refilter()
+                return
+
+            if self._show_prefetched_completions():
+                return
+
+        position = self.textCursor().position()
+        if self._is_prefetch_position():
+            # Keep the results of this request to filter them locally while
+            # the user types the rest of the word.
+            self._set_prefetched_completions(show=True)
+        else:
+            self._prefetched_completions = None
+
+        self.completion_args = (position, automatic)
+        return self._get_completion_params()
+
+    @request(method=CompletionRequestTypes.DOCUMENT_COMPLETION)
+    def prefetch_completions(self):
+        """
+        Request completions in advance after a trigger character.
+
+        The results are kept for the position where they were requested
+        and, if automatic completions are triggered later for the same word,
+        they are filtered locally instead of asking the server again.
+        """
+        if (
+            not self.completions_prefetch
+            or not self.completions_available
+            or self.in_comment_or_string()
+            or not self._is_prefetch_position()
+        ):
+            return
+
+        # Completions were already requested for this position
+        prefetched = self._get_prefetched_completions()
+        if (
+            prefetched is not None
+            and prefetched["position"] == self.textCursor().position()
+        ):
+            return
+
+        # The server needs the current text to compute completions.
+        if self._document_server_needs_update:
+            self.document_did_change()
+            self._document_server_needs_update = False
+
+        self._set_prefetched_completions(show=False)
+        self.completion_args = None
+        return self._get_completion_params()
+
+    def _is_prefetch_position(self):
+        """Check if the cursor is right after a completion trigger."""
+        if not self.completions_prefetch:
+            return False
+
+        cursor = self.textCursor()
+        line_prefix = cursor.block().text()[:cursor.positionInBlock()]
+        return PREFETCH_TRIGGER_REGEXP.search(line_prefix) is not None
+
+    def _set_prefetched_completions(self, show):
+        """Start tracking completions prefetched at the cursor position."""
+        cursor = self.textCursor()
+        self._prefetched_completions = {
+            "position": cursor.position(),
+            "line_prefix": cursor.block().text()[:cursor.positionInBlock()],
+            "completions": None,
+            "incomplete": False,
+            "show": show,
+        }
+
+    def _get_prefetched_completions(self):
+        """
+        Return prefetched completions if they are still valid for the current
+        cursor position.
+        """
+        prefetched = self._prefetched_completions
+        if prefetched is None:
+            return None
+
+        cursor = self.textCursor()
+        position = prefetched["position"]
+        block = cursor.block()
+        column = position - block.position()
+
+        # The cursor must be in the word that starts at the prefetch position
+        # and the text before it must not have changed.
+        valid = (
+            cursor.position() >= position
+            and column >= 0
+            and block.text()[:column] == prefetched["line_prefix"]
+            and PREFETCH_WORD_REGEXP.fullmatch(
+                block.text()[column:cursor.positionInBlock()]
+            )
+        )
+
+        if not valid:
+            self._prefetched_completions = None
+            return None
+
+        return prefetched
+
+    def _show_prefetched_completions(self):
+        """
+        Show prefetched completions for the current word, if available.
+
+        Returns True if prefetched completions are used (or will be used as
+        soon as they arrive), False otherwise.
+        """
+        prefetched = self._get_prefetched_completions()
+        if prefetched is None or prefetched["incomplete"]:
+            return False
+
+        if prefetched["completions"] is None:
+            # The response hasn't arrived yet, so show it when it does.
+            prefetched["show"] = True
+            self.completion_args = (prefetched["position"], True)
+        else:
+            self._show_completions(
+                copy.deepcopy(prefetched["completions"]),
+                prefetched["position"],
+                automatic=True,
+            )
+        return True
+
     @handles(CompletionRequestTypes.DOCUMENT_COMPLETION)
     def process_completion(self, params):
         """Handle completion response."""
+        prefetched = self._prefetched_completions
+        if prefetched is not None and prefetched["completions"] is None:
+            completions = params.get("params") or []
+            prefetched["completions"] = copy.deepcopy(completions)
+            prefetched["incomplete"] = params.get("isIncomplete", False)
+            # Background prefetches are only shown if automatic completions
+            # asked for them. Otherwise, completion_args has the arguments of
+            # the request that is waiting for them.
+            if not prefetched["show"]:
+                return
+
         args = self.completion_args
         if args is None:
             # This should not happen
             return
         self.completion_args = None
         position, automatic = args
+        self._show_completions(
+            params["params"],
+            position,
+            automatic,
+            incomplete=params.get("isIncomplete", False),
+        )
 
+    def _show_completions(self, completions, position, automatic,
+                          incomplete=False):
+        """Process completions and show them in the completion widget."""
         start_cursor = self.textCursor()
         start_cursor.movePosition(QTextCursor.StartOfBlock)
         line_text = self.get_text(start_cursor.position(), "eol")
@@ -687,7 +861,6 @@ def process_completion(self, params):
         eol_char = self.get_line_separator()
 
         try:
-            completions = params["params"]
             completions = (
                 []
                 if completions is None
@@ -764,7 +937,7 @@ def sort_key(completion):
                     completion["insertText"] = reindented_text
 
             self.completion_widget.show_list(
-                completion_list, position, automatic
+                completion_list, position, automatic, incomplete
             )
         except RuntimeError:
             # This is triggered when a codeeditor instance was removed
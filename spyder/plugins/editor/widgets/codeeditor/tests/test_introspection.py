@@ -1232,5 +1232,142 @@ def test_directory_completions(directory, completions_codeeditor, qtbot):
     assert osp.normpath(code_editor.toPlainText()) == f"'{directory}{os.sep}'"
 
 
+@pytest.mark.order(1)
+def test_completions_prefetch(mock_completions_codeeditor, qtbot):
+    """
+    Test that completions are requested after a trigger character and then
+    filtered locally while typing.
+    """
+    code_editor, mock_response = mock_completions_codeeditor
+    completion = code_editor.completion_widget
+    code_editor.toggle_completions_prefetch(True)
+    code_editor.set_text('')
+
+    def completion_item(label):
+        return {
+            'label': label,
+            'kind': CompletionItemKind.METHOD,
+            'sortText': (0, label),
+            'insertText': label,
+            'detail': '',
+            'documentation': '',
+            'filterText': label,
+            'insertTextFormat': 1,
+            'provider': 'LSP',
+            'resolve': False
+        }
+
+    requested_offsets = []
+
+    def response(lang, method, params):
+        if method == CompletionRequestTypes.DOCUMENT_COMPLETION:
+            requested_offsets.append(params['offset'])
+            return {'params': [completion_item('append'),
+                               completion_item('apply'),
+                               completion_item('copy')]}
+
+    mock_response.side_effect = response
+
+    # Completions are requested right after the dot
+    qtbot.keyClicks(code_editor, 'foo.')
+    qtbot.waitUntil(lambda: len(requested_offsets) == 1)
+    assert requested_offsets == [4]
+
+    # and then shown without asking for them again
+    with qtbot.waitSignal(completion.sig_show_completions,
+                          timeout=10000):
+        qtbot.keyClicks(code_editor, 'ap')
+
+    qtbot.wait(500)
+    labels = [completion.item(i).data(Qt.UserRole)['label']
+              for i in range(completion.count())]
+    assert labels == ['append', 'apply']
+    assert requested_offsets == [4]
+
+    # Prefetched completions are discarded if the text before them changes
+    completion.hide()
+    code_editor.set_text('bar.ap')
+    code_editor.moveCursor(QTextCursor.End)
+    assert code_editor._get_prefetched_completions() is None
+
+    # Completions requested by users after a trigger character are not shown
+    # as automatic ones
+    code_editor.set_text('foo.')
+    code_editor.moveCursor(QTextCursor.End)
+    with qtbot.waitSignal(completion.sig_show_completions,
+                          timeout=10000):
+        code_editor.do_completion(automatic=False)
+    assert not completion.automatic
+    completion.hide()
+
+    code_editor.toggle_completions_prefetch(False)
+    code_editor.set_text('')
+
+
+@pytest.mark.order(1)
+def test_completions_local_filtering(mock_completions_codeeditor, qtbot):
+    """
+    Test that completions are filtered and ranked locally while typing the
+    same word, unless the providers mark them as incomplete.
+    """
+    code_editor, mock_response = mock_completions_codeeditor
+    completion = code_editor.completion_widget
+    code_editor.set_text('')
+
+    labels = ['kernel', 'kwargs_key', 'keyword', 'key_error']
+    completion_items = [
+        {
+            'label': label,
+            'kind': CompletionItemKind.VARIABLE,
+            'sortText': (0, label),
+            'insertText': label,
+            'detail': '',
+            'documentation': '',
+            'filterText': label,
+            'insertTextFormat': 1,
+            'provider': 'LSP',
+            'resolve': False
+        }
+        for label in labels
+    ]
+    is_incomplete = False
+    requests = []
+
+    def response(lang, method, params):
+        if method == CompletionRequestTypes.DOCUMENT_COMPLETION:
+            requests.append(params['current_word'])
+            return {'params': completion_items, 'isIncomplete': is_incomplete}
+
+    mock_response.side_effect = response
+
+    with qtbot.waitSignal(completion.sig_show_completions, timeout=10000):
+        qtbot.keyClicks(code_editor, 'ke')
+    assert len(requests) == 1
+
+    # Typing more letters of the same word filters the list locally and
+    # ranks prefix matches first, keeping the order given by sortText
+    # otherwise.
+    qtbot.keyClicks(code_editor, 'y')
+    qtbot.wait(1000)
+    assert len(requests) == 1
+    shown = [completion.item(i).data(Qt.UserRole)['label']
+             for i in range(completion.count())]
+    assert shown == ['key_error', 'keyword', 'kwargs_key']
+
+    # Incomplete lists are requested again
+    completion.hide()
+    code_editor.set_text('')
+    is_incomplete = True
+    requests.clear()
+
+    with qtbot.waitSignal(completion.sig_show_completions, timeout=10000):
+        qtbot.keyClicks(code_editor, 'ke')
+    qtbot.keyClicks(code_editor, 'y')
+    qtbot.waitUntil(lambda: len(requests) == 2)
+
+    completion.hide()
+    code_editor.set_text('')
+
+
 if __name__ == '__main__':
     pytest.main(['test_introspection.py', '--run-slow'])
@@ -21,6 +21,7 @@
 from spyder.plugins.completion.api import CompletionItemKind
 from spyder.py3compat import to_text_string
 from spyder.utils.qthelpers import keyevent_to_keysequence_str
+from spyder.utils.stringmatching import get_fuzzy_score
 from spyder.widgets.helperwidgets import HTMLDelegate
 
 
@@ -79,6 +80,10 @@ def __init__(self, parent, ancestor):
         self.current_selected_item_point = None
         self.display_index = []
 
+        # Last full list of completions returned by the providers, which is
+        # filtered locally while the user keeps typing the same word.
+        self._full_results = None
+
         # Setup item rendering
         self.setItemDelegate(HTMLDelegate(self, margin=3))
         self.setMinimumWidth(COMPLETION_ITEM_WIDTH)
@@ -98,12 +103,19 @@ def is_empty(self):
             return True
         return False
 
-    def show_list(self, completion_list, position, automatic):
-        """Show list corresponding to position."""
+    def show_list(self, completion_list, position, automatic,
+                  incomplete=False):
+        """
+        Show list corresponding to position.
+
+        If `incomplete` is True, the providers could return more results
+        for a longer word, so the list can't be filtered locally afterwards.
+        """
         self.current_selected_item_label = None
         self.current_selected_item_point = None
 
         if not completion_list:
+            self._full_results = None
             self.hide()
             return
 
@@ -126,6 +138,11 @@ def show_list(self, completion_list, position, automatic):
         if not isinstance(completion_list[0], dict):
             self.is_internal_console = True
         self.completion_list = completion_list
+        self._full_results = {
+            'completions': completion_list,
+            'position': self.completion_position,
+            'incomplete': incomplete,
+        }
 
         # Check everything is in order
         self.update_current(new=True)
@@ -207,6 +224,9 @@ def update_list(self, current_word, new=True):
             # right border.
             width = COMPLETION_ITEM_WIDTH + COMPLETION_DELTA_FOR_SCROLLBAR
 
+        # Filter completions and rank the best matches first, keeping the
+        # order given by the providers otherwise.
+        matches = []
         for i, completion in enumerate(self.completion_list):
             if not self.is_internal_console:
                 if not new and 'textEdit' in completion:
@@ -215,8 +235,14 @@ def update_list(self, current_word, new=True):
             else:
                 completion_label = completion[0]
 
-            if not self.check_can_complete(completion_label, current_word):
+            score = self.get_completion_score(completion_label, current_word)
+            if score is None:
                 continue
+            matches.append((score, i, completion, completion_label))
+
+        matches.sort(key=lambda match: match[:2])
+
+        for __, i, completion, completion_label in matches:
             item = QListWidgetItem()
 
             if not self.is_internal_console:
@@ -321,6 +347,10 @@ def hide(self, focus_to_parent=True):
         self.completion_list = None
         self.clear()
 
+        # The text could change in any way while the widget is hidden, so
+        # completions need to be requested again after that.
+        self._full_results = None
+
         # Used to control when to give focus to its parent.
         # This is necessary to have a better fix than the initially
         # proposed for issue spyder-ide/spyder#11502.
@@ -435,35 +465,42 @@ def is_up_to_date(self, item=None):
             filter_text = completion
         return self.check_can_complete(filter_text, current_word)
 
-    def check_can_complete(self, filter_text, current_word):
-        """Check if current_word matches filter_text."""
-        if not filter_text:
-            return True
+    def get_completion_score(self, filter_text, current_word):
+        """
+        Return the score of filter_text as a match of current_word, or None
+        if it doesn't match. Lower scores imply a better match.
+        """
+        if not filter_text or not current_word:
+            return 0
 
-        if not current_word:
-            return True
+        return get_fuzzy_score(
+            to_text_string(current_word), to_text_string(filter_text))
 
-        return to_text_string(filter_text).lower().startswith(
-                to_text_string(current_word).lower())
+    def check_can_complete(self, filter_text, current_word):
+        """Check if current_word matches filter_text."""
+        return self.get_completion_score(filter_text, current_word) is not None
 
     def is_position_correct(self):
         """Check if the position is correct."""
+        return self._is_position_correct(self.completion_position)
 
-        if self.completion_position is None:
+    def _is_position_correct(self, completion_position):
+        """Check if the cursor is in the word at completion_position."""
+        if completion_position is None:
             return False
 
         cursor_position = self.textedit.textCursor().position()
 
         # Can only go forward from the data we have
-        if cursor_position < self.completion_position:
+        if cursor_position < completion_position:
             return False
 
         completion_text = self.textedit.get_current_word_and_position(
             completion=True)
 
-        # If no text found, we must be at self.completion_position
+        # If no text found, we must be at completion_position
         if completion_text is None:
-            if self.completion_position == cursor_position:
+            if completion_position == cursor_position:
                 return True
             else:
                 return False
@@ -472,12 +509,61 @@ def is_position_correct(self):
         completion_text = to_text_string(completion_text)
 
         # The position of text must compatible with completion_position
-        if not text_position <= self.completion_position <= (
+        if not text_position <= completion_position <= (
                 text_position + len(completion_text)):
             return False
 
         return True
 
+    def can_refilter(self):
+        """
+        Check if the last full list of completions can be filtered for the
+        word under the cursor instead of requesting a new one.
+        """
+        results = self._full_results
+        if (
+            results is None
+            or results['incomplete']
+            or self.is_internal_console
+        ):
+            return False
+
+        if not self._is_position_correct(results['position']):
+            self._full_results = None
+            return False
+
+        return True
+
+    def refilter(self):
+        """Show the last full list of completions filtered for current word."""
+        results = self._full_results
+        completions = results['completions']
+        current_word = self.textedit.get_current_word(
+            completion=True, valid_python_variable=False)
+
+        # Don't show the list if the word is already complete
+        matches = [
+            completion for completion in completions
+            if self.check_can_complete(
+                completion.get('filterText') or completion['label'],
+                current_word
+            )
+        ]
+        if (
+            len(matches) == 1
+            and matches[0].get('insertText') == current_word
+            and not matches[0].get('textEdit', {}).get('newText')
+        ):
+            self.hide()
+            return
+
+        self.show_list(
+            completions,
+            results['position'],
+            automatic=True,
+            incomplete=results['incomplete']
+        )
+
     def update_current(self, new=False):
         """
         Update the displayed list.
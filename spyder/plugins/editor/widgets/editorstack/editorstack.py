@@ -342,6 +342,7 @@ def __init__(self, parent, actions, use_switcher=True):
         self.automatic_completion_ms = 300
         self.completions_hint_enabled = True
         self.completions_hint_after_ms = 500
+        self.completions_prefetch_enabled = False
         self.hover_hints_enabled = True
         self.format_on_save = False
         self.code_snippets_enabled = True
@@ -1025,6 +1026,14 @@ def set_completions_hint_enabled(self, state):
             for finfo in self.data:
                 finfo.editor.toggle_completions_hint(state)
 
+    @on_conf_change(option='completions_prefetch')
+    def set_completions_prefetch_enabled(self, state):
+        logger.debug(f"Set completions prefetch to {state}")
+        self.completions_prefetch_enabled = state
+        if self.data:
+            for finfo in self.data:
+                finfo.editor.toggle_completions_prefetch(state)
+
     @on_conf_change(option='completions_hint_after_ms')
     def set_completions_hint_after_ms(self, ms):
         logger.debug(f"Set completions hint after {ms} ms")
@@ -2627,6 +2636,7 @@ def create_new_editor(self, fname, enc, txt, set_current, new=False,
             code_snippets=self.code_snippets_enabled,
             completions_hint=self.completions_hint_enabled,
             completions_hint_after_ms=self.completions_hint_after_ms,
+            completions_prefetch=self.completions_prefetch_enabled,
             hover_hints=self.hover_hints_enabled,
             highlight_current_line=self.highlight_current_line_enabled,
             highlight_current_cell=self.highlight_current_cell_enabled,
@@ -1361,6 +1361,7 @@ def register_editorstack(self, editorstack):
             ('set_completions_hint_enabled',        'completions_hint'),
             ('set_completions_hint_after_ms',
              'completions_hint_after_ms'),
+            ('set_completions_prefetch_enabled',    'completions_prefetch'),
             ('set_highlight_current_line_enabled',  'highlight_current_line'),
             ('set_highlight_current_cell_enabled',  'highlight_current_cell'),
             ('set_occurrence_highlighting_enabled', 'occurrence_highlighting'),  # noqa
@@ -14,7 +14,7 @@
 from spyder.api.translations import _
 from spyder.py3compat import to_text_string
 from spyder.utils.workers import WorkerManager
-from spyder.utils.vcs import get_git_refs
+from spyder.utils.vcs import GIT_STATUS_CACHE
 
 
 class ReadWriteStatus(StatusBarWidget):
@@ -92,7 +92,24 @@ def closeEvent(self, event):
 
     def update_vcs_state(self, idx, fname, fname2):
         """Update vcs status."""
-        self.update_vcs(fname, None)
+        # Saving a file changes the status of its repository
+        GIT_STATUS_CACHE.invalidate(fname)
+        self.update_vcs(fname, None, force=True)
+
+    def invalidate_vcs(self, paths):
+        """
+        Update vcs status after files were changed outside the editor.
+
+        Parameters
+        ----------
+        paths: list
+            Paths of the changed files.
+        """
+        for path in paths:
+            GIT_STATUS_CACHE.invalidate(path)
+
+        if self._last_git_job is not None:
+            self.update_vcs(*self._last_git_job, force=True)
 
     def update_vcs(self, fname, index, force=False):
         """Update vcs status."""
@@ -113,8 +130,8 @@ def update_vcs(self, fname, index, force=False):
             worker.start()
 
     def get_git_refs(self, fname):
-        """Get Git active branch, state, branches (plus tags)."""
-        return get_git_refs(osp.dirname(fname))
+        """Get Git active branch and the status of the repository files."""
+        return GIT_STATUS_CACHE.get_status(osp.dirname(fname))
 
     def process_git_data(self, worker, output, error):
         """Receive data from git and update gui."""
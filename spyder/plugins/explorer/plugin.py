@@ -282,6 +282,7 @@ def on_application_teardown(self):
 
     @on_plugin_teardown(plugin=Plugins.RemoteClient)
     def on_remote_client_teardown(self):
+        self.get_widget().remote_treewidget.stop_watching()
         if len(self._file_managers):
             for file_manager in self._file_managers.values():
                 AsyncDispatcher(
@@ -290,6 +291,7 @@ def on_remote_client_teardown(self):
             self._file_managers = {}
 
     def on_close(self, cancelable=False):
+        self.get_widget().remote_treewidget.stop_watching()
         if len(self._file_managers):
             for file_manager in self._file_managers.values():
                 AsyncDispatcher(
@@ -173,28 +173,35 @@ def set_project_dir(self, project_dir):
 
     def initStyleOption(self, option, index):
         """
-        To change the item icon when expanding a folder.
+        Set the item icon.
+
+        Icons are resolved here instead of in the model's icon provider, so
+        that only the ones of the rows that are painted are computed. This
+        also changes the icon when expanding a folder.
 
         From https://stackoverflow.com/a/48531349/438386
         """
         super().initStyleOption(option, index)
 
-        if isinstance(option, QStyleOptionViewItem):
+        if (
+            isinstance(option, QStyleOptionViewItem)
+            and option.features & QStyleOptionViewItem.HasDecoration
+        ):
             model = index.model()
 
             if isinstance(model, QSortFilterProxyModel):
                 # This is necessary for Projects because it has a proxy model
-                is_dir = model.sourceModel().isDir(model.mapToSource(index))
+                source_model = model.sourceModel()
+                source_index = model.mapToSource(index)
             else:
-                is_dir = model.isDir(index)
+                source_model = model
+                source_index = index
 
-            if is_dir:
+            if source_model.isDir(source_index):
                 # This is necessary because Projects has a root directory and
                 # we want to set a different icon for it.
                 if isinstance(model, QSortFilterProxyModel):
-                    dir_path = model.sourceModel().filePath(
-                        model.mapToSource(index)
-                    )
+                    dir_path = source_model.filePath(source_index)
                 else:
                     dir_path = None
 
@@ -202,6 +209,18 @@ def initStyleOption(self, option, index):
                     option.icon = ima.icon("project_spyder")
                 elif (option.state & QStyle.State_Open):
                     option.icon = ima.icon("DirOpenIcon")
+                else:
+                    option.icon = ima.get_icon_by_extension_or_type(
+                        dir_path or "", scale_factor=1.0, is_dir=True
+                    )
+            else:
+                # Icons are cached by extension, so this doesn't access the
+                # file.
+                option.icon = ima.get_icon_by_extension_or_type(
+                    source_model.fileName(source_index),
+                    scale_factor=1.0,
+                    is_dir=False
+                )
 
 
 # ---- Widgets
@@ -10,6 +10,7 @@
 import os
 from datetime import datetime
 
+import aiohttp
 from qtpy.QtCore import QSortFilterProxyModel, Qt, Signal
 from qtpy.QtGui import QStandardItem, QStandardItemModel
 from qtpy.QtWidgets import QTreeView, QVBoxLayout, QWidget
@@ -21,12 +22,19 @@
 from spyder.plugins.remoteclient.api.modules.base import (
     SpyderRemoteSessionClosed,
 )
-from spyder.plugins.remoteclient.api.modules.file_services import RemoteOSError
+from spyder.plugins.remoteclient.api.modules.file_services import (
+    RemoteFileServicesError,
+    RemoteOSError,
+)
+from spyder.plugins.remoteclient.utils.watcher import RemoteWorkspaceWatcher
 from spyder.utils.icon_manager import ima
 
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of directories listed in the background after showing one.
+MAX_PREFETCHED_DIRS = 10
+
 
 class RemoteQSortFilterProxyModel(QSortFilterProxyModel):
 
@@ -56,6 +64,19 @@ class RemoteExplorer(QWidget, SpyderWidgetMixin):
     sig_dir_opened = Signal(str, str)
     sig_stop_spinner_requested = Signal()
 
+    _sig_listing_updated = Signal(str, str)
+    """
+    This signal is emitted when the cached listing of a directory changed
+    after fetching it again in the background.
+
+    Parameters
+    ----------
+    path: str
+        Path of the directory.
+    server_id: str
+        Id of the server where the directory is.
+    """
+
     def __init__(self, parent=None, class_parent=None, files=None):
         super().__init__(parent=parent, class_parent=parent)
 
@@ -64,7 +85,10 @@ def __init__(self, parent=None, class_parent=None, files=None):
         self.server_id = None
         self.root_prefix = ""
 
+        self.watcher = None
+
         self.background_files_load = set()
+        self.background_listings = set()
         self.extra_files = []
         self.more_files_available = False
 
@@ -97,6 +121,8 @@ def __init__(self, parent=None, class_parent=None, files=None):
         self.view.sortByColumn(0, Qt.AscendingOrder)
         self.view.entered.connect(self._on_entered_item)
 
+        self._sig_listing_updated.connect(self._on_listing_updated)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.addWidget(self.view)
@@ -122,7 +148,7 @@ def on_conf_update(self, option, value):
             if self.filter_on:
                 self.filter_files(value)
         elif option == "show_hidden":
-            self.refresh(force_current=True)
+            self.refresh(force_current=True, revalidate=False)
         elif option == "single_click_to_open":
             self.set_single_click_to_open(value)
 
@@ -151,23 +177,39 @@ def _on_remote_ls(self, future):
         self.set_files(data)
 
     @AsyncDispatcher(loop="explorer")
-    async def _do_remote_ls(self, path, server_id):
+    async def _do_remote_ls(self, path, server_id, revalidate=True):
         if not self.remote_files_manager:
             return
 
-        for task in self.background_files_load:
+        for task in self.background_files_load | self.background_listings:
             task.cancel()
             try:
                 await task
             except asyncio.CancelledError:
                 pass
 
+        # Show cached listings right away. Stale ones, or all of them if
+        # requested, are fetched again in the background and shown again if
+        # they changed.
+        cached = self.remote_files_manager.listing_cache.get(
+            server_id, path
+        )
+        if cached is not None:
+            cached_files, fresh = cached
+            if revalidate or not fresh:
+                self._start_background_listing(
+                    self._revalidate_listing(path, server_id, cached_files)
+                )
+
         self.extra_files = []
         self.more_files_available = False
         files = []
         try:
             init_files_display = self.get_conf("init_files_display")
-            generator = self.remote_files_manager.ls(path)
+            if cached is not None:
+                generator = self._iter_files(cached_files)
+            else:
+                generator = self._ls_and_cache(path, server_id)
             async for file in generator:
                 file_name = os.path.relpath(file["name"], self.root_prefix)
                 file_type = file["type"]
@@ -204,9 +246,88 @@ async def _do_remote_ls(self, path, server_id):
             logger.error(error)
         except SpyderRemoteSessionClosed:
             self.remote_files_manager = None
+        else:
+            self._start_background_listing(
+                self._prefetch_listings(path, server_id, files)
+            )
 
         return files
 
+    async def _iter_files(self, files):
+        for file in files:
+            yield file
+
+    async def _ls_and_cache(self, path, server_id):
+        """
+        List the files in `path`, saving them in the listing cache if the
+        listing is completed.
+        """
+        files = []
+        async for file in self.remote_files_manager.ls(path):
+            files.append(file)
+            yield file
+
+        self.remote_files_manager.listing_cache.set(server_id, path, files)
+
+    def _start_background_listing(self, coroutine):
+        task = asyncio.create_task(coroutine)
+        self.background_listings.add(task)
+        task.add_done_callback(self.background_listings.discard)
+
+    async def _fetch_listing(self, path, server_id):
+        """
+        Fetch and cache the listing of `path` in the background.
+
+        Directories with more files than the ones that can be displayed are
+        not cached because they're too expensive to list in full.
+        """
+        max_files = self.get_conf("max_files_display")
+        files = []
+        async for file in self.remote_files_manager.ls(path):
+            files.append(file)
+            if len(files) > max_files:
+                return None
+
+        self.remote_files_manager.listing_cache.set(server_id, path, files)
+        return files
+
+    async def _revalidate_listing(self, path, server_id, cached_files):
+        """Fetch a cached listing again and show it if it changed."""
+        try:
+            files = await self._fetch_listing(path, server_id)
+        except (RemoteOSError, SpyderRemoteSessionClosed) as error:
+            logger.debug(f"Error revalidating listing of {path}: {error}")
+            return
+
+        if files is not None and files != cached_files:
+            logger.debug(f"Listing of {path} changed")
+            self._sig_listing_updated.emit(path, server_id)
+
+    async def _prefetch_listings(self, path, server_id, files):
+        """List the parent and some child directories of `path`."""
+        cache = self.remote_files_manager.listing_cache
+        directories = [os.path.dirname(path)] + [
+            file["name"] for file in files if file["type"] == "directory"
+        ]
+
+        prefetched = 0
+        for directory in directories:
+            if prefetched == MAX_PREFETCHED_DIRS:
+                break
+            if directory == path or cache.get(server_id, directory):
+                continue
+
+            prefetched += 1
+            try:
+                await self._fetch_listing(directory, server_id)
+            except (RemoteOSError, SpyderRemoteSessionClosed):
+                # Directories that can't be listed are not a problem here
+                continue
+
+    def _on_listing_updated(self, path, server_id):
+        if path == self.root_prefix and server_id == self.server_id:
+            self.refresh(force_current=True, revalidate=False)
+
     async def _get_extra_files(self, generator, already_added):
         self.extra_files = []
         self.more_files_available = False
@@ -271,10 +392,43 @@ def chdir(
             self.server_id = server_id
         if remote_files_manager:
             self.remote_files_manager = remote_files_manager
-        self.refresh(force_current=True)
+        self._watch_directory(directory)
+        self.refresh(force_current=True, revalidate=False)
         if emit:
             self.sig_dir_opened.emit(directory, self.server_id)
 
+    def _watch_directory(self, directory):
+        """Watch the changes in the shown directory to refresh it."""
+        if (
+            self.watcher is not None
+            and self.watcher.files_api is not self.remote_files_manager
+        ):
+            self.stop_watching()
+
+        if not self.remote_files_manager:
+            return
+
+        if self.watcher is None:
+            self.watcher = RemoteWorkspaceWatcher(
+                self.remote_files_manager,
+                recursive=False,
+                parent=self,
+            )
+            self.watcher.sig_files_changed.connect(self._on_files_changed)
+
+        self.watcher.start(directory)
+
+    def stop_watching(self):
+        """Stop watching the shown directory."""
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
+
+    def _on_files_changed(self, changes):
+        # The files API already forgot the listings of the directories where
+        # files changed, so they're listed again.
+        self.refresh(force_current=True, revalidate=False)
+
     def set_files(self, files, reset=True):
         if reset:
             self.model.setRowCount(0)
@@ -360,11 +514,69 @@ def fetch_more_files(self):
         fetch_files_display = self.get_conf("fetch_files_display")
         new_files = self.extra_files[:fetch_files_display]
         del self.extra_files[:fetch_files_display]
-        self.set_files(new_files, reset=False)
+        self._do_update_files_info(self.root_prefix, new_files).connect(
+            self._on_files_info_updated
+        )
         logger.debug(
             f"{len(self.extra_files)} extra files remaining to be shown"
         )
 
+    @AsyncDispatcher(loop="explorer")
+    async def _do_update_files_info(self, path, files):
+        """
+        Get the current info of files listed some time ago.
+
+        That's done with a single request for all of them. Files that were
+        removed since they were listed are dropped.
+        """
+        if not self.remote_files_manager:
+            return path, files
+
+        try:
+            infos = await self.remote_files_manager.info_batch(
+                [file["name"] for file in files]
+            )
+        except RemoteOSError as error:
+            logger.debug(f"Error updating files info in {path}: {error}")
+            return path, files
+        except (aiohttp.ClientResponseError, RemoteFileServicesError) as error:
+            # Servers that don't support batched requests or fail to answer
+            # them are asked for the info of each file instead.
+            logger.debug(
+                f"Error getting the info of several files in {path}, "
+                f"getting it file by file: {error}"
+            )
+            infos = await asyncio.gather(
+                *[
+                    self.remote_files_manager.info(file["name"])
+                    for file in files
+                ],
+                return_exceptions=True,
+            )
+        except SpyderRemoteSessionClosed:
+            self.remote_files_manager = None
+            return path, files
+
+        updated_files = []
+        for file, info in zip(files, infos):
+            if isinstance(info, RemoteOSError):
+                # The file was removed
+                continue
+            elif isinstance(info, BaseException):
+                updated_files.append(file)
+            else:
+                updated_files.append(info)
+
+        return path, updated_files
+
+    @AsyncDispatcher.QtSlot
+    def _on_files_info_updated(self, future):
+        path, files = future.result()
+
+        # Discard files of a directory that is not shown anymore
+        if path == self.root_prefix:
+            self.set_files(files, reset=False)
+
     def set_current_folder(self, folder):
         self.root_prefix = folder
         return self.model.invisibleRootItem()
@@ -395,13 +607,13 @@ def go_to_next_directory(self):
         )
         self.chdir(browsing_history=True)
 
-    def refresh(self, new_path=None, force_current=False):
+    def refresh(self, new_path=None, force_current=False, revalidate=True):
         if force_current:
             if new_path is None:
                 new_path = self.root_prefix
-            self._do_remote_ls(new_path, self.server_id).connect(
-                self._on_remote_ls
-            )
+            self._do_remote_ls(
+                new_path, self.server_id, revalidate=revalidate
+            ).connect(self._on_remote_ls)
 
         self.previous_action.setEnabled(False)
         self.next_action.setEnabled(False)
@@ -432,7 +644,7 @@ def filter_files(self, name_filters=None):
         self.name_filters = []
         if self.filter_on:
             self.name_filters = name_filters
-        self.refresh(force_current=True)
+        self.refresh(force_current=True, revalidate=False)
 
     def change_filter_state(self):
         self.filter_on = not self.filter_on
@@ -15,12 +15,12 @@
 
 # Third-party imports
 from qtpy.QtCore import QFileInfo, Slot
+from qtpy.QtGui import QIcon
 from qtpy.QtWidgets import QFileIconProvider, QMessageBox
 
 # Local imports
 from spyder.api.translations import _
 from spyder.utils import encoding
-from spyder.utils.icon_manager import ima
 
 
 def open_file_in_external_explorer(filename):
@@ -92,7 +92,14 @@ def has_subdirectories(path, include, exclude):
 
 
 class IconProvider(QFileIconProvider):
-    """Project tree widget icon provider"""
+    """
+    Project tree widget icon provider.
+
+    Icons of files and directories are not resolved here because the model
+    asks for them when it loads a directory, even for rows that are never
+    shown. Instead, generic icons are used and DirViewItemDelegate sets the
+    right ones for the rows that are painted.
+    """
 
     @Slot(int)
     @Slot(QFileInfo)
@@ -101,14 +108,5 @@ def icon(self, icontype_or_qfileinfo):
         if isinstance(icontype_or_qfileinfo, QFileIconProvider.IconType):
             return super().icon(icontype_or_qfileinfo)
         else:
-            qfileinfo = icontype_or_qfileinfo
-            fname = osp.normpath(str(qfileinfo.absoluteFilePath()))
-
-            if osp.isfile(fname) or osp.isdir(fname):
-                icon = ima.get_icon_by_extension_or_type(
-                    fname, scale_factor=1.0
-                )
-            else:
-                icon = ima.icon('binary')
-
-            return icon
+            # A null icon makes the model use the generic ones above
+            return QIcon()
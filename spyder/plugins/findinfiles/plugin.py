@@ -7,6 +7,9 @@
 Find in Files Plugin.
 """
 
+# Standard library imports
+import os.path as osp
+
 # Third party imports
 from qtpy.QtCore import Qt
 from qtpy.QtWidgets import QApplication
@@ -16,6 +19,7 @@
 from spyder.api.plugin_registration.decorators import (
     on_plugin_available, on_plugin_teardown)
 from spyder.api.translations import _
+from spyder.plugins.findinfiles.utils.engine import shutdown_executor
 from spyder.plugins.findinfiles.widgets.main_widget import FindInFilesWidget
 from spyder.plugins.mainmenu.api import ApplicationMenus, SearchMenuSections
 from spyder.utils.misc import getcwd_or_home
@@ -37,8 +41,10 @@ class FindInFiles(SpyderDockablePlugin):
     REQUIRES = []
     OPTIONAL = [
         Plugins.Editor,
+        Plugins.Explorer,
         Plugins.Projects,
         Plugins.MainMenu,
+        Plugins.RemoteClient,
         Plugins.WorkingDirectory,
     ]
     TABIFY = [Plugins.VariableExplorer]
@@ -82,11 +88,18 @@ def on_editor_available(self):
         editor.sig_file_opened_closed_or_updated.connect(
             self.set_current_opened_file)
 
+    @on_plugin_available(plugin=Plugins.Explorer)
+    def on_explorer_available(self):
+        explorer = self.get_plugin(Plugins.Explorer)
+        explorer.sig_dir_opened.connect(self._set_remote_directory)
+
     @on_plugin_available(plugin=Plugins.Projects)
     def on_projects_available(self):
+        widget = self.get_widget()
         projects = self.get_plugin(Plugins.Projects)
         projects.sig_project_loaded.connect(self.set_project_path)
         projects.sig_project_closed.connect(self.unset_project_path)
+        projects.sig_files_changed.connect(widget.project_files_changed)
 
     @on_plugin_available(plugin=Plugins.MainMenu)
     def on_main_menu_available(self):
@@ -114,11 +127,23 @@ def on_editor_teardown(self):
         editor.sig_file_opened_closed_or_updated.disconnect(
             self.set_current_opened_file)
 
+    @on_plugin_teardown(plugin=Plugins.Explorer)
+    def on_explorer_teardown(self):
+        explorer = self.get_plugin(Plugins.Explorer)
+        explorer.sig_dir_opened.disconnect(self._set_remote_directory)
+        self.get_widget().unset_remote_path()
+
+    @on_plugin_teardown(plugin=Plugins.RemoteClient)
+    def on_remote_client_teardown(self):
+        self.get_widget().unset_remote_path()
+
     @on_plugin_teardown(plugin=Plugins.Projects)
     def on_projects_teardon_plugin_teardown(self):
+        widget = self.get_widget()
         projects = self.get_plugin(Plugins.Projects)
         projects.sig_project_loaded.disconnect(self.set_project_path)
         projects.sig_project_closed.disconnect(self.unset_project_path)
+        projects.sig_files_changed.disconnect(widget.project_files_changed)
 
     @on_plugin_teardown(plugin=Plugins.MainMenu)
     def on_main_menu_teardown(self):
@@ -140,6 +165,9 @@ def on_close(self, cancelable=False):
         self.get_widget()._update_options()
         if self.get_widget().running:
             self.get_widget()._stop_and_reset_thread(ignore_results=True)
+        self.get_widget().stop_replace()
+        self.get_widget().close_project_index()
+        shutdown_executor()
         return True
 
     # --- Public API
@@ -215,6 +243,43 @@ def find(self):
 
         widget.find()
 
+    # --- Private API
+    # ------------------------------------------------------------------------
+    def _get_open_editors(self):
+        """
+        Get the code editors of the files open in the Editor.
+
+        Returns
+        -------
+        dict
+            Dictionary that maps normalized file paths to their code editor.
+        """
+        editor = self.get_plugin(Plugins.Editor, error=False)
+        if editor is None:
+            return {}
+
+        editors = {}
+        for filename in editor.get_filenames():
+            codeeditor = editor.get_codeeditor_for_filename(filename)
+            if codeeditor is not None:
+                editors[osp.normpath(filename)] = codeeditor
+
+        return editors
+
+    def _set_remote_directory(self, directory, server_id):
+        """Set a directory opened in the remote explorer as search path."""
+        # Local directories are followed through the working directory
+        if not server_id:
+            return
+
+        remoteclient = self.get_plugin(Plugins.RemoteClient, error=False)
+        if remoteclient is None:
+            return
+
+        self.get_widget().set_remote_path(
+            directory, server_id, remoteclient.get_file_api(server_id)
+        )
+
 
 def test():
     import sys
@@ -0,0 +1,515 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Search engines for Find in files.
+
+Engines look for the search texts in a sequence of files and return their
+matches in batches. `SearchEngine` scans files in the current thread and
+`ProcessPoolSearchEngine` distributes them in chunks among a pool of worker
+processes, so that large trees are searched using all available cores.
+
+Note: This module is imported by the worker processes, so it must not import
+Qt or any other heavy module.
+"""
+
+# Standard library imports
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+import itertools
+import logging
+import mmap
+import multiprocessing
+import os
+import re
+import threading
+
+# Local imports
+from spyder.utils.encoding import is_text_file
+
+
+logger = logging.getLogger(__name__)
+
+
+# ---- Constants
+# ----------------------------------------------------------------------------
+# Files bigger than this (in bytes) are memory mapped instead of read.
+MMAP_THRESHOLD = 1024 ** 2
+
+# Number of files sent to a worker process at once.
+CHUNK_SIZE = 32
+
+# Searches with less files than this are done in the current process because
+# it's faster than sending them to the pool.
+MIN_POOL_FILES = 2 * CHUNK_SIZE
+
+# Time (in seconds) to wait for results before checking if the search was
+# stopped.
+STOP_CHECK_INTERVAL = 0.1
+
+# Regexp anchors that only match at the start or end of the searched text.
+# These can't be used to look for candidate lines in whole files.
+TEXT_ANCHORS_REGEXP = re.compile(rb'\\[AZ]')
+
+# Pattern that matches at the start of all lines.
+ALL_LINES_REGEXP = re.compile(b'^', re.MULTILINE)
+
+
+# ---- Search functions
+# ----------------------------------------------------------------------------
+def search_line(line, search_text, texts, text_re):
+    """
+    Search `texts` in a single line.
+
+    Parameters
+    ----------
+    line: bytes
+        Line contents.
+    search_text: bytes
+        Line where the search is performed. It's different from `line` for
+        case insensitive searches.
+    texts: list
+        List of (text, encoding) tuples, where text is a compiled regexp if
+        `text_re` is True or a bytes string otherwise.
+    text_re: bool
+        Whether `texts` are regular expressions.
+
+    Returns
+    -------
+    list
+        List of (start, end, line) tuples, where start and end are the
+        character positions of the match and line the decoded line.
+    """
+    # Use the first text found in the line
+    for text, enc in texts:
+        if text_re:
+            found = text.search(search_text) is not None
+        else:
+            found = search_text.find(text) > -1
+        if found:
+            break
+    else:
+        return []
+
+    try:
+        line_dec = line.decode(enc)
+    except UnicodeDecodeError:
+        line_dec = line
+
+    results = []
+    if text_re:
+        for match in text.finditer(search_text):
+            bstart, bend = match.start(), match.end()
+            try:
+                # Go from binary position to utf8 position
+                start = len(search_text[:bstart].decode(enc))
+                end = start + len(search_text[bstart:bend].decode(enc))
+            except UnicodeDecodeError:
+                start = bstart
+                end = bend
+            results.append((start, end, line_dec))
+    else:
+        found = search_text.find(text)
+        while found > -1:
+            try:
+                # Go from binary position to utf8 position
+                start = len(search_text[:found].decode(enc))
+                end = start + len(text.decode(enc))
+            except UnicodeDecodeError:
+                start = found
+                end = found + len(text)
+            results.append((start, end, line_dec))
+
+            for text, enc in texts:
+                found = search_text.find(text, found + 1)
+                if found > -1:
+                    break
+
+    return results
+
+
+def get_prefilter_texts(texts, text_re):
+    """
+    Get the texts used to look for candidate lines in whole files.
+
+    Regular expressions are compiled in multiline mode so that line anchors
+    keep their meaning. The ones using text anchors are replaced by a pattern
+    that matches all lines, so they are checked line by line instead.
+    """
+    if not text_re:
+        return [text for text, __ in texts]
+
+    prefilter = []
+    for text, __ in texts:
+        if TEXT_ANCHORS_REGEXP.search(text.pattern):
+            prefilter.append(ALL_LINES_REGEXP)
+        else:
+            prefilter.append(
+                re.compile(text.pattern, text.flags | re.MULTILINE)
+            )
+
+    return prefilter
+
+
+def search_data(data, texts, text_re, case_sensitive, prefilter=None):
+    """
+    Search `texts` in the contents of a file.
+
+    The whole file is searched at once to find candidate lines, which is much
+    faster than searching every line when only a few of them have matches.
+    Candidate lines are then searched with `search_line`, which gives the
+    same results as searching the file line by line.
+
+    Parameters
+    ----------
+    data: bytes or mmap.mmap
+        File contents.
+    texts: list
+        List of (text, encoding) tuples. See `search_line`.
+    text_re: bool
+        Whether `texts` are regular expressions.
+    case_sensitive: bool
+        Whether the search is case sensitive. If not, `texts` need to be in
+        lower case.
+    prefilter: list, optional
+        Output of `get_prefilter_texts` for `texts`. It's computed if not
+        given.
+
+    Returns
+    -------
+    list
+        List of (lineno, start, end, line) tuples, with one-based line
+        numbers.
+    """
+    if prefilter is None:
+        prefilter = get_prefilter_texts(texts, text_re)
+
+    search_text = data if case_sensitive else data.lower()
+    size = len(search_text)
+    matches = []
+
+    pos = 0
+    lineno = 0
+    counted = 0
+    while pos < size:
+        # Find the first possible match after pos
+        positions = []
+        for text in prefilter:
+            if text_re:
+                match = text.search(search_text, pos)
+                found = match.start() if match is not None else -1
+            else:
+                found = search_text.find(text, pos)
+            if found > -1:
+                positions.append(found)
+
+        if not positions:
+            break
+
+        found = min(positions)
+        if found >= size:
+            break
+
+        # Get the line that contains it. Note that pos is always at the
+        # start of a line.
+        newline = search_text.rfind(b'\n', pos, found)
+        line_start = pos if newline == -1 else newline + 1
+        line_end = search_text.find(b'\n', found)
+        line_end = size if line_end == -1 else line_end + 1
+
+        lineno += search_text[counted:line_start].count(b'\n')
+        counted = line_start
+
+        for start, end, line in search_line(
+            data[line_start:line_end],
+            search_text[line_start:line_end],
+            texts,
+            text_re
+        ):
+            matches.append((lineno + 1, start, end, line))
+
+        pos = line_end
+
+    return matches
+
+
+def search_file(filename, texts, text_re, case_sensitive, check_text=False,
+                prefilter=None):
+    """
+    Search `texts` in `filename`.
+
+    Parameters
+    ----------
+    filename: str
+        Path of the file to search.
+    texts, text_re, case_sensitive, prefilter:
+        See `search_data`.
+    check_text: bool, optional
+        Check that the file is a text one before searching it.
+
+    Returns
+    -------
+    tuple
+        (matches, error) tuple, where matches is the output of `search_data`
+        (or None if `check_text` is True and the file is not a text one) and
+        error is True if the file couldn't be read.
+    """
+    try:
+        if check_text and not is_text_file(filename):
+            return None, False
+
+        with open(filename, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return [], False
+
+            # Case insensitive searches need a lowered copy of the file
+            # anyway, so mapping it is pointless.
+            if size >= MMAP_THRESHOLD and case_sensitive:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    matches = search_data(data, texts, text_re,
+                                          case_sensitive, prefilter)
+            else:
+                matches = search_data(f.read(), texts, text_re,
+                                      case_sensitive, prefilter)
+    except (OSError, ValueError):
+        return [], True
+
+    return matches, False
+
+
+def search_files(files, texts, text_re, case_sensitive):
+    """
+    Search `texts` in several files.
+
+    This is the function run by the worker processes.
+
+    Parameters
+    ----------
+    files: list
+        List of (filename, check_text) tuples.
+    texts, text_re, case_sensitive:
+        See `search_data`.
+
+    Returns
+    -------
+    list
+        List of (filename, matches, error) tuples. See `search_file`. They
+        are only returned for files with matches or errors, and for files
+        whose type was checked so that callers can remember it.
+    """
+    prefilter = get_prefilter_texts(texts, text_re)
+    results = []
+    for filename, check_text in files:
+        matches, error = search_file(filename, texts, text_re,
+                                     case_sensitive, check_text, prefilter)
+        if matches or error or check_text:
+            results.append((filename, matches, error))
+    return results
+
+
+# ---- Process pool
+# ----------------------------------------------------------------------------
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_default_workers():
+    """Get the default number of worker processes."""
+    return max((os.cpu_count() or 1) - 1, 1)
+
+
+def get_executor(max_workers=None):
+    """
+    Get the process pool shared by all searches.
+
+    The pool is created on first use and kept alive afterwards, so that the
+    cost of starting processes is only paid once per session.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # Forking a process with running Qt threads is unsafe, so we
+            # always spawn workers.
+            _executor = ProcessPoolExecutor(
+                max_workers=max_workers or get_default_workers(),
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return _executor
+
+
+def shutdown_executor():
+    """Shut down the shared process pool, if it was created."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            logger.debug("Shutting down Find in files process pool")
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+# ---- Engines
+# ----------------------------------------------------------------------------
+class SearchEngine:
+    """
+    Search engine that scans files in the current thread.
+
+    Other engines need to reimplement `search`, which receives files as they
+    are found and yields their matches in batches.
+    """
+
+    def __init__(self, texts, text_re, case_sensitive):
+        """
+        Parameters
+        ----------
+        texts: list
+            List of (text, encoding) tuples. See `search_line`.
+        text_re: bool
+            Whether `texts` are regular expressions.
+        case_sensitive: bool
+            Whether the search is case sensitive.
+        """
+        self.texts = texts
+        self.text_re = text_re
+        self.case_sensitive = case_sensitive
+        self._stop_event = threading.Event()
+
+    @property
+    def stopped(self):
+        """Whether the search was stopped."""
+        return self._stop_event.is_set()
+
+    def stop(self):
+        """Stop the search as soon as possible."""
+        self._stop_event.set()
+
+    def search(self, files):
+        """
+        Search in `files`.
+
+        Parameters
+        ----------
+        files: iterable
+            Iterable of (filename, check_text) tuples, where check_text tells
+            if the file needs to be checked to be a text one before searching
+            it.
+
+        Yields
+        ------
+        list
+            List of (filename, matches, error) tuples. See `search_files`.
+        """
+        prefilter = get_prefilter_texts(self.texts, self.text_re)
+        for filename, check_text in files:
+            if self.stopped:
+                return
+
+            matches, error = search_file(filename, self.texts, self.text_re,
+                                         self.case_sensitive, check_text,
+                                         prefilter)
+            if matches or error or check_text:
+                yield [(filename, matches, error)]
+
+    def search_buffer(self, filename, text):
+        """
+        Search in the contents of a file that are not saved to disk.
+
+        Parameters
+        ----------
+        filename: str
+            Path of the file.
+        text: str
+            Contents of the file.
+
+        Returns
+        -------
+        list
+            List of (filename, matches, error) tuples. See `search_files`.
+        """
+        if self.stopped:
+            return []
+
+        # All texts are encodings of the same search text, so the first one
+        # is enough.
+        enc = self.texts[0][1]
+        data = text.encode(enc, errors='replace')
+        matches = search_data(data, self.texts, self.text_re,
+                              self.case_sensitive)
+        return [(filename, matches, False)] if matches else []
+
+
+class ProcessPoolSearchEngine(SearchEngine):
+    """
+    Search engine that scans files in chunks using a pool of processes.
+    """
+
+    def __init__(self, texts, text_re, case_sensitive, max_workers=None,
+                 chunk_size=CHUNK_SIZE):
+        super().__init__(texts, text_re, case_sensitive)
+        self.max_workers = max_workers or get_default_workers()
+        self.chunk_size = chunk_size
+
+    def search(self, files):
+        files = iter(files)
+
+        # Starting the pool is not worth it for a few files
+        first_files = list(itertools.islice(files, MIN_POOL_FILES))
+        if len(first_files) < MIN_POOL_FILES:
+            yield from super().search(first_files)
+            return
+
+        files = itertools.chain(first_files, files)
+        executor = get_executor(self.max_workers)
+        pending = set()
+        exhausted = False
+
+        try:
+            while True:
+                # Keep all workers busy while new files are found
+                while not exhausted and len(pending) < 2 * self.max_workers:
+                    chunk = list(itertools.islice(files, self.chunk_size))
+                    if not chunk:
+                        exhausted = True
+                        break
+
+                    pending.add(
+                        executor.submit(
+                            search_files,
+                            chunk,
+                            self.texts,
+                            self.text_re,
+                            self.case_sensitive
+                        )
+                    )
+
+                    if self.stopped:
+                        return
+
+                if not pending:
+                    break
+
+                done, pending = wait(
+                    pending,
+                    timeout=STOP_CHECK_INTERVAL,
+                    return_when=FIRST_COMPLETED
+                )
+
+                if self.stopped:
+                    return
+
+                for future in done:
+                    results = future.result()
+                    if results:
+                        yield results
+        except BrokenProcessPool:
+            # A worker died, so a new pool is needed for the next search
+            shutdown_executor()
+            raise
+        finally:
+            # Chunks that were not started yet are cancelled and the ones
+            # running are short enough to let them finish.
+            for future in pending:
+                future.cancel()
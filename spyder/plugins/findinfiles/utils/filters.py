@@ -0,0 +1,364 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Filters to decide which files are searched by Find in files.
+
+`IgnoreMatcher` follows the rules of the `.gitignore` and `.ignore` files
+found in the searched directories (and in their parents, up to the root of
+the Git repository they belong to), so that build outputs, virtual
+environments and other ignored directories are pruned while walking the
+tree. `TextFileCache` remembers which files are text ones, so that files
+with unknown extensions are only read to detect their type once.
+"""
+
+# Standard library imports
+from collections import OrderedDict
+import logging
+import os
+import os.path as osp
+import re
+
+
+logger = logging.getLogger(__name__)
+
+
+# ---- Constants
+# ----------------------------------------------------------------------------
+# Files with ignore rules, in order of precedence.
+IGNORE_FILES = ['.gitignore', '.ignore']
+
+# Maximum number of entries kept by TextFileCache.
+TEXT_FILE_CACHE_SIZE = 100000
+
+
+# ---- Ignore files
+# ----------------------------------------------------------------------------
+def translate_pattern(pattern):
+    """
+    Translate a gitignore pattern to a regular expression.
+
+    The expression matches paths relative to the directory of the ignore
+    file, with `/` as separator.
+    """
+    # Patterns with a slash at the beginning or in the middle are relative
+    # to the ignore file directory. Other ones match at any level.
+    anchored = '/' in pattern.rstrip('/')
+    pattern = pattern.strip('/')
+
+    regexp = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        char = pattern[i]
+        if char == '*' and pattern[i:i + 2] == '**':
+            if i + 2 == n:
+                # Everything inside
+                regexp.append('.*')
+                i += 2
+            elif pattern[i + 2] == '/' and (i == 0 or pattern[i - 1] == '/'):
+                # Zero or more directories
+                regexp.append('(?:.*/)?')
+                i += 3
+            else:
+                regexp.append('[^/]*')
+                i += 2
+        elif char == '*':
+            regexp.append('[^/]*')
+            i += 1
+        elif char == '?':
+            regexp.append('[^/]')
+            i += 1
+        elif char == '[':
+            end = pattern.find(']', i + 2)
+            if end == -1:
+                regexp.append(re.escape(char))
+                i += 1
+            else:
+                chars = pattern[i + 1:end].replace('\\', '\\\\')
+                if chars[0] in '!^':
+                    chars = '^' + chars[1:]
+                regexp.append('[{}]'.format(chars))
+                i = end + 1
+        elif char == '\\' and i + 1 < n:
+            regexp.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            regexp.append(re.escape(char))
+            i += 1
+
+    regexp = ''.join(regexp)
+    if not anchored:
+        regexp = '(?:.*/)?' + regexp
+
+    return regexp + r'\Z'
+
+
+class IgnoreRules:
+    """Rules of a single ignore file."""
+
+    def __init__(self, base_path, lines):
+        """
+        Parameters
+        ----------
+        base_path: str
+            Directory of the ignore file. Rules are relative to it.
+        lines: list of str
+            Lines of the ignore file.
+        """
+        self.base_path = base_path
+        self._prefix_length = len(osp.join(base_path, ''))
+
+        # List of (regexp, negated, dir_only) tuples
+        self.rules = []
+        for line in lines:
+            rule = self._parse_line(line)
+            if rule is not None:
+                self.rules.append(rule)
+
+        # Without negations the result doesn't depend on the order of the
+        # rules, so they can be checked at once.
+        self._has_negations = any([negated for __, negated, __ in self.rules])
+        self._dirs_regexp = self._combine(self.rules)
+        self._files_regexp = self._combine(
+            [rule for rule in self.rules if not rule[2]]
+        )
+
+    def __bool__(self):
+        return bool(self.rules)
+
+    @classmethod
+    def from_file(cls, filename, base_path=None):
+        """
+        Read the rules in `filename`.
+
+        Rules are relative to `base_path`, which is the directory of
+        `filename` by default.
+        """
+        try:
+            with open(filename, 'r', encoding='utf-8',
+                      errors='replace') as f:
+                lines = f.read().splitlines()
+        except OSError:
+            lines = []
+
+        if base_path is None:
+            base_path = osp.dirname(filename)
+
+        return cls(base_path, lines)
+
+    def _parse_line(self, line):
+        """Get the (regexp, negated, dir_only) rule of `line`, if any."""
+        # Trailing spaces are ignored unless they are escaped
+        if not line.endswith('\\ '):
+            line = line.rstrip(' ')
+        if not line or line.startswith('#'):
+            return None
+
+        negated = line.startswith('!')
+        if negated:
+            line = line[1:]
+        elif line.startswith(('\\!', '\\#')):
+            line = line[1:]
+
+        dir_only = line.endswith('/')
+        if not line.strip('/'):
+            return None
+
+        try:
+            regexp = re.compile(translate_pattern(line))
+        except re.error:
+            logger.debug("Invalid ignore pattern {}".format(line))
+            return None
+
+        return regexp, negated, dir_only
+
+    def _combine(self, rules):
+        if not rules or self._has_negations:
+            return None
+        return re.compile(
+            '|'.join(['(?:{})'.format(regexp.pattern)
+                      for regexp, __, __ in rules])
+        )
+
+    def match(self, path, is_dir):
+        """
+        Check if `path` is ignored by these rules.
+
+        Returns
+        -------
+        bool or None
+            True if it's ignored, False if it's explicitly included by a
+            negated rule and None if no rule applies to it.
+        """
+        relpath = path[self._prefix_length:]
+        if os.sep != '/':
+            relpath = relpath.replace(os.sep, '/')
+
+        if not self._has_negations:
+            regexp = self._dirs_regexp if is_dir else self._files_regexp
+            if regexp is not None and regexp.match(relpath):
+                return True
+            return None
+
+        # The last rule that matches takes precedence
+        for regexp, negated, dir_only in reversed(self.rules):
+            if dir_only and not is_dir:
+                continue
+            if regexp.match(relpath):
+                return not negated
+
+        return None
+
+
+class IgnoreMatcher:
+    """
+    Rules that apply to the contents of a directory.
+
+    Matchers are immutable. Use `for_directory` to get the matcher of a
+    subdirectory.
+    """
+
+    def __init__(self, rules=()):
+        """
+        Parameters
+        ----------
+        rules: tuple of IgnoreRules
+            Rules from the outermost to the innermost directory.
+        """
+        self.rules = rules
+
+    def __bool__(self):
+        return bool(self.rules)
+
+    @classmethod
+    def for_parents(cls, path):
+        """
+        Get the matcher with the rules of the parent directories of `path`.
+
+        Only the parents that are part of the same Git repository as `path`
+        are taken into account, as Git does.
+        """
+        path = osp.abspath(path)
+
+        # Look for the repository root
+        parents = []
+        current = path
+        root = None
+        while True:
+            if osp.exists(osp.join(current, '.git')):
+                root = current
+                break
+            parent = osp.dirname(current)
+            if parent == current:
+                break
+            current = parent
+            parents.append(current)
+
+        matcher = cls()
+        if root is None:
+            return matcher
+
+        exclude = IgnoreRules.from_file(
+            osp.join(root, '.git', 'info', 'exclude'), base_path=root)
+        if exclude:
+            matcher = cls((exclude,))
+
+        for parent in reversed(parents):
+            matcher = matcher.for_directory(parent)
+
+        return matcher
+
+    def for_directory(self, dirpath, names=None):
+        """
+        Get the matcher for the contents of `dirpath`.
+
+        Parameters
+        ----------
+        dirpath: str
+            Path of a directory.
+        names: set of str, optional
+            Names of the entries in `dirpath`. They're used to avoid checking
+            if ignore files exist.
+        """
+        rules = self.rules
+        for name in IGNORE_FILES:
+            if names is not None and name not in names:
+                continue
+
+            filename = osp.join(dirpath, name)
+            if names is None and not osp.isfile(filename):
+                continue
+
+            new_rules = IgnoreRules.from_file(filename)
+            if new_rules:
+                rules = rules + (new_rules,)
+
+        if rules is self.rules:
+            return self
+        return IgnoreMatcher(rules)
+
+    def is_ignored(self, path, is_dir):
+        """Check if `path` is ignored."""
+        # Rules of inner directories take precedence
+        for rules in reversed(self.rules):
+            result = rules.match(path, is_dir)
+            if result is not None:
+                return result
+        return False
+
+
+# ---- File types
+# ----------------------------------------------------------------------------
+class TextFileCache:
+    """
+    Cache of the files detected to be text or binary ones.
+
+    Entries are keyed by inode, modification time and size, so they remain
+    valid across searches until files change, even if they're renamed.
+    """
+
+    def __init__(self, maxsize=TEXT_FILE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def get_key(entry):
+        """
+        Get the key of a file.
+
+        Parameters
+        ----------
+        entry: os.DirEntry
+            Entry of the file.
+        """
+        stat = entry.stat()
+        return (entry.inode(), stat.st_mtime_ns, stat.st_size)
+
+    def get(self, key):
+        """
+        Check if the file with `key` is a text one.
+
+        Returns
+        -------
+        bool or None
+            None if the file type is not known.
+        """
+        return self._entries.get(key)
+
+    def set(self, key, is_text):
+        """Save if the file with `key` is a text one."""
+        self._entries[key] = is_text
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries."""
+        self._entries.clear()
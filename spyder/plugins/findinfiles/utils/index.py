@@ -0,0 +1,543 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Trigram index to speed up Find in files searches in projects.
+
+For every indexed file we store a signature, which is a bitmap with one bit
+set per trigram (sequence of three bytes) found in the file, in lower case.
+A file can only contain a text if its signature has the bits of all the
+trigrams of that text, so searches only need to check the files that pass
+that test. Signatures can give false positives but never false negatives,
+which is fine because matches are always verified by the search engine.
+
+Note: This module is imported by the Find in files worker processes, so it
+must not import Qt or any other heavy module.
+"""
+
+# Standard library imports
+import hashlib
+import json
+import logging
+import os
+import os.path as osp
+import threading
+
+try:
+    # Python 3.11+
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_constants
+    import sre_parse
+
+# Local imports
+from spyder.config.base import get_conf_path
+from spyder.config.utils import EDIT_EXTENSIONS
+from spyder.plugins.findinfiles.utils.engine import (
+    MIN_POOL_FILES, get_executor)
+
+
+logger = logging.getLogger(__name__)
+
+
+# ---- Constants
+# ----------------------------------------------------------------------------
+# Bump this when the format of the saved index changes.
+INDEX_VERSION = 2
+
+# Files bigger than this (in bytes) are not indexed and always searched.
+MAX_INDEXED_SIZE = 1024 ** 2
+
+# Minimum and maximum number of bits of the signatures, as powers of two.
+# Signatures are sized according to the number of trigrams in each file to
+# keep false positives low.
+MIN_SIGNATURE_BITS = 9
+MAX_SIGNATURE_BITS = 16
+
+# Number of files whose signatures are computed by each worker process.
+INDEX_CHUNK_SIZE = 64
+
+
+# ---- Signatures
+# ----------------------------------------------------------------------------
+def get_trigrams(data):
+    """Get the set of trigrams in `data`, in lower case."""
+    data = data.lower()
+    return {data[i:i + 3] for i in range(len(data) - 2)}
+
+
+def get_trigram_bit(trigram, bits):
+    """Get the bit that corresponds to `trigram` in a signature of `bits`."""
+    value = int.from_bytes(trigram, 'little')
+    return ((value * 0x9E3779B1) & 0xFFFFFFFF) >> (32 - bits)
+
+
+def get_signature(trigrams):
+    """
+    Get the signature of a set of trigrams.
+
+    Returns
+    -------
+    tuple
+        (bits, signature) tuple, where signature is an int with `2**bits`
+        bits.
+    """
+    bits = MIN_SIGNATURE_BITS
+    while (1 << bits) < 4 * len(trigrams) and bits < MAX_SIGNATURE_BITS:
+        bits += 1
+
+    bitmap = bytearray(1 << (bits - 3))
+    for trigram in trigrams:
+        bit = get_trigram_bit(trigram, bits)
+        bitmap[bit >> 3] |= 1 << (bit & 7)
+
+    return bits, int.from_bytes(bitmap, 'little')
+
+
+def get_file_signature(filename):
+    """
+    Get the signature of `filename`.
+
+    Returns
+    -------
+    tuple or None
+        (mtime, size, bits, signature) tuple or None if the file can't be
+        indexed.
+    """
+    try:
+        stat = os.stat(filename)
+        if stat.st_size > MAX_INDEXED_SIZE:
+            return None
+
+        with open(filename, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    # Binary files are not indexed
+    if b'\0' in data:
+        return None
+
+    return (stat.st_mtime, stat.st_size) + get_signature(get_trigrams(data))
+
+
+def get_file_signatures(filenames):
+    """
+    Get the signatures of several files.
+
+    This is the function run by the worker processes.
+    """
+    return [(filename, get_file_signature(filename))
+            for filename in filenames]
+
+
+# ---- Queries
+# ----------------------------------------------------------------------------
+def get_regexp_literals(pattern):
+    """
+    Get literal strings that must be present in all matches of `pattern`.
+
+    Parameters
+    ----------
+    pattern: bytes
+        Regular expression.
+
+    Returns
+    -------
+    list of bytes
+        Literals required by the pattern. Only sequences of at least three
+        characters are returned because shorter ones have no trigrams.
+    """
+    literals = []
+
+    def flush(run):
+        if len(run) >= 3:
+            literals.append(bytes(run))
+        run.clear()
+
+    def visit(parsed):
+        run = []
+        for op, av in parsed:
+            if op == sre_constants.LITERAL:
+                run.append(av)
+            elif op == sre_constants.AT:
+                # Anchors don't consume characters
+                continue
+            elif op == sre_constants.SUBPATTERN:
+                flush(run)
+                visit(av[-1])
+            elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+                flush(run)
+                min_repeat, __, subpattern = av
+                if min_repeat >= 1:
+                    visit(subpattern)
+            else:
+                flush(run)
+        flush(run)
+
+    try:
+        visit(sre_parse.parse(pattern))
+    except Exception:
+        return []
+
+    return literals
+
+
+def get_query_trigrams(texts, text_re):
+    """
+    Get the trigrams that files need to contain to match each text.
+
+    Parameters
+    ----------
+    texts: list
+        List of (text, encoding) tuples, as passed to `SearchThread`.
+    text_re: bool
+        Whether `texts` are regular expressions.
+
+    Returns
+    -------
+    list or None
+        List with a set of trigrams per text, or None if any of the texts
+        can't be used to narrow down the files to search.
+    """
+    query = []
+    for text, __ in texts:
+        if text_re:
+            literals = get_regexp_literals(text.pattern)
+        else:
+            literals = [text] if len(text) >= 3 else []
+
+        if not literals:
+            return None
+
+        trigrams = set()
+        for literal in literals:
+            trigrams |= get_trigrams(literal)
+        query.append(trigrams)
+
+    return query
+
+
+# ---- Index
+# ----------------------------------------------------------------------------
+class TrigramIndex:
+    """
+    Trigram index of the text files in a project.
+
+    Only files with editable extensions outside hidden directories are
+    indexed, which are the ones reported by the Projects workspace watcher.
+    Files not in the index are always searched.
+    """
+
+    def __init__(self, root_path, index_path=None):
+        """
+        Parameters
+        ----------
+        root_path: str
+            Path of the project.
+        index_path: str, optional
+            File where the index is saved. By default, it's saved in
+            Spyder's config directory, in a file named after a hash of
+            `root_path`. It's never saved inside the project because
+            projects can come from untrusted sources.
+        """
+        self.root_path = osp.normpath(root_path)
+        if index_path is None:
+            digest = hashlib.sha1(self.root_path.encode('utf-8')).hexdigest()
+            index_path = osp.join(
+                get_conf_path('findinfiles_index'), digest + '.json'
+            )
+        self.index_path = index_path
+
+        # Filename -> (mtime, size, bits, signature)
+        self._files = {}
+
+        # Files changed since they were last indexed
+        self._dirty = set()
+
+        # Whether the index was checked against the files on disk
+        self.ready = False
+
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._files)
+
+    def __contains__(self, filename):
+        return filename in self._files
+
+    def is_current(self, filename, stat):
+        """
+        Check if `filename` is indexed and didn't change since then.
+
+        Parameters
+        ----------
+        filename: str
+            Normalized path of the file.
+        stat: os.stat_result
+            Current status of the file.
+        """
+        entry = self._files.get(filename)
+        return (
+            entry is not None
+            and entry[:2] == (stat.st_mtime, stat.st_size)
+        )
+
+    # ---- Persistence
+    # ------------------------------------------------------------------------
+    def load(self):
+        """Load the index saved in `index_path`, if any."""
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                data = json.load(f)
+
+            if (
+                data.get('version') != INDEX_VERSION
+                or data.get('root_path') != self.root_path
+            ):
+                return False
+
+            # Signatures are saved as hex strings because they're too big
+            # to be converted to decimal ones.
+            files = {
+                osp.join(self.root_path, relpath): (
+                    mtime, size, bits, int(signature, 16)
+                )
+                for relpath, (mtime, size, bits, signature)
+                in data['files'].items()
+            }
+        except Exception:
+            return False
+
+        with self._lock:
+            self._files = files
+        return True
+
+    def save(self):
+        """Save the index to `index_path`."""
+        with self._lock:
+            files = {
+                osp.relpath(filename, self.root_path): (
+                    mtime, size, bits, format(signature, 'x')
+                )
+                for filename, (mtime, size, bits, signature)
+                in self._files.items()
+            }
+
+        data = {
+            'version': INDEX_VERSION,
+            'root_path': self.root_path,
+            'files': files,
+        }
+
+        try:
+            os.makedirs(osp.dirname(self.index_path), exist_ok=True)
+            temp_path = self.index_path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.index_path)
+        except OSError:
+            logger.debug("Could not save Find in files index for "
+                         "{}".format(self.root_path), exc_info=True)
+            return False
+
+        return True
+
+    # ---- Updates
+    # ------------------------------------------------------------------------
+    def is_indexable(self, filename):
+        """Check if `filename` should be part of the index."""
+        relpath = osp.relpath(filename, self.root_path)
+        if relpath.startswith(osp.pardir):
+            return False
+
+        parts = relpath.split(os.sep)
+        if any([part.startswith('.') for part in parts[:-1]]):
+            return False
+
+        return osp.splitext(filename)[1] in EDIT_EXTENSIONS
+
+    def iter_indexable_files(self):
+        """Generate the files in the project that should be indexed."""
+        dirs = [self.root_path]
+        while dirs:
+            dirpath = dirs.pop()
+            try:
+                entries = list(os.scandir(dirpath))
+            except OSError:
+                continue
+
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith('.'):
+                            dirs.append(entry.path)
+                    elif (
+                        osp.splitext(entry.name)[1] in EDIT_EXTENSIONS
+                        and entry.is_file()
+                    ):
+                        yield entry.path, entry.stat()
+                except OSError:
+                    continue
+
+    def update(self):
+        """
+        Bring the index up to date with the files on disk.
+
+        Only new files, files that changed since they were indexed and the
+        ones reported as changed by `invalidate_file` are read again.
+
+        Notes
+        -----
+        This can take a while for big projects, so it needs to be called
+        in a thread.
+        """
+        with self._lock:
+            dirty = self._dirty
+            self._dirty = set()
+            indexed = dict(self._files)
+
+        existing = set()
+        changed = []
+        for filename, stat in self.iter_indexable_files():
+            existing.add(filename)
+            entry = indexed.get(filename)
+            if (
+                filename in dirty
+                or entry is None
+                or entry[:2] != (stat.st_mtime, stat.st_size)
+            ):
+                changed.append(filename)
+
+        signatures = self._compute_signatures(changed)
+
+        with self._lock:
+            for filename in set(self._files) - existing:
+                del self._files[filename]
+
+            for filename, signature in signatures:
+                # Files invalidated while we were computing their signature
+                # need to be indexed again.
+                if filename in self._dirty:
+                    continue
+
+                if signature is None:
+                    self._files.pop(filename, None)
+                else:
+                    self._files[filename] = signature
+
+            self.ready = True
+
+        logger.debug(
+            "Find in files index for {} updated: {} files, {} changed".format(
+                self.root_path, len(self._files), len(changed))
+        )
+
+    def update_dirty_files(self):
+        """Index again the files reported by `invalidate_file`."""
+        with self._lock:
+            dirty = self._dirty
+            self._dirty = set()
+
+        signatures = self._compute_signatures(
+            [filename for filename in dirty if osp.isfile(filename)]
+        )
+
+        with self._lock:
+            for filename, signature in signatures:
+                if filename in self._dirty:
+                    continue
+                if signature is not None:
+                    self._files[filename] = signature
+
+    def has_dirty_files(self):
+        """Check if there are files waiting to be indexed again."""
+        return bool(self._dirty)
+
+    def invalidate_file(self, filename):
+        """
+        Remove `filename` from the index until it's indexed again.
+
+        This needs to be called when a file is created, modified or removed.
+        """
+        filename = osp.normpath(filename)
+        if not self.is_indexable(filename):
+            return
+
+        with self._lock:
+            self._files.pop(filename, None)
+            self._dirty.add(filename)
+
+    def invalidate_directory(self, path):
+        """Remove all files in `path` from the index."""
+        path = osp.normpath(path)
+        prefix = path + os.sep
+        with self._lock:
+            for filename in list(self._files):
+                if filename.startswith(prefix):
+                    del self._files[filename]
+            self._dirty = {
+                filename for filename in self._dirty
+                if not filename.startswith(prefix)
+            }
+
+    def _compute_signatures(self, filenames):
+        """Compute the signatures of `filenames` using the search pool."""
+        if len(filenames) < MIN_POOL_FILES:
+            return get_file_signatures(filenames)
+
+        executor = get_executor()
+        futures = [
+            executor.submit(
+                get_file_signatures,
+                filenames[i:i + INDEX_CHUNK_SIZE]
+            )
+            for i in range(0, len(filenames), INDEX_CHUNK_SIZE)
+        ]
+
+        signatures = []
+        for future in futures:
+            signatures.extend(future.result())
+        return signatures
+
+    # ---- Queries
+    # ------------------------------------------------------------------------
+    def get_candidates(self, texts, text_re):
+        """
+        Get the indexed files that could contain any of `texts`.
+
+        Returns
+        -------
+        set or None
+            Set of filenames or None if the query can't be narrowed down
+            with the index (e.g. for texts shorter than three characters).
+        """
+        query = get_query_trigrams(texts, text_re)
+        if query is None:
+            return None
+
+        # Masks for each signature size
+        masks = {}
+        for bits in range(MIN_SIGNATURE_BITS, MAX_SIGNATURE_BITS + 1):
+            masks[bits] = []
+            for trigrams in query:
+                mask = 0
+                for trigram in trigrams:
+                    mask |= 1 << get_trigram_bit(trigram, bits)
+                masks[bits].append(mask)
+
+        with self._lock:
+            files = list(self._files.items())
+
+        candidates = set()
+        for filename, (__, __, bits, signature) in files:
+            for mask in masks[bits]:
+                if signature & mask == mask:
+                    candidates.add(filename)
+                    break
+
+        return candidates
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Replace utilities for Find in files.
+
+Replacements are done line by line, like searches, so that every match shown
+in the results browser is replaced and multiline texts are never touched by
+accident. This also allows to patch documents open in the editor by only
+changing the lines with matches.
+"""
+
+# Standard library imports
+import difflib
+import os.path as osp
+import re
+
+# Local imports
+from spyder.utils import encoding
+
+
+# ---- Constants
+# ----------------------------------------------------------------------------
+# Number of context lines shown around changes in diffs.
+DIFF_CONTEXT_LINES = 3
+
+
+# ---- Functions
+# ----------------------------------------------------------------------------
+def get_replace_pattern(search_text, replace_text, text_re, case_sensitive):
+    """
+    Get the pattern and replacement used to replace `search_text`.
+
+    Parameters
+    ----------
+    search_text: str
+        Searched text or regular expression.
+    replace_text: str
+        Replacement text. If `text_re` is True, it can contain references to
+        groups of `search_text` (e.g. \\1 or \\g<name>).
+    text_re: bool
+        Whether `search_text` is a regular expression.
+    case_sensitive: bool
+        Whether the search is case sensitive.
+
+    Returns
+    -------
+    tuple
+        (pattern, repl) tuple, where pattern is a compiled regexp and repl
+        can be passed to its `sub` method.
+
+    Raises
+    ------
+    re.error
+        If `search_text` or the group references in `replace_text` are not
+        valid.
+    """
+    flags = 0 if case_sensitive else re.IGNORECASE
+    if text_re:
+        pattern = re.compile(search_text, flags)
+
+        # The replacement is compiled before looking for matches, so this
+        # validates its group references.
+        pattern.sub(replace_text, '')
+        repl = replace_text
+    else:
+        pattern = re.compile(re.escape(search_text), flags)
+
+        # Backslashes in the replacement must be inserted verbatim
+        def repl(match):
+            return replace_text
+
+    return pattern, repl
+
+
+def replace_lines(lines, pattern, repl):
+    """
+    Replace the matches of `pattern` in `lines`.
+
+    Parameters
+    ----------
+    lines: list
+        List of lines without line endings.
+    pattern, repl:
+        See `get_replace_pattern`.
+
+    Returns
+    -------
+    tuple
+        (changes, count) tuple, where changes is a dict that maps the
+        zero-based number of each changed line to its new contents and count
+        is the number of replacements.
+    """
+    changes = {}
+    total = 0
+    for lineno, line in enumerate(lines):
+        new_line, count = pattern.subn(repl, line)
+        if count:
+            total += count
+            if new_line != line:
+                changes[lineno] = new_line
+
+    return changes, total
+
+
+def replace_text(text, pattern, repl):
+    """
+    Replace the matches of `pattern` in `text`, keeping its line endings.
+
+    Parameters
+    ----------
+    text: str
+        Text to replace.
+    pattern, repl:
+        See `get_replace_pattern`.
+
+    Returns
+    -------
+    tuple
+        (new_text, count) tuple.
+    """
+    # Split lines like the search engine, i.e. only at \n
+    lines = text.split('\n')
+    endings = []
+    for i, line in enumerate(lines):
+        if line.endswith('\r'):
+            lines[i] = line[:-1]
+            endings.append('\r')
+        else:
+            endings.append('')
+
+    changes, count = replace_lines(lines, pattern, repl)
+    if not changes:
+        return text, count
+
+    for lineno, new_line in changes.items():
+        lines[lineno] = new_line
+
+    new_text = '\n'.join(
+        line + ending for line, ending in zip(lines, endings)
+    )
+    return new_text, count
+
+
+def get_diff(filename, text, new_text, rel_dirname=None):
+    """
+    Get a unified diff between `text` and `new_text`.
+
+    Parameters
+    ----------
+    filename: str
+        Path of the file the texts belong to.
+    text: str
+        Original text.
+    new_text: str
+        Replaced text.
+    rel_dirname: str, optional
+        Directory to make `filename` relative to in the diff header.
+
+    Returns
+    -------
+    str
+        The diff, with Unix line endings.
+    """
+    if rel_dirname is not None:
+        filename = osp.relpath(filename, rel_dirname)
+
+    diff = difflib.unified_diff(
+        text.splitlines(),
+        new_text.splitlines(),
+        fromfile='a/' + filename,
+        tofile='b/' + filename,
+        n=DIFF_CONTEXT_LINES,
+        lineterm=''
+    )
+    return '\n'.join(diff)
+
+
+def replace_in_file(filename, pattern, repl, write=True, diff=False):
+    """
+    Replace the matches of `pattern` in `filename`.
+
+    Files are written atomically, so they are either fully replaced or left
+    untouched if there's an error.
+
+    Parameters
+    ----------
+    filename: str
+        Path of the file.
+    pattern, repl:
+        See `get_replace_pattern`.
+    write: bool, optional
+        Whether to write the replaced text to the file. Use False to
+        preview the replacements. Default is True.
+    diff: bool, optional
+        Whether to compute a diff of the changes. Default is False.
+
+    Returns
+    -------
+    tuple
+        (count, diff) tuple, where count is the number of replacements and
+        diff the output of `get_diff` (or None if `diff` is False).
+
+    Raises
+    ------
+    OSError
+        If the file can't be read or written.
+    """
+    text, enc = encoding.read(filename)
+    new_text, count = replace_text(text, pattern, repl)
+
+    file_diff = None
+    if diff:
+        file_diff = get_diff(filename, text, new_text,
+                             rel_dirname=osp.dirname(filename))
+
+    if write and new_text != text:
+        encoding.write(new_text, filename, enc)
+
+    return count, file_diff
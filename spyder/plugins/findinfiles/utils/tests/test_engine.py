@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Tests for the Find in files search engines."""
+
+# Standard library imports
+import re
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.findinfiles.utils import engine
+from spyder.plugins.findinfiles.utils.engine import (
+    ProcessPoolSearchEngine, SearchEngine, search_data, search_file)
+
+
+TEXT = (
+    "spam = 1\n"
+    "ham = spam + spam\n"
+    "# Nothing here\n"
+    "eggs = 'spam'\n"
+    "áé = 'Spam'"
+)
+
+
+def get_texts(text, text_re=False, case_sensitive=True):
+    if not case_sensitive:
+        text = text.lower()
+    texts = [(text.encode('utf-8'), 'utf-8')]
+    if text_re:
+        texts = [(re.compile(t), enc) for t, enc in texts]
+    return texts
+
+
+def search_lines(data, texts, text_re, case_sensitive):
+    """Search data line by line, like Find in files used to do."""
+    results = []
+    for lineno, line in enumerate(data.splitlines(keepends=True)):
+        search_line = line if case_sensitive else line.lower()
+        for start, end, line_dec in engine.search_line(
+                line, search_line, texts, text_re):
+            results.append((lineno + 1, start, end, line_dec))
+    return results
+
+
+@pytest.mark.parametrize(
+    'text, text_re',
+    [('spam', False), ('Spam', False), ('=', False), ("'", False),
+     ('^spam', True), ('spam$', True), (r'\Aspam', True), ('s.*m', True),
+     ('x*', True), (r'\s+=', True)]
+)
+@pytest.mark.parametrize('case_sensitive', [True, False])
+def test_search_data(text, text_re, case_sensitive):
+    """Searching whole files gives the same results as line by line."""
+    data = TEXT.encode('utf-8')
+    texts = get_texts(text, text_re, case_sensitive)
+    expected = search_lines(data, texts, text_re, case_sensitive)
+
+    assert search_data(data, texts, text_re, case_sensitive) == expected
+
+
+def test_search_data_positions():
+    """Match positions are given in characters and lines are one-based."""
+    data = TEXT.encode('utf-8')
+    texts = get_texts('spam', case_sensitive=False)
+    matches = search_data(data, texts, False, False)
+
+    assert [match[:3] for match in matches] == [
+        (1, 0, 4), (2, 6, 10), (2, 13, 17), (4, 8, 12), (5, 6, 10)
+    ]
+    assert matches[-1][3] == "áé = 'Spam'"
+
+
+def test_search_file_mmap(tmp_path, monkeypatch):
+    """Big files are memory mapped."""
+    monkeypatch.setattr(engine, 'MMAP_THRESHOLD', 10)
+    filename = tmp_path / 'big.txt'
+    filename.write_text('foo\n' * 100 + 'spam\n')
+
+    matches, error = search_file(str(filename), get_texts('spam'), False,
+                                 True)
+    assert not error
+    assert matches == [(101, 0, 4, 'spam\n')]
+
+
+def test_search_file_errors(tmp_path):
+    """Files that can't be read are reported as errors."""
+    matches, error = search_file(str(tmp_path / 'foo.txt'),
+                                 get_texts('spam'), False, True)
+    assert matches == []
+    assert error
+
+
+@pytest.mark.parametrize('engine_class', [SearchEngine,
+                                          ProcessPoolSearchEngine])
+def test_engines(tmp_path, engine_class):
+    """Engines return the matches of all files."""
+    files = []
+    for i in range(2 * engine.MIN_POOL_FILES):
+        filename = tmp_path / 'file{}.py'.format(i)
+        filename.write_text('spam\n' if i % 2 else 'ham\n')
+        files.append((str(filename), False))
+
+    search_engine = engine_class(get_texts('spam'), False, True)
+    results = [
+        result for batch in search_engine.search(files) for result in batch
+    ]
+
+    assert len(results) == engine.MIN_POOL_FILES
+    assert all([matches == [(1, 0, 4, 'spam\n')]
+                for __, matches, __ in results])
+
+    # Stopped engines don't return anything else
+    search_engine.stop()
+    assert list(search_engine.search(files)) == []
+
+    engine.shutdown_executor()
+
+
+def test_search_buffer():
+    """Unsaved contents are searched like files."""
+    search_engine = SearchEngine(get_texts('spam', case_sensitive=False),
+                                 False, False)
+    results = search_engine.search_buffer('foo.py', TEXT)
+
+    assert [filename for filename, __, __ in results] == ['foo.py']
+    assert results[0][1] == search_data(
+        TEXT.encode('utf-8'), search_engine.texts, False, False)
+
+    # Buffers without matches don't return results
+    assert search_engine.search_buffer('foo.py', 'ham') == []
+
+
+if __name__ == "__main__":
+    pytest.main()
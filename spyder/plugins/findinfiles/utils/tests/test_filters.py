@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright © Spyder Project Contributors
+#
+# Licensed under the terms of the MIT License
+# ----------------------------------------------------------------------------
+
+"""Tests for the Find in files filters."""
+
+# Standard library imports
+import os
+import os.path as osp
+import re
+import time
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.findinfiles.utils.engine import SearchEngine
+from spyder.plugins.findinfiles.utils.filters import (
+    IgnoreMatcher, IgnoreRules, TextFileCache, translate_pattern)
+
+
+def walk(path, ignore=None):
+    """Walk `path` pruning ignored directories, as `SearchThread` does."""
+    files = []
+    dirs = [(path, ignore)]
+    while dirs:
+        dirpath, ignore = dirs.pop()
+        entries = list(os.scandir(dirpath))
+        if ignore is not None:
+            ignore = ignore.for_directory(
+                dirpath, {entry.name for entry in entries})
+
+        for entry in entries:
+            is_dir = entry.is_dir()
+            if is_dir and entry.name.startswith('.'):
+                continue
+            if ignore and ignore.is_ignored(entry.path, is_dir):
+                continue
+            if is_dir:
+                dirs.append((entry.path, ignore))
+            else:
+                files.append(entry.path)
+
+    return sorted(files)
+
+
+@pytest.mark.parametrize(
+    "pattern, path, matches",
+    [
+        ('*.pyc', 'foo.pyc', True),
+        ('*.pyc', 'sub/foo.pyc', True),
+        ('*.pyc', 'foo.py', False),
+        ('/build', 'build', True),
+        ('/build', 'sub/build', False),
+        ('doc/build', 'doc/build', True),
+        ('doc/build', 'sub/doc/build', False),
+        ('**/build', 'sub/doc/build', True),
+        ('doc/**/*.txt', 'doc/a/b/c.txt', True),
+        ('doc/**/*.txt', 'doc/c.txt', True),
+        ('doc/**', 'doc/c.txt', True),
+        ('foo?.py', 'foo1.py', True),
+        ('foo[0-9].py', 'foo1.py', True),
+        ('foo[!0-9].py', 'foo1.py', False),
+        ('foo*', 'foo/bar', False),
+        (r'\#notes', '#notes', True),
+    ]
+)
+def test_translate_pattern(pattern, path, matches):
+    """Patterns follow the gitignore syntax."""
+    regexp = re.compile(translate_pattern(pattern))
+    assert bool(regexp.match(path)) == matches
+
+
+def test_ignore_rules():
+    """Negated and directory-only rules are taken into account."""
+    base = osp.join(os.sep, 'project')
+    rules = IgnoreRules(
+        base,
+        ['# Comment', '', '*.log', '!keep.log', 'build/', 'data/*.csv  ']
+    )
+    assert len(rules.rules) == 4
+
+    assert rules.match(osp.join(base, 'sub', 'out.log'), False)
+    assert rules.match(osp.join(base, 'keep.log'), False) is False
+    assert rules.match(osp.join(base, 'build'), True)
+    assert rules.match(osp.join(base, 'build'), False) is None
+    assert rules.match(osp.join(base, 'data', 'a.csv'), False)
+    assert rules.match(osp.join(base, 'foo.py'), False) is None
+
+
+def test_ignore_matcher(tmp_path):
+    """Rules of inner ignore files take precedence."""
+    (tmp_path / '.git' / 'info').mkdir(parents=True)
+    (tmp_path / '.git' / 'info' / 'exclude').write_text('*.tmp\n')
+    (tmp_path / '.gitignore').write_text('*.log\nbuild/\n')
+    (tmp_path / 'src' / 'build').mkdir(parents=True)
+    (tmp_path / 'src' / '.ignore').write_text('!debug.log\n')
+    for relpath in ['a.py', 'a.log', 'a.tmp', 'src/debug.log',
+                    'src/other.log', 'src/b.py', 'src/build/c.py']:
+        (tmp_path / relpath).write_text('spam\n')
+
+    matcher = IgnoreMatcher.for_parents(str(tmp_path))
+    assert len(matcher.rules) == 1
+    files = walk(str(tmp_path), matcher)
+    files = [osp.relpath(f, str(tmp_path)) for f in files]
+    assert files == [
+        '.gitignore', 'a.py', osp.join('src', '.ignore'),
+        osp.join('src', 'b.py'), osp.join('src', 'debug.log')
+    ]
+
+    # Rules of parent directories are used when searching a subdirectory
+    src = str(tmp_path / 'src')
+    matcher = IgnoreMatcher.for_parents(src)
+    assert len(matcher.rules) == 2
+    files = walk(src, matcher)
+    assert [osp.basename(f) for f in files] == ['.ignore', 'b.py',
+                                                'debug.log']
+
+
+def test_text_file_cache(tmp_path):
+    """Entries are invalidated when files change."""
+    filename = tmp_path / 'foo.dat'
+    filename.write_text('spam')
+
+    cache = TextFileCache(maxsize=1)
+    entry = next(os.scandir(str(tmp_path)))
+    key = cache.get_key(entry)
+    assert cache.get(key) is None
+
+    cache.set(key, True)
+    assert cache.get(key)
+
+    filename.write_text('spam and eggs')
+    entry = next(os.scandir(str(tmp_path)))
+    assert cache.get(cache.get_key(entry)) is None
+
+    # Old entries are evicted
+    cache.set(cache.get_key(entry), False)
+    assert len(cache) == 1
+    assert cache.get(key) is None
+
+
+@pytest.mark.slow
+def test_benchmark_ignored_dirs(tmp_path):
+    """
+    Benchmark a search in a tree with large ignored directories.
+
+    This resembles a project with a virtual environment, node modules and
+    build outputs next to its sources.
+    """
+    (tmp_path / '.git').mkdir()
+    (tmp_path / '.gitignore').write_text(
+        'node_modules/\nvenv/\nbuild/\n*.egg-info/\n')
+
+    contents = 'import os\n\n\ndef spam(eggs):\n    return eggs\n' * 20
+    num_sources = 0
+    for top, num_dirs in [('src', 10), ('node_modules', 100),
+                          ('venv', 100), ('build', 50)]:
+        for i in range(num_dirs):
+            path = tmp_path / top / 'pkg{}'.format(i)
+            path.mkdir(parents=True)
+            for j in range(20):
+                (path / 'module{}.py'.format(j)).write_text(contents)
+                if top == 'src':
+                    num_sources += 1
+
+    texts = [(b'spam', 'utf-8')]
+    timings = {}
+    for name, matcher in [('all', None), ('pruned', IgnoreMatcher())]:
+        t0 = time.perf_counter()
+        files = walk(str(tmp_path), matcher)
+        results = [
+            result
+            for batch in SearchEngine(texts, False, True).search(
+                [(filename, False) for filename in files])
+            for result in batch
+        ]
+        timings[name] = time.perf_counter() - t0
+        print("{}: {} files searched in {:.3f}s".format(
+            name, len(files), timings[name]))
+
+    assert len(results) == num_sources
+    assert timings['pruned'] < timings['all']
+
+
+if __name__ == "__main__":
+    pytest.main()
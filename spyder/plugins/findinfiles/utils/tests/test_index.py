@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright © Spyder Project Contributors
+#
+# Licensed under the terms of the MIT License
+# ----------------------------------------------------------------------------
+
+"""Tests for the Find in files trigram index."""
+
+# Standard library imports
+import os
+import os.path as osp
+import re
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.findinfiles.utils.index import (
+    TrigramIndex, get_regexp_literals)
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a project with a few files."""
+    files = {
+        'foo.py': 'import os\nspam = 1\n',
+        'bar.py': 'def ham():\n    return "eggs"\n',
+        osp.join('sub', 'baz.txt'): 'Some Text with SPAM\n',
+        osp.join('.hidden', 'spam.py'): 'spam\n',
+        'data.bin': 'spam',
+    }
+    for relpath, contents in files.items():
+        path = tmp_path / relpath
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(contents)
+
+    return str(tmp_path)
+
+
+@pytest.fixture
+def index(project, tmp_path_factory):
+    index_path = str(tmp_path_factory.mktemp('index') / 'trigrams.json')
+    index = TrigramIndex(project, index_path=index_path)
+    index.update()
+    return index
+
+
+def get_texts(text, text_re=False):
+    text = text.encode('utf-8')
+    if text_re:
+        text = re.compile(text)
+    return [(text, 'utf-8')]
+
+
+@pytest.mark.parametrize(
+    "pattern, literals",
+    [
+        (rb'spam', [b'spam']),
+        (rb'^spam\s+eggs$', [b'spam', b'eggs']),
+        (rb'(foo|bar)baz', [b'baz']),
+        (rb'(?:spam)+ and (ham)?', [b'spam', b' and ']),
+        (rb'sp.m', []),
+        (rb'[a-z]+', []),
+        (rb'a\bcd', [b'acd']),
+        (rb'SPAM', [b'SPAM']),
+    ]
+)
+def test_get_regexp_literals(pattern, literals):
+    """Only literals required by all matches are extracted."""
+    assert get_regexp_literals(pattern) == literals
+
+
+def test_candidates(project, index):
+    """The index narrows down the files to search."""
+    # Only visible files with editable extensions are indexed
+    assert len(index) == 3
+    assert osp.join(project, 'data.bin') not in index
+
+    candidates = index.get_candidates(get_texts('spam'), False)
+    assert osp.join(project, 'foo.py') in candidates
+    assert osp.join(project, 'sub', 'baz.txt') in candidates
+    assert osp.join(project, 'bar.py') not in candidates
+
+    candidates = index.get_candidates(get_texts(r'return\s+"eggs"', True),
+                                      True)
+    assert candidates == {osp.join(project, 'bar.py')}
+
+    # Texts without trigrams can't be narrowed down
+    assert index.get_candidates(get_texts('sp'), False) is None
+    assert index.get_candidates(get_texts('s.*m', True), True) is None
+
+
+def test_invalidation(project, index):
+    """Changed files are dropped from the index until indexed again."""
+    filename = osp.join(project, 'bar.py')
+    with open(filename, 'a') as f:
+        f.write('spam = 2\n')
+
+    assert not index.is_current(filename, os.stat(filename))
+
+    index.invalidate_file(filename)
+    assert filename not in index
+    assert index.has_dirty_files()
+
+    index.update_dirty_files()
+    assert index.is_current(filename, os.stat(filename))
+    assert filename in index.get_candidates(get_texts('spam'), False)
+
+    index.invalidate_directory(osp.join(project, 'sub'))
+    assert osp.join(project, 'sub', 'baz.txt') not in index
+
+
+def test_save_load(project, index):
+    """The index is restored from disk."""
+    assert index.save()
+
+    new_index = TrigramIndex(project, index_path=index.index_path)
+    assert new_index.load()
+    assert len(new_index) == len(index)
+    assert not new_index.ready
+
+    assert new_index.get_candidates(get_texts('spam'), False) == (
+        index.get_candidates(get_texts('spam'), False)
+    )
+
+    # Removed files are dropped when the index is updated
+    os.remove(osp.join(project, 'foo.py'))
+    new_index.update()
+    assert new_index.ready
+    assert osp.join(project, 'foo.py') not in new_index
+
+
+def test_index_path(project):
+    """The index is not saved inside the project."""
+    index = TrigramIndex(project)
+    assert not index.index_path.startswith(project)
+    assert index.index_path != TrigramIndex(project + 'x').index_path
+
+
+if __name__ == "__main__":
+    pytest.main()
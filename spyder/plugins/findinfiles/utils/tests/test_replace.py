@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Tests for the Find in files replace utilities."""
+
+# Standard library imports
+import re
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.findinfiles.utils.replace import (
+    get_diff, get_replace_pattern, replace_in_file, replace_text)
+
+
+TEXT = (
+    "spam = 1\r\n"
+    "ham = spam + Spam\r\n"
+    "# Nothing here\r\n"
+    "eggs = 'spam'\r\n"
+)
+
+
+@pytest.mark.parametrize(
+    "search,replacement,text_re,case_sensitive,expected,count",
+    [
+        ('spam', 'foo', False, True,
+         "foo = 1\r\nham = foo + Spam\r\n# Nothing here\r\neggs = 'foo'\r\n",
+         3),
+        ('spam', 'foo', False, False,
+         "foo = 1\r\nham = foo + foo\r\n# Nothing here\r\neggs = 'foo'\r\n",
+         4),
+        # Backslashes in literal replacements are kept
+        ('spam', r'\1', False, True,
+         "\\1 = 1\r\nham = \\1 + Spam\r\n# Nothing here\r\neggs = '\\1'\r\n",
+         3),
+        # Groups and line anchors in regexps
+        (r'^(\w+) =', r'\1 :=', True, True,
+         "spam := 1\r\nham := spam + Spam\r\n# Nothing here\r\n"
+         "eggs := 'spam'\r\n",
+         3),
+        (r'spam$', 'foo', True, False,
+         "spam = 1\r\nham = spam + foo\r\n# Nothing here\r\neggs = 'spam'\r\n",
+         1),
+    ]
+)
+def test_replace_text(search, replacement, text_re, case_sensitive,
+                      expected, count):
+    """Check that replacements are done line by line."""
+    pattern, repl = get_replace_pattern(
+        search, replacement, text_re, case_sensitive)
+    assert replace_text(TEXT, pattern, repl) == (expected, count)
+
+
+def test_invalid_replacement():
+    """Check that invalid group references are detected beforehand."""
+    with pytest.raises(re.error):
+        get_replace_pattern(r'(spam)', r'\2', True, True)
+
+
+def test_get_diff():
+    """Check the diff of a replaced text."""
+    pattern, repl = get_replace_pattern('eggs', 'bacon', False, True)
+    new_text, __ = replace_text(TEXT, pattern, repl)
+    diff = get_diff('/project/spam.py', TEXT, new_text,
+                    rel_dirname='/project')
+
+    assert diff.splitlines() == [
+        '--- a/spam.py',
+        '+++ b/spam.py',
+        '@@ -1,4 +1,4 @@',
+        ' spam = 1',
+        ' ham = spam + Spam',
+        ' # Nothing here',
+        "-eggs = 'spam'",
+        "+bacon = 'spam'",
+    ]
+
+
+@pytest.mark.parametrize("write", [True, False])
+def test_replace_in_file(tmp_path, write):
+    """Check replacing in a file and previewing the replacements."""
+    path = tmp_path / 'spam.txt'
+    path.write_bytes("áé spam\nspam\n".encode('utf-8'))
+
+    pattern, repl = get_replace_pattern('spam', 'eggs', False, True)
+    count, diff = replace_in_file(str(path), pattern, repl, write=write,
+                                  diff=not write)
+
+    assert count == 2
+    if write:
+        assert diff is None
+        assert path.read_bytes() == "áé eggs\neggs\n".encode('utf-8')
+    else:
+        assert '+eggs' in diff
+        assert path.read_bytes() == "áé spam\nspam\n".encode('utf-8')
@@ -24,11 +24,12 @@ class SearchInComboBoxItems:
     Cwd = 0
     Project = 1
     File = 2
-    FirstSeparator = 3
-    SelectAnotherDirectory = 4
-    ClearList = 5
-    SecondSeparator = 6
-    ExternalPaths = 7
+    RemoteDirectory = 3
+    FirstSeparator = 4
+    SelectAnotherDirectory = 5
+    ClearList = 6
+    SecondSeparator = 7
+    ExternalPaths = 8
 
 MAX_PATH_HISTORY = 15
 
@@ -54,6 +55,10 @@ def __init__(self, external_path_history=[], parent=None, id_=None):
         self.file_path = ''
         self.external_path = ''
 
+        # Directory in a remote server and id of that server
+        self.remote_path = ''
+        self.server_id = None
+
         if id_ is not None:
             self.ID = id_
 
@@ -64,6 +69,11 @@ def __init__(self, external_path_history=[], parent=None, id_=None):
 
         self.addItem(_("Current file").replace('&', ''))
 
+        self.addItem(_("Remote directory"))
+        self.model().item(
+            SearchInComboBoxItems.RemoteDirectory, 0
+        ).setEnabled(False)
+
         self.insertSeparator(SearchInComboBoxItems.FirstSeparator)
 
         self.addItem(_("Select another directory"))
@@ -125,15 +135,42 @@ def get_current_searchpath(self):
             return self.project_path
         elif idx == SearchInComboBoxItems.File:
             return self.file_path
+        elif idx == SearchInComboBoxItems.RemoteDirectory:
+            return self.remote_path
         else:
             return self.external_path
 
+    def get_current_searchpath_index(self):
+        """
+        Returns the index of the current item to save it in our config.
+
+        Indexes after the remote directory are saved as if it wasn't in the
+        combobox, so that they're the same as the ones saved before it was
+        added.
+        """
+        index = self.currentIndex()
+        if index == SearchInComboBoxItems.RemoteDirectory:
+            # Remote directories are not available at startup
+            return SearchInComboBoxItems.Cwd
+        elif index > SearchInComboBoxItems.RemoteDirectory:
+            return index - 1
+        else:
+            return index
+
     def set_current_searchpath_index(self, index):
-        """Set the current index of this combo box."""
+        """
+        Set the current index of this combo box from one saved with
+        `get_current_searchpath_index`.
+        """
         if index is not None:
+            if index >= SearchInComboBoxItems.RemoteDirectory:
+                index += 1
             index = min(index, self.count() - 1)
             if index in [SearchInComboBoxItems.ClearList,
-                         SearchInComboBoxItems.SelectAnotherDirectory]:
+                         SearchInComboBoxItems.SelectAnotherDirectory,
+                         SearchInComboBoxItems.RemoteDirectory,
+                         SearchInComboBoxItems.FirstSeparator,
+                         SearchInComboBoxItems.SecondSeparator]:
                 index = SearchInComboBoxItems.Cwd
         else:
             index = SearchInComboBoxItems.Cwd
@@ -147,6 +184,10 @@ def is_file_search(self):
         else:
             return False
 
+    def is_remote_search(self):
+        """Returns whether the current search path is in a remote server."""
+        return self.currentIndex() == SearchInComboBoxItems.RemoteDirectory
+
     @Slot()
     def path_selection_changed(self):
         """Handles when the current index of the combobox changes."""
@@ -203,6 +244,25 @@ def set_project_path(self, path):
                 SearchInComboBoxItems.Project, 0
             ).setEnabled(True)
 
+    def set_remote_path(self, path, server_id):
+        """
+        Sets the remote directory and the id of its server, and disables the
+        remote search in the combobox if the value of path is None.
+        """
+        item = self.model().item(SearchInComboBoxItems.RemoteDirectory, 0)
+        if path is None:
+            self.remote_path = ''
+            self.server_id = None
+            item.setEnabled(False)
+            item.setData(None, Qt.ToolTipRole)
+            if self.currentIndex() == SearchInComboBoxItems.RemoteDirectory:
+                self.setCurrentIndex(SearchInComboBoxItems.Cwd)
+        else:
+            self.remote_path = path
+            self.server_id = server_id
+            item.setEnabled(True)
+            item.setData(path, Qt.ToolTipRole)
+
     def set_state_other_dirs_items(self, enabled):
         """
         Set the enabled/visible state of items that change when other
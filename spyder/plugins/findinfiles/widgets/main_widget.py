@@ -6,36 +6,49 @@
 
 # Standard library imports
 import fnmatch
+import logging
 import math
 import os.path as osp
 import re
 
 # Third party imports
 from qtpy import PYSIDE2
-from qtpy.QtCore import Signal, Qt
-from qtpy.QtGui import QFontMetricsF
+from qtpy.QtCore import QTimer, Signal, Qt
+from qtpy.QtGui import QFontMetricsF, QTextCursor
 from qtpy.QtWidgets import QInputDialog, QLabel
 
 # Local imports
 from spyder.api.config.decorators import on_conf_change
 from spyder.api.translations import _
 from spyder.api.widgets.main_widget import PluginMainWidget
+from spyder.plugins.findinfiles.utils.filters import TextFileCache
+from spyder.plugins.findinfiles.utils.index import TrigramIndex
+from spyder.plugins.findinfiles.utils.replace import (
+    get_diff, get_replace_pattern, replace_lines, replace_text)
 from spyder.plugins.findinfiles.widgets.results_browser import (
     ON, ResultsBrowser)
 from spyder.plugins.findinfiles.widgets.combobox import (
     MAX_PATH_HISTORY, SearchInComboBox)
-from spyder.plugins.findinfiles.widgets.search_thread import SearchThread
+from spyder.plugins.findinfiles.widgets.replace_dialog import ReplaceDialog
+from spyder.plugins.findinfiles.widgets.replace_thread import ReplaceThread
+from spyder.plugins.findinfiles.widgets.search_thread import (
+    RemoteSearchThread, SearchThread)
 from spyder.utils.misc import regexp_error_msg
 from spyder.utils.palette import SpyderPalette
 from spyder.utils.stylesheet import AppStyle
+from spyder.utils.workers import WorkerManager
 from spyder.widgets.comboboxes import PatternComboBox
 
 
+logger = logging.getLogger(__name__)
+
+
 # ---- Constants
 # -----------------------------------------------------------------------------
 MAIN_TEXT_COLOR = SpyderPalette.COLOR_TEXT_1
 MAX_COMBOBOX_WIDTH = AppStyle.FindMinWidth + 80  # In pixels
 MIN_COMBOBOX_WIDTH = AppStyle.FindMinWidth - 80  # In pixels
+INDEX_UPDATE_DELAY = 2000  # In milliseconds
 
 
 # ---- Enums
@@ -44,18 +57,23 @@ class FindInFilesWidgetActions:
     # Triggers
     Find = 'find_action'
     MaxResults = 'max_results_action'
+    Replace = 'replace_action'
 
     # Toggles
     ToggleCase = 'toggle_case_action'
     ToggleExcludeCase = 'toggle_exclude_case_action'
     ToggleExcludeRegex = 'togle_use_regex_on_exlude_action'
+    ToggleIgnoreFiles = 'toggle_ignore_files_action'
     ToggleMoreOptions = 'toggle_more_options_action'
+    ToggleProjectIndex = 'toggle_project_index_action'
+    ToggleReplace = 'toggle_replace_action'
     ToggleSearchRegex = 'toggle_use_regex_on_search_action'
 
 
 class FindInFilesWidgetToolbars:
     Exclude = 'exclude_toolbar'
     Location = 'location_toolbar'
+    Replace = 'replace_toolbar'
 
 
 class FindInFilesWidgetMainToolbarSections:
@@ -70,6 +88,10 @@ class FindInFilesWidgetLocationToolbarSections:
     Main = 'main_section'
 
 
+class FindInFilesWidgetReplaceToolbarSections:
+    Main = 'main_section'
+
+
 class FindInFilesWidgetToolbarItems:
     SearchPatternCombo = 'pattern_combo'
     SearchInLabel = 'search_in_label'
@@ -78,6 +100,9 @@ class FindInFilesWidgetToolbarItems:
     Stretcher1 = 'stretcher_1'
     SearchInCombo = 'search_in_combo'
     Stretcher2 = 'stretcher_2'
+    ReplaceLabel = 'replace_label'
+    ReplacePatternCombo = 'replace_pattern_combo'
+    Stretcher3 = 'stretcher_3'
 
 
 # ---- Main widget
@@ -133,6 +158,18 @@ class FindInFilesWidget(PluginMainWidget):
     to reaching the maximum number of results.
     """
 
+    sig_replace_finished = Signal(int, int)
+    """
+    This signal is emitted when replacements in files were applied.
+
+    Parameters
+    ----------
+    num_files: int
+        Number of changed files.
+    num_replacements: int
+        Number of replacements done.
+    """
+
     def __init__(self, name=None, plugin=None, parent=None):
         if not PYSIDE2:
             super().__init__(name, plugin, parent=parent)
@@ -145,21 +182,45 @@ def __init__(self, name=None, plugin=None, parent=None):
         self.text_color = self.get_conf('text_color')
         self.supported_encodings = self.get_conf('supported_encodings')
         self.search_thread = None
+        self.replace_thread = None
+        self.replace_dialog = None
         self.running = False
         self.more_options_action = None
+        self.replace_mode_action = None
         self.extras_toolbar = None
+        self.replace_toolbar = None
         self._search_in_label_width = None
         self._exclude_label_width = None
         self._is_shown = False
         self._is_first_time = False
+        self.project_index = None
+        self.text_file_cache = TextFileCache()
+        self._worker_manager = WorkerManager(self)
+        self._last_search = None
+        self._last_search_remote = False
+        self._remote_files_api_class = None
+        self._replace_pattern = None
+        self._replaced_files = 0
+        self._num_replacements = 0
+
+        # Files changed in the project are indexed again after a delay, so
+        # that several changes are processed at once.
+        self._index_timer = QTimer(self)
+        self._index_timer.setSingleShot(True)
+        self._index_timer.setInterval(INDEX_UPDATE_DELAY)
+        self._index_timer.timeout.connect(self._update_project_index_files)
 
         search_text = self.get_conf('search_text', '')
         path_history = self.get_conf('path_history', [])
         exclude = self.get_conf('exclude')
+        replace_history = self.get_conf('replace_text', [''])
 
         if not isinstance(search_text, (list, tuple)):
             search_text = [search_text]
 
+        if not isinstance(replace_history, (list, tuple)):
+            replace_history = [replace_history]
+
         if not isinstance(exclude, (list, tuple)):
             exclude = [exclude]
 
@@ -213,6 +274,23 @@ def __init__(self, name=None, plugin=None, parent=None):
         )
         self.exclude_pattern_edit.setMaximumWidth(MAX_COMBOBOX_WIDTH)
 
+        self.replace_label = QLabel(_('Replace with:'))
+        self.replace_label.ID = FindInFilesWidgetToolbarItems.ReplaceLabel
+
+        self.replace_text_edit = PatternComboBox(
+            self,
+            items=replace_history,
+            adjust_to_minimum=False,
+            id_=FindInFilesWidgetToolbarItems.ReplacePatternCombo,
+            items_elide_mode=Qt.ElideMiddle
+        )
+        self.replace_text_edit.lineEdit().setPlaceholderText(
+            _('Write the replacement text'))
+        self.replace_text_edit.setMinimumSize(
+            MIN_COMBOBOX_WIDTH, AppStyle.FindHeight
+        )
+        self.replace_text_edit.setMaximumWidth(MAX_COMBOBOX_WIDTH)
+
         self.result_browser = ResultsBrowser(
             self,
             text_color=self.text_color,
@@ -235,8 +313,9 @@ def __init__(self, name=None, plugin=None, parent=None):
             self.sig_redirect_stdio_requested)
         self.search_text_edit.valid.connect(lambda valid: self.find())
         self.exclude_pattern_edit.valid.connect(lambda valid: self.find())
+        self.replace_text_edit.valid.connect(lambda valid: self.replace())
         self.result_browser.sig_edit_goto_requested.connect(
-            self.sig_edit_goto_requested)
+            self._on_edit_goto_requested)
         self.result_browser.sig_max_results_reached.connect(
             self.sig_max_results_reached)
         self.result_browser.sig_max_results_reached.connect(
@@ -311,12 +390,51 @@ def setup(self):
             tip=_('Set maximum number of results'),
             triggered=lambda x=None: self.set_max_results(),
         )
+        self.ignore_files_action = self.create_action(
+            FindInFilesWidgetActions.ToggleIgnoreFiles,
+            text=_('Skip files ignored by Git'),
+            tip=_(
+                'Skip files and directories listed in .gitignore and '
+                '.ignore files'
+            ),
+            toggled=True,
+            initial=self.get_conf('use_ignore_files'),
+            option='use_ignore_files'
+        )
+        self.replace_mode_action = self.create_action(
+            FindInFilesWidgetActions.ToggleReplace,
+            text=_('Show replace options'),
+            tip=_('Show replace options'),
+            icon=self.create_icon('replace'),
+            toggled=True,
+            initial=self.get_conf('replace_mode'),
+            option='replace_mode'
+        )
+        self.replace_action = self.create_action(
+            FindInFilesWidgetActions.Replace,
+            text=_('&Replace in files'),
+            tip=_('Preview and replace the results in their files'),
+            icon=self.create_icon('replace'),
+            triggered=self.replace,
+            register_shortcut=False,
+        )
+        self.project_index_action = self.create_action(
+            FindInFilesWidgetActions.ToggleProjectIndex,
+            text=_('Index project files for faster searches'),
+            tip=_(
+                'Keep an index of the project files to skip the ones that '
+                "can't have matches"
+            ),
+            toggled=True,
+            initial=self.get_conf('project_index'),
+            option='project_index'
+        )
 
         # Toolbar
         toolbar = self.get_main_toolbar()
         for item in [self.search_text_edit, self.find_action,
                      self.search_regexp_action, self.case_action,
-                     self.more_options_action]:
+                     self.replace_mode_action, self.more_options_action]:
             self.add_item_to_toolbar(
                 item,
                 toolbar=toolbar,
@@ -350,11 +468,27 @@ def setup(self):
                 section=FindInFilesWidgetLocationToolbarSections.Main,
             )
 
+        # Replace toolbar
+        self.replace_toolbar = self.create_toolbar(
+            FindInFilesWidgetToolbars.Replace)
+        stretcher3 = self.create_stretcher(
+            FindInFilesWidgetToolbarItems.Stretcher3)
+        for item in [self.replace_label, self.replace_text_edit,
+                     self.replace_action, stretcher3]:
+            self.add_item_to_toolbar(
+                item,
+                toolbar=self.replace_toolbar,
+                section=FindInFilesWidgetReplaceToolbarSections.Main,
+            )
+
         menu = self.get_options_menu()
-        self.add_item_to_menu(
-            self.set_max_results_action,
-            menu=menu,
-        )
+        for item in [self.set_max_results_action,
+                     self.ignore_files_action,
+                     self.project_index_action]:
+            self.add_item_to_menu(
+                item,
+                menu=menu,
+            )
 
     def update_actions(self):
         self.find_action.setIcon(self.create_icon(
@@ -365,6 +499,12 @@ def update_actions(self):
             self.extras_toolbar.setVisible(
                 self.more_options_action.isChecked())
 
+        if self.replace_toolbar and self.replace_mode_action:
+            self.replace_toolbar.setVisible(
+                self.replace_mode_action.isChecked())
+            self.replace_action.setEnabled(
+                not self.running and self.replace_thread is None)
+
     @on_conf_change(option='more_options')
     def on_more_options_update(self, value):
         if value:
@@ -409,10 +549,22 @@ def on_more_options_update(self, value):
             self.more_options_action.setIcon(icon)
             self.more_options_action.setToolTip(tip)
 
+    @on_conf_change(option='replace_mode')
+    def on_replace_mode_update(self, value):
+        if self.replace_toolbar:
+            self.replace_toolbar.setVisible(value)
+
     @on_conf_change(option='max_results')
     def on_max_results_update(self, value):
         self.result_browser.set_max_results(value)
 
+    @on_conf_change(option='project_index')
+    def on_project_index_update(self, value):
+        if value and self.project_path:
+            self._setup_project_index(self.project_path)
+        else:
+            self._close_project_index()
+
     # ---- Qt methods
     # ------------------------------------------------------------------------
     def showEvent(self, event):
@@ -530,16 +682,21 @@ def _update_options(self):
                         for index in range(self.search_text_edit.count())]
         excludes = [str(self.exclude_pattern_edit.itemText(index))
                     for index in range(self.exclude_pattern_edit.count())]
+        replace_texts = [str(self.replace_text_edit.itemText(index))
+                         for index in range(self.replace_text_edit.count())]
         path_history = self.path_selection_combo.get_external_paths()
 
         self.set_conf('path_history', path_history)
         self.set_conf('search_text', search_texts[:hist_limit])
         self.set_conf('exclude', excludes[:hist_limit])
+        self.set_conf('replace_text', replace_texts[:hist_limit])
         self.set_conf('path_history', path_history[-hist_limit:])
         self.set_conf(
             'exclude_index', self.exclude_pattern_edit.currentIndex())
         self.set_conf(
-            'search_in_index', self.path_selection_combo.currentIndex())
+            'search_in_index',
+            self.path_selection_combo.get_current_searchpath_index()
+        )
 
     def _handle_search_complete(self, completed):
         """
@@ -577,6 +734,242 @@ def _stop_and_reset_thread(self, ignore_results=False):
         self.stop_spinner()
         self.update_actions()
 
+    def _on_edit_goto_requested(self, filename, lineno, search_text, colno,
+                                colend):
+        """Open a result in the editor, unless it's in a remote server."""
+        if self._last_search_remote:
+            logger.debug(f"Can't open remote file {filename} in the editor")
+            return
+
+        self.sig_edit_goto_requested.emit(
+            filename, lineno, search_text, colno, colend)
+
+    def _get_open_editors(self):
+        """Get a dict that maps the files open in the editor to them."""
+        if self._plugin is None:
+            return {}
+        return self._plugin._get_open_editors()
+
+    def _get_unsaved_buffers(self):
+        """
+        Get the contents of the files with unsaved changes in the editor.
+
+        Returns
+        -------
+        dict
+            Dictionary that maps normalized file paths to their contents.
+        """
+        return {
+            filename: editor.toPlainText()
+            for filename, editor in self._get_open_editors().items()
+            if editor.document().isModified()
+        }
+
+    def _replace_in_editor(self, editor, pattern, repl):
+        """
+        Replace the matches of `pattern` in the document of `editor`.
+
+        Only lines with matches are changed and all changes are done in a
+        single undo step.
+
+        Returns
+        -------
+        int
+            Number of replacements.
+        """
+        document = editor.document()
+        changes, count = replace_lines(
+            editor.toPlainText().split('\n'), pattern, repl
+        )
+        if not changes:
+            return count
+
+        cursor = QTextCursor(document)
+        cursor.beginEditBlock()
+
+        # Go backwards because replacements can add new lines
+        for lineno in sorted(changes, reverse=True):
+            block = document.findBlockByNumber(lineno)
+            cursor.setPosition(block.position())
+            cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+            cursor.insertText(changes[lineno])
+
+        cursor.endEditBlock()
+        return count
+
+    def _start_replace_thread(self, filenames, preview):
+        """Start a thread to preview or replace `filenames` on disk."""
+        pattern, repl = self._replace_pattern
+        thread = ReplaceThread(
+            None, filenames, pattern, repl, preview=preview
+        )
+        dialog = self.replace_dialog
+        if preview:
+            thread.sig_file_replaced.connect(dialog.add_file)
+        else:
+            thread.sig_file_replaced.connect(self._handle_file_replaced)
+        thread.sig_file_error.connect(dialog.add_error)
+        thread.sig_progress.connect(dialog.set_progress)
+        thread.sig_finished.connect(
+            lambda completed: self._handle_replace_complete(thread))
+
+        self.replace_thread = thread
+        self.start_spinner()
+        thread.start()
+        self.update_actions()
+
+    def _handle_file_replaced(self, filename, count, __):
+        """A file was changed on disk by the replace thread."""
+        if count:
+            self._replaced_files += 1
+            self._num_replacements += count
+
+    def _handle_replace_complete(self, thread=None):
+        """
+        Replace thread has finished.
+
+        `thread` is None when there were no files to replace on disk.
+        """
+        if thread is not None:
+            # Ignore threads that were stopped before
+            if thread is not self.replace_thread:
+                return
+            self._stop_and_reset_replace_thread()
+
+        if self.replace_dialog is None:
+            return
+
+        if thread is not None and thread.preview:
+            self.replace_dialog.set_preview_finished()
+        else:
+            self.replace_dialog.set_replace_finished(
+                self._replaced_files, self._num_replacements)
+            self.sig_replace_finished.emit(
+                self._replaced_files, self._num_replacements)
+
+            # Show the results that are left
+            self.start()
+
+    def _stop_and_reset_replace_thread(self):
+        """
+        Stop current replace thread and clean-up.
+
+        Files are written atomically, so stopping a thread that applies
+        replacements leaves the files it didn't process untouched.
+        """
+        if self.replace_thread is not None:
+            if self.replace_thread.isRunning():
+                self.replace_thread.stop()
+                self.replace_thread.wait()
+
+            self.replace_thread.setParent(None)
+            self.replace_thread = None
+
+        if not self.running:
+            self.stop_spinner()
+        self.update_actions()
+
+    def _cancel_replace(self):
+        """Stop previewing replacements when their dialog is closed."""
+        if (
+            self.replace_thread is not None
+            and self.replace_thread.preview
+        ):
+            self._stop_and_reset_replace_thread()
+
+    def _apply_replacements(self, filenames):
+        """Apply replacements to the files selected in the dialog."""
+        # Previews for files on disk are not needed anymore
+        self._stop_and_reset_replace_thread()
+
+        self._replaced_files = 0
+        self._num_replacements = 0
+        pattern, repl = self._replace_pattern
+
+        # Files open in the editor are patched in memory, so that users can
+        # review and save them.
+        editors = self._get_open_editors()
+        disk_files = []
+        for filename in filenames:
+            editor = editors.get(filename)
+            if editor is None:
+                disk_files.append(filename)
+                continue
+
+            count = self._replace_in_editor(editor, pattern, repl)
+            if count:
+                self._replaced_files += 1
+                self._num_replacements += count
+
+        if disk_files:
+            self._start_replace_thread(disk_files, preview=False)
+        else:
+            self._handle_replace_complete()
+
+    def _setup_project_index(self, path):
+        """Load the index of the project in `path` and update it."""
+        self._close_project_index()
+        if not self.get_conf('project_index'):
+            return
+
+        self.project_index = TrigramIndex(path)
+
+        # Loading and updating the index requires reading the project files,
+        # so it needs to be done in a thread.
+        worker = self._worker_manager.create_python_worker(
+            self._load_project_index, self.project_index
+        )
+        worker.sig_finished.connect(self._on_project_index_updated)
+        worker.start()
+
+    def _load_project_index(self, index):
+        """Load `index` from disk and bring it up to date."""
+        index.load()
+        index.update()
+        index.save()
+        return index
+
+    def _on_project_index_updated(self, worker, output, error):
+        """Handle the end of an index update."""
+        if error:
+            logger.debug(
+                "Error while updating Find in files index: {}".format(error)
+            )
+            return
+
+        # Process changes reported while the index was updated
+        if output is self.project_index and output.has_dirty_files():
+            self._index_timer.start()
+
+    def _update_project_index_files(self):
+        """Index again the project files that changed."""
+        if self.project_index is None or not self.project_index.ready:
+            return
+
+        worker = self._worker_manager.create_python_worker(
+            self.project_index.update_dirty_files
+        )
+        worker.start()
+
+    def _close_project_index(self):
+        """Save and stop using the current project index."""
+        self._index_timer.stop()
+        if self.project_index is not None:
+            if self.project_index.ready:
+                self.project_index.save()
+            self.project_index = None
+
+    def _invalidate_project_path(self, path, is_dir):
+        """Remove a changed file or directory from the project index."""
+        if self.project_index is None:
+            return
+
+        if is_dir:
+            self.project_index.invalidate_directory(path)
+        else:
+            self.project_index.invalidate_file(path)
+            self._index_timer.start()
+
     # ---- Public API
     # ------------------------------------------------------------------------
     @property
@@ -615,10 +1008,54 @@ def set_project_path(self, path):
             Project path string.
         """
         self.path_selection_combo.set_project_path(path)
+        self._setup_project_index(path)
 
     def disable_project_search(self):
         """Disable project search path in combobox."""
         self.path_selection_combo.set_project_path(None)
+        self._close_project_index()
+
+    def close_project_index(self):
+        """Save the project index and stop pending updates."""
+        self._worker_manager.terminate_all()
+        self._close_project_index()
+
+    def project_files_changed(self, changes):
+        """
+        Update the project index after files were changed.
+
+        Parameters
+        ----------
+        changes: list
+            List of (event_type, src_path, dest_path, is_dir) tuples, where
+            dest_path is only set for moves.
+        """
+        for __, src_path, dest_path, is_dir in changes:
+            self._invalidate_project_path(src_path, is_dir)
+            if dest_path is not None:
+                self._invalidate_project_path(dest_path, is_dir)
+
+    def set_remote_path(self, path, server_id, files_api_class):
+        """
+        Set a directory in a remote server as the remote search path.
+
+        Parameters
+        ----------
+        path: str
+            Directory path in the remote server.
+        server_id: str
+            Id of the remote server.
+        files_api_class: callable
+            Class of the file services API of the server, as returned by
+            the Remote client plugin.
+        """
+        self._remote_files_api_class = files_api_class
+        self.path_selection_combo.set_remote_path(path, server_id)
+
+    def unset_remote_path(self):
+        """Disable remote search path in combobox."""
+        self._remote_files_api_class = None
+        self.path_selection_combo.set_remote_path(None, None)
 
     def set_file_path(self, path):
         """
@@ -683,6 +1120,15 @@ def start(self):
 
         self._stop_and_reset_thread(ignore_results=True)
         search_text = self.search_text_edit.currentText()
+        self._last_search = (
+            search_text,
+            self.search_regexp_action.isChecked(),
+            self.case_action.isChecked(),
+            options[0],
+        )
+        self._last_search_remote = (
+            self.path_selection_combo.is_remote_search()
+        )
 
         # Update and set options
         self._update_options()
@@ -695,12 +1141,24 @@ def start(self):
         # Start
         self.running = True
         self.start_spinner()
-        self.search_thread = SearchThread(
-            None,
-            search_text,
-            self.text_color,
-            self.get_conf('max_results')
-        )
+        if self._last_search_remote:
+            # Remote directories are searched by their server
+            self.search_thread = RemoteSearchThread(
+                None,
+                search_text,
+                self._remote_files_api_class,
+                self.get_conf('max_results'),
+            )
+        else:
+            self.search_thread = SearchThread(
+                None,
+                search_text,
+                self.get_conf('max_results'),
+                index=self.project_index,
+                text_file_cache=self.text_file_cache,
+                use_ignore_files=self.get_conf('use_ignore_files'),
+                buffers=self._get_unsaved_buffers()
+            )
         self.search_thread.sig_finished.connect(self._handle_search_complete)
         self.search_thread.sig_file_match.connect(
             self.result_browser.append_file_result
@@ -713,6 +1171,83 @@ def start(self):
         self.search_thread.start()
         self.update_actions()
 
+    def replace(self):
+        """
+        Preview the replacements of the current results in a dialog.
+
+        Notes
+        -----
+        Replacements are applied in a thread after users confirm them in
+        the dialog. Files open in the editor are changed in memory instead
+        of on disk.
+        """
+        filenames = list(self.result_browser.files)
+        if (
+            self.running
+            or self.replace_thread is not None
+            or self._last_search is None
+            or self._last_search_remote
+            or not filenames
+        ):
+            return
+
+        search_text, text_re, case_sensitive, path = self._last_search
+        replacement = str(self.replace_text_edit.currentText())
+
+        # Validate the replacement
+        self.replace_text_edit.lineEdit().setStyleSheet("")
+        self.replace_text_edit.setToolTip("")
+        try:
+            self._replace_pattern = get_replace_pattern(
+                search_text, replacement, text_re, case_sensitive)
+        except re.error as error:
+            self.replace_text_edit.lineEdit().setStyleSheet(
+                self.REGEX_INVALID)
+            tooltip = self.REGEX_ERROR + ': ' + str(error)
+            self.replace_text_edit.setToolTip(tooltip)
+            return
+
+        self.replace_text_edit.add_text(replacement)
+        self._update_options()
+
+        if self.replace_dialog is not None:
+            self.replace_dialog.close()
+        self.replace_dialog = ReplaceDialog(
+            self, search_text, replacement, path)
+        self.replace_dialog.sig_replace_requested.connect(
+            self._apply_replacements)
+        self.replace_dialog.rejected.connect(self._cancel_replace)
+
+        # Preview files open in the editor with their current contents
+        pattern, repl = self._replace_pattern
+        editors = self._get_open_editors()
+        disk_files = []
+        for filename in filenames:
+            editor = editors.get(filename)
+            if editor is None:
+                disk_files.append(filename)
+                continue
+
+            text = editor.toPlainText()
+            new_text, count = replace_text(text, pattern, repl)
+            self.replace_dialog.add_file(
+                filename,
+                count,
+                get_diff(filename, text, new_text,
+                         rel_dirname=osp.dirname(filename)),
+                in_editor=True
+            )
+
+        self.replace_dialog.show()
+        if disk_files:
+            self._start_replace_thread(disk_files, preview=True)
+        else:
+            self.replace_dialog.set_preview_finished()
+
+    def stop_replace(self):
+        """Stop the current replace thread."""
+        self._stop_and_reset_replace_thread()
+
     def add_external_path(self, path):
         """
         Parameters
@@ -749,7 +1284,7 @@ def set_max_results(self, value=None):
             # dialog. Since that value seems a bit arbitrary, we decided to set
             # it to 5.
             # See spyder-ide/spyder#16256
-            dialog.setIntRange(5, 10000)
+            dialog.setIntRange(5, 1000000)
 
             # Connect slot
             dialog.intValueSelected.connect(
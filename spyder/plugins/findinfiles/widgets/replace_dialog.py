@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Dialog to preview and apply replacements in files."""
+
+# Standard library imports
+import os.path as osp
+
+# Third party imports
+from qtpy import PYSIDE2
+from qtpy.QtCore import Qt, Signal
+from qtpy.QtWidgets import (
+    QDialog,
+    QDialogButtonBox,
+    QLabel,
+    QListWidget,
+    QListWidgetItem,
+    QProgressBar,
+    QSplitter,
+    QVBoxLayout,
+)
+
+# Local imports
+from spyder.api.fonts import SpyderFontsMixin, SpyderFontType
+from spyder.api.translations import _
+from spyder.api.widgets.dialogs import SpyderDialogButtonBox
+from spyder.api.widgets.mixins import SpyderWidgetMixin
+from spyder.widgets.simplecodeeditor import SimpleCodeEditor
+
+
+# ---- Constants
+# ----------------------------------------------------------------------------
+# Roles used to store file data in list items.
+FILENAME_ROLE = Qt.UserRole
+DIFF_ROLE = Qt.UserRole + 1
+
+
+# ---- Dialog
+# ----------------------------------------------------------------------------
+class ReplaceDialog(QDialog, SpyderWidgetMixin, SpyderFontsMixin):
+    """
+    Dialog that shows a diff of the replacements in each file and lets
+    users select the files where they are applied.
+    """
+
+    sig_replace_requested = Signal(list)
+    """
+    This signal is emitted to request applying the replacements.
+
+    Parameters
+    ----------
+    filenames: list
+        Files selected by the user.
+    """
+
+    def __init__(self, parent, search_text, replace_text, path):
+        """
+        Parameters
+        ----------
+        parent: QWidget
+            Parent widget.
+        search_text: str
+            Searched text.
+        replace_text: str
+            Replacement text.
+        path: str
+            Path where the search was done. File names are shown relative to
+            it.
+        """
+        if not PYSIDE2:
+            super().__init__(parent, class_parent=parent)
+        else:
+            QDialog.__init__(self, parent)
+            SpyderWidgetMixin.__init__(self, class_parent=parent)
+
+        self.search_text = search_text
+        self.replace_text = replace_text
+        self.path = path if path and osp.isdir(path) else None
+        self.num_files = 0
+        self.num_replacements = 0
+        self.errors = {}
+        self.replacing = False
+        self.finished = False
+
+        # Widgets
+        self.summary_label = QLabel(self)
+        self.summary_label.setWordWrap(True)
+
+        self.files_list = QListWidget(self)
+
+        self.diff_viewer = SimpleCodeEditor(self)
+        self.diff_viewer.setup_editor(
+            linenumbers=False,
+            language='diff',
+            color_scheme=self.get_conf('selected', section='appearance'),
+            font=self.get_font(SpyderFontType.Monospace),
+            wrap=False,
+            highlight_current_line=False,
+        )
+        self.diff_viewer.setReadOnly(True)
+
+        splitter = QSplitter(self)
+        splitter.addWidget(self.files_list)
+        splitter.addWidget(self.diff_viewer)
+        splitter.setStretchFactor(0, 1)
+        splitter.setStretchFactor(1, 3)
+
+        self.progress_bar = QProgressBar(self)
+
+        self.button_box = SpyderDialogButtonBox(
+            QDialogButtonBox.Cancel, parent=self
+        )
+        self.replace_button = self.button_box.addButton(
+            _("Replace"), QDialogButtonBox.AcceptRole
+        )
+        self.replace_button.setEnabled(False)
+
+        # Layout
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.summary_label)
+        layout.addWidget(splitter)
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.button_box)
+        self.setLayout(layout)
+
+        # Setup
+        self.setWindowTitle(_("Replace in files"))
+        self.resize(900, 550)
+        self._update_summary()
+
+        # Signals
+        self.files_list.currentItemChanged.connect(self._show_diff)
+        self.files_list.itemChanged.connect(self._update_replace_button)
+        self.button_box.accepted.connect(self._request_replace)
+        self.button_box.rejected.connect(self.reject)
+
+    # ---- Private API
+    # ------------------------------------------------------------------------
+    def _get_display_name(self, filename):
+        if self.path is not None:
+            return osp.relpath(filename, self.path)
+        return filename
+
+    def _show_diff(self, item, __=None):
+        if item is not None:
+            self.diff_viewer.set_text(item.data(DIFF_ROLE))
+
+    def _update_replace_button(self, __=None):
+        self.replace_button.setEnabled(
+            not self.replacing
+            and not self.finished
+            and bool(self.get_selected_files())
+        )
+
+    def _update_summary(self, text=None):
+        if text is None:
+            text = _(
+                "Replace <b>{}</b> with <b>{}</b>: {} replacements in {} "
+                "files. Uncheck the files you don't want to change."
+            ).format(
+                self._escape(self.search_text),
+                self._escape(self.replace_text),
+                self.num_replacements,
+                self.num_files
+            )
+        self.summary_label.setText(text)
+
+    def _escape(self, text):
+        return (
+            text.replace('&', '&amp;')
+            .replace('<', '&lt;')
+            .replace('>', '&gt;')
+        )
+
+    def _request_replace(self):
+        filenames = self.get_selected_files()
+        if not filenames:
+            return
+
+        self.replacing = True
+        self.errors = {}
+        self.files_list.setEnabled(False)
+        self._update_replace_button()
+        self.set_progress(0, len(filenames))
+        self._update_summary(_("Replacing..."))
+        self.sig_replace_requested.emit(filenames)
+
+    # ---- Public API
+    # ------------------------------------------------------------------------
+    def add_file(self, filename, count, diff, in_editor=False):
+        """
+        Add the preview of the replacements in a file.
+
+        Parameters
+        ----------
+        filename: str
+            Path of the file.
+        count: int
+            Number of replacements.
+        diff: str
+            Diff of the changes.
+        in_editor: bool, optional
+            Whether the file is open in the editor, in which case it will be
+            changed in memory. Default is False.
+        """
+        if not count:
+            return
+
+        text = "{} ({})".format(self._get_display_name(filename), count)
+        if in_editor:
+            text += " - " + _("open in the editor")
+
+        item = QListWidgetItem(text)
+        item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+        item.setCheckState(Qt.Checked)
+        item.setData(FILENAME_ROLE, filename)
+        item.setData(DIFF_ROLE, diff)
+        item.setToolTip(filename)
+        self.files_list.addItem(item)
+
+        self.num_files += 1
+        self.num_replacements += count
+        if self.files_list.currentItem() is None:
+            self.files_list.setCurrentItem(item)
+
+        self._update_summary()
+
+    def add_error(self, filename, error):
+        """Register a file that couldn't be processed."""
+        self.errors[filename] = error
+
+    def get_selected_files(self):
+        """Get the files checked by the user."""
+        filenames = []
+        for row in range(self.files_list.count()):
+            item = self.files_list.item(row)
+            if item.checkState() == Qt.Checked:
+                filenames.append(item.data(FILENAME_ROLE))
+        return filenames
+
+    def set_progress(self, done, total):
+        """Show the number of processed files."""
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(done)
+
+    def set_preview_finished(self):
+        """Enable replacements once all files were previewed."""
+        self.progress_bar.setValue(self.progress_bar.maximum())
+        if self.errors:
+            self._update_summary(
+                self.summary_label.text()
+                + "<br>"
+                + _("{} files couldn't be read.").format(len(self.errors))
+            )
+        self._update_replace_button()
+
+    def set_replace_finished(self, num_files, num_replacements):
+        """
+        Show the result of the replacements.
+
+        Parameters
+        ----------
+        num_files: int
+            Number of changed files.
+        num_replacements: int
+            Number of replacements done.
+        """
+        self.replacing = False
+        self.finished = True
+        self._update_replace_button()
+        text = _("Done: {} replacements in {} files.").format(
+            num_replacements, num_files
+        )
+        if self.errors:
+            text += "<br>" + _("{} files couldn't be changed:").format(
+                len(self.errors)
+            )
+            text += "<br>" + "<br>".join(
+                self._escape(self._get_display_name(filename))
+                for filename in sorted(self.errors)
+            )
+        self._update_summary(text)
+
+        cancel_button = self.button_box.button(QDialogButtonBox.Cancel)
+        if cancel_button is not None:
+            cancel_button.setText(_("Close"))
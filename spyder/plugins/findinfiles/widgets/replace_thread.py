@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Replace thread."""
+
+# Standard library imports
+import threading
+import traceback
+
+# Third party imports
+from qtpy.QtCore import QThread, Signal
+
+# Local imports
+from spyder.plugins.findinfiles.utils.replace import replace_in_file
+
+
+# ---- Thread
+# ----------------------------------------------------------------------------
+class ReplaceThread(QThread):
+    """
+    Find in files replace thread.
+
+    It previews or applies replacements in a list of files on disk.
+    """
+
+    sig_file_replaced = Signal(str, int, str)
+    """
+    This signal is emitted when a file was previewed or replaced.
+
+    Parameters
+    ----------
+    filename: str
+        Path of the file.
+    count: int
+        Number of replacements.
+    diff: str
+        Diff of the changes. It's empty when replacements are applied.
+    """
+
+    sig_file_error = Signal(str, str)
+    """
+    This signal is emitted when a file couldn't be read or written.
+
+    Parameters
+    ----------
+    filename: str
+        Path of the file.
+    error: str
+        Error message.
+    """
+
+    sig_progress = Signal(int, int)
+    """
+    This signal is emitted to report the number of processed files.
+
+    Parameters
+    ----------
+    done: int
+        Number of processed files.
+    total: int
+        Total number of files.
+    """
+
+    sig_finished = Signal(bool)
+    """
+    This signal is emitted when the thread finishes.
+
+    Parameters
+    ----------
+    completed: bool
+        Whether all files were processed or the thread was stopped before.
+    """
+
+    def __init__(self, parent, filenames, pattern, repl, preview=True):
+        """
+        Parameters
+        ----------
+        parent: QObject
+            Parent object.
+        filenames: list
+            Files to replace.
+        pattern, repl:
+            Output of `get_replace_pattern`.
+        preview: bool, optional
+            If True, only compute the diffs of the replacements. Otherwise
+            write them to disk. Default is True.
+        """
+        super().__init__(parent)
+        self.filenames = list(filenames)
+        self.pattern = pattern
+        self.repl = repl
+        self.preview = preview
+        self.completed = False
+        self._stop_event = threading.Event()
+
+    @property
+    def stopped(self):
+        """Whether the thread was stopped."""
+        return self._stop_event.is_set()
+
+    def run(self):
+        total = len(self.filenames)
+        try:
+            for done, filename in enumerate(self.filenames, start=1):
+                if self.stopped:
+                    break
+
+                try:
+                    count, diff = replace_in_file(
+                        filename,
+                        self.pattern,
+                        self.repl,
+                        write=not self.preview,
+                        diff=self.preview
+                    )
+                except (OSError, RuntimeError) as error:
+                    self.sig_file_error.emit(filename, str(error))
+                else:
+                    self.sig_file_replaced.emit(filename, count, diff or '')
+
+                self.sig_progress.emit(done, total)
+            else:
+                self.completed = True
+        except Exception:
+            # Important note: we have to handle unexpected exceptions by
+            # ourselves because they won't be catched by the main thread
+            # (known QThread limitation/bug)
+            traceback.print_exc()
+
+        self.sig_finished.emit(self.completed)
+
+    def stop(self):
+        """Stop processing files after the current one."""
+        self._stop_event.set()
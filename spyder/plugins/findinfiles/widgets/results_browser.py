@@ -7,76 +7,329 @@
 """Results browser."""
 
 # Standard library imports
+from array import array
 import os.path as osp
 
 # Third party imports
-from qtpy.QtCore import QPoint, QSize, Qt, Signal, Slot
+from qtpy import PYSIDE2
+from qtpy.QtCore import (QAbstractItemModel, QModelIndex, QPoint, QSize, Qt,
+                         Signal, Slot)
 from qtpy.QtGui import (QAbstractTextDocumentLayout, QColor, QFontMetrics,
                         QTextDocument)
-from qtpy.QtWidgets import (QApplication, QStyle, QStyledItemDelegate,
-                            QStyleOptionViewItem, QTreeWidgetItem)
+from qtpy.QtWidgets import (QAbstractItemView, QApplication, QHeaderView,
+                            QStyle, QStyledItemDelegate, QStyleOptionViewItem,
+                            QTreeView)
 
 # Local imports
 from spyder.api.fonts import SpyderFontsMixin, SpyderFontType
 from spyder.api.translations import _
-from spyder.plugins.findinfiles.widgets.search_thread import (
-    ELLIPSIS, MAX_RESULT_LENGTH)
+from spyder.api.widgets.mixins import SpyderWidgetMixin
 from spyder.utils import icon_manager as ima
 from spyder.utils.palette import SpyderPalette
 from spyder.utils.stylesheet import AppStyle
-from spyder.widgets.onecolumntree import OneColumnTree
 
 
 # ---- Constants
 # ----------------------------------------------------------------------------
 ON = 'on'
 OFF = 'off'
+ELLIPSIS = '...'
+MAX_RESULT_LENGTH = 80
+MAX_NUM_CHAR_FRAGMENT = 40
 
+# Role to get the record of an item, which is rendered by the delegate.
+RecordRole = Qt.UserRole + 1
 
-# ---- Items
+
+class ResultsBrowserActions:
+    CollapseAll = 'collapse_all_action'
+    ExpandAll = 'expand_all_action'
+
+
+# ---- Rendering
 # ----------------------------------------------------------------------------
-class LineMatchItem(QTreeWidgetItem):
+def html_escape(text):
+    """Produce entities within text."""
+    html_escape_table = {
+        "&": "&amp;",
+        '"': "&quot;",
+        "'": "&apos;",
+        ">": "&gt;",
+        "<": "&lt;",
+    }
+    return "".join(html_escape_table.get(c, c) for c in text)
+
+
+def truncate_result(line, start, end):
+    """
+    Shorten text on line to display the match within `MAX_RESULT_LENGTH`.
+
+    Returns
+    -------
+    tuple
+        (left, match, right) tuple with the text before, in and after the
+        match.
+    """
+    line = str(line)
+    left, match, right = line[:start], line[start:end], line[end:]
+
+    if len(line) > MAX_RESULT_LENGTH:
+        offset = (len(line) - len(match)) // 2
+
+        left = left.split(' ')
+        num_left_words = len(left)
+
+        if num_left_words == 1:
+            left = left[0]
+            if len(left) > MAX_NUM_CHAR_FRAGMENT:
+                left = ELLIPSIS + left[-offset:]
+            left = [left]
+
+        right = right.split(' ')
+        num_right_words = len(right)
+
+        if num_right_words == 1:
+            right = right[0]
+            if len(right) > MAX_NUM_CHAR_FRAGMENT:
+                right = right[:offset] + ELLIPSIS
+            right = [right]
+
+        left = left[-4:]
+        right = right[:4]
+
+        if len(left) < num_left_words:
+            left = [ELLIPSIS] + left
+
+        if len(right) < num_right_words:
+            right = right + [ELLIPSIS]
+
+        left = ' '.join(left)
+        right = ' '.join(right)
+
+        if len(left) > MAX_NUM_CHAR_FRAGMENT:
+            left = ELLIPSIS + left[-30:]
+
+        if len(right) > MAX_NUM_CHAR_FRAGMENT:
+            right = right[:30] + ELLIPSIS
+
+    return left, match, right
+
+
+def get_line_html(lineno, start, end, line, font, text_color):
+    """Get the HTML used to display a line match."""
+    left, match, right = truncate_result(line, start, end)
+    match_color = SpyderPalette.COLOR_OCCURRENCE_4
+    formatted_text = (
+        f'<span style="color:{text_color}">'
+        f'{html_escape(left)}'
+        f'<span style="background-color:{match_color}">'
+        f'{html_escape(match)}'
+        f'</span>'
+        f'{html_escape(right)}'
+        f'</span>'
+    )
+
+    return (
+        f"<p style=\"color:'{text_color}';\">"
+        f'&nbsp;&nbsp;'
+        f"<b>{lineno}</b> ({start}): "
+        f"<span style='font-family:{font.family()};"
+        f"font-size:{font.pointSize()}pt;'>{formatted_text}</span>"
+        f"</p>"
+    )
+
+
+def get_file_html(filename, rel_dirname, text_color):
+    """Get the HTML used to display a file with matches."""
+    return (
+        f'<b style="color:{text_color}">{osp.basename(filename)}</b>'
+        f'&nbsp;&nbsp;&nbsp;'
+        f'<span style="color:{text_color}">'
+        f'<em>{rel_dirname}</em>'
+        f'</span>'
+    )
+
+
+# ---- Model
+# ----------------------------------------------------------------------------
+class FileResults:
+    """
+    Matches found in a file.
 
-    def __init__(self, parent, lineno, colno, match, font, text_color):
-        self.lineno = lineno
-        self.colno = colno
-        self.match = match['formatted_text']
-        self.plain_match = match['text']
-        self.text_color = text_color
-        self.font = font
-        super().__init__(parent, [self.__repr__()], QTreeWidgetItem.Type)
-
-    def __repr__(self):
-        match = str(self.match).rstrip()
-        _str = (
-            f"<!-- LineMatchItem -->"
-            f"<p style=\"color:'{self.text_color}';\">"
-            f'&nbsp;&nbsp;'
-            f"<b>{self.lineno}</b> ({self.colno}): "
-            f"<span style='font-family:{self.font.family()};"
-            f"font-size:{self.font.pointSize()}pt;'>{match}</span></p>"
-        )
-        return _str
+    Matches are kept as (lineno, start, end) triples in a flat array and
+    lines are stored once, even if they have several matches, to keep the
+    memory used by large searches low.
+    """
+
+    __slots__ = ('filename', 'rel_dirname', 'row', 'matches', 'lines')
+
+    def __init__(self, filename, rel_dirname, row):
+        self.filename = filename
+        self.rel_dirname = rel_dirname
+        self.row = row
+        self.matches = array('l')
+        self.lines = {}
+
+    def __len__(self):
+        return len(self.matches) // 3
+
+    def add_match(self, lineno, start, end, line):
+        """Add a match to the file."""
+        self.matches.extend((lineno, start, end))
+        if lineno not in self.lines:
+            self.lines[lineno] = line
+
+    def get_match(self, row):
+        """Get the (lineno, start, end, line) tuple of match in `row`."""
+        lineno, start, end = self.matches[3 * row:3 * row + 3]
+        return lineno, start, end, self.lines[lineno]
+
+
+class ResultsModel(QAbstractItemModel):
+    """
+    Model with the results of a search.
+
+    Top level rows are files and their children the matches found in them.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.path = None
+        self.title = ''
+        self.num_matches = 0
+        self.files = {}
+        self._rows = []
+        self._icons = {}
+
+    # ---- Qt methods
+    # ------------------------------------------------------------------------
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
 
-    def __unicode__(self):
-        return self.__repr__()
+        if not parent.isValid():
+            return self.createIndex(row, column)
 
-    def __str__(self):
-        return self.__repr__()
+        # Match items point to the results of their file
+        return self.createIndex(row, column, self._rows[parent.row()])
 
-    def __lt__(self, x):
-        return self.lineno < x.lineno
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
 
-    def __ge__(self, x):
-        return self.lineno >= x.lineno
+        file_results = index.internalPointer()
+        if file_results is None:
+            return QModelIndex()
 
+        return self.createIndex(file_results.row, 0)
 
-class FileMatchItem(QTreeWidgetItem):
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
 
-    def __init__(self, parent, path, filename, sorting, text_color):
+        if not parent.isValid():
+            return len(self._rows)
 
-        self.sorting = sorting
-        self.filename = osp.basename(filename)
+        if parent.internalPointer() is None:
+            return len(self._rows[parent.row()])
+
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        return self.rowCount(parent) > 0
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        file_results = index.internalPointer()
+        if file_results is None:
+            file_results = self._rows[index.row()]
+            if role == RecordRole:
+                return (file_results.filename, file_results.rel_dirname)
+            elif role == Qt.DisplayRole:
+                return osp.join(file_results.rel_dirname,
+                                osp.basename(file_results.filename))
+            elif role == Qt.ToolTipRole:
+                return file_results.filename
+            elif role == Qt.DecorationRole:
+                return self._get_icon(file_results.filename)
+        else:
+            if role == RecordRole:
+                return file_results.get_match(index.row())
+            elif role == Qt.DisplayRole:
+                lineno, start, __, line = file_results.get_match(index.row())
+                return f"{lineno} ({start}): {line}"
+
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.title
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort files by name."""
+        self.layoutAboutToBeChanged.emit()
+
+        old_indexes = self.persistentIndexList()
+        old_files = [
+            self._rows[index.row()] if index.internalPointer() is None
+            else None
+            for index in old_indexes
+        ]
+
+        self._rows.sort(
+            key=lambda file_results: osp.basename(file_results.filename),
+            reverse=(order == Qt.DescendingOrder)
+        )
+        for row, file_results in enumerate(self._rows):
+            file_results.row = row
+
+        # Matches don't move, so only file indexes need to be updated
+        new_indexes = [
+            self.createIndex(file_results.row, index.column())
+            if file_results is not None else index
+            for index, file_results in zip(old_indexes, old_files)
+        ]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+
+        self.layoutChanged.emit()
+
+    # ---- Public API
+    # ------------------------------------------------------------------------
+    def clear(self):
+        """Remove all results."""
+        self.beginResetModel()
+        self.num_matches = 0
+        self.files = {}
+        self._rows = []
+        self.endResetModel()
+
+    def set_title(self, title):
+        """Set the title shown in the header."""
+        self.title = title
+        self.headerDataChanged.emit(Qt.Horizontal, 0, 0)
+
+    def add_file(self, filename):
+        """
+        Add a file to the results.
+
+        Returns
+        -------
+        QModelIndex
+            Index of the file.
+        """
+        if filename in self.files:
+            return self.createIndex(self.files[filename].row, 0)
 
         # Get relative dirname according to the path we're searching in.
         dirname = osp.dirname(filename)
@@ -85,83 +338,125 @@ def __init__(self, parent, path, filename, sorting, text_color):
         # name. This happens when the user is searching in a single file.
         # Fixes spyder-ide/spyder#17443 and spyder-ide/spyder#20964
         try:
-            rel_dirname = dirname.split(path)[1]
+            rel_dirname = dirname.split(self.path)[1]
             if rel_dirname.startswith(osp.sep):
                 rel_dirname = rel_dirname[1:]
-        except IndexError:
+        except (IndexError, TypeError, ValueError):
             rel_dirname = dirname
 
-        self.rel_dirname = rel_dirname
-
-        title = (
-            f'<!-- FileMatchItem -->'
-            f'<b style="color:{text_color}">{osp.basename(filename)}</b>'
-            f'&nbsp;&nbsp;&nbsp;'
-            f'<span style="color:{text_color}">'
-            f'<em>{self.rel_dirname}</em>'
-            f'</span>'
-        )
-
-        super().__init__(parent, [title], QTreeWidgetItem.Type)
-
-        self.setIcon(0, ima.get_icon_by_extension_or_type(filename, 1.0))
-        self.setToolTip(0, filename)
-
-    def __lt__(self, x):
-        if self.sorting['status'] == ON:
-            return self.filename < x.filename
-        else:
-            return False
-
-    def __ge__(self, x):
-        if self.sorting['status'] == ON:
-            return self.filename >= x.filename
-        else:
-            return False
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        file_results = FileResults(filename, rel_dirname, row)
+        self._rows.append(file_results)
+        self.files[filename] = file_results
+        self.endInsertRows()
+
+        return self.createIndex(row, 0)
+
+    def add_matches(self, filename, matches):
+        """
+        Add matches found in `filename`, which needs to be added first.
+
+        Parameters
+        ----------
+        filename: str
+            Path of the file.
+        matches: list
+            List of (lineno, start, end, line) tuples.
+        """
+        file_results = self.files[filename]
+        first = len(file_results)
+        parent = self.createIndex(file_results.row, 0)
+
+        self.beginInsertRows(parent, first, first + len(matches) - 1)
+        for lineno, start, end, line in matches:
+            file_results.add_match(lineno, start, end, line)
+        self.num_matches += len(matches)
+        self.endInsertRows()
+
+    def get_match_data(self, index):
+        """
+        Get the (filename, lineno, start, end) tuple of a match index.
+
+        Returns None for file indexes.
+        """
+        if not index.isValid() or index.internalPointer() is None:
+            return None
+
+        file_results = index.internalPointer()
+        lineno, start, end, __ = file_results.get_match(index.row())
+        return file_results.filename, lineno, start, end
+
+    def iter_matches(self):
+        """Generate (filename, lineno, start, end) tuples for all matches."""
+        for file_results in self._rows:
+            for row in range(len(file_results)):
+                lineno, start, end, __ = file_results.get_match(row)
+                yield file_results.filename, lineno, start, end
+
+    # ---- Private API
+    # ------------------------------------------------------------------------
+    def _get_icon(self, filename):
+        """Get the icon of a file, which is cached by extension."""
+        ext = osp.splitext(filename)[1].lower()
+        if ext not in self._icons:
+            self._icons[ext] = ima.get_icon_by_extension_or_type(
+                filename, 1.0)
+        return self._icons[ext]
 
 
 # ---- Browser
 # ----------------------------------------------------------------------------
 class ItemDelegate(QStyledItemDelegate):
+    """
+    Delegate that renders the results as HTML.
+
+    Rendering is done when items are painted, so only visible items are
+    formatted.
+    """
 
-    def __init__(self, parent):
+    def __init__(self, parent, text_color):
         super().__init__(parent)
         self._margin = None
         self._background_color = QColor(SpyderPalette.COLOR_BACKGROUND_3)
+        self.text_color = text_color
+        self.font = None
         self.width = 0
 
+    def get_html(self, index):
+        """Get the HTML that corresponds to `index`."""
+        record = index.data(RecordRole)
+        if record is None:
+            return ''
+
+        if index.parent().isValid():
+            lineno, start, end, line = record
+            return get_line_html(lineno, start, end, line, self.font,
+                                 self.text_color)
+        else:
+            filename, rel_dirname = record
+            return get_file_html(filename, rel_dirname, self.text_color)
+
     def paint(self, painter, option, index):
         options = QStyleOptionViewItem(option)
         self.initStyleOption(options, index)
         style = (QApplication.style() if options.widget is None
                  else options.widget.style())
 
-        # Set background color for selected and hovered items.
+        # Set background color for hovered items.
         # Inspired by:
         # - https://stackoverflow.com/a/43253004/438386
         # - https://stackoverflow.com/a/27274233/438386
-
-        # This is commented for now until we find a way to correctly colorize
-        # the entire line with a single color.
-        # if options.state & QStyle.State_Selected:
-        #     # This only applies when the selected item doesn't have focus
-        #     if not (options.state & QStyle.State_HasFocus):
-        #         options.palette.setBrush(
-        #             QPalette.Highlight,
-        #             QBrush(self._background_color)
-        #         )
-
         if options.state & QStyle.State_MouseOver:
             painter.fillRect(option.rect, self._background_color)
 
         # Set text
         doc = QTextDocument()
-        text = options.text
-        doc.setHtml(text)
+        doc.setHtml(self.get_html(index))
         doc.setDocumentMargin(0)
 
         # This needs to be an empty string to avoid overlapping the
-        # normal text of the QTreeWidgetItem
+        # plain text of the item
         options.text = ""
         style.drawControl(QStyle.CE_ItemViewItem, options, painter)
 
@@ -176,61 +471,145 @@ def paint(self, painter, option, index):
         painter.restore()
 
     def sizeHint(self, option, index):
+        # The tree view has uniform row heights, so this is only called for
+        # the first row.
         options = QStyleOptionViewItem(option)
         self.initStyleOption(options, index)
         doc = QTextDocument()
-        doc.setHtml(options.text)
+        doc.setHtml(self.get_html(index))
         doc.setTextWidth(options.rect.width())
-        size = QSize(self.width, int(doc.size().height()))
-        return size
+        return QSize(self.width, int(doc.size().height()))
 
 
-class ResultsBrowser(OneColumnTree, SpyderFontsMixin):
+class ResultsBrowser(QTreeView, SpyderWidgetMixin, SpyderFontsMixin):
 
     sig_edit_goto_requested = Signal(str, int, str, int, int)
     sig_max_results_reached = Signal()
 
     def __init__(self, parent, text_color, max_results=1000):
-        super().__init__(parent)
+        if not PYSIDE2:
+            super().__init__(parent, class_parent=parent)
+        else:
+            QTreeView.__init__(self, parent)
+            SpyderWidgetMixin.__init__(self, class_parent=parent)
+
         self.search_text = None
-        self.results = None
         self.max_results = max_results
-        self.total_matches = None
-        self.error_flag = None
-        self.completed = None
         self.sorting = {}
         self.font = self.get_font(SpyderFontType.MonospaceInterface)
-        self.data = None
-        self.files = None
-        self.root_items = None
         self.text_color = text_color
-        self.path = None
         self.longest_file_item = ''
         self.longest_line_item = ''
 
+        self.path = None
+
+        # Model
+        self.results_model = ResultsModel(self)
+        self.setModel(self.results_model)
+
         # Setup
         self.set_title('')
         self.set_sorting(OFF)
         self.setSortingEnabled(False)
-        self.setItemDelegate(ItemDelegate(self))
+        self.setItemDelegate(ItemDelegate(self, text_color))
+        self.itemDelegate().font = self.font
         self.setUniformRowHeights(True)  # Needed for performance
+        self.setItemsExpandable(True)
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.header().setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        self.header().setStretchLastSection(False)
         self.sortByColumn(0, Qt.AscendingOrder)
 
-        # Only show the actions for collaps/expand all entries in the widget
-        # For further information see spyder-ide/spyder#13178
-        self.common_actions = self.common_actions[:2]
+        # To use mouseMoveEvent
+        self.setMouseTracking(True)
+
+        # Context menu
+        self.menu = None
+        self.setup()
 
         # Signals
         self.header().sectionClicked.connect(self.sort_section)
+        self.activated.connect(self.on_item_activated)
+        self.clicked.connect(self.on_item_clicked)
 
-    def on_item_activated(self, item):
+    # ---- SpyderWidgetMixin API
+    # ------------------------------------------------------------------------
+    def setup(self):
+        # Only show the actions for collaps/expand all entries in the widget
+        # For further information see spyder-ide/spyder#13178
+        self.menu = self.create_menu("context_menu")
+        collapse_all_action = self.create_action(
+            ResultsBrowserActions.CollapseAll,
+            text=_("Collapse all"),
+            icon=ima.icon("collapse"),
+            triggered=self.collapseAll,
+            register_shortcut=False,
+        )
+        expand_all_action = self.create_action(
+            ResultsBrowserActions.ExpandAll,
+            text=_("Expand all"),
+            icon=ima.icon("expand"),
+            triggered=self.expandAll,
+            register_shortcut=False,
+        )
+        for item in [collapse_all_action, expand_all_action]:
+            self.add_item_to_menu(item, self.menu)
+
+    def update_actions(self):
+        pass
+
+    # ---- Qt methods
+    # ------------------------------------------------------------------------
+    def contextMenuEvent(self, event):
+        """Override Qt method"""
+        self.menu.popup(event.globalPos())
+
+    def mouseMoveEvent(self, event):
+        """Change cursor shape."""
+        index = self.indexAt(event.pos())
+        if index.isValid():
+            vrect = self.visualRect(index)
+            item_identation = vrect.x() - self.visualRect(self.rootIndex()).x()
+            if event.pos().x() > item_identation:
+                # When hovering over results
+                self.setCursor(Qt.PointingHandCursor)
+            else:
+                # On every other element
+                self.setCursor(Qt.ArrowCursor)
+
+        super().mouseMoveEvent(event)
+
+    # ---- Public API
+    # ------------------------------------------------------------------------
+    @property
+    def files(self):
+        """Files with results, by filename."""
+        return self.results_model.files
+
+    @property
+    def num_matches(self):
+        """Number of matches shown."""
+        return self.results_model.num_matches
+
+    def get_matches(self):
+        """Get a list of (filename, lineno, start, end) match tuples."""
+        return list(self.results_model.iter_matches())
+
+    def on_item_activated(self, index):
         """Double-click event."""
-        itemdata = self.data.get(id(self.currentItem()))
+        itemdata = self.results_model.get_match_data(index)
         if itemdata is not None:
             filename, lineno, colno, colend = itemdata
             self.sig_edit_goto_requested.emit(
                 filename, lineno, self.search_text, colno, colend - colno)
 
+    def on_item_clicked(self, index):
+        """Click event."""
+        if not index.parent().isValid():
+            self.setExpanded(index, not self.isExpanded(index))
+        else:
+            self.on_item_activated(index)
+
     def set_sorting(self, flag):
         """Enable result sorting after search is complete."""
         self.sorting['status'] = flag
@@ -240,23 +619,11 @@ def set_sorting(self, flag):
     def sort_section(self, idx):
         self.setSortingEnabled(True)
 
-    def on_item_clicked(self, item):
-        """Click event."""
-        if isinstance(item, FileMatchItem):
-            if item.isExpanded():
-                self.collapseItem(item)
-            else:
-                self.expandItem(item)
-        else:
-            self.on_item_activated(item)
-
     def clear_title(self, search_text):
         self.font = self.get_font(SpyderFontType.MonospaceInterface)
-        self.clear()
+        self.itemDelegate().font = self.font
         self.setSortingEnabled(False)
-        self.num_files = 0
-        self.data = {}
-        self.files = {}
+        self.results_model.clear()
         self.set_sorting(OFF)
         self.search_text = search_text
         title = "'%s' - " % search_text
@@ -273,56 +640,57 @@ def set_title(self, title):
         else:
             elided_title = title
 
-        self.setHeaderLabels([elided_title])
+        self.results_model.set_title(elided_title)
 
     @Slot(object)
     def append_file_result(self, filename):
         """Real-time update of file items."""
-        if len(self.data) < self.max_results:
-            item = FileMatchItem(
-                self,
-                self.path,
-                filename,
-                self.sorting,
-                self.text_color
-            )
-
-            self.files[filename] = item
+        if self.results_model.num_matches < self.max_results:
+            index = self.results_model.add_file(filename)
+            self.expand(index)
 
-            item.setExpanded(True)
-            self.num_files += 1
-
-            item_text = osp.join(item.rel_dirname, item.filename)
+            file_results = self.results_model.files[filename]
+            item_text = osp.join(file_results.rel_dirname,
+                                 osp.basename(filename))
             if len(item_text) > len(self.longest_file_item):
                 self.longest_file_item = item_text
 
     @Slot(object, object)
     def append_result(self, items, title):
         """Real-time update of line items."""
-        if len(self.data) >= self.max_results:
+        if self.results_model.num_matches >= self.max_results:
             self.set_title(_('Maximum number of results reached! Try '
                              'narrowing the search.'))
             self.sig_max_results_reached.emit()
             return
 
-        available = self.max_results - len(self.data)
+        available = self.max_results - self.results_model.num_matches
         if available < len(items):
             items = items[:available]
 
-        self.setUpdatesEnabled(False)
         self.set_title(title)
-        for item in items:
-            filename, lineno, colno, line, match_end = item
-            file_item = self.files.get(filename, None)
-            if file_item:
-                item = LineMatchItem(file_item, lineno, colno, line,
-                                     self.font, self.text_color)
-                self.data[id(item)] = (filename, lineno, colno, match_end)
 
-                if len(item.plain_match) > len(self.longest_line_item):
-                    self.longest_line_item = item.plain_match
+        # Add consecutive matches of the same file at once
+        current_file = None
+        matches = []
+        for filename, lineno, colno, line, match_end in items:
+            if filename not in self.results_model.files:
+                continue
+
+            if filename != current_file:
+                if matches:
+                    self.results_model.add_matches(current_file, matches)
+                current_file = filename
+                matches = []
+
+            line = str(line).rstrip('\r\n')
+            matches.append((lineno, colno, match_end, line))
+
+            if len(line) > len(self.longest_line_item):
+                self.longest_line_item = line
 
-        self.setUpdatesEnabled(True)
+        if matches:
+            self.results_model.add_matches(current_file, matches)
 
     def set_max_results(self, value):
         """Set maximum amount of results to add."""
@@ -331,10 +699,11 @@ def set_max_results(self, value):
     def set_path(self, path):
         """Set path where the search is performed."""
         self.path = path
+        self.results_model.path = path
 
     def set_width(self):
         """Set widget width according to its longest item."""
-        if not self.data:
+        if not self.results_model.num_matches:
             return
 
         # File item width
@@ -7,27 +7,24 @@
 """Search thread."""
 
 # Standard library imports
+from concurrent.futures import CancelledError, ThreadPoolExecutor
 import os
 import os.path as osp
 import re
-import stat
 import traceback
 
 # Third party imports
-from qtpy.QtCore import QMutex, QMutexLocker, QThread, Signal
+from qtpy.QtCore import QThread, Signal
 
 # Local imports
+from spyder.api.asyncdispatcher import AsyncDispatcher
 from spyder.api.translations import _
 from spyder.config.utils import EDIT_EXTENSIONS
-from spyder.utils.encoding import is_text_file
-from spyder.utils.palette import SpyderPalette
-
-
-# ---- Constants
-# ----------------------------------------------------------------------------
-ELLIPSIS = '...'
-MAX_RESULT_LENGTH = 80
-MAX_NUM_CHAR_FRAGMENT = 40
+from spyder.plugins.findinfiles.utils.engine import ProcessPoolSearchEngine
+from spyder.plugins.findinfiles.utils.filters import (
+    IgnoreMatcher, TextFileCache)
+from spyder.plugins.remoteclient.api.modules.base import (
+    SpyderRemoteAPIError)
 
 
 # ---- Thread
@@ -55,13 +52,26 @@ class SearchThread(QThread):
     power = 0       # 0**1 = 1
     max_power = 9   # 2**9 = 512
 
-    def __init__(self, parent, search_text, text_color, max_results=1000):
+    def __init__(self, parent, search_text, max_results=1000,
+                 engine_class=None, index=None, text_file_cache=None,
+                 use_ignore_files=True, buffers=None):
         super().__init__(parent)
         self.search_text = search_text
-        self.text_color = text_color
         self.max_results = max_results
-
-        self.mutex = QMutex()
+        self.engine_class = engine_class or ProcessPoolSearchEngine
+        self.index = index
+        self.text_file_cache = text_file_cache or TextFileCache()
+        self.use_ignore_files = use_ignore_files
+
+        # Snapshot of the unsaved contents of files open in the editor, by
+        # normalized path. They are searched instead of their files on disk.
+        self.buffers = buffers or {}
+        self._buffer_executor = None
+        self._buffer_futures = []
+
+        self.engine = None
+        self.candidates = None
+        self._pending_checks = {}
         self.stopped = None
         self.pathlist = None
         self.total_matches = None
@@ -77,7 +87,7 @@ def __init__(self, parent, search_text, text_color, max_results=1000):
         self.results = {}
 
         self.num_files = 0
-        self.files = []
+        self.files = set()
         self.partial_results = []
         self.total_items = 0
 
@@ -92,12 +102,21 @@ def initialize(self, path, is_file, exclude,
         self.stopped = False
         self.completed = False
         self.case_sensitive = case_sensitive
+        self.engine = self.engine_class(texts, text_re, case_sensitive)
+        self.candidates = None
+        self._pending_checks = {}
+        self._buffer_futures = []
 
     def run(self):
         try:
             self.filenames = []
+            self.error_flag = False
             if self.is_file:
-                self.find_string_in_file(self.rootpath)
+                self.sig_current_file.emit(self.rootpath)
+                if self.search_buffer(self.rootpath):
+                    self.search_files([])
+                else:
+                    self.search_files([(self.rootpath, False)])
             else:
                 self.find_files_in_path(self.rootpath)
         except Exception:
@@ -106,183 +125,281 @@ def run(self):
             # (known QThread limitation/bug)
             traceback.print_exc()
             self.error_flag = _("Unexpected error: see internal console")
+        finally:
+            if self._buffer_executor is not None:
+                self._buffer_executor.shutdown(wait=False,
+                                               cancel_futures=True)
+                self._buffer_executor = None
         self.stop()
         self.sig_finished.emit(self.completed)
 
     def stop(self):
-        with QMutexLocker(self.mutex):
-            self.stopped = True
+        # The engine can be stopped from any thread without locking
+        self.stopped = True
+        if self.engine is not None:
+            self.engine.stop()
 
     def find_files_in_path(self, path):
         if self.pathlist is None:
             self.pathlist = []
         self.pathlist.append(path)
-        for path, dirs, files in os.walk(path):
-            with QMutexLocker(self.mutex):
-                if self.stopped:
-                    return False
-            try:
-                # For directories
-                for d in dirs[:]:
-                    with QMutexLocker(self.mutex):
-                        if self.stopped:
-                            return False
 
-                    dirname = os.path.join(path, d)
+        try:
+            self.candidates = self.get_candidates(path)
+            return self.search_files(self.iter_files(path))
+        except re.error:
+            self.error_flag = _("invalid regular expression")
+            return False
+
+    def get_candidates(self, path):
+        """
+        Get the indexed files in `path` that could have matches.
+
+        Returns
+        -------
+        set or None
+            Set of filenames or None if the project index can't be used for
+            this search.
+        """
+        index = self.index
+        if index is None or not index.ready:
+            return None
+
+        # The index only covers the project
+        relpath = osp.relpath(osp.normpath(path), index.root_path)
+        if relpath.startswith(osp.pardir):
+            return None
+
+        return index.get_candidates(self.texts, self.text_re)
 
-                    # Only search in regular directories
-                    st_dir_mode = os.stat(dirname).st_mode
-                    if not stat.S_ISDIR(st_dir_mode):
-                        dirs.remove(d)
+    def iter_files(self, path):
+        """
+        Generate the files to search in `path`.
 
+        Yields
+        ------
+        tuple
+            (filename, check_text) tuples, where check_text tells if the
+            file needs to be checked to be a text one before searching it.
+        """
+        ignore = None
+        if self.use_ignore_files:
+            ignore = IgnoreMatcher.for_parents(path)
+
+        dirs = [(path, ignore)]
+        while dirs:
+            if self.engine.stopped:
+                return
+
+            dirpath, ignore = dirs.pop()
+            self.sig_current_folder.emit(dirpath)
+            try:
+                # Entries returned by scandir cache their file type, so we
+                # don't need to stat every file and directory.
+                entries = list(os.scandir(dirpath))
+            except OSError:
+                continue
+
+            # Add the rules of the ignore files in this directory
+            if ignore is not None:
+                ignore = ignore.for_directory(
+                    dirpath, {entry.name for entry in entries})
+
+            subdirs = []
+            for entry in entries:
+                # Only search in regular directories and files (i.e. not
+                # pipes). The try/except is necessary to catch an error when
+                # Python can't get the file status due to too many levels of
+                # symbolic links.
+                # Fixes spyder-ide/spyder#20798
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    is_file = not is_dir and entry.is_file()
+                except OSError:
+                    continue
+
+                if is_dir:
                     if (self.exclude and
-                            re.search(self.exclude, dirname + os.sep)):
+                            self.exclude.search(entry.path + os.sep)):
                         # Exclude patterns defined by the user
-                        dirs.remove(d)
-                    elif d.startswith('.'):
+                        continue
+                    elif entry.name.startswith('.'):
                         # Exclude all dot dirs.
-                        dirs.remove(d)
-
-                # For files
-                for f in files:
-                    with QMutexLocker(self.mutex):
-                        if self.stopped:
-                            return False
-
-                    filename = os.path.join(path, f)
-                    ext = osp.splitext(filename)[1]
-
-                    # Only search in regular files (i.e. not pipes).
-                    # The try/except is necessary to catch an error when
-                    # Python can't get the file status due to too many levels
-                    # of symbolic links.
-                    # Fixes spyder-ide/spyder#20798
-                    try:
-                        st_file_mode = os.stat(filename).st_mode
-                        if not stat.S_ISREG(st_file_mode):
-                            continue
-                    except OSError:
                         continue
+                    elif ignore and ignore.is_ignored(entry.path, True):
+                        # Exclude dirs ignored by Git (e.g. build outputs
+                        # or virtual environments).
+                        continue
+                    subdirs.append(entry.path)
+                elif is_file:
+                    filename = entry.path
+                    ext = osp.splitext(entry.name)[1]
 
                     # Exclude patterns defined by the user
-                    if self.exclude and re.search(self.exclude, filename):
+                    if self.exclude and self.exclude.search(filename):
                         continue
 
-                    # Don't search in plain text files with skipped extensions
-                    # (e.g .svg)
+                    # Don't search in plain text files with skipped
+                    # extensions (e.g .svg)
                     if ext in self.SKIPPED_EXTENSIONS:
                         continue
 
+                    # Exclude files ignored by Git
+                    if ignore and ignore.is_ignored(filename, False):
+                        continue
+
+                    # Files with unsaved changes are searched in memory
+                    if self.search_buffer(filename):
+                        continue
+
                     # It's much faster to check for extension first before
-                    # validating if the file is plain text.
-                    if (
+                    # validating if the file is plain text, which is left to
+                    # the search engine.
+                    check_text = not (
                         ext in self.PYTHON_EXTENSIONS
                         or ext in self.USEFUL_EXTENSIONS
                         or ext in EDIT_EXTENSIONS
-                        or is_text_file(filename)
-                    ):
-                        self.find_string_in_file(filename)
-            except re.error:
-                self.error_flag = _("invalid regular expression")
-                return False
-            except FileNotFoundError:
-                return False
+                    )
 
-        # Process any pending results
-        if self.partial_results:
-            self.process_results()
+                    # Skip indexed files that can't have matches. Files
+                    # changed after they were indexed are always searched.
+                    if self.candidates is not None:
+                        normpath = osp.normpath(filename)
+                        try:
+                            if (
+                                normpath not in self.candidates
+                                and self.index.is_current(
+                                    normpath, entry.stat())
+                            ):
+                                continue
+                        except OSError:
+                            pass
+
+                    # Files already detected as binary are skipped and the
+                    # ones detected as text don't need to be checked again.
+                    if check_text:
+                        try:
+                            key = self.text_file_cache.get_key(entry)
+                        except OSError:
+                            continue
+
+                        is_text = self.text_file_cache.get(key)
+                        if is_text is None:
+                            self._pending_checks[filename] = key
+                        elif is_text:
+                            check_text = False
+                        else:
+                            continue
+
+                    self.sig_current_file.emit(filename)
+                    yield filename, check_text
+
+            # Search subdirectories in the same order as os.walk
+            dirs.extend([(subdir, ignore) for subdir in reversed(subdirs)])
 
+    def search_buffer(self, filename):
+        """
+        Search the unsaved contents of `filename`, if there are any.
+
+        Buffers are searched in a separate thread, in parallel with the
+        files on disk.
+
+        Returns
+        -------
+        bool
+            Whether `filename` has unsaved contents, in which case it must
+            not be searched on disk.
+        """
+        if not self.buffers:
+            return False
+
+        text = self.buffers.get(osp.normpath(filename))
+        if text is None:
+            return False
+
+        if self._buffer_executor is None:
+            self._buffer_executor = ThreadPoolExecutor(max_workers=1)
+
+        self._buffer_futures.append(
+            self._buffer_executor.submit(
+                self.engine.search_buffer, filename, text)
+        )
         return True
 
-    def find_string_in_file(self, fname):
-        self.error_flag = False
-        self.sig_current_file.emit(fname)
-        try:
-            for lineno, line in enumerate(open(fname, 'rb')):
-                for text, enc in self.texts:
-                    with QMutexLocker(self.mutex):
-                        if self.stopped:
-                            return False
-                    line_search = line
-                    if not self.case_sensitive:
-                        line_search = line_search.lower()
-                    if self.text_re:
-                        found = re.search(text, line_search)
-                        if found is not None:
-                            break
-                    else:
-                        found = line_search.find(text)
-                        if found > -1:
-                            break
-                try:
-                    line_dec = line.decode(enc)
-                except UnicodeDecodeError:
-                    line_dec = line
-
-                if not self.case_sensitive:
-                    line = line.lower()
-
-                if self.text_re:
-                    for match in re.finditer(text, line):
-                        with QMutexLocker(self.mutex):
-                            if self.stopped:
-                                return False
-                        self.total_matches += 1
-                        bstart, bend = match.start(), match.end()
-                        try:
-                            # Go from binary position to utf8 position
-                            start = len(line[:bstart].decode(enc))
-                            end = start + len(line[bstart:bend].decode(enc))
-                        except UnicodeDecodeError:
-                            start = bstart
-                            end = bend
-                        self.partial_results.append((osp.abspath(fname),
-                                                     lineno + 1,
-                                                     start,
-                                                     end,
-                                                     line_dec))
-                        if len(self.partial_results) > (2**self.power):
-                            self.process_results()
-                            if self.power < self.max_power:
-                                self.power += 1
-                else:
-                    found = line.find(text)
-                    while found > -1:
-                        with QMutexLocker(self.mutex):
-                            if self.stopped:
-                                return False
-                        self.total_matches += 1
-                        try:
-                            # Go from binary position to utf8 position
-                            start = len(line[:found].decode(enc))
-                            end = start + len(text.decode(enc))
-                        except UnicodeDecodeError:
-                            start = found
-                            end = found + len(text)
-
-                        self.partial_results.append((osp.abspath(fname),
-                                                     lineno + 1,
-                                                     start,
-                                                     end,
-                                                     line_dec))
-                        if len(self.partial_results) > (2**self.power):
-                            self.process_results()
-                            if self.power < self.max_power:
-                                self.power += 1
-
-                        for text, enc in self.texts:
-                            found = line.find(text, found + 1)
-                            if found > -1:
-                                break
-        except IOError as xxx_todo_changeme:
-            (_errno, _strerror) = xxx_todo_changeme.args
-            self.error_flag = _("permission denied errors were encountered")
+    def search_files(self, files):
+        """
+        Search in `files` with the search engine and process its results.
+
+        Parameters
+        ----------
+        files: iterable
+            Iterable of (filename, check_text) tuples.
+        """
+        for results in self.engine.search(files):
+            self.add_results(results)
+            self.add_buffer_results()
+
+            if len(self.partial_results) > (2**self.power):
+                self.process_results()
+                if self.power < self.max_power:
+                    self.power += 1
+
+        # Wait for the buffers still being searched
+        if not self.engine.stopped:
+            self.add_buffer_results(wait=True)
 
         # Process any pending results
-        if self.is_file and self.partial_results:
+        if self.partial_results:
             self.process_results()
 
-        self.completed = True
+        self.completed = not self.engine.stopped
+        return self.completed
+
+    def add_buffer_results(self, wait=False):
+        """
+        Add the results of the buffers that were already searched.
+
+        Parameters
+        ----------
+        wait: bool, optional
+            Whether to wait for all buffers to be searched. Default is False.
+        """
+        pending = []
+        for future in self._buffer_futures:
+            if wait or future.done():
+                self.add_results(future.result())
+            else:
+                pending.append(future)
+        self._buffer_futures = pending
+
+    def add_results(self, results):
+        """
+        Add the results returned by the search engine.
+
+        Parameters
+        ----------
+        results: list
+            List of (filename, matches, error) tuples.
+        """
+        for filename, matches, error in results:
+            if error:
+                self.error_flag = _(
+                    "permission denied errors were encountered")
+
+            # Remember the type of the files checked by the engine
+            key = self._pending_checks.pop(filename, None)
+            if key is not None and not error:
+                self.text_file_cache.set(key, matches is not None)
+
+            if matches is None:
+                continue
+
+            filename = osp.abspath(filename)
+            for lineno, start, end, line in matches:
+                self.total_matches += 1
+                self.partial_results.append(
+                    (filename, lineno, start, end, line)
+                )
 
     def process_results(self):
         """
@@ -303,11 +420,12 @@ def process_results(self):
                 filename, lineno, colno, match_end, line = result
 
                 if filename not in self.files:
-                    self.files.append(filename)
+                    self.files.add(filename)
                     self.sig_file_match.emit(filename)
                     self.num_files += 1
 
-                line = self.truncate_result(line, colno, match_end)
+                # Lines are formatted by the results browser only when
+                # they're displayed.
                 item = (filename, lineno, colno, line, match_end)
                 items.append(item)
                 self.total_items += 1
@@ -329,79 +447,78 @@ def process_results(self):
         self.partial_results = []
         self.sig_line_match.emit(items, title)
 
-    def truncate_result(self, line, start, end):
-        """
-        Shorten text on line to display the match within `max_line_length`.
-        """
-        html_escape_table = {
-            "&": "&amp;",
-            '"': "&quot;",
-            "'": "&apos;",
-            ">": "&gt;",
-            "<": "&lt;",
-        }
-
-        def html_escape(text):
-            """Produce entities within text."""
-            return "".join(html_escape_table.get(c, c) for c in text)
-
-        line = str(line)
-        left, match, right = line[:start], line[start:end], line[end:]
-
-        if len(line) > MAX_RESULT_LENGTH:
-            offset = (len(line) - len(match)) // 2
-
-            left = left.split(' ')
-            num_left_words = len(left)
-
-            if num_left_words == 1:
-                left = left[0]
-                if len(left) > MAX_NUM_CHAR_FRAGMENT:
-                    left = ELLIPSIS + left[-offset:]
-                left = [left]
-
-            right = right.split(' ')
-            num_right_words = len(right)
-
-            if num_right_words == 1:
-                right = right[0]
-                if len(right) > MAX_NUM_CHAR_FRAGMENT:
-                    right = right[:offset] + ELLIPSIS
-                right = [right]
-
-            left = left[-4:]
-            right = right[:4]
-
-            if len(left) < num_left_words:
-                left = [ELLIPSIS] + left
-
-            if len(right) < num_right_words:
-                right = right + [ELLIPSIS]
-
-            left = ' '.join(left)
-            right = ' '.join(right)
-
-            if len(left) > MAX_NUM_CHAR_FRAGMENT:
-                left = ELLIPSIS + left[-30:]
-
-            if len(right) > MAX_NUM_CHAR_FRAGMENT:
-                right = right[:30] + ELLIPSIS
-
-        match_color = SpyderPalette.COLOR_OCCURRENCE_4
-        trunc_line = dict(
-            text=''.join([left, match, right]),
-            formatted_text=(
-                f'<span style="color:{self.text_color}">'
-                f'{html_escape(left)}'
-                f'<span style="background-color:{match_color}">'
-                f'{html_escape(match)}'
-                f'</span>'
-                f'{html_escape(right)}'
-                f'</span>'
-            )
-        )
-
-        return trunc_line
-
     def get_results(self):
         return self.results, self.pathlist, self.total_matches, self.error_flag
+
+
+class RemoteSearchThread(SearchThread):
+    """
+    Find in files search thread for directories in remote servers.
+
+    Files are scanned by the server, which streams their matches in batches,
+    so they don't need to be transferred.
+    """
+
+    def __init__(self, parent, search_text, files_api_class,
+                 max_results=1000):
+        super().__init__(parent, search_text, max_results)
+        self.files_api_class = files_api_class
+        self._future = None
+
+    def initialize(self, path, is_file, exclude,
+                   texts, text_re, case_sensitive):
+        self.rootpath = path
+        self.exclude = exclude
+        self.texts = texts
+        self.text_re = text_re
+        self.is_file = is_file
+        self.stopped = False
+        self.completed = False
+        self.case_sensitive = case_sensitive
+
+    def run(self):
+        self.error_flag = False
+        self.pathlist = [self.rootpath]
+        try:
+            self._future = AsyncDispatcher(loop="findinfiles")(
+                self._search_remote)()
+            self.completed = self._future.result()
+        except CancelledError:
+            pass
+        except (OSError, SpyderRemoteAPIError) as error:
+            self.error_flag = str(error)
+        except Exception:
+            traceback.print_exc()
+            self.error_flag = _("Unexpected error: see internal console")
+
+        self.stopped = True
+        self.sig_finished.emit(self.completed)
+
+    def stop(self):
+        self.stopped = True
+        if self._future is not None:
+            self._future.cancel()
+
+    async def _search_remote(self):
+        """Search in the remote directory and process its matches."""
+        exclude = self.exclude.pattern if self.exclude else None
+        async with self.files_api_class() as files_api:
+            async for matches in files_api.search(
+                self.rootpath,
+                self.search_text,
+                regexp=self.text_re,
+                case_sensitive=self.case_sensitive,
+                exclude=exclude,
+                max_results=self.max_results,
+            ):
+                if self.stopped:
+                    return False
+
+                for filename, lineno, start, end, line in matches:
+                    self.total_matches += 1
+                    self.partial_results.append(
+                        (filename, lineno, start, end, line)
+                    )
+                self.process_results()
+
+        return not self.stopped
@@ -17,7 +17,7 @@
 from flaky import flaky
 import pytest
 from qtpy.QtCore import Qt
-from qtpy.QtWidgets import QMessageBox
+from qtpy.QtWidgets import QMessageBox, QPlainTextEdit
 
 # Local imports
 from spyder.config.base import running_in_ci
@@ -27,7 +27,8 @@
     SearchInComboBox,
     SearchInComboBoxItems
 )
-from spyder.plugins.findinfiles.widgets.search_thread import SearchThread
+from spyder.plugins.findinfiles.widgets.results_browser import (
+    ON, get_line_html, truncate_result)
 from spyder.utils.palette import SpyderPalette
 from spyder.utils.stylesheet import APP_STYLESHEET
 
@@ -44,7 +45,7 @@ def process_search_results(results):
     test framework comparison representation.
     """
     matches = {}
-    for result in results.values():
+    for result in results:
         file, line, col, __ = result
         filename = osp.basename(file)
         if filename not in matches:
@@ -149,7 +150,7 @@ def test_find_in_files_search(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(findinfiles.result_browser.get_matches())
     assert expected_results() == matches
 
 
@@ -162,7 +163,7 @@ def test_exclude_extension_regex(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(findinfiles.result_browser.get_matches())
     files_filtered = True
     for file in matches:
         filename, ext = osp.splitext(file)
@@ -181,7 +182,7 @@ def test_exclude_extension_string(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(findinfiles.result_browser.get_matches())
     files_filtered = True
     for file in matches:
         filename, ext = osp.splitext(file)
@@ -200,7 +201,7 @@ def test_exclude_extension_empty_regex(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(findinfiles.result_browser.get_matches())
     assert expected_results() == matches
 
 
@@ -213,7 +214,7 @@ def test_exclude_extension_string_no_regexp(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(findinfiles.result_browser.get_matches())
     assert expected_results() == matches
 
 
@@ -226,7 +227,7 @@ def test_exclude_extension_multiple_string(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(findinfiles.result_browser.get_matches())
     files_filtered = True
     for file in matches:
         filename, ext = osp.splitext(file)
@@ -257,11 +258,53 @@ def test_truncate_result_with_different_input(findinfiles, qtbot, line_input):
     )
 
     # when
-    thread = SearchThread(None, '', text_color=SpyderPalette.COLOR_TEXT_1)
-    truncated_line = thread.truncate_result(line_input, slice_start,
-                                            slice_end)
+    assert truncate_result(line_input, slice_start, slice_end) == (
+        line_input[:slice_start],
+        line_input[slice_start:slice_end],
+        line_input[slice_end:]
+    )
+    html = get_line_html(1, slice_start, slice_end, line_input,
+                         findinfiles.result_browser.font,
+                         SpyderPalette.COLOR_TEXT_1)
+
     # then
-    assert truncated_line['formatted_text'] == expected_result
+    assert expected_result in html
+
+
+def test_results_model(findinfiles, qtbot):
+    """Results are stored in the model and sorted by file name."""
+    browser = findinfiles.result_browser
+    browser.clear_title('spam')
+    browser.set_path(LOCATION)
+
+    for filename in ['spam.py', 'ham.py']:
+        browser.append_file_result(osp.join(LOCATION, filename))
+
+    items = [
+        (osp.join(LOCATION, 'spam.py'), 1, 0, 'spam = 1\n', 4),
+        (osp.join(LOCATION, 'spam.py'), 1, 7, 'spam = spam\n', 11),
+        (osp.join(LOCATION, 'ham.py'), 3, 2, '  spam\n', 6),
+    ]
+    browser.append_result(items, 'title')
+
+    model = browser.results_model
+    assert browser.num_matches == 3
+    assert model.rowCount() == 2
+    assert model.rowCount(model.index(0, 0)) == 2
+
+    # Lines are only stored once per line number
+    assert len(browser.files[osp.join(LOCATION, 'spam.py')].lines) == 1
+
+    # Sort files and check that matches follow them
+    browser.set_sorting(ON)
+    model.sort(0)
+    file_index = model.index(0, 0)
+    match_index = model.index(0, 0, file_index)
+    assert model.data(file_index, Qt.ToolTipRole) == osp.join(LOCATION,
+                                                              'ham.py')
+    assert model.get_match_data(match_index) == (
+        osp.join(LOCATION, 'ham.py'), 3, 2, 6)
+    assert model.parent(match_index) == file_index
 
 
 @pytest.mark.parametrize('findinfiles',
@@ -273,7 +316,7 @@ def test_case_unsensitive_search(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(findinfiles.result_browser.get_matches())
     print(matches)
     assert expected_case_unsensitive_results() == matches
 
@@ -287,7 +330,7 @@ def test_case_sensitive_search(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(findinfiles.result_browser.get_matches())
     print(matches)
     assert matches == {'ham.txt': [(9, 0)]}
 
@@ -336,14 +379,16 @@ def test_no_empty_file_items(findinfiles, qtbot):
     # expected because os.walk (used by findinfiles) gives an arbitrary file
     # ordering.)
     spamfiles = set(['spam.py', 'spam.txt', 'spam.cpp'])
-    find_results = process_search_results(findinfiles.result_browser.data)
+    find_results = process_search_results(
+        findinfiles.result_browser.get_matches()
+    )
     assert set(find_results.keys()).issubset(spamfiles)
     assert sum(len(finds) for finds in find_results.values()) == max_results
 
     # Assert that the files with results are exactly the same as those
     # displayed in the results browser.
     files_with_results = set(
-        [v[0] for v in findinfiles.result_browser.data.values()]
+        [v[0] for v in findinfiles.result_browser.get_matches()]
     )
     displayed_files = set(findinfiles.result_browser.files.keys())
     assert files_with_results == displayed_files
@@ -468,6 +513,31 @@ def test_clear_this_list(searchin_combobox, mocker):
     assert searchin_combobox.currentIndex() == SearchInComboBoxItems.Cwd
 
 
+def test_saved_searchpath_index(searchin_combobox):
+    """
+    Test that the saved index of the current item doesn't depend on the
+    remote directory item, so values saved before it was added still work.
+    """
+    # The first external path was saved as 7 before
+    searchin_combobox.set_current_searchpath_index(7)
+    assert (
+        searchin_combobox.currentIndex() == SearchInComboBoxItems.ExternalPaths
+    )
+    assert searchin_combobox.get_current_searchpath() == LOCATION
+    assert searchin_combobox.get_current_searchpath_index() == 7
+
+    searchin_combobox.set_current_searchpath_index(SearchInComboBoxItems.File)
+    assert searchin_combobox.currentIndex() == SearchInComboBoxItems.File
+
+    # Remote directories are not restored
+    searchin_combobox.set_remote_path('/home/user/project', 'server')
+    searchin_combobox.setCurrentIndex(SearchInComboBoxItems.RemoteDirectory)
+    assert (
+        searchin_combobox.get_current_searchpath_index()
+        == SearchInComboBoxItems.Cwd
+    )
+
+
 def test_delete_path(searchin_combobox, qtbot, mocker):
     """
     Test that the selected external path in the combobox view is removed
@@ -620,6 +690,43 @@ def test_set_project_path(findinfiles, qtbot):
     assert path_selection_combo.currentIndex() == SearchInComboBoxItems.Cwd
 
 
+def test_set_remote_path(findinfiles, qtbot):
+    """
+    Test setting the remote directory of the SearchInComboBox from the
+    FindInFilesWidget.
+    """
+    path_selection_combo = findinfiles.path_selection_combo
+    remote_item = path_selection_combo.model().item(
+        SearchInComboBoxItems.RemoteDirectory, 0
+    )
+    assert remote_item.isEnabled() is False
+
+    findinfiles.set_remote_path('/home/user/project', 'server', MagicMock())
+    assert remote_item.isEnabled() is True
+
+    path_selection_combo.setCurrentIndex(
+        SearchInComboBoxItems.RemoteDirectory
+    )
+    assert path_selection_combo.is_remote_search() is True
+    assert path_selection_combo.is_file_search() is False
+    assert (
+        path_selection_combo.get_current_searchpath() == '/home/user/project'
+    )
+    assert path_selection_combo.server_id == 'server'
+
+    # Remote results can't be replaced
+    findinfiles._last_search_remote = True
+    findinfiles.replace()
+    assert findinfiles.replace_thread is None
+
+    # Disable the remote search in the widget.
+    findinfiles.unset_remote_path()
+    assert remote_item.isEnabled() is False
+    assert path_selection_combo.remote_path == ''
+    assert path_selection_combo.is_remote_search() is False
+    assert path_selection_combo.currentIndex() == SearchInComboBoxItems.Cwd
+
+
 @pytest.mark.parametrize('findinfiles',
                          [{'path_history': [
                              LOCATION,
@@ -720,8 +827,8 @@ def test_max_results(findinfiles, qtbot):
     blocker = qtbot.waitSignal(findinfiles.sig_max_results_reached)
     blocker.wait()
 
-    print(len(findinfiles.result_browser.data), value)
-    assert len(findinfiles.result_browser.data) == value
+    print(findinfiles.result_browser.num_matches, value)
+    assert findinfiles.result_browser.num_matches == value
 
     # Restore defaults
     findinfiles.set_max_results(1000)
@@ -742,10 +849,89 @@ def test_find_in_single_file(findinfiles, qtbot):
     with qtbot.waitSignal(findinfiles.sig_finished):
         findinfiles.find()
 
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(findinfiles.result_browser.get_matches())
     assert list(matches.keys()) == ['spam.txt']
     assert expected_results()['spam.txt'] == matches['spam.txt']
 
 
+def test_replace_in_files(findinfiles, qtbot, tmp_path):
+    """
+    Test that replacements are applied to files on disk and to the files
+    open in the editor, which are changed in memory.
+    """
+    disk_file = tmp_path / 'spam.py'
+    disk_file.write_text("spam = 1\nprint(spam)\n")
+    open_file = tmp_path / 'spam.txt'
+    open_file.write_text("spam\n")
+
+    editor = QPlainTextEdit()
+    qtbot.addWidget(editor)
+    editor.setPlainText("eggs\nspam spam\n")
+    findinfiles._plugin._get_open_editors.return_value = {
+        osp.normpath(str(open_file)): editor
+    }
+
+    findinfiles.set_search_text("spam")
+    findinfiles.set_directory(str(tmp_path))
+    with qtbot.waitSignal(findinfiles.sig_finished):
+        findinfiles.find()
+
+    # Preview replacements
+    findinfiles.replace_text_edit.add_text("ham")
+    findinfiles.replace()
+    dialog = findinfiles.replace_dialog
+    qtbot.waitUntil(dialog.replace_button.isEnabled)
+    assert dialog.num_files == 2
+    assert dialog.num_replacements == 4
+
+    # Apply them
+    with qtbot.waitSignals([findinfiles.sig_replace_finished,
+                            findinfiles.sig_finished]):
+        dialog.replace_button.click()
+
+    assert disk_file.read_text() == "ham = 1\nprint(ham)\n"
+    assert open_file.read_text() == "spam\n"
+    assert editor.toPlainText() == "eggs\nham ham\n"
+
+    # Undo all replacements in the editor at once
+    editor.undo()
+    assert editor.toPlainText() == "eggs\nspam spam\n"
+
+
+def test_search_unsaved_buffers(findinfiles, qtbot, tmp_path):
+    """
+    Test that files with unsaved changes in the editor are searched in
+    memory instead of on disk.
+    """
+    saved_file = tmp_path / 'saved.py'
+    saved_file.write_text("spam = 1\n")
+    unsaved_file = tmp_path / 'unsaved.py'
+    unsaved_file.write_text("spam = 1\n")
+    new_file = tmp_path / 'new.py'
+    new_file.write_text("eggs = 1\n")
+
+    editors = {}
+    for path, text in [(unsaved_file, "eggs = 1\n\nspam = spam\n"),
+                       (new_file, "spam = 1\n")]:
+        editor = QPlainTextEdit()
+        qtbot.addWidget(editor)
+        editor.setPlainText(text)
+        editor.document().setModified(True)
+        editors[osp.normpath(str(path))] = editor
+    findinfiles._plugin._get_open_editors.return_value = editors
+
+    findinfiles.set_search_text("spam")
+    findinfiles.set_directory(str(tmp_path))
+    with qtbot.waitSignal(findinfiles.sig_finished):
+        findinfiles.find()
+
+    matches = process_search_results(findinfiles.result_browser.get_matches())
+    assert matches == {
+        'saved.py': [(1, 0)],
+        'unsaved.py': [(3, 0), (3, 7)],
+        'new.py': [(1, 0)],
+    }
+
+
 if __name__ == "__main__":
     pytest.main(['-x', osp.basename(__file__), '-v', '-rw'])
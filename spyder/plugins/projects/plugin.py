@@ -83,6 +83,19 @@ class Projects(SpyderDockablePlugin):
         between projects (signature 2).
     """
 
+    sig_files_changed = Signal(list)
+    """
+    This signal is emitted with a batch of changes to the files and
+    directories of the current project.
+
+    Parameters
+    ----------
+    changes: list
+        List of (event_type, src_path, dest_path, is_dir) tuples, where
+        event_type is one of "created", "deleted", "modified" or "moved"
+        and dest_path is only set for moves.
+    """
+
     # ---- SpyderDockablePlugin API
     # -------------------------------------------------------------------------
     @staticmethod
@@ -108,6 +121,7 @@ def on_initialize(self):
         widget.sig_project_created.connect(self.sig_project_created)
         widget.sig_project_closed.connect(self.sig_project_closed)
         widget.sig_project_loaded.connect(self.sig_project_loaded)
+        widget.watcher.sig_files_changed.connect(self.sig_files_changed)
 
         treewidget.sig_delete_project.connect(self.delete_project)
         treewidget.sig_redirect_stdio_requested.connect(
@@ -139,6 +153,7 @@ def on_editor_available(self):
         treewidget.sig_file_created.connect(self._new_editor)
 
         widget.sig_save_open_files_requested.connect(editor.save_open_files)
+        widget.sig_open_symbol_requested.connect(self._open_symbol_in_editor)
         widget.sig_project_loaded.connect(self._setup_editor_files)
         widget.sig_project_closed[bool].connect(self._setup_editor_files)
         widget.sig_project_loaded.connect(self._set_path_in_editor)
@@ -231,6 +246,8 @@ def on_editor_teardown(self):
         treewidget.sig_file_created.disconnect(self._new_editor)
 
         widget.sig_save_open_files_requested.disconnect(editor.save_open_files)
+        widget.sig_open_symbol_requested.disconnect(
+            self._open_symbol_in_editor)
         widget.sig_project_loaded.disconnect(self._setup_editor_files)
         widget.sig_project_closed[bool].disconnect(self._setup_editor_files)
         widget.sig_project_loaded.disconnect(self._set_path_in_editor)
@@ -514,7 +531,8 @@ def _handle_switcher_modes(self, mode):
 
         List the file names of the current active project with their
         directories in the switcher. It only handles the files mode, i.e.
-        an empty string.
+        an empty string. Project symbols are only listed after users type
+        something in the symbol mode.
 
         Parameters
         ----------
@@ -556,7 +574,16 @@ def _handle_switcher_search(self, search_text):
         text: str
             The current search text in the switcher dialog box.
         """
-        self.get_widget().handle_switcher_search(search_text)
+        mode = self._switcher.get_mode()
+        if mode == "":
+            self.get_widget().handle_switcher_search(search_text)
+        elif mode == "@":
+            self.get_widget().handle_switcher_symbol_search(search_text)
+
+    def _open_symbol_in_editor(self, filename, line_number):
+        """Open the file where a symbol is defined and go to its line."""
+        editor = self.get_plugin(Plugins.Editor)
+        editor.load(filename, goto=line_number)
 
     def _display_items_in_switcher(self, items, setup, clear_section):
         """
@@ -583,7 +610,8 @@ def _display_items_in_switcher(self, items, setup, clear_section):
                 data=path,
                 last_item=is_last_item,
                 score=1e10,  # To make the editor results appear first
-                use_score=False  # Results come from fzf in the right order
+                # Results come from the index in the right order
+                use_score=False
             )
 
         if setup:
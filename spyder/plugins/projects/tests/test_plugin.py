@@ -29,6 +29,7 @@
 from spyder.plugins.preferences.tests.conftest import MainWindowMock
 from spyder.plugins.projects.api import BaseProjectType
 from spyder.plugins.projects.plugin import Projects
+from spyder.plugins.projects.utils.watcher import coalesce_events
 from spyder.plugins.projects.widgets.main_widget import QMessageBox
 from spyder.plugins.projects.widgets.projectdialog import ProjectDialog
 from spyder.py3compat import to_text_string
@@ -388,91 +389,108 @@ def test_filesystem_notifications(qtbot, projects, tmpdir):
     # Open the project
     projects.open_project(path=str(project_root))
 
-    # Get a reference to the filesystem event handler
-    fs_handler = projects.get_widget().watcher.event_handler
+    # Get a reference to the filesystem watcher
+    watcher = projects.get_widget().watcher
 
     # Test file creation
-    with qtbot.waitSignal(fs_handler.sig_file_created,
+    with qtbot.waitSignal(watcher.sig_files_changed,
                           timeout=30000) as blocker:
         file2.write('')
 
-    file_created, is_dir = blocker.args
-    assert file_created == str(file2)
-    assert not is_dir
+    assert ('created', str(file2), None, False) in blocker.args[0]
 
     # Test folder creation
-    with qtbot.waitSignal(fs_handler.sig_file_created,
+    with qtbot.waitSignal(watcher.sig_files_changed,
                           timeout=3000) as blocker:
         folder2 = project_root.mkdir('folder2')
 
-    folder_created, is_dir = blocker.args
-    assert folder_created == osp.join(str(project_root), 'folder2')
+    assert (
+        ('created', osp.join(str(project_root), 'folder2'), None, True)
+        in blocker.args[0]
+    )
 
     # Test file move/renaming
     new_file = osp.join(str(folder0), 'new_file.txt')
-    with qtbot.waitSignal(fs_handler.sig_file_moved,
+    with qtbot.waitSignal(watcher.sig_files_changed,
                           timeout=3000) as blocker:
         shutil.move(str(file1), new_file)
 
-    original_file, file_moved, is_dir = blocker.args
-    assert original_file == str(file1)
-    assert file_moved == new_file
-    assert not is_dir
+    assert ('moved', str(file1), new_file, False) in blocker.args[0]
 
     # Test folder move/renaming
     new_folder = osp.join(str(project_root), 'new_folder')
-    with qtbot.waitSignal(fs_handler.sig_file_moved,
+    with qtbot.waitSignal(watcher.sig_files_changed,
                           timeout=3000) as blocker:
         shutil.move(str(folder2), new_folder)
 
-    original_folder, folder_moved, is_dir = blocker.args
-    assert original_folder == str(folder2)
-    assert folder_moved == new_folder
-    assert is_dir
+    assert ('moved', str(folder2), new_folder, True) in blocker.args[0]
 
     # Test file deletion
-    with qtbot.waitSignal(fs_handler.sig_file_deleted,
+    with qtbot.waitSignal(watcher.sig_files_changed,
                           timeout=3000) as blocker:
         os.remove(str(file0))
 
-    deleted_file, is_dir = blocker.args
-    assert deleted_file == str(file0)
-    assert not is_dir
+    assert ('deleted', str(file0), None, False) in blocker.args[0]
     assert not osp.exists(str(file0))
 
-    # Test folder deletion
-    with qtbot.waitSignal(fs_handler.sig_file_deleted,
+    # Test folder deletion. Its files are reported in the same batch.
+    with qtbot.waitSignal(watcher.sig_files_changed,
                           timeout=3000) as blocker:
         shutil.rmtree(str(folder0))
 
-    deleted_folder, is_dir = blocker.args
-    assert str(folder0) in deleted_folder
+    assert ('deleted', str(folder0), None, True) in blocker.args[0]
+    assert ('deleted', new_file, None, False) in blocker.args[0]
 
     # Test file/folder modification
-    with qtbot.waitSignal(fs_handler.sig_file_modified,
+    with qtbot.waitSignal(watcher.sig_files_changed,
                           timeout=3000) as blocker:
         file3.write('abc')
 
-    modified_file, is_dir = blocker.args
-    assert modified_file in str(file3)
+    assert ('modified', str(file3), None, False) in blocker.args[0]
 
     # Test events in hidden folders are not emitted
-    with qtbot.assertNotEmitted(fs_handler.sig_file_created, wait=2000):
+    with qtbot.assertNotEmitted(watcher.sig_files_changed, wait=2000):
         git_file = git_folder.join('git_file.txt')
         git_file.write("Some data")
 
     # Test events in pycache folders are not emitted
-    with qtbot.assertNotEmitted(fs_handler.sig_file_created, wait=2000):
+    with qtbot.assertNotEmitted(watcher.sig_files_changed, wait=2000):
         pycache_folder = project_root.mkdir('__pycache__')
         pycache_file = pycache_folder.join("foo.pyc")
         pycache_file.write("")
 
     # Test events for files with binary extensions are not emitted
-    with qtbot.assertNotEmitted(fs_handler.sig_file_created, wait=2000):
+    with qtbot.assertNotEmitted(watcher.sig_files_changed, wait=2000):
         png_file = project_root.join("binary.png")
         png_file.write("")
 
 
+def test_coalesced_filesystem_events():
+    """Test that sequences of events are collapsed per path."""
+    events = [
+        ('created', 'a.py', None, False),
+        ('modified', 'a.py', None, False),
+        ('created', 'b.py', None, False),
+        ('deleted', 'b.py', None, False),
+        ('deleted', 'c.py', None, False),
+        ('created', 'c.py', None, False),
+        ('modified', 'd.py', None, False),
+        ('modified', 'd.py', None, False),
+        ('deleted', 'd.py', None, False),
+        ('created', 'e.py.tmp', None, False),
+        ('moved', 'e.py.tmp', 'e.py', False),
+        ('moved', 'f.py', 'g.py', False),
+    ]
+
+    assert coalesce_events(events) == [
+        ('created', 'a.py', None, False),
+        ('modified', 'c.py', None, False),
+        ('deleted', 'd.py', None, False),
+        ('created', 'e.py', None, False),
+        ('moved', 'f.py', 'g.py', False),
+    ]
+
+
 def test_loaded_and_closed_signals(create_projects, tmpdir, mocker, qtbot):
     """
     Test that loaded and closed signals are emitted when switching
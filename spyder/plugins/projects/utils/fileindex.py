@@ -0,0 +1,410 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Index of the files in a project, used to search them from the Switcher.
+
+Paths are kept in memory and matched against queries with regular
+expressions that run over all of them at once, joined in a single string
+with one path per line. That way searches don't need to walk the project
+tree or loop over its files in Python, which is too slow for big projects.
+"""
+
+# Standard library imports
+from array import array
+from bisect import bisect_right
+from collections import deque
+from itertools import accumulate, chain
+import hashlib
+import json
+import logging
+import os
+import os.path as osp
+import re
+import threading
+
+# Local imports
+from spyder.config.base import get_conf_path
+from spyder.config.utils import EDIT_EXTENSIONS
+from spyder.plugins.projects.utils.watcher import FOLDERS_TO_IGNORE
+
+
+logger = logging.getLogger(__name__)
+
+
+# ---- Constants
+# ----------------------------------------------------------------------------
+# Bump this when the format of the saved index changes.
+INDEX_VERSION = 2
+
+
+# ---- Queries
+# ----------------------------------------------------------------------------
+def get_query_patterns(query):
+    """
+    Get the regular expressions used to search `query` in the index.
+
+    Parameters
+    ----------
+    query: str
+        Lower case query, without spaces.
+
+    Returns
+    -------
+    tuple
+        (literal, fuzzy) tuple of compiled regexps. The first one matches
+        `query` as is and the second one its characters in order, with
+        anything but new lines between them.
+    """
+    literal = re.compile(re.escape(query))
+
+    # Each character is preceded by a class that excludes it, so there's
+    # only one way to match a line and failed matches don't backtrack.
+    parts = [re.escape(query[0])]
+    for char in query[1:]:
+        char = re.escape(char)
+        parts.append(r'[^{0}\n]*{0}'.format(char))
+    fuzzy = re.compile(''.join(parts))
+
+    return literal, fuzzy
+
+
+def iter_matched_lines(pattern, text, starts):
+    """
+    Generate the numbers of the lines in `text` matched by `pattern`.
+
+    Parameters
+    ----------
+    pattern: re.Pattern
+        Compiled regular expression that doesn't match new lines.
+    text: str
+        Lines joined by new lines.
+    starts: array
+        Position in `text` where each line starts.
+    """
+    num_lines = len(starts)
+    position = 0
+    while True:
+        match = pattern.search(text, position)
+        if match is None:
+            return
+
+        line = bisect_right(starts, match.start()) - 1
+        yield line
+
+        # Look for the next match in the following line
+        if line + 1 >= num_lines:
+            return
+        position = starts[line + 1]
+
+
+def join_lines(lines):
+    """
+    Join `lines` in a single string.
+
+    Returns
+    -------
+    tuple
+        (text, starts) tuple, where starts has the position in text where
+        each line starts.
+    """
+    text = '\n'.join(lines)
+    if not lines:
+        return text, array('q')
+
+    starts = array(
+        'q',
+        accumulate(chain([0], (len(line) + 1 for line in lines[:-1])))
+    )
+    return text, starts
+
+
+# ---- Index
+# ----------------------------------------------------------------------------
+class ProjectFileIndex:
+    """
+    Index of the files in a project that can be opened in the editor.
+
+    Files in hidden directories or in the directories ignored by the
+    workspace watcher are not indexed, because changes to them are not
+    reported.
+    """
+
+    def __init__(self, root_path, index_path=None):
+        """
+        Parameters
+        ----------
+        root_path: str
+            Path of the project.
+        index_path: str, optional
+            File where the index is saved. By default, it's saved in
+            Spyder's config directory, in a file named after a hash of
+            `root_path`. It's never saved inside the project because
+            projects can come from untrusted sources.
+        """
+        self.root_path = osp.normpath(root_path)
+        if index_path is None:
+            digest = hashlib.sha1(self.root_path.encode('utf-8')).hexdigest()
+            index_path = osp.join(
+                get_conf_path('projects_index'), digest + '.files.json'
+            )
+        self.index_path = index_path
+
+        # Relative paths of the indexed files. A dict is used as an ordered
+        # set, so that files are listed in the order they were found.
+        self._files = {}
+
+        # Data used to search files, computed again after changes
+        self._search_data = None
+
+        # Whether the index was checked against the files on disk
+        self.ready = False
+
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._files)
+
+    def __contains__(self, filename):
+        return self._get_relpath(filename) in self._files
+
+    # ---- Persistence
+    # ------------------------------------------------------------------------
+    def load(self):
+        """Load the index saved in `index_path`, if any."""
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                data = json.load(f)
+
+            if (
+                data.get('version') != INDEX_VERSION
+                or data.get('root_path') != self.root_path
+            ):
+                return False
+
+            files = dict.fromkeys(
+                relpath for relpath in data['files']
+                if isinstance(relpath, str)
+            )
+        except Exception:
+            return False
+
+        with self._lock:
+            self._files = files
+            self._search_data = None
+        return True
+
+    def save(self):
+        """Save the index to `index_path`."""
+        with self._lock:
+            files = list(self._files)
+
+        data = {
+            'version': INDEX_VERSION,
+            'root_path': self.root_path,
+            'files': files,
+        }
+
+        try:
+            os.makedirs(osp.dirname(self.index_path), exist_ok=True)
+            temp_path = self.index_path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.index_path)
+        except OSError:
+            logger.debug("Could not save file index for "
+                         "{}".format(self.root_path), exc_info=True)
+            return False
+
+        return True
+
+    # ---- Updates
+    # ------------------------------------------------------------------------
+    def _get_relpath(self, filename):
+        return osp.relpath(osp.normpath(filename), self.root_path)
+
+    def _ignore_dir(self, name):
+        return name.startswith('.') or name in FOLDERS_TO_IGNORE
+
+    def is_indexable(self, filename):
+        """Check if `filename` should be part of the index."""
+        relpath = self._get_relpath(filename)
+        if relpath.startswith(osp.pardir):
+            return False
+
+        parts = relpath.split(os.sep)
+        if any([self._ignore_dir(part) for part in parts[:-1]]):
+            return False
+
+        return osp.splitext(filename)[1] in EDIT_EXTENSIONS
+
+    def iter_indexable_files(self):
+        """Generate the relative paths of the files that should be indexed."""
+        dirs = deque([''])
+        while dirs:
+            reldir = dirs.popleft()
+            try:
+                entries = sorted(
+                    os.scandir(osp.join(self.root_path, reldir)),
+                    key=lambda entry: entry.name
+                )
+            except OSError:
+                continue
+
+            for entry in entries:
+                relpath = osp.join(reldir, entry.name)
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not self._ignore_dir(entry.name):
+                            dirs.append(relpath)
+                    elif (
+                        osp.splitext(entry.name)[1] in EDIT_EXTENSIONS
+                        and entry.is_file()
+                    ):
+                        yield relpath
+                except OSError:
+                    continue
+
+    def update(self):
+        """
+        Bring the index up to date with the files on disk.
+
+        Notes
+        -----
+        This walks the whole project, so it needs to be called in a thread.
+        Searches can be done in the meantime with the current files.
+        """
+        files = dict.fromkeys(self.iter_indexable_files())
+        with self._lock:
+            self._files = files
+            self._search_data = None
+            self.ready = True
+
+        logger.debug(
+            "File index for {} updated: {} files".format(
+                self.root_path, len(files))
+        )
+
+    def add_file(self, filename):
+        """Add `filename` to the index, if it should be part of it."""
+        if not self.is_indexable(filename):
+            return
+
+        relpath = self._get_relpath(filename)
+        with self._lock:
+            if relpath not in self._files:
+                self._files[relpath] = None
+                self._search_data = None
+
+    def remove_file(self, filename):
+        """Remove `filename` from the index."""
+        relpath = self._get_relpath(filename)
+        with self._lock:
+            if relpath in self._files:
+                del self._files[relpath]
+                self._search_data = None
+
+    def remove_directory(self, path):
+        """Remove all files in `path` from the index."""
+        prefix = self._get_relpath(path) + os.sep
+        with self._lock:
+            files = {
+                relpath: None for relpath in self._files
+                if not relpath.startswith(prefix)
+            }
+            if len(files) != len(self._files):
+                self._files = files
+                self._search_data = None
+
+    def move_directory(self, src_path, dest_path):
+        """Update the files in `src_path` after it was moved to `dest_path`."""
+        src_prefix = self._get_relpath(src_path) + os.sep
+        dest_prefix = osp.join(dest_path, '')
+        with self._lock:
+            moved = [
+                relpath for relpath in self._files
+                if relpath.startswith(src_prefix)
+            ]
+            for relpath in moved:
+                del self._files[relpath]
+            self._search_data = None
+
+        for relpath in moved:
+            self.add_file(dest_prefix + relpath[len(src_prefix):])
+
+    # ---- Queries
+    # ------------------------------------------------------------------------
+    def _get_search_data(self):
+        """Get the lines searched by `search`, computing them if needed."""
+        with self._lock:
+            if self._search_data is None:
+                files = list(self._files)
+
+                # Shorter paths are searched first, so that they are the ones
+                # kept when the number of results is limited.
+                sorted_files = sorted(files, key=len)
+                lower_paths = [relpath.lower() for relpath in sorted_files]
+                lower_names = [
+                    osp.basename(relpath) for relpath in lower_paths
+                ]
+                self._search_data = (
+                    files,
+                    sorted_files,
+                    join_lines(lower_names),
+                    join_lines(lower_paths),
+                )
+
+            return self._search_data
+
+    def search(self, query, max_results):
+        """
+        Search the indexed files that match `query`.
+
+        Parameters
+        ----------
+        query: str
+            Searched text. Files match it if they contain its characters in
+            order, regardless of their case and of spaces.
+        max_results: int
+            Maximum number of results.
+
+        Returns
+        -------
+        list
+            Absolute paths of the matched files. Files whose name contains
+            the query are listed first, followed by the ones whose name has
+            its characters in order and then by the ones where the query
+            matches other parts of their path. Shorter paths are listed first
+            in each group.
+        """
+        files, sorted_files, names, paths = self._get_search_data()
+        query = query.replace(' ', '').replace('/', os.sep).lower()
+
+        if not query:
+            results = files[:max_results]
+        else:
+            literal, fuzzy = get_query_patterns(query)
+            results = []
+            found = set()
+            for pattern, (text, starts) in [
+                (literal, names),
+                (fuzzy, names),
+                (literal, paths),
+                (fuzzy, paths),
+            ]:
+                for line in iter_matched_lines(pattern, text, starts):
+                    if line in found:
+                        continue
+
+                    found.add(line)
+                    results.append(sorted_files[line])
+                    if len(results) >= max_results:
+                        break
+
+                if len(results) >= max_results:
+                    break
+
+        return [osp.join(self.root_path, relpath) for relpath in results]
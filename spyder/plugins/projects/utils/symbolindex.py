@@ -0,0 +1,395 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Index of the symbols defined in the Python files of a project.
+
+Symbols are extracted in worker processes when files change and saved with
+the project, so they can be searched from the Switcher without asking the
+language server for them on every keystroke.
+"""
+
+# Standard library imports
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import os.path as osp
+import threading
+
+# Local imports
+from spyder.config.base import get_conf_path
+from spyder.plugins.projects.utils.fileindex import (
+    get_query_patterns, iter_matched_lines, join_lines)
+from spyder.plugins.projects.utils.symbols import (
+    PYTHON_EXTENSIONS, get_files_symbols)
+from spyder.plugins.projects.utils.watcher import FOLDERS_TO_IGNORE
+
+
+logger = logging.getLogger(__name__)
+
+
+# ---- Constants
+# ----------------------------------------------------------------------------
+# Bump this when the format of the saved index changes.
+INDEX_VERSION = 2
+
+# Number of files parsed by each worker process.
+INDEX_CHUNK_SIZE = 64
+
+# Minimum number of changed files to parse them in worker processes.
+MIN_POOL_FILES = 4 * INDEX_CHUNK_SIZE
+
+
+# ---- Index
+# ----------------------------------------------------------------------------
+class ProjectSymbolIndex:
+    """
+    Index of the symbols defined in the Python files of a project.
+
+    Only top level symbols and class members are indexed. Files in hidden
+    directories or in the directories ignored by the workspace watcher are
+    not indexed, because changes to them are not reported.
+    """
+
+    def __init__(self, root_path, index_path=None):
+        """
+        Parameters
+        ----------
+        root_path: str
+            Path of the project.
+        index_path: str, optional
+            File where the index is saved. By default, it's saved in
+            Spyder's config directory, in a file named after a hash of
+            `root_path`. It's never saved inside the project because
+            projects can come from untrusted sources.
+        """
+        self.root_path = osp.normpath(root_path)
+        if index_path is None:
+            digest = hashlib.sha1(self.root_path.encode('utf-8')).hexdigest()
+            index_path = osp.join(
+                get_conf_path('projects_index'), digest + '.symbols.json'
+            )
+        self.index_path = index_path
+
+        # Filename -> (mtime, size, symbols)
+        self._files = {}
+
+        # Files changed since they were last indexed
+        self._dirty = set()
+
+        # Data used to search symbols, computed again after changes
+        self._search_data = None
+
+        # Whether the index was checked against the files on disk
+        self.ready = False
+
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._files)
+
+    def __contains__(self, filename):
+        return filename in self._files
+
+    # ---- Persistence
+    # ------------------------------------------------------------------------
+    def load(self):
+        """Load the index saved in `index_path`, if any."""
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                data = json.load(f)
+
+            if (
+                data.get('version') != INDEX_VERSION
+                or data.get('root_path') != self.root_path
+            ):
+                return False
+
+            # JSON has no tuples, so entries and symbols come as lists
+            files = {
+                osp.join(self.root_path, relpath): (
+                    mtime, size, [tuple(symbol) for symbol in symbols]
+                )
+                for relpath, (mtime, size, symbols) in data['files'].items()
+            }
+        except Exception:
+            return False
+
+        with self._lock:
+            self._files = files
+            self._search_data = None
+        return True
+
+    def save(self):
+        """Save the index to `index_path`."""
+        with self._lock:
+            files = {
+                osp.relpath(filename, self.root_path): entry
+                for filename, entry in self._files.items()
+            }
+
+        data = {
+            'version': INDEX_VERSION,
+            'root_path': self.root_path,
+            'files': files,
+        }
+
+        try:
+            os.makedirs(osp.dirname(self.index_path), exist_ok=True)
+            temp_path = self.index_path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.index_path)
+        except OSError:
+            logger.debug("Could not save symbol index for "
+                         "{}".format(self.root_path), exc_info=True)
+            return False
+
+        return True
+
+    # ---- Updates
+    # ------------------------------------------------------------------------
+    def _ignore_dir(self, name):
+        return name.startswith('.') or name in FOLDERS_TO_IGNORE
+
+    def is_indexable(self, filename):
+        """Check if `filename` should be part of the index."""
+        relpath = osp.relpath(filename, self.root_path)
+        if relpath.startswith(osp.pardir):
+            return False
+
+        parts = relpath.split(os.sep)
+        if any([self._ignore_dir(part) for part in parts[:-1]]):
+            return False
+
+        return osp.splitext(filename)[1] in PYTHON_EXTENSIONS
+
+    def iter_indexable_files(self):
+        """Generate the files in the project that should be indexed."""
+        dirs = [self.root_path]
+        while dirs:
+            dirpath = dirs.pop()
+            try:
+                entries = list(os.scandir(dirpath))
+            except OSError:
+                continue
+
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not self._ignore_dir(entry.name):
+                            dirs.append(entry.path)
+                    elif (
+                        osp.splitext(entry.name)[1] in PYTHON_EXTENSIONS
+                        and entry.is_file()
+                    ):
+                        yield entry.path, entry.stat()
+                except OSError:
+                    continue
+
+    def update(self):
+        """
+        Bring the index up to date with the files on disk.
+
+        Only new files, files that changed since they were indexed and the
+        ones reported as changed by `invalidate_file` are parsed again.
+
+        Notes
+        -----
+        This can take a while for big projects, so it needs to be called
+        in a thread.
+        """
+        with self._lock:
+            dirty = self._dirty
+            self._dirty = set()
+            indexed = dict(self._files)
+
+        existing = set()
+        changed = []
+        for filename, stat in self.iter_indexable_files():
+            existing.add(filename)
+            entry = indexed.get(filename)
+            if (
+                filename in dirty
+                or entry is None
+                or entry[:2] != (stat.st_mtime, stat.st_size)
+            ):
+                changed.append(filename)
+
+        results = self._compute_symbols(changed)
+
+        with self._lock:
+            for filename in set(self._files) - existing:
+                del self._files[filename]
+
+            self._set_results(results)
+            self.ready = True
+
+        logger.debug(
+            "Symbol index for {} updated: {} files, {} changed".format(
+                self.root_path, len(self._files), len(changed))
+        )
+
+    def update_dirty_files(self):
+        """Parse again the files reported by `invalidate_file`."""
+        with self._lock:
+            dirty = self._dirty
+            self._dirty = set()
+
+        results = self._compute_symbols(
+            [filename for filename in dirty if osp.isfile(filename)]
+        )
+
+        with self._lock:
+            self._set_results(results)
+
+    def has_dirty_files(self):
+        """Check if there are files waiting to be parsed again."""
+        return bool(self._dirty)
+
+    def invalidate_file(self, filename):
+        """
+        Mark `filename` to be parsed again by `update_dirty_files`.
+
+        This needs to be called when a file is created or modified. Its
+        current symbols are kept until it's parsed again.
+        """
+        filename = osp.normpath(filename)
+        if not self.is_indexable(filename):
+            return
+
+        with self._lock:
+            self._dirty.add(filename)
+
+    def remove_file(self, filename):
+        """Remove `filename` from the index."""
+        filename = osp.normpath(filename)
+        with self._lock:
+            self._dirty.discard(filename)
+            if self._files.pop(filename, None) is not None:
+                self._search_data = None
+
+    def remove_directory(self, path):
+        """Remove all files in `path` from the index."""
+        prefix = osp.join(osp.normpath(path), '')
+        with self._lock:
+            for filename in list(self._files):
+                if filename.startswith(prefix):
+                    del self._files[filename]
+                    self._search_data = None
+            self._dirty = {
+                filename for filename in self._dirty
+                if not filename.startswith(prefix)
+            }
+
+    def _set_results(self, results):
+        """Save the symbols computed by `_compute_symbols`."""
+        for filename, entry in results:
+            # Files invalidated while we were parsing them need to be parsed
+            # again.
+            if filename in self._dirty:
+                continue
+
+            if entry is None:
+                self._files.pop(filename, None)
+            else:
+                self._files[filename] = entry
+
+        if results:
+            self._search_data = None
+
+    def _compute_symbols(self, filenames):
+        """Get the symbols of `filenames`, using worker processes if many."""
+        if len(filenames) < MIN_POOL_FILES:
+            return get_files_symbols(filenames)
+
+        chunks = [
+            filenames[i:i + INDEX_CHUNK_SIZE]
+            for i in range(0, len(filenames), INDEX_CHUNK_SIZE)
+        ]
+
+        # Forking a process with running Qt threads is unsafe, so we always
+        # spawn workers.
+        results = []
+        with ProcessPoolExecutor(
+            max_workers=max((os.cpu_count() or 1) - 1, 1),
+            mp_context=multiprocessing.get_context('spawn')
+        ) as executor:
+            for chunk_results in executor.map(get_files_symbols, chunks):
+                results.extend(chunk_results)
+
+        return results
+
+    # ---- Queries
+    # ------------------------------------------------------------------------
+    def _get_search_data(self):
+        """Get the names searched by `search`, computing them if needed."""
+        with self._lock:
+            if self._search_data is None:
+                symbols = [
+                    (filename,) + symbol
+                    for filename, (__, __, file_symbols) in self._files.items()
+                    for symbol in file_symbols
+                ]
+
+                # Shorter names are searched first, so that they are the ones
+                # kept when the number of results is limited.
+                symbols.sort(key=lambda symbol: len(symbol[1]))
+                names = join_lines([symbol[1].lower() for symbol in symbols])
+                self._search_data = (symbols, names)
+
+            return self._search_data
+
+    def search(self, query, max_results, kinds=None):
+        """
+        Search the indexed symbols whose name matches `query`.
+
+        Parameters
+        ----------
+        query: str
+            Searched text. Symbols match it if their name contains its
+            characters in order, regardless of their case and of spaces.
+        max_results: int
+            Maximum number of results.
+        kinds: set, optional
+            Kinds of the symbols to search. By default, all of them.
+
+        Returns
+        -------
+        list
+            List of (filename, name, kind, line, parent) tuples. Symbols
+            whose name contains the query are listed first, followed by the
+            ones that have its characters in order. Shorter names are listed
+            first in each group.
+        """
+        query = query.replace(' ', '').lower()
+        if not query:
+            return []
+
+        symbols, (text, starts) = self._get_search_data()
+        results = []
+        found = set()
+        for pattern in get_query_patterns(query):
+            for line in iter_matched_lines(pattern, text, starts):
+                if line in found:
+                    continue
+
+                found.add(line)
+                symbol = symbols[line]
+                if kinds is not None and symbol[2] not in kinds:
+                    continue
+
+                results.append(symbol)
+                if len(results) >= max_results:
+                    break
+
+            if len(results) >= max_results:
+                break
+
+        return results
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Extraction of the symbols defined in Python files.
+
+Note: This module is imported by the worker processes that index project
+symbols, so it must not import Qt or any other heavy module.
+"""
+
+# Standard library imports
+import ast
+import os
+
+
+# ---- Constants
+# ----------------------------------------------------------------------------
+# Extensions of the files whose symbols are extracted.
+PYTHON_EXTENSIONS = ('.py', '.pyw')
+
+# Files bigger than this (in bytes) are not parsed.
+MAX_PARSED_SIZE = 1024 ** 2
+
+# Symbol kinds. They have the same values as the ones in
+# spyder.plugins.completion.api.SymbolKind, which can't be imported here.
+CLASS = 5
+METHOD = 6
+FIELD = 8
+FUNCTION = 12
+VARIABLE = 13
+
+
+# ---- Functions
+# ----------------------------------------------------------------------------
+def _get_node_symbols(node, parent):
+    """
+    Get the symbols defined by `node`.
+
+    Returns
+    -------
+    list
+        List of (name, kind, line, parent) tuples.
+    """
+    line = node.lineno
+    if isinstance(node, ast.ClassDef):
+        return [(node.name, CLASS, line, parent)]
+    elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        kind = METHOD if parent else FUNCTION
+        return [(node.name, kind, line, parent)]
+
+    if isinstance(node, ast.Assign):
+        targets = node.targets
+    elif isinstance(node, ast.AnnAssign):
+        targets = [node.target]
+    else:
+        return []
+
+    kind = FIELD if parent else VARIABLE
+    symbols = []
+    for target in targets:
+        if isinstance(target, ast.Tuple):
+            names = target.elts
+        else:
+            names = [target]
+
+        for name in names:
+            if isinstance(name, ast.Name):
+                symbols.append((name.id, kind, line, parent))
+
+    return symbols
+
+
+def get_symbols(text):
+    """
+    Get the top level symbols and class members defined in `text`.
+
+    Parameters
+    ----------
+    text: str or bytes
+        Python code.
+
+    Returns
+    -------
+    list
+        List of (name, kind, line, parent) tuples, where line is one-based
+        and parent is the name of the class of class members or an empty
+        string for top level symbols.
+
+    Raises
+    ------
+    SyntaxError
+        If `text` is not valid Python code.
+    """
+    tree = ast.parse(text)
+
+    symbols = []
+    for node in tree.body:
+        symbols.extend(_get_node_symbols(node, ''))
+        if isinstance(node, ast.ClassDef):
+            for child in node.body:
+                symbols.extend(_get_node_symbols(child, node.name))
+
+    return symbols
+
+
+def get_file_symbols(filename):
+    """
+    Get the symbols defined in `filename`.
+
+    Returns
+    -------
+    tuple or None
+        (mtime, size, symbols) tuple or None if the file can't be read.
+        Files that can't be parsed have no symbols.
+    """
+    try:
+        stat = os.stat(filename)
+        if stat.st_size > MAX_PARSED_SIZE:
+            return None
+
+        with open(filename, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    try:
+        symbols = get_symbols(data)
+    except (SyntaxError, ValueError, RecursionError):
+        symbols = []
+
+    return (stat.st_mtime, stat.st_size, symbols)
+
+
+def get_files_symbols(filenames):
+    """
+    Get the symbols defined in several files.
+
+    This is the function run by the worker processes.
+    """
+    return [(filename, get_file_symbols(filename)) for filename in filenames]
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright © Spyder Project Contributors
+#
+# Licensed under the terms of the MIT License
+# ----------------------------------------------------------------------------
+
+"""Tests for the project file index."""
+
+# Standard library imports
+import os
+import os.path as osp
+import random
+import string
+import time
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.projects.utils.fileindex import ProjectFileIndex
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a project with a few files."""
+    files = [
+        'main.py',
+        'setup.py',
+        osp.join('spam', 'domain.py'),
+        osp.join('spam', 'main_window.py'),
+        osp.join('maintenance', 'notes.txt'),
+        osp.join('.hidden', 'main.py'),
+        osp.join('__pycache__', 'main.py'),
+        'data.bin',
+    ]
+    for relpath in files:
+        path = tmp_path / relpath
+        path.parent.mkdir(exist_ok=True)
+        path.touch()
+
+    return str(tmp_path)
+
+
+@pytest.fixture
+def index(project, tmp_path_factory):
+    index_path = str(tmp_path_factory.mktemp('index') / 'files.json')
+    index = ProjectFileIndex(project, index_path=index_path)
+    index.update()
+    return index
+
+
+def test_indexed_files(project, index):
+    """Only visible files with editable extensions are indexed."""
+    assert len(index) == 5
+    assert osp.join(project, 'data.bin') not in index
+    assert osp.join(project, '.hidden', 'main.py') not in index
+    assert osp.join(project, '__pycache__', 'main.py') not in index
+
+    # Files are listed in the order they were found
+    assert index.search('', 2) == [
+        osp.join(project, 'main.py'),
+        osp.join(project, 'setup.py'),
+    ]
+
+
+def test_search(project, index):
+    """Files whose name matches the query are listed first."""
+    assert index.search('MAIN', 10) == [
+        osp.join(project, 'main.py'),
+        osp.join(project, 'spam', 'domain.py'),
+        osp.join(project, 'spam', 'main_window.py'),
+        osp.join(project, 'maintenance', 'notes.txt'),
+    ]
+
+    # Characters in order
+    assert index.search('mwin', 10) == [
+        osp.join(project, 'spam', 'main_window.py'),
+    ]
+
+    # Characters in the path
+    assert index.search('spam/dom', 10) == [
+        osp.join(project, 'spam', 'domain.py'),
+    ]
+
+    # Regexp characters are searched literally
+    assert index.search('m.n', 10) == []
+
+    # The number of results is limited
+    assert len(index.search('main', 2)) == 2
+
+
+def test_search_shortest(tmp_path, tmp_path_factory):
+    """The shortest paths are kept when the number of results is limited."""
+    (tmp_path / 'main_window.py').touch()
+    (tmp_path / 'spam').mkdir()
+    (tmp_path / 'spam' / 'main.py').touch()
+
+    index_path = str(tmp_path_factory.mktemp('index') / 'files.json')
+    index = ProjectFileIndex(str(tmp_path), index_path=index_path)
+    index.update()
+
+    # Files in the project root are found first
+    assert index.search('', 2) == [
+        str(tmp_path / 'main_window.py'),
+        str(tmp_path / 'spam' / 'main.py'),
+    ]
+    assert index.search('main', 1) == [str(tmp_path / 'spam' / 'main.py')]
+
+
+def test_updates(project, index):
+    """Changes reported by the watcher are applied to the index."""
+    index.add_file(osp.join(project, 'eggs.py'))
+    index.add_file(osp.join(project, '.hidden', 'eggs.py'))
+    assert index.search('eggs', 10) == [osp.join(project, 'eggs.py')]
+
+    index.remove_file(osp.join(project, 'eggs.py'))
+    assert index.search('eggs', 10) == []
+
+    index.move_directory(osp.join(project, 'spam'),
+                         osp.join(project, 'ham'))
+    assert index.search('domain', 10) == [
+        osp.join(project, 'ham', 'domain.py'),
+    ]
+
+    index.remove_directory(osp.join(project, 'ham'))
+    assert index.search('domain', 10) == []
+
+
+def test_save_load(project, index):
+    """The index is restored from disk."""
+    assert index.save()
+
+    new_index = ProjectFileIndex(project, index_path=index.index_path)
+    assert new_index.load()
+    assert len(new_index) == len(index)
+    assert not new_index.ready
+
+    # Removed files are dropped when the index is updated
+    os.remove(osp.join(project, 'main.py'))
+    new_index.update()
+    assert new_index.ready
+    assert osp.join(project, 'main.py') not in new_index
+
+
+def test_index_path(project):
+    """The index is not saved inside the project."""
+    index = ProjectFileIndex(project)
+    assert not index.index_path.startswith(project)
+    assert index.index_path != ProjectFileIndex(project + 'x').index_path
+
+
+@pytest.mark.slow
+def test_benchmark_search(tmp_path):
+    """Searches in a big project are fast enough to be done on keystrokes."""
+    random.seed(0)
+    words = [
+        ''.join(random.choice(string.ascii_lowercase)
+                for __ in range(random.randint(3, 9)))
+        for __ in range(3000)
+    ]
+    files = [
+        osp.join(*random.sample(words, random.randint(2, 6))) + '.py'
+        for __ in range(500000)
+    ]
+
+    index = ProjectFileIndex(str(tmp_path))
+    index._files = dict.fromkeys(files)
+    index.search('', 50)
+
+    for query in ['m', 'main', 'mainpy', 'abcdef', 'qqqqqq']:
+        start = time.perf_counter()
+        results = index.search(query, 50)
+        assert time.perf_counter() - start < 0.2
+        assert len(results) <= 50
+
+
+if __name__ == "__main__":
+    pytest.main()
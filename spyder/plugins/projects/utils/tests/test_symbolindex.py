@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright © Spyder Project Contributors
+#
+# Licensed under the terms of the MIT License
+# ----------------------------------------------------------------------------
+
+"""Tests for the project symbol index."""
+
+# Standard library imports
+import os
+import os.path as osp
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.projects.utils import symbolindex
+from spyder.plugins.projects.utils.symbolindex import ProjectSymbolIndex
+from spyder.plugins.projects.utils.symbols import (
+    CLASS, FIELD, FUNCTION, METHOD, VARIABLE, get_symbols)
+
+
+CODE = """
+import os
+
+MAX_SIZE = 10
+width, height = 1, 2
+
+class MainWindow:
+    title: str = ''
+
+    def setup(self):
+        local_variable = 1
+
+async def main():
+    pass
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a project with a few Python files."""
+    files = {
+        'main.py': CODE,
+        osp.join('spam', 'domain.py'): "def get_domain():\n    pass\n",
+        osp.join('spam', 'broken.py'): "def broken(:\n",
+        osp.join('.hidden', 'hidden.py'): "def hidden():\n    pass\n",
+        'notes.txt': "def notes():\n    pass\n",
+    }
+    for relpath, text in files.items():
+        path = tmp_path / relpath
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(text)
+
+    return str(tmp_path)
+
+
+@pytest.fixture
+def index(project, tmp_path_factory):
+    index_path = str(tmp_path_factory.mktemp('index') / 'symbols.json')
+    index = ProjectSymbolIndex(project, index_path=index_path)
+    index.update()
+    return index
+
+
+def test_get_symbols():
+    """Top level symbols and class members are extracted."""
+    assert get_symbols(CODE) == [
+        ('MAX_SIZE', VARIABLE, 4, ''),
+        ('width', VARIABLE, 5, ''),
+        ('height', VARIABLE, 5, ''),
+        ('MainWindow', CLASS, 7, ''),
+        ('title', FIELD, 8, 'MainWindow'),
+        ('setup', METHOD, 10, 'MainWindow'),
+        ('main', FUNCTION, 13, ''),
+    ]
+
+
+def test_indexed_files(project, index):
+    """Only visible Python files are indexed."""
+    assert index.ready
+    assert len(index) == 3
+    assert osp.join(project, 'notes.txt') not in index
+    assert osp.join(project, '.hidden', 'hidden.py') not in index
+
+    # Files with syntax errors have no symbols
+    assert index.search('broken', 10) == []
+
+
+def test_search(project, index):
+    """Symbols whose name contains the query are listed first."""
+    main = osp.join(project, 'main.py')
+    domain = osp.join(project, 'spam', 'domain.py')
+    assert index.search('TI', 10) == [
+        (main, 'title', FIELD, 8, 'MainWindow'),
+        (domain, 'get_domain', FUNCTION, 1, ''),
+    ]
+
+    # Shorter names are listed first
+    assert index.search('main', 10, kinds={FUNCTION}) == [
+        (main, 'main', FUNCTION, 13, ''),
+        (domain, 'get_domain', FUNCTION, 1, ''),
+    ]
+
+    # Filter by kind
+    assert index.search('main', 10, kinds={CLASS}) == [
+        (main, 'MainWindow', CLASS, 7, ''),
+    ]
+
+    # The number of results is limited, keeping the shortest names
+    assert len(index.search('i', 2)) == 2
+    assert index.search('ma', 1) == [(main, 'main', FUNCTION, 13, '')]
+
+    # Empty queries don't list anything
+    assert index.search('', 10) == []
+
+
+def test_updates(project, index):
+    """Changes reported by the watcher are applied to the index."""
+    domain = osp.join(project, 'spam', 'domain.py')
+    with open(domain, 'w') as f:
+        f.write("def get_eggs():\n    pass\n")
+
+    # Symbols are kept until the file is parsed again
+    index.invalidate_file(domain)
+    assert index.has_dirty_files()
+    assert len(index.search('get_domain', 10)) == 1
+
+    index.update_dirty_files()
+    assert not index.has_dirty_files()
+    assert index.search('get_domain', 10) == []
+    assert len(index.search('get_eggs', 10)) == 1
+
+    index.remove_directory(osp.join(project, 'spam'))
+    assert index.search('get_eggs', 10) == []
+
+    index.remove_file(osp.join(project, 'main.py'))
+    assert len(index) == 0
+
+
+def test_save_load(project, index):
+    """The index is restored from disk and only changed files are parsed."""
+    assert index.save()
+
+    new_index = ProjectSymbolIndex(project, index_path=index.index_path)
+    assert new_index.load()
+    assert len(new_index) == len(index)
+    assert not new_index.ready
+    assert new_index.search('main', 10) == index.search('main', 10) != []
+
+    parsed = []
+
+    def get_files_symbols(filenames):
+        parsed.extend(filenames)
+        return symbolindex.get_files_symbols(filenames)
+
+    os.remove(osp.join(project, 'main.py'))
+    new_index._compute_symbols = get_files_symbols
+    new_index.update()
+
+    assert new_index.ready
+    assert parsed == []
+    assert osp.join(project, 'main.py') not in new_index
+
+
+def test_index_path(project):
+    """The index is not saved inside the project."""
+    index = ProjectSymbolIndex(project)
+    assert not index.index_path.startswith(project)
+    assert index.index_path != ProjectSymbolIndex(project + 'x').index_path
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -10,10 +10,10 @@
 import os
 import logging
 from pathlib import Path
+import threading
 
 # Third-party imports
-from qtpy.QtCore import QObject, Signal
-from superqt.utils import qthrottled
+from qtpy.QtCore import QObject, QTimer, Signal
 import watchdog
 from watchdog.events import FileSystemEventHandler, PatternMatchingEventHandler
 from watchdog.observers.polling import PollingObserverVFS
@@ -31,6 +31,16 @@
     "build",
 ]
 
+# Time to wait for more events before reporting them.
+EVENTS_DELAY = 200  # In milliseconds
+
+
+class WorkspaceEventType:
+    Created = "created"
+    Deleted = "deleted"
+    Modified = "modified"
+    Moved = "moved"
+
 
 # ---- Monkey patches
 # -----------------------------------------------------------------------------
@@ -96,6 +106,79 @@ def filter_scandir(path):
     )
 
 
+def ignore_path(path, root_path):
+    """Check if changes to `path` in `root_path` should be ignored."""
+    parts = Path(os.path.relpath(path, root_path)).parts
+    return any(
+        [p.startswith(".") or p in FOLDERS_TO_IGNORE for p in parts]
+    )
+
+
+def coalesce_events(events):
+    """
+    Collapse a sequence of filesystem events to the changes they produce.
+
+    Parameters
+    ----------
+    events: list
+        List of (event_type, src_path, dest_path, is_dir) tuples, in the
+        order they happened. `dest_path` is only set for moves.
+
+    Returns
+    -------
+    list
+        Changes in the same format, at most one per path for creations,
+        deletions and modifications. For instance, a file that was created
+        and modified is reported as created, and a file that was created and
+        deleted is not reported.
+    """
+    # Changes are kept in a dict to preserve their order while being able to
+    # drop them. Moves are keyed by their position instead of a path.
+    changes = {}
+
+    for i, (event_type, src_path, dest_path, is_dir) in enumerate(events):
+        key = (src_path, is_dir)
+        previous = changes.get(key, (None,))[0]
+
+        if event_type == WorkspaceEventType.Created:
+            if previous == WorkspaceEventType.Deleted:
+                # The file was replaced
+                del changes[key]
+                event_type = WorkspaceEventType.Modified
+            elif previous is not None:
+                continue
+        elif event_type == WorkspaceEventType.Modified:
+            if previous is not None:
+                continue
+        elif event_type == WorkspaceEventType.Deleted:
+            if previous == WorkspaceEventType.Created:
+                del changes[key]
+                continue
+            changes.pop(key, None)
+        elif event_type == WorkspaceEventType.Moved:
+            if previous == WorkspaceEventType.Created:
+                # Files saved through a temporary one are reported as
+                # created in their final location.
+                del changes[key]
+                dest_key = (dest_path, is_dir)
+                dest_previous = changes.pop(dest_key, (None,))[0]
+                if dest_previous == WorkspaceEventType.Deleted:
+                    event_type = WorkspaceEventType.Modified
+                else:
+                    event_type = WorkspaceEventType.Created
+                changes[dest_key] = (event_type, dest_path, None, is_dir)
+            else:
+                changes.pop(key, None)
+                changes[i] = (
+                    event_type, src_path, dest_path, is_dir
+                )
+            continue
+
+        changes[key] = (event_type, src_path, None, is_dir)
+
+    return list(changes.values())
+
+
 # ---- Event handler
 # -----------------------------------------------------------------------------
 class WorkspaceEventHandler(QObject, PatternMatchingEventHandler):
@@ -103,13 +186,15 @@ class WorkspaceEventHandler(QObject, PatternMatchingEventHandler):
     Event handler for watchdog notifications.
 
     This class receives notifications about file/folder moving, modification,
-    creation and deletion and emits a corresponding signal about it.
+    creation and deletion from the observer thread and collects them until
+    they're taken with `take_events`.
     """
 
-    sig_file_moved = Signal(str, str, bool)
-    sig_file_created = Signal(str, bool)
-    sig_file_deleted = Signal(str, bool)
-    sig_file_modified = Signal(str, bool)
+    sig_events_available = Signal()
+    """
+    This signal is emitted when events are received after the previous ones
+    were taken.
+    """
 
     def __init__(self, parent=None):
         QObject.__init__(self, parent)
@@ -117,38 +202,83 @@ def __init__(self, parent=None):
             self,
             patterns=[f"*{ext}" for ext in EDIT_EXTENSIONS],
         )
+        self.root_path = None
+        self._events = []
+        self._lock = threading.Lock()
 
     def fmt_is_dir(self, is_dir):
         return 'directory' if is_dir else 'file'
 
+    def take_events(self):
+        """Get the events received so far and forget them."""
+        with self._lock:
+            events = self._events
+            self._events = []
+        return events
+
+    def add_event(self, event_type, src_path, dest_path, is_dir):
+        """Collect an event to be taken later."""
+        with self._lock:
+            emit = not self._events
+            self._events.append((event_type, src_path, dest_path, is_dir))
+
+        # Only notify about the first event to not flood the main thread
+        # with signals.
+        if emit:
+            self.sig_events_available.emit()
+
+    def is_ignored(self, path):
+        return self.root_path is not None and ignore_path(path, self.root_path)
+
     def on_moved(self, event):
         src_path = event.src_path
         dest_path = event.dest_path
         is_dir = event.is_directory
-        logger.info("Moved {0}: {1} to {2}".format(
+        logger.debug("Moved {0}: {1} to {2}".format(
             self.fmt_is_dir(is_dir), src_path, dest_path))
-        self.sig_file_moved.emit(src_path, dest_path, is_dir)
+
+        # Moves from or to ignored directories are seen as creations or
+        # deletions, respectively.
+        if self.is_ignored(src_path):
+            if not self.is_ignored(dest_path):
+                self.add_event(
+                    WorkspaceEventType.Created, dest_path, None, is_dir
+                )
+        elif self.is_ignored(dest_path):
+            self.add_event(WorkspaceEventType.Deleted, src_path, None, is_dir)
+        else:
+            self.add_event(
+                WorkspaceEventType.Moved, src_path, dest_path, is_dir
+            )
 
     def on_created(self, event):
         src_path = event.src_path
         is_dir = event.is_directory
-        logger.info("Created {0}: {1}".format(
+        logger.debug("Created {0}: {1}".format(
             self.fmt_is_dir(is_dir), src_path))
-        self.sig_file_created.emit(src_path, is_dir)
+        if not self.is_ignored(src_path):
+            self.add_event(WorkspaceEventType.Created, src_path, None, is_dir)
 
     def on_deleted(self, event):
         src_path = event.src_path
         is_dir = event.is_directory
-        logger.info("Deleted {0}: {1}".format(
+        logger.debug("Deleted {0}: {1}".format(
             self.fmt_is_dir(is_dir), src_path))
-        self.sig_file_deleted.emit(src_path, is_dir)
+        if not self.is_ignored(src_path):
+            self.add_event(WorkspaceEventType.Deleted, src_path, None, is_dir)
 
     def on_modified(self, event):
         src_path = event.src_path
         is_dir = event.is_directory
-        logger.info("Modified {0}: {1}".format(
+        logger.debug("Modified {0}: {1}".format(
             self.fmt_is_dir(is_dir), src_path))
-        self.sig_file_modified.emit(src_path, is_dir)
+
+        # Directories are reported as modified when their contents change,
+        # which is already notified by the events of their files.
+        if not is_dir and not self.is_ignored(src_path):
+            self.add_event(
+                WorkspaceEventType.Modified, src_path, None, is_dir
+            )
 
     def dispatch(self, event):
         # Don't apply patterns to directories, only to files
@@ -164,32 +294,44 @@ class WorkspaceWatcher(QObject):
     """
     Wrapper class around watchdog observer and notifier.
 
-    It provides methods to start and stop watching folders.
+    It provides methods to start and stop watching folders. Events are
+    collected for a short time and reported in batches, so that operations
+    that change many files at once (e.g. switching git branches) don't
+    flood the interface with notifications.
     """
 
     observer = None
 
-    sig_file_moved = Signal(str, str, bool)
-    sig_file_created = Signal(str, bool)
-    sig_file_deleted = Signal(str, bool)
-    sig_file_modified = Signal(str, bool)
+    sig_files_changed = Signal(list)
+    """
+    This signal is emitted with the changes detected in the watched folder.
+
+    Parameters
+    ----------
+    changes: list
+        List of (event_type, src_path, dest_path, is_dir) tuples, where
+        event_type is one of the values of `WorkspaceEventType` and
+        dest_path is only set for moves. There is at most one creation,
+        deletion or modification per path.
+    """
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.event_handler = WorkspaceEventHandler(self)
 
-        self.event_handler.sig_file_moved.connect(self.on_moved)
-        self.event_handler.sig_file_created.connect(self.on_created)
-        self.event_handler.sig_file_deleted.connect(self.on_deleted)
-        self.event_handler.sig_file_modified.connect(self.on_modified)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(EVENTS_DELAY)
+        self._timer.timeout.connect(self._emit_changes)
+
+        self.event_handler.sig_events_available.connect(self._timer.start)
 
     def connect_signals(self, project):
-        self.sig_file_created.connect(project.file_created)
-        self.sig_file_moved.connect(project.file_moved)
-        self.sig_file_deleted.connect(project.file_deleted)
-        self.sig_file_modified.connect(project.file_modified)
+        self.sig_files_changed.connect(project.files_changed)
 
     def start(self, workspace_folder):
+        self.event_handler.root_path = workspace_folder
+
         # We use a polling observer because:
         # * It doesn't introduce long freezes on Linux when switching git
         #   branches that have many changes between them. That's because the
@@ -226,18 +368,17 @@ def stop(self):
             except RuntimeError:
                 pass
 
-    @qthrottled(timeout=200)
-    def on_moved(self, src_path, dest_path, is_dir):
-        self.sig_file_moved.emit(src_path, dest_path, is_dir)
-
-    @qthrottled(timeout=200)
-    def on_created(self, path, is_dir):
-        self.sig_file_created.emit(path, is_dir)
+        # Changes in the previous folder are not relevant anymore
+        self._timer.stop()
+        self.event_handler.take_events()
 
-    @qthrottled(timeout=200)
-    def on_deleted(self, path, is_dir):
-        self.sig_file_deleted.emit(path, is_dir)
+    def _emit_changes(self):
+        events = self.event_handler.take_events()
+        changes = coalesce_events(events)
+        logger.debug(
+            "Reporting {0} changes from {1} events".format(
+                len(changes), len(events))
+        )
 
-    @qthrottled(timeout=200)
-    def on_modified(self, path, is_dir):
-        self.sig_file_modified.emit(path, is_dir)
+        if changes:
+            self.sig_files_changed.emit(changes)
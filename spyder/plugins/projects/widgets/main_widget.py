@@ -18,7 +18,7 @@
 
 # Third party imports
 from qtpy.compat import getexistingdirectory
-from qtpy.QtCore import Qt, Signal, Slot
+from qtpy.QtCore import Qt, QTimer, Signal, Slot
 from qtpy.QtWidgets import (
     QHBoxLayout, QInputDialog, QLabel, QMessageBox, QVBoxLayout, QWidget)
 
@@ -29,22 +29,23 @@
 from spyder.api.widgets.main_widget import PluginMainWidget
 from spyder.config.base import (
     get_home_dir, get_project_config_folder, running_under_pytest)
-from spyder.config.utils import EDIT_EXTENSIONS
 from spyder.plugins.completion.api import (
-    CompletionRequestTypes, FileChangeType)
+    CompletionRequestTypes, FileChangeType, SymbolKind, SYMBOL_KIND_ICON)
 from spyder.plugins.completion.decorators import (
     class_register, handles, request)
 from spyder.plugins.explorer.api import DirViewActions
 from spyder.plugins.projects.api import (
     BaseProjectType, EmptyProject, WORKSPACE)
-from spyder.plugins.projects.utils.watcher import WorkspaceWatcher
+from spyder.plugins.projects.utils.fileindex import ProjectFileIndex
+from spyder.plugins.projects.utils.symbolindex import ProjectSymbolIndex
+from spyder.plugins.projects.utils.watcher import (
+    WorkspaceEventType, WorkspaceWatcher)
 from spyder.plugins.projects.widgets.projectdialog import ProjectDialog
 from spyder.plugins.projects.widgets.projectexplorer import (
     ProjectExplorerTreeWidget)
 from spyder.plugins.switcher.utils import get_file_icon, shorten_paths
 from spyder.utils import encoding
 from spyder.utils.misc import getcwd_or_home
-from spyder.utils.programs import find_program
 from spyder.utils.workers import WorkerManager
 
 
@@ -78,6 +79,7 @@ class RecentProjectsMenuSections:
 
 class ProjectsOptionsMenuActions:
     SearchInSwitcher = "search_in_switcher"
+    SearchSymbolsInSwitcher = "search_symbols_in_switcher"
 
 
 # ---- Main widget
@@ -98,6 +100,7 @@ class ProjectExplorerWidget(PluginMainWidget):
     # ---- Constants
     # -------------------------------------------------------------------------
     MAX_SWITCHER_RESULTS = 50
+    SYMBOL_INDEX_UPDATE_DELAY = 2000  # In milliseconds
 
     # ---- Signals
     # -------------------------------------------------------------------------
@@ -111,6 +114,18 @@ class ProjectExplorerWidget(PluginMainWidget):
         The path to the requested file.
     """
 
+    sig_open_symbol_requested = Signal(str, int)
+    """
+    This signal is emitted when a symbol is requested to be opened.
+
+    Parameters
+    ----------
+    filename: str
+        The path to the file where the symbol is defined.
+    line_number: int
+        The line where the symbol is defined.
+    """
+
     sig_project_created = Signal(str, str)
     """
     This signal is emitted to request the Projects plugin the creation of a
@@ -184,8 +199,8 @@ def __init__(self, name, plugin, parent=None):
         self.current_active_project = None
         self.latest_project = None
         self.completions_available = False
-        self._fzf = find_program('fzf')
-        self._default_switcher_paths = []
+        self.file_index = None
+        self.symbol_index = None
 
         # -- Tree widget
         self.treewidget = ProjectExplorerTreeWidget(self, self.show_hscrollbar)
@@ -199,20 +214,31 @@ def __init__(self, name, plugin, parent=None):
         self.watcher = WorkspaceWatcher(self)
         self.watcher.connect_signals(self)
 
-        # -- Worker manager for calls to fzf
+        # -- Worker manager to build the file and symbol indexes
         self._worker_manager = WorkerManager(self)
 
+        # -- Timer to parse changed files again for the symbol index
+        self._symbol_index_timer = QTimer(self)
+        self._symbol_index_timer.setSingleShot(True)
+        self._symbol_index_timer.setInterval(self.SYMBOL_INDEX_UPDATE_DELAY)
+        self._symbol_index_timer.timeout.connect(
+            self._update_symbol_index_files)
+
         # -- Signals
         self.sig_project_loaded.connect(self._setup_project)
 
-        # This is necessary to populate the switcher with some default list of
-        # paths instead of computing that list every time it's shown.
+        # The index of project files is used to search them in the switcher.
+        self.sig_project_loaded.connect(lambda p: self._setup_file_index())
+        self.sig_project_closed.connect(lambda p: self._close_file_index())
+
+        # The index of project symbols is used to search them in the
+        # switcher.
         self.sig_project_loaded.connect(
-            lambda p: self._update_default_switcher_paths()
+            lambda p: self._setup_symbol_index()
+        )
+        self.sig_project_closed.connect(
+            lambda p: self._close_symbol_index()
         )
-
-        # Clear saved paths for the switcher when closing the project.
-        self.sig_project_closed.connect(lambda p: self._clear_switcher_paths())
 
         # -- Layout
         self.setMinimumWidth(200)
@@ -282,6 +308,13 @@ def setup(self):
             option='search_files_in_switcher',
         )
 
+        search_symbols_in_switcher_action = self.create_action(
+            ProjectsOptionsMenuActions.SearchSymbolsInSwitcher,
+            text=_("Search project symbols in the switcher"),
+            toggled=True,
+            option='search_symbols_in_switcher',
+        )
+
         # Add some DirView actions to the Options menu for easy access.
         hidden_action = self.get_action(DirViewActions.ToggleHiddenFiles)
         single_click_action = self.get_action(DirViewActions.ToggleSingleClick)
@@ -292,6 +325,7 @@ def setup(self):
             hidden_action,
             single_click_action,
             search_in_switcher_action,
+            search_symbols_in_switcher_action,
         ]:
             self.add_item_to_menu(
                 action,
@@ -304,6 +338,8 @@ def update_actions(self):
 
     def on_close(self):
         self._worker_manager.terminate_all()
+        self._close_file_index()
+        self._close_symbol_index()
 
     # ---- Public API
     # -------------------------------------------------------------------------
@@ -659,11 +695,12 @@ def show_widget(self):
     # -------------------------------------------------------------------------
     def display_default_switcher_items(self):
         """Populate switcher with a default set of files in the project."""
-        if not self._default_switcher_paths:
+        paths = self._search_files()
+        if not paths:
             return
 
         self._display_paths_in_switcher(
-            self._default_switcher_paths, setup=False, clear_section=False
+            paths, setup=False, clear_section=False
         )
 
     def handle_switcher_selection(self, item, mode, search_text):
@@ -686,8 +723,15 @@ def handle_switcher_selection(self, item, mode, search_text):
         if item.get_section() != self.get_title():
             return
 
-        # Open file in editor
-        self.sig_open_file_requested.emit(item.get_data())
+        if mode == '@':
+            # Go to symbol in editor
+            data = item.get_data()
+            self.sig_open_symbol_requested.emit(
+                data['filename'], data['line_number']
+            )
+        else:
+            # Open file in editor
+            self.sig_open_file_requested.emit(item.get_data())
 
     def handle_switcher_search(self, search_text):
         """
@@ -699,7 +743,28 @@ def handle_switcher_search(self, search_text):
         text: str
             The current search text in the switcher dialog box.
         """
-        self._call_fzf(search_text)
+        if self.file_index is None:
+            return
+
+        self._display_paths_in_switcher(
+            self._search_files(search_text), setup=True, clear_section=True
+        )
+
+    def handle_switcher_symbol_search(self, search_text):
+        """
+        Handle user typing in the symbol mode of the switcher.
+
+        Load the project symbols that match the search text.
+
+        Parameters
+        ----------
+        text: str
+            The current search text in the switcher dialog box.
+        """
+        if self.symbol_index is None:
+            return
+
+        self._display_symbols_in_switcher(self._search_symbols(search_text))
 
     # ---- Public API for the LSP
     # -------------------------------------------------------------------------
@@ -730,83 +795,38 @@ def handle_response(self, method, params):
 
     @request(method=CompletionRequestTypes.WORKSPACE_WATCHED_FILES_UPDATE,
              requires_response=False)
-    @Slot(str, bool)
-    def file_created(self, src_file, is_dir):
-        """Notify LSP server about file creation."""
-        self._update_default_switcher_paths()
-
-        # LSP specification only considers file updates
-        if is_dir:
-            return
-
-        params = {
-            'params': [{
-                'file': src_file,
-                'kind': FileChangeType.CREATED
-            }]
-        }
-        return params
-
-    @Slot(str, str, bool)
-    @request(method=CompletionRequestTypes.WORKSPACE_WATCHED_FILES_UPDATE,
-             requires_response=False)
-    def file_moved(self, src_file, dest_file, is_dir):
-        """Notify LSP server about a file that is moved."""
-        self._update_default_switcher_paths()
+    @Slot(list)
+    def files_changed(self, changes):
+        """
+        Update the project indexes and notify LSP servers about a batch of
+        changes reported by the watcher.
 
-        if is_dir:
+        Parameters
+        ----------
+        changes: list
+            List of (event_type, src_path, dest_path, is_dir) tuples, as
+            emitted by `WorkspaceWatcher.sig_files_changed`.
+        """
+        entries = []
+        for event_type, src_path, dest_path, is_dir in changes:
+            if event_type == WorkspaceEventType.Created:
+                entries.extend(self._file_created(src_path, is_dir))
+            elif event_type == WorkspaceEventType.Moved:
+                entries.extend(self._file_moved(src_path, dest_path, is_dir))
+            elif event_type == WorkspaceEventType.Deleted:
+                entries.extend(self._file_deleted(src_path, is_dir))
+            elif event_type == WorkspaceEventType.Modified:
+                entries.extend(self._file_modified(src_path, is_dir))
+
+        # LSP servers are notified about all changes at once
+        if not entries:
             return
 
-        deletion_entry = {
-            'file': src_file,
-            'kind': FileChangeType.DELETED
-        }
-
-        addition_entry = {
-            'file': dest_file,
-            'kind': FileChangeType.CREATED
-        }
-
-        entries = [addition_entry, deletion_entry]
         params = {
             'params': entries
         }
         return params
 
-    @request(method=CompletionRequestTypes.WORKSPACE_WATCHED_FILES_UPDATE,
-             requires_response=False)
-    @Slot(str, bool)
-    def file_deleted(self, src_file, is_dir):
-        """Notify LSP server about file deletion."""
-        self._update_default_switcher_paths()
-
-        if is_dir:
-            return
-
-        params = {
-            'params': [{
-                'file': src_file,
-                'kind': FileChangeType.DELETED
-            }]
-        }
-        return params
-
-    @request(method=CompletionRequestTypes.WORKSPACE_WATCHED_FILES_UPDATE,
-             requires_response=False)
-    @Slot(str, bool)
-    def file_modified(self, src_file, is_dir):
-        """Notify LSP server about file modification."""
-        if is_dir:
-            return
-
-        params = {
-            'params': [{
-                'file': src_file,
-                'kind': FileChangeType.CHANGED
-            }]
-        }
-        return params
-
     @request(method=CompletionRequestTypes.WORKSPACE_FOLDERS_CHANGE,
              requires_response=False)
     def notify_project_open(self, path):
@@ -1038,73 +1058,259 @@ def _disable_pdb_prevent_closing(self):
                 "pdb_prevent_closing", pdb_prevent_closing, section="debugger"
             )
 
+    def _file_created(self, src_file, is_dir):
+        """Handle file creation and get its LSP notification entries."""
+        if self.file_index is not None and not is_dir:
+            self.file_index.add_file(src_file)
+        self._invalidate_symbol_index_path(src_file, is_dir)
+
+        # LSP specification only considers file updates
+        if is_dir:
+            return []
+
+        return [{
+            'file': src_file,
+            'kind': FileChangeType.CREATED
+        }]
+
+    def _file_moved(self, src_file, dest_file, is_dir):
+        """Handle a file move and get its LSP notification entries."""
+        if self.file_index is not None:
+            if is_dir:
+                self.file_index.move_directory(src_file, dest_file)
+            else:
+                self.file_index.remove_file(src_file)
+                self.file_index.add_file(dest_file)
+        self._remove_symbol_index_path(src_file, is_dir)
+        self._invalidate_symbol_index_path(dest_file, is_dir)
+
+        if is_dir:
+            return []
+
+        deletion_entry = {
+            'file': src_file,
+            'kind': FileChangeType.DELETED
+        }
+
+        addition_entry = {
+            'file': dest_file,
+            'kind': FileChangeType.CREATED
+        }
+
+        return [addition_entry, deletion_entry]
+
+    def _file_deleted(self, src_file, is_dir):
+        """Handle file deletion and get its LSP notification entries."""
+        if self.file_index is not None:
+            if is_dir:
+                self.file_index.remove_directory(src_file)
+            else:
+                self.file_index.remove_file(src_file)
+        self._remove_symbol_index_path(src_file, is_dir)
+
+        if is_dir:
+            return []
+
+        return [{
+            'file': src_file,
+            'kind': FileChangeType.DELETED
+        }]
+
+    def _file_modified(self, src_file, is_dir):
+        """Handle file modification and get its LSP notification entries."""
+        self._invalidate_symbol_index_path(src_file, is_dir)
+
+        if is_dir:
+            return []
+
+        return [{
+            'file': src_file,
+            'kind': FileChangeType.CHANGED
+        }]
+
     # ---- Private API for the Switcher
     # -------------------------------------------------------------------------
-    def _call_fzf(self, search_text=""):
+    def _setup_file_index(self):
+        """Load the index of the files in the current project and update it."""
+        self._close_file_index()
+
+        project_path = self.get_active_project_path()
+        if (
+            not self.get_conf("search_files_in_switcher")
+            or project_path is None
+        ):
+            return
+
+        self.file_index = ProjectFileIndex(project_path)
+
+        # Walking the project can take a while, so it's done in a thread.
+        # Files can be searched in the meantime with the saved index.
+        worker = self._worker_manager.create_python_worker(
+            self._load_file_index, self.file_index
+        )
+        worker.sig_finished.connect(self._on_file_index_updated)
+        worker.start()
+
+    def _load_file_index(self, index):
+        """Load `index` from disk and bring it up to date."""
+        index.load()
+        index.update()
+        index.save()
+        return index
+
+    def _on_file_index_updated(self, worker, output, error):
+        """Handle the end of a file index update."""
+        if error:
+            logger.debug(
+                "Error while updating the project file index: {}".format(
+                    error)
+            )
+
+    def _close_file_index(self):
+        """Save and stop using the current file index."""
+        if self.file_index is not None:
+            if self.file_index.ready:
+                self.file_index.save()
+            self.file_index = None
+
+    def _search_files(self, search_text=""):
         """
-        Call fzf in a worker to get the list of files in the current project
-        that match with `search_text`.
+        Get the files in the current project that match `search_text`.
 
         Parameters
         ----------
         search_text: str, optional
-            The search text to pass to fzf.
+            The search text. If empty, the first files in the project are
+            returned.
         """
+        if self.file_index is None:
+            return []
+
+        return self.file_index.search(search_text, self.MAX_SWITCHER_RESULTS)
+
+    def _setup_symbol_index(self):
+        """Load the symbol index of the current project and update it."""
+        self._close_symbol_index()
+
         project_path = self.get_active_project_path()
         if (
-            not self.get_conf("search_files_in_switcher")
-            or self._fzf is None
+            not self.get_conf("search_symbols_in_switcher")
             or project_path is None
         ):
             return
 
-        self._worker_manager.terminate_all()
+        self.symbol_index = ProjectSymbolIndex(project_path)
 
-        worker = self._worker_manager.create_process_worker(
-            [self._fzf, "--filter", search_text],
-            os.environ.copy()
+        # Parsing the project files takes a while, so it's done in a thread.
+        # Symbols can be searched in the meantime with the saved index.
+        worker = self._worker_manager.create_python_worker(
+            self._load_symbol_index, self.symbol_index
         )
+        worker.sig_finished.connect(self._on_symbol_index_updated)
+        worker.start()
+
+    def _load_symbol_index(self, index):
+        """Load `index` from disk and bring it up to date."""
+        index.load()
+        index.update()
+        index.save()
+        return index
+
+    def _on_symbol_index_updated(self, worker, output, error):
+        """Handle the end of a symbol index update."""
+        if error:
+            logger.debug(
+                "Error while updating the project symbol index: {}".format(
+                    error)
+            )
+            return
+
+        # Process changes reported while the index was updated
+        if output is self.symbol_index and output.has_dirty_files():
+            self._symbol_index_timer.start()
 
-        worker.set_cwd(project_path)
-        worker.sig_finished.connect(self._process_fzf_output)
+    def _update_symbol_index_files(self):
+        """Parse again the project files that changed."""
+        if self.symbol_index is None or not self.symbol_index.ready:
+            return
+
+        worker = self._worker_manager.create_python_worker(
+            self.symbol_index.update_dirty_files
+        )
         worker.start()
 
-    def _process_fzf_output(self, worker, output, error):
-        """Process output that comes from the fzf worker."""
-        if output is None or error:
+    def _close_symbol_index(self):
+        """Save and stop using the current symbol index."""
+        self._symbol_index_timer.stop()
+        if self.symbol_index is not None:
+            if self.symbol_index.ready:
+                self.symbol_index.save()
+            self.symbol_index = None
+
+    def _invalidate_symbol_index_path(self, path, is_dir):
+        """Parse a changed file again for the symbol index."""
+        if self.symbol_index is None or is_dir:
             return
 
-        # Get list of paths from fzf output
-        relative_path_list = output.decode('utf-8').strip().split("\n")
+        self.symbol_index.invalidate_file(path)
+        self._symbol_index_timer.start()
 
-        # List of results with absolute path
-        if relative_path_list != ['']:
-            project_path = self.get_active_project_path()
-            result_list = [
-                osp.normpath(os.path.join(project_path, path))
-                for path in relative_path_list
-            ]
+    def _remove_symbol_index_path(self, path, is_dir):
+        """Remove a file or directory from the symbol index."""
+        if self.symbol_index is None:
+            return
+
+        if is_dir:
+            self.symbol_index.remove_directory(path)
         else:
-            result_list = []
+            self.symbol_index.remove_file(path)
 
-        # Filter files that can be opened in the editor
-        result_list = [
-            path for path in result_list
-            if osp.splitext(path)[1] in EDIT_EXTENSIONS
-        ]
+    def _search_symbols(self, search_text):
+        """Get the symbols in the current project that match `search_text`."""
+        if self.symbol_index is None:
+            return []
 
-        # Limit the number of results to not introduce lags when displaying
-        # them in the switcher.
-        if len(result_list) > self.MAX_SWITCHER_RESULTS:
-            result_list = result_list[:self.MAX_SWITCHER_RESULTS]
+        # Follow the Outline option to show variables or not
+        kinds = None
+        if not self.get_conf('display_variables', section='outline_explorer'):
+            kinds = {SymbolKind.CLASS, SymbolKind.METHOD, SymbolKind.FUNCTION}
 
-        if not self._default_switcher_paths:
-            self._default_switcher_paths = result_list
-        else:
-            self._display_paths_in_switcher(
-                result_list, setup=True, clear_section=True
+        return self.symbol_index.search(
+            search_text, self.MAX_SWITCHER_RESULTS, kinds=kinds
+        )
+
+    def _display_symbols_in_switcher(self, symbols):
+        """Display a list of symbols in the switcher."""
+        project_path = self.get_active_project_path()
+        section = self.get_title()
+
+        items = []
+        for i, (filename, name, kind, line, parent) in enumerate(symbols):
+            icon = self.create_icon(SYMBOL_KIND_ICON.get(kind, 'no_match'))
+            location = "{}:{}".format(
+                osp.relpath(filename, project_path), line
+            )
+            if parent:
+                description = "{} - {}".format(parent, location)
+            else:
+                description = location
+            data = {
+                'title': name,
+                'filename': filename,
+                'line_number': line,
+            }
+            is_last_item = (i + 1 == len(symbols))
+
+            items.append(
+                (name, description, icon, section, data, is_last_item)
             )
 
+        # Call directly the plugin's method instead of emitting a signal
+        # because it's faster.
+        self._plugin._display_items_in_switcher(
+            items, setup=True, clear_section=True
+        )
+
     def _convert_paths_to_switcher_items(self, paths):
         """
         Convert a list of paths to items that can be shown in the switcher.
@@ -1145,15 +1351,6 @@ def _display_paths_in_switcher(self, paths, setup, clear_section):
         # because it's faster.
         self._plugin._display_items_in_switcher(items, setup, clear_section)
 
-    def _clear_switcher_paths(self):
-        """Clear saved switcher results."""
-        self._default_switcher_paths = []
-
-    def _update_default_switcher_paths(self):
-        """Update default paths to be shown in the switcher."""
-        self._default_switcher_paths = []
-        self._call_fzf()
-
     @on_conf_change(option="search_files_in_switcher")
     def _on_search_files_in_switcher_changed(self, value):
         """
@@ -1161,9 +1358,20 @@ def _on_search_files_in_switcher_changed(self, value):
         switcher.
         """
         if value:
-            self._update_default_switcher_paths()
+            self._setup_file_index()
+        else:
+            self._close_file_index()
+
+    @on_conf_change(option="search_symbols_in_switcher")
+    def _on_search_symbols_in_switcher_changed(self, value):
+        """
+        Actions to take when users enable/disable searching symbols in the
+        switcher.
+        """
+        if value:
+            self._setup_symbol_index()
         else:
-            self._clear_switcher_paths()
+            self._close_symbol_index()
 
 
 # =============================================================================
@@ -12,7 +12,7 @@
 """
 
 # Required version of spyder-remote-services
-SPYDER_REMOTE_MIN_VERSION = "1.0.0"
+SPYDER_REMOTE_MIN_VERSION = "1.1.0"
 SPYDER_REMOTE_MAX_VERSION = "2.0.0"
 SPYDER_REMOTE_VERSION = (
     f">={SPYDER_REMOTE_MIN_VERSION},<{SPYDER_REMOTE_MAX_VERSION}"
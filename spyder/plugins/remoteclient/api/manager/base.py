@@ -27,8 +27,10 @@
 from spyder.plugins.remoteclient.api.modules.base import (
     JupyterAPI,
 )
+from spyder.plugins.remoteclient.api.pool import SpyderRemoteConnectionPool
 from spyder.plugins.remoteclient.api.protocol import (
     ConnectionInfo,
+    ConnectionStats,
     ConnectionStatus,
     RemoteClientLog,
 )
@@ -84,6 +86,12 @@ def __init__(
         self.__installing_server = False
         self.__starting_server = False
         self.__creating_connection = False
+        self.__connection_lost = False
+
+        # HTTP connections shared by the APIs of the server
+        self.connection_pool = SpyderRemoteConnectionPool(
+            conf_id, on_stats_updated=self._emit_connection_stats
+        )
 
         # For logging
         self.logger = logging.getLogger(
@@ -110,6 +118,10 @@ def _emit_connection_status(self, status, message):
                 )
             )
 
+    def _emit_connection_stats(self, stats: ConnectionStats):
+        if self._plugin is not None:
+            self._plugin.sig_connection_stats_updated.emit(stats)
+
     def _emit_version_mismatch(self, version: str):
         if self._plugin is not None:
             self._plugin.sig_version_mismatch.emit(self.config_id, version)
@@ -165,7 +177,9 @@ def _handle_connection_lost(self, exc: Exception | None = None):
         self.__connection_established.clear()
         self.__starting_event.clear()
         self._port_forwarder = None
+        self.connection_pool.reset()
         if exc:
+            self.__connection_lost = True
             self.logger.error(
                 "Connection to %s was lost",
                 self.server_name,
@@ -286,6 +300,9 @@ async def create_new_connection(self) -> bool:
         try:
             if await self._create_new_connection():
                 self.__connection_established.set()
+                if self.__connection_lost:
+                    self.__connection_lost = False
+                    self.connection_pool.record_reconnect()
                 return True
         finally:
             self.__creating_connection = False
@@ -258,6 +258,7 @@ async def _create_new_connection(self) -> bool:
 
     async def close_connection(self):
         """Close SSH connection."""
+        await self.connection_pool.close()
         if not self.connected:
             self.logger.debug("Connection is not open")
             return
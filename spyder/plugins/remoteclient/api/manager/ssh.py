@@ -442,6 +442,7 @@ async def close_port_forwarder(self):
 
     async def close_connection(self):
         """Close SSH connection."""
+        await self.connection_pool.close()
         if not self.connected:
             self.logger.debug("SSH connection is not open")
             return
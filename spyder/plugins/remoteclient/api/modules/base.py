@@ -126,15 +126,23 @@ async def connect(self):
             raise RuntimeError("Failed to connect to Jupyter server")
         if not self.closed:
             return
+
+        # Connections are shared with the other APIs of the server
+        pool = self.manager.connection_pool
         self.session = aiohttp.ClientSession(
             headers={"Authorization": f"token {self.manager.api_token}"},
-            connector=aiohttp.TCPConnector(
-                ssl=None if self.verify_ssl else False
-            ),
+            connector=pool.get_connector(self.verify_ssl),
+            connector_owner=False,
             raise_for_status=self._raise_for_status,
             timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+            trace_configs=[pool.trace_config],
         )
 
+        if not await pool.check_health(self.session, self.server_url / "api"):
+            self.manager.logger.warning(
+                "The server didn't answer a health check"
+            )
+
     async def __aenter__(self):
         await self.connect()
         return self
@@ -6,8 +6,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+from collections import OrderedDict, deque
+import hashlib
 import json
+import logging
+import os
+import posixpath
+import struct
+import threading
+import time
 import typing
 from http import HTTPStatus
 from io import RawIOBase
@@ -21,12 +30,67 @@
 from spyder.plugins.remoteclient.api.modules.base import (
     SpyderBaseJupyterAPI,
     SpyderRemoteAPIError,
+    SpyderRemoteSessionClosed,
 )
+from spyder.plugins.remoteclient.utils.filecache import RemoteFileMirror
 
 if typing.TYPE_CHECKING:
     from pathlib import Path
 
 
+logger = logging.getLogger(__name__)
+
+
+# Time during which a cached directory listing is considered up to date.
+LISTING_CACHE_TTL = 30  # In seconds
+
+# Maximum number of cached directory listings.
+LISTING_CACHE_SIZE = 256
+
+# Size of the chunks in which files are transferred.
+TRANSFER_CHUNK_SIZE = 4 * 1024 ** 2  # 4 MiB
+
+# Number of chunk requests sent before waiting for their responses.
+TRANSFER_MAX_IN_FLIGHT = 4
+
+# Number of times a transfer is resumed after losing the connection.
+TRANSFER_MAX_RETRIES = 3
+
+# Suffix of the local files where downloads are written until they finish.
+PARTIAL_DOWNLOAD_SUFFIX = ".spyder.part"
+
+# Size prefix of the JSON header of binary chunk messages.
+CHUNK_HEADER = struct.Struct("!I")
+
+# Maximum size of the messages received through file websockets. It has to
+# leave room for the header of chunk messages, which is a few hundred bytes.
+WEBSOCKET_MAX_MSG_SIZE = TRANSFER_CHUNK_SIZE + 64 * 1024
+
+# Maximum number of paths sent in a single batched metadata request.
+BATCH_MAX_PATHS = 1000
+
+# Errors after which transfers are resumed.
+TRANSFER_ERRORS = (
+    aiohttp.ClientError,
+    asyncio.TimeoutError,
+    ConnectionError,
+    SpyderRemoteSessionClosed,
+)
+
+
+class MirroredFile(typing.NamedTuple):
+    """Local copy of a remote file, as returned by `get_local_copy`."""
+
+    path: str
+    """Path of the local copy. It must not be modified."""
+
+    offline: bool
+    """
+    Whether the server couldn't be reached, so the copy could be outdated
+    and changes to it can't be saved.
+    """
+
+
 class RemoteFileServicesError(SpyderRemoteAPIError):
     """
     Exception for errors related to remote file services.
@@ -59,6 +123,121 @@ def __str__(self):
         return super(OSError, self).__str__()
 
 
+def _file_checksum(path, size=-1):
+    """Get the SHA-256 checksum of the first `size` bytes of a local file."""
+    checksum = hashlib.sha256()
+    with open(path, "rb") as f:
+        while size != 0:
+            block = f.read(
+                TRANSFER_CHUNK_SIZE if size < 0
+                else min(size, TRANSFER_CHUNK_SIZE)
+            )
+            if not block:
+                break
+            checksum.update(block)
+            if size > 0:
+                size -= len(block)
+
+    return checksum.hexdigest()
+
+
+def _iter_file_chunks(file, offset, chunk_size):
+    """Generate (offset, data) chunks of a local file from `offset`."""
+    file.seek(offset)
+    while data := file.read(chunk_size):
+        yield offset, data
+        offset += len(data)
+
+
+class RemoteListingCache:
+    """
+    Cache of the directory listings of remote servers.
+
+    Listings are kept per (server, path) and are considered fresh for `ttl`
+    seconds. Stale listings are still returned, so they can be shown while
+    they're fetched again.
+
+    Listings are invalidated when the file services API changes the
+    directories they belong to. Changes made by other means are only seen
+    once listings expire.
+    """
+
+    def __init__(self, ttl=LISTING_CACHE_TTL, max_size=LISTING_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_size = max_size
+
+        # (server_id, path) -> (timestamp, files), in least recently used
+        # order.
+        self._listings = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normpath(path):
+        return posixpath.normpath(str(path))
+
+    def get(self, server_id, path):
+        """
+        Get the cached listing of `path` in `server_id`.
+
+        Returns
+        -------
+        tuple or None
+            (files, fresh) tuple, where files is the list of dicts returned
+            by `SpyderRemoteFileServicesAPI.ls` and fresh tells if the
+            listing hasn't expired yet, or None if there's no listing.
+        """
+        key = (server_id, self._normpath(path))
+        with self._lock:
+            entry = self._listings.get(key)
+            if entry is None:
+                return None
+            self._listings.move_to_end(key)
+
+        timestamp, files = entry
+        return files, time.monotonic() - timestamp < self.ttl
+
+    def set(self, server_id, path, files):
+        """Save the listing of `path` in `server_id`."""
+        key = (server_id, self._normpath(path))
+        with self._lock:
+            self._listings[key] = (time.monotonic(), list(files))
+            self._listings.move_to_end(key)
+            while len(self._listings) > self.max_size:
+                self._listings.popitem(last=False)
+
+    def invalidate(self, server_id, path, recursive=False):
+        """
+        Forget the listing of `path` in `server_id` and of its parent.
+
+        If `recursive` is True, the listings of the directories inside
+        `path` are forgotten too.
+        """
+        path = self._normpath(path)
+        parent = posixpath.dirname(path)
+        prefix = posixpath.join(path, "")
+        with self._lock:
+            for key in list(self._listings):
+                key_server_id, key_path = key
+                if key_server_id != server_id:
+                    continue
+                if (
+                    key_path in (path, parent)
+                    or (recursive and key_path.startswith(prefix))
+                ):
+                    del self._listings[key]
+
+    def clear(self, server_id=None):
+        """Forget all listings of `server_id`, or of all servers if None."""
+        with self._lock:
+            if server_id is None:
+                self._listings.clear()
+                return
+
+            for key in list(self._listings):
+                if key[0] == server_id:
+                    del self._listings[key]
+
+
 @SpyderRemoteAPIManagerBase.register_api
 class SpyderRemoteFileIOAPI(SpyderBaseJupyterAPI, RawIOBase):
     """
@@ -78,6 +257,11 @@ class SpyderRemoteFileIOAPI(SpyderBaseJupyterAPI, RawIOBase):
     copy of the file, and then the file will be replaced with the copy upon
     closing.
 
+    Files opened in binary mode can also be transferred in raw binary chunks
+    with `read_chunks` and `write_chunks`, which keep several requests in
+    flight and check the integrity of each chunk. Those methods can't be
+    used at the same time as other ones on the same file.
+
     Parameters
     ----------
     file : str
@@ -131,6 +315,7 @@ async def connect(self):
 
         self._websocket = await self.session.ws_connect(
             self.api_url,
+            max_msg_size=WEBSOCKET_MAX_MSG_SIZE,
             params={
                 "path": f"file://{self.name}",
                 "mode": self.mode,
@@ -183,6 +368,12 @@ async def close(self):
             pass
         await super().close()
 
+        # The file could have been created or its size changed
+        if any(char in self.mode for char in "wax+"):
+            SpyderRemoteFileServicesAPI.listing_cache.invalidate(
+                self.server_id, self.name
+            )
+
     @property
     def closed(self):
         if self._websocket is None:
@@ -210,11 +401,34 @@ def _encode_data(self, data: bytes | str | object) -> str:
     async def _send_request(self, method: str, **args):
         await self._websocket.send_json({"method": method, **args})
 
-    async def _get_response(self, timeout=None):
-        message = json.loads(
-            await self._websocket.receive_bytes(timeout=timeout)
+    async def _send_chunk_request(self, method: str, data: bytes, **args):
+        header = json.dumps({"method": method, **args}).encode()
+        await self._websocket.send_bytes(
+            CHUNK_HEADER.pack(len(header)) + header + data
         )
 
+    async def _receive_bytes(self, timeout=None) -> bytes:
+        message = await self._websocket.receive(timeout=timeout)
+        if message.type in (
+            aiohttp.WSMsgType.CLOSE,
+            aiohttp.WSMsgType.CLOSING,
+            aiohttp.WSMsgType.CLOSED,
+            aiohttp.WSMsgType.ERROR,
+        ):
+            raise ConnectionResetError(
+                f"Connection to {self.name} was closed"
+            )
+        if message.type != aiohttp.WSMsgType.BINARY:
+            raise RemoteFileServicesError(
+                "UnexpectedMessage",
+                f"Received {message.type} message",
+                self._websocket._response.url,
+                [],
+            )
+
+        return message.data
+
+    def _raise_for_message(self, message: dict):
         if message["status"] > 400:
             if message["status"] == HTTPStatus.EXPECTATION_FAILED:
                 raise RemoteOSError.from_json(
@@ -228,6 +442,10 @@ async def _get_response(self, timeout=None):
                 message.get("tracebacks", []),
             )
 
+    async def _get_response(self, timeout=None):
+        message = json.loads(await self._receive_bytes(timeout=timeout))
+        self._raise_for_message(message)
+
         data = message.get("data")
         if data is None:
             return None
@@ -237,6 +455,33 @@ async def _get_response(self, timeout=None):
 
         return self._decode_data(data)
 
+    async def _get_chunk_response(self, timeout=None) -> tuple[int, bytes]:
+        message = await self._receive_bytes(timeout=timeout)
+
+        # Errors are sent as regular JSON messages
+        if message[:1] == b"{":
+            self._raise_for_message(json.loads(message))
+            raise RemoteFileServicesError(
+                "UnexpectedMessage",
+                "Expected a chunk message",
+                self._websocket._response.url,
+                [],
+            )
+
+        (header_size,) = CHUNK_HEADER.unpack_from(message)
+        header_end = CHUNK_HEADER.size + header_size
+        header = json.loads(message[CHUNK_HEADER.size:header_end])
+        data = message[header_end:]
+        if hashlib.sha256(data).hexdigest() != header["sha256"]:
+            raise RemoteFileServicesError(
+                "ChecksumError",
+                f"Corrupted chunk at offset {header['offset']}",
+                self._websocket._response.url,
+                [],
+            )
+
+        return header["offset"], data
+
     @property
     def closefd(self):
         return True
@@ -328,6 +573,89 @@ async def writable(self) -> bool:
         await self._send_request("writable")
         return await self._get_response()
 
+    async def checksum(self, size: int = -1) -> str:
+        """Get the SHA-256 checksum of the first `size` bytes of the file."""
+        await self._send_request("checksum", size=size)
+        return (await self._get_response()).decode("ascii")
+
+    async def read_chunks(
+        self,
+        offset: int = 0,
+        chunk_size: int = TRANSFER_CHUNK_SIZE,
+        max_in_flight: int = TRANSFER_MAX_IN_FLIGHT,
+    ):
+        """
+        Read the file from `offset` in binary chunks.
+
+        Up to `max_in_flight` chunks are requested before waiting for the
+        first one, so the connection latency is only paid once.
+
+        Yields
+        ------
+        tuple
+            (offset, data) tuples, in order.
+
+        Notes
+        -----
+        If the iteration is stopped before reaching the end of the file,
+        responses to pending requests are left unread, so the file needs to
+        be closed.
+        """
+        pending = 0
+        next_offset = offset
+        eof = False
+        while not eof or pending:
+            while not eof and pending < max_in_flight:
+                await self._send_request(
+                    "read_chunk", offset=next_offset, size=chunk_size
+                )
+                next_offset += chunk_size
+                pending += 1
+
+            chunk_offset, data = await self._get_chunk_response()
+            pending -= 1
+
+            # Requests sent past the end of the file return empty chunks
+            if len(data) < chunk_size:
+                eof = True
+            if data:
+                yield chunk_offset, data
+
+    async def write_chunks(
+        self,
+        chunks: typing.Iterable[tuple[int, bytes]],
+        max_in_flight: int = TRANSFER_MAX_IN_FLIGHT,
+    ):
+        """
+        Write (offset, data) binary chunks to the file.
+
+        Up to `max_in_flight` chunks are sent before waiting for the first
+        one to be written. Each chunk is sent with its checksum, which is
+        verified by the server before writing it.
+
+        Yields
+        ------
+        int
+            Offset of the end of each chunk after it was written, in order.
+        """
+        pending = deque()
+        for offset, data in chunks:
+            if len(pending) == max_in_flight:
+                await self._get_response()
+                yield pending.popleft()
+
+            await self._send_chunk_request(
+                "write_chunk",
+                data,
+                offset=offset,
+                sha256=hashlib.sha256(data).hexdigest(),
+            )
+            pending.append(offset + len(data))
+
+        while pending:
+            await self._get_response()
+            yield pending.popleft()
+
 
 @SpyderRemoteAPIManagerBase.register_api
 class SpyderRemoteFileServicesAPI(SpyderBaseJupyterAPI):
@@ -346,6 +674,16 @@ class SpyderRemoteFileServicesAPI(SpyderBaseJupyterAPI):
 
     base_url = SPYDER_PLUGIN_NAME + "/fs"
 
+    # Directory listings shared by all instances. Methods that change files
+    # invalidate the listings they affect.
+    listing_cache = RemoteListingCache()
+
+    # Local copies of the remote files downloaded by get_local_copy
+    file_mirror = RemoteFileMirror()
+
+    def _invalidate_listing(self, path, recursive=False):
+        self.listing_cache.invalidate(self.server_id, path, recursive)
+
     async def _raise_for_status(self, response: aiohttp.ClientResponse):
         if response.status not in (
             HTTPStatus.INTERNAL_SERVER_ERROR,
@@ -381,6 +719,167 @@ async def ls(self, path: Path, *, detail: bool = True):
             async for line in response.content:
                 yield json.loads(line)
 
+    async def search(
+        self,
+        path: Path,
+        text: str,
+        *,
+        regexp: bool = False,
+        case_sensitive: bool = True,
+        exclude: str | None = None,
+        max_results: int = 1000,
+    ):
+        """
+        Search text in the files of a remote directory.
+
+        Files are scanned by the server, which streams their matches as it
+        finds them. Hidden directories and binary files are skipped.
+
+        Parameters
+        ----------
+        path : Path
+            Directory where to search.
+        text : str
+            Searched text.
+        regexp : bool, optional
+            Whether `text` is a regular expression, by default False.
+        case_sensitive : bool, optional
+            Whether the search is case sensitive, by default True.
+        exclude : str, optional
+            Regular expression of the paths to exclude.
+        max_results : int, optional
+            Maximum number of matches, by default 1000.
+
+        Yields
+        ------
+        list
+            Batches of (filename, lineno, start, end, line) tuples, with
+            one-based line numbers. Stopping the iteration stops the search
+            in the server.
+
+        Raises
+        ------
+        RemoteOSError
+            If `path` is not a directory that can be searched.
+        RemoteFileServicesError
+            If `text` or `exclude` are not valid regular expressions.
+        """
+        async with self.session.ws_connect(
+            self.api_url / "search",
+            max_msg_size=WEBSOCKET_MAX_MSG_SIZE,
+            params={
+                "path": f"file://{path}",
+                "text": text,
+                "regexp": str(regexp).lower(),
+                "case_sensitive": str(case_sensitive).lower(),
+                "exclude": exclude or "",
+                "max_results": str(max_results),
+            },
+        ) as websocket:
+            while True:
+                message = await websocket.receive()
+                if message.type != aiohttp.WSMsgType.BINARY:
+                    break
+
+                data = json.loads(message.data)
+                if data.get("done"):
+                    logger.debug(
+                        f"Search in {path} finished with {data['errors']} "
+                        f"unreadable files"
+                    )
+                    return
+
+                yield [tuple(match) for match in data["data"]]
+
+            self._raise_for_close(message)
+            raise ConnectionResetError(f"Search in {path} was interrupted")
+
+    async def watch(self, path: Path, *, recursive: bool = True):
+        """
+        Watch the changes in a remote directory.
+
+        Changes are detected by the server, which collects them for a short
+        time and sends them in batches while the iteration goes on. Changes
+        in hidden directories and in `__pycache__` are not reported.
+
+        Parameters
+        ----------
+        path : Path
+            Watched directory.
+        recursive : bool, optional
+            Whether to watch its subdirectories too, by default True.
+
+        Yields
+        ------
+        list
+            Batches of (event_type, src_path, dest_path, is_dir) tuples,
+            where event_type is "created", "deleted", "modified" or "moved"
+            and dest_path is only set for moves. There is at most one
+            creation, deletion or modification per path in each batch.
+
+        Raises
+        ------
+        RemoteOSError
+            If `path` is not a directory that can be watched.
+        ConnectionResetError
+            If the connection with the server is lost.
+        """
+        async with self.session.ws_connect(
+            self.api_url / "watch",
+            max_msg_size=WEBSOCKET_MAX_MSG_SIZE,
+            params={
+                "path": f"file://{path}",
+                "recursive": str(recursive).lower(),
+            },
+        ) as websocket:
+            while True:
+                message = await websocket.receive()
+                if message.type != aiohttp.WSMsgType.BINARY:
+                    break
+
+                changes = [
+                    tuple(change)
+                    for change in json.loads(message.data)["data"]
+                ]
+
+                # Listings of the directories where files changed are not
+                # valid anymore.
+                for __, src_path, dest_path, is_dir in changes:
+                    for changed_path in (src_path, dest_path):
+                        if changed_path:
+                            self._invalidate_listing(
+                                changed_path, recursive=is_dir
+                            )
+
+                yield changes
+
+            self._raise_for_close(message)
+            raise ConnectionResetError(f"Watch of {path} was interrupted")
+
+    def _raise_for_close(self, message: aiohttp.WSMessage):
+        """
+        Raise the error sent by the server when closing a websocket.
+
+        The server closes the connection with a 1002 code and the error as
+        reason if a request on it couldn't start.
+        """
+        if (
+            message.type != aiohttp.WSMsgType.CLOSE
+            or message.data != 1002
+        ):
+            return
+
+        data = json.loads(message.extra)
+        if data["status"] == HTTPStatus.EXPECTATION_FAILED:
+            raise RemoteOSError.from_json(data, url=self.api_url)
+
+        raise RemoteFileServicesError(
+            data.get("type", "UnknownError"),
+            data.get("message", "Unknown error"),
+            self.api_url,
+            data.get("tracebacks", []),
+        )
+
     async def info(self, path: Path):
         async with self.session.get(
             self.api_url / "info",
@@ -409,6 +908,64 @@ async def is_dir(self, path: Path):
         ) as response:
             return await response.json()
 
+    async def _post_batch(self, endpoint: str, key: str, paths: list[Path]):
+        """
+        Send `paths` to the batched variant of `endpoint`.
+
+        Paths are split in requests of at most `BATCH_MAX_PATHS` and the
+        results in `key` of their responses are joined in a single list.
+        """
+        results = []
+        paths = list(paths)
+        for start in range(0, len(paths), BATCH_MAX_PATHS):
+            async with self.session.post(
+                self.api_url / endpoint,
+                json={
+                    "paths": [
+                        f"file://{path}"
+                        for path in paths[start:start + BATCH_MAX_PATHS]
+                    ]
+                },
+            ) as response:
+                results.extend((await response.json())[key])
+
+        return results
+
+    async def info_batch(self, paths: list[Path]):
+        """
+        Get the info of several paths in a single request.
+
+        Parameters
+        ----------
+        paths : list of Path
+            Paths to get info about.
+
+        Returns
+        -------
+        list
+            The info of each path, in the same order as `paths`, or a
+            `RemoteOSError` for the ones that couldn't be accessed.
+        """
+        results = await self._post_batch("info", "data", paths)
+        return [
+            result["data"]
+            if result["status"] == HTTPStatus.OK
+            else RemoteOSError.from_json(result, self.api_url / "info")
+            for result in results
+        ]
+
+    async def exists_batch(self, paths: list[Path]) -> list[bool]:
+        """Check if several paths exist in a single request."""
+        return await self._post_batch("exists", "exists", paths)
+
+    async def is_file_batch(self, paths: list[Path]) -> list[bool]:
+        """Check if several paths are files in a single request."""
+        return await self._post_batch("isfile", "isfile", paths)
+
+    async def is_dir_batch(self, paths: list[Path]) -> list[bool]:
+        """Check if several paths are directories in a single request."""
+        return await self._post_batch("isdir", "isdir", paths)
+
     async def mkdir(
         self,
         path: Path,
@@ -424,14 +981,20 @@ async def mkdir(
                 "exist_ok": str(exist_ok).lower(),
             },
         ) as response:
-            return await response.json()
+            result = await response.json()
+
+        self._invalidate_listing(path)
+        return result
 
     async def rmdir(self, path: Path):
         async with self.session.delete(
             self.api_url / "rmdir",
             params={"path": f"file://{path}"},
         ) as response:
-            return await response.json()
+            result = await response.json()
+
+        self._invalidate_listing(path, recursive=True)
+        return result
 
     async def unlink(self, path: Path, missing_ok: bool = False):
         async with self.session.delete(
@@ -441,14 +1004,20 @@ async def unlink(self, path: Path, missing_ok: bool = False):
                 "missing_ok": str(missing_ok).lower(),
             },
         ) as response:
-            return await response.json()
+            result = await response.json()
+
+        self._invalidate_listing(path)
+        return result
 
     async def copy(self, path1: Path, path2: Path):
         async with self.session.post(
             self.api_url / "copy",
             params={"path": f"file://{path1}", "dest": f"file://{path2}"},
         ) as response:
-            return await response.json()
+            result = await response.json()
+
+        self._invalidate_listing(path2)
+        return result
 
     async def copy2(self, path1: Path, path2: Path):
         async with self.session.post(
@@ -459,14 +1028,21 @@ async def copy2(self, path1: Path, path2: Path):
                 "metadata": "true",
             },
         ) as response:
-            return await response.json()
+            result = await response.json()
+
+        self._invalidate_listing(path2)
+        return result
 
     async def replace(self, path1: Path, path2: Path):
         async with self.session.post(
             self.api_url / "move",
             params={"path": f"file://{path1}", "dest": f"file://{path2}"},
         ) as response:
-            return await response.json()
+            result = await response.json()
+
+        self._invalidate_listing(path1, recursive=True)
+        self._invalidate_listing(path2, recursive=True)
+        return result
 
     async def touch(self, path: Path, truncate: bool = True):
         async with self.session.post(
@@ -476,7 +1052,10 @@ async def touch(self, path: Path, truncate: bool = True):
                 "truncate": str(truncate).lower(),
             },
         ) as response:
-            return await response.json()
+            result = await response.json()
+
+        self._invalidate_listing(path)
+        return result
 
     async def open(
         self, path, mode="r", atomic=False, lock=False, encoding="utf-8"
@@ -486,3 +1065,243 @@ async def open(
         )
         await file.connect()
         return file
+
+    async def _close_transfer_file(self, file):
+        try:
+            await file.close()
+        except TRANSFER_ERRORS:
+            # The connection could be already lost
+            pass
+
+    async def _get_resume_offset(self, file, local_path, offset):
+        """
+        Check that the first `offset` bytes of `file` and `local_path` are
+        the same, to resume a transfer from there.
+
+        Returns
+        -------
+        int
+            `offset` if they're the same or 0 otherwise.
+        """
+        if offset == 0:
+            return 0
+
+        # Local files can be big, so they're read in a thread
+        local_checksum = await asyncio.get_running_loop().run_in_executor(
+            None, _file_checksum, local_path, offset
+        )
+        if await file.checksum(offset) != local_checksum:
+            logger.debug(
+                f"Can't resume transfer of {file.name} because it changed"
+            )
+            return 0
+
+        return offset
+
+    async def copy_to_local(
+        self,
+        path: Path,
+        local_path: str,
+        *,
+        callback: typing.Callable[[int, int], None] | None = None,
+        resume: bool = True,
+        chunk_size: int = TRANSFER_CHUNK_SIZE,
+        max_in_flight: int = TRANSFER_MAX_IN_FLIGHT,
+    ):
+        """
+        Download a remote file.
+
+        Data is written to a partial file next to `local_path`, which
+        replaces it once the download finishes. If the connection is lost,
+        the download is resumed from the last received chunk. Downloads
+        that didn't finish are also resumed by later calls if `resume` is
+        True and the remote file didn't change.
+
+        Parameters
+        ----------
+        path : Path
+            Path of the remote file.
+        local_path : str
+            Path of the local file.
+        callback : callable, optional
+            Function called with the number of transferred bytes and the
+            size of the file every time a chunk is received.
+        resume : bool, optional
+            Whether to resume a previous download, by default True.
+        chunk_size : int, optional
+            Size of the transferred chunks.
+        max_in_flight : int, optional
+            Maximum number of chunks requested at the same time.
+        """
+        total = (await self.info(path))["size"]
+        part_path = local_path + PARTIAL_DOWNLOAD_SUFFIX
+
+        offset = 0
+        if resume and os.path.isfile(part_path):
+            offset = min(os.path.getsize(part_path), total)
+
+        for attempt in range(TRANSFER_MAX_RETRIES + 1):
+            try:
+                file = await self.open(path, "rb")
+                try:
+                    offset = await self._get_resume_offset(
+                        file, part_path, offset
+                    )
+                    with open(part_path, "r+b" if offset else "wb") as f:
+                        f.truncate(offset)
+                        f.seek(offset)
+                        async for chunk_offset, data in file.read_chunks(
+                            offset, chunk_size, max_in_flight
+                        ):
+                            f.write(data)
+                            offset = chunk_offset + len(data)
+                            if callback is not None:
+                                callback(offset, total)
+                finally:
+                    await self._close_transfer_file(file)
+            except TRANSFER_ERRORS as error:
+                if attempt == TRANSFER_MAX_RETRIES:
+                    raise
+                logger.debug(
+                    f"Resuming download of {path} at {offset}: {error}"
+                )
+            else:
+                break
+
+        os.replace(part_path, local_path)
+
+    async def copy_from_local(
+        self,
+        local_path: str,
+        path: Path,
+        *,
+        callback: typing.Callable[[int, int], None] | None = None,
+        resume: bool = True,
+        chunk_size: int = TRANSFER_CHUNK_SIZE,
+        max_in_flight: int = TRANSFER_MAX_IN_FLIGHT,
+    ):
+        """
+        Upload a local file.
+
+        The remote file is written in place. If the connection is lost, the
+        upload is resumed from the last written chunk. Uploads that didn't
+        finish are also resumed by later calls if `resume` is True and the
+        local file didn't change.
+
+        Parameters
+        ----------
+        local_path : str
+            Path of the local file.
+        path : Path
+            Path of the remote file.
+        callback : callable, optional
+            Function called with the number of transferred bytes and the
+            size of the file every time a chunk is written.
+        resume : bool, optional
+            Whether to resume a previous upload, by default True.
+        chunk_size : int, optional
+            Size of the transferred chunks.
+        max_in_flight : int, optional
+            Maximum number of chunks sent at the same time.
+        """
+        total = os.path.getsize(local_path)
+
+        offset = 0
+        if resume:
+            try:
+                offset = min((await self.info(path))["size"], total)
+            except RemoteOSError:
+                pass
+
+        for attempt in range(TRANSFER_MAX_RETRIES + 1):
+            try:
+                file = await self.open(path, "r+b" if offset else "wb")
+                try:
+                    offset = await self._get_resume_offset(
+                        file, local_path, offset
+                    )
+                    await file.truncate(offset)
+                    with open(local_path, "rb") as f:
+                        async for offset in file.write_chunks(
+                            _iter_file_chunks(f, offset, chunk_size),
+                            max_in_flight,
+                        ):
+                            if callback is not None:
+                                callback(offset, total)
+                finally:
+                    await self._close_transfer_file(file)
+            except TRANSFER_ERRORS as error:
+                if attempt == TRANSFER_MAX_RETRIES:
+                    raise
+                logger.debug(
+                    f"Resuming upload of {path} at {offset}: {error}"
+                )
+            else:
+                break
+
+    async def get_local_copy(
+        self,
+        path: Path,
+        *,
+        offline: bool = False,
+        callback: typing.Callable[[int, int], None] | None = None,
+    ) -> MirroredFile:
+        """
+        Get a local copy of a remote file.
+
+        Copies are kept in a local mirror and only downloaded again if the
+        mtime or size of the remote file changed since then.
+
+        Parameters
+        ----------
+        path : Path
+            Path of the remote file.
+        offline : bool, optional
+            Whether to return the last mirrored copy if the server can't be
+            reached, by default False.
+        callback : callable, optional
+            Function called with the progress of the download, if any. See
+            `copy_to_local`.
+
+        Returns
+        -------
+        MirroredFile
+            The local copy.
+
+        Raises
+        ------
+        RemoteOSError
+            If the remote file doesn't exist or can't be read.
+        """
+        try:
+            info = await self.info(path)
+        except TRANSFER_ERRORS:
+            if offline:
+                local_path = self.file_mirror.get(self.server_id, str(path))
+                if local_path is not None:
+                    logger.debug(f"Using offline copy of {path}")
+                    return MirroredFile(local_path, offline=True)
+            raise
+
+        local_path = self.file_mirror.get(self.server_id, str(path), info)
+        if local_path is not None:
+            return MirroredFile(local_path, offline=False)
+
+        download_path = self.file_mirror.get_download_path(
+            self.server_id, str(path)
+        )
+        os.makedirs(os.path.dirname(download_path), exist_ok=True)
+        await self.copy_to_local(path, download_path, callback=callback)
+
+        # The info from before the download is saved, so that copies of
+        # files changed while downloading them are not considered valid.
+        # Downloads can be big, so they're hashed in a thread.
+        local_path = await asyncio.get_running_loop().run_in_executor(
+            None,
+            self.file_mirror.add,
+            self.server_id,
+            str(path),
+            download_path,
+            info,
+        )
+        return MirroredFile(local_path, offline=False)
@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Pool of HTTP connections shared by the APIs of a remote server.
+
+The sessions of all the APIs of a server (files, environments, Jupyter
+kernels, etc) use the connections of its pool, so they're reused between
+them instead of each API opening its own ones through the SSH tunnel.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+import typing
+
+import aiohttp
+
+from spyder.api.asyncdispatcher import AsyncDispatcher
+from spyder.plugins.remoteclient.api.protocol import ConnectionStats
+
+
+logger = logging.getLogger(__name__)
+
+
+# ---- Constants
+# -----------------------------------------------------------------------------
+# Maximum number of connections open at the same time in each event loop.
+# Websockets hold one while they're open, so this must be high enough to not
+# block them.
+POOL_MAX_CONNECTIONS = 100
+
+# Time after which idle connections are closed.
+POOL_KEEPALIVE_TIMEOUT = 60  # In seconds
+
+# Time after which the pool is checked again before connecting an API.
+HEALTH_CHECK_INTERVAL = 30  # In seconds
+
+# Time to wait for the server to answer a health check.
+HEALTH_CHECK_TIMEOUT = 5  # In seconds
+
+# Weight of the last request in the average latency.
+LATENCY_SMOOTHING = 0.2
+
+# Minimum time between two updates of the stats, so that the interface is not
+# flooded with them when many requests are done.
+STATS_EMIT_INTERVAL = 1  # In seconds
+
+
+# ---- Pool
+# -----------------------------------------------------------------------------
+class SpyderRemoteConnectionPool:
+    """
+    Pool of HTTP connections to a remote server.
+
+    Connections are bound to the event loop where they were opened, so
+    there's a connector per loop. The pool also keeps statistics of the
+    requests done with its connections.
+    """
+
+    def __init__(
+        self,
+        config_id: str,
+        on_stats_updated: typing.Callable[[ConnectionStats], None]
+        | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        config_id: str
+            Id of the server configuration.
+        on_stats_updated: callable, optional
+            Function called with the statistics of the pool when they
+            change.
+        """
+        self.config_id = config_id
+        self._on_stats_updated = on_stats_updated
+
+        # (loop, verify_ssl) -> connector
+        self._connectors: dict[
+            tuple[asyncio.AbstractEventLoop, bool], aiohttp.TCPConnector
+        ] = {}
+
+        # Loop -> time of its last health check
+        self._last_health_checks: dict[asyncio.AbstractEventLoop, float] = {}
+
+        self._trace_config = None
+        self._lock = threading.Lock()
+        self._last_stats_emit = 0.0
+        self._stats_emit_scheduled = False
+        self._stats = ConnectionStats(
+            id=config_id,
+            requests=0,
+            errors=0,
+            latency=0.0,
+            last_latency=0.0,
+            connections=0,
+            reconnects=0,
+        )
+
+    @property
+    def stats(self) -> ConnectionStats:
+        """Statistics of the requests done with the pool."""
+        with self._lock:
+            return ConnectionStats(**self._stats)
+
+    @property
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Trace config that sessions need to use to update the stats."""
+        if self._trace_config is None:
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_request_start.append(self._on_request_start)
+            trace_config.on_request_end.append(self._on_request_end)
+            trace_config.on_request_exception.append(
+                self._on_request_exception
+            )
+            trace_config.on_connection_create_end.append(
+                self._on_connection_created
+            )
+            self._trace_config = trace_config
+
+        return self._trace_config
+
+    def get_connector(self, verify_ssl: bool = True) -> aiohttp.TCPConnector:
+        """
+        Get the connector of the running event loop.
+
+        Sessions that use it must not own it (i.e. they have to be created
+        with `connector_owner=False`), so it's not closed with them.
+        """
+        key = (asyncio.get_running_loop(), verify_ssl)
+        connector = self._connectors.get(key)
+        if connector is None or connector.closed:
+            connector = aiohttp.TCPConnector(
+                ssl=None if verify_ssl else False,
+                limit=POOL_MAX_CONNECTIONS,
+                keepalive_timeout=POOL_KEEPALIVE_TIMEOUT,
+            )
+            self._connectors[key] = connector
+
+        return connector
+
+    async def check_health(
+        self, session: aiohttp.ClientSession, url: str
+    ) -> bool:
+        """
+        Check that the server can be reached with the pooled connections.
+
+        Idle connections could have been closed by the server or the SSH
+        tunnel without us noticing. A request on them fails, after which
+        they're discarded, so the check is tried again once with a new one.
+        That's done at most once every `HEALTH_CHECK_INTERVAL` per loop.
+
+        Parameters
+        ----------
+        session: aiohttp.ClientSession
+            Session that uses the connector of the running loop.
+        url: str
+            URL that the server answers quickly.
+
+        Returns
+        -------
+        bool
+            Whether the server answered.
+        """
+        loop = asyncio.get_running_loop()
+        now = time.monotonic()
+        last_check = self._last_health_checks.get(loop)
+        if last_check is not None and now - last_check < HEALTH_CHECK_INTERVAL:
+            return True
+
+        for attempt in range(2):
+            try:
+                async with session.get(
+                    url,
+                    timeout=aiohttp.ClientTimeout(total=HEALTH_CHECK_TIMEOUT),
+                ):
+                    pass
+            except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                logger.debug(
+                    f"Health check of {self.config_id} failed: {error!r}"
+                )
+                continue
+
+            if attempt > 0:
+                self.record_reconnect()
+            self._last_health_checks[loop] = time.monotonic()
+            return True
+
+        self._last_health_checks.pop(loop, None)
+        return False
+
+    def record_reconnect(self):
+        """Count a connection to the server that had to be opened again."""
+        with self._lock:
+            self._stats["reconnects"] += 1
+        self._emit_stats()
+
+    def reset(self):
+        """
+        Discard the connections of all loops.
+
+        This needs to be done when the connection to the server is lost, so
+        that new ones are opened the next time they're needed.
+        """
+        for loop, connector in self._detach_connectors():
+            asyncio.run_coroutine_threadsafe(
+                self._close_connector(connector), loop
+            )
+
+    async def close(self):
+        """Close the connections of all loops."""
+        for loop, connector in self._detach_connectors():
+            if loop is asyncio.get_running_loop():
+                await connector.close()
+            else:
+                await AsyncDispatcher(loop=loop, return_awaitable=True)(
+                    self._close_connector
+                )(connector)
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _detach_connectors(self):
+        """Forget the connectors of all loops and return the open ones."""
+        connectors = self._connectors
+        self._connectors = {}
+        self._last_health_checks = {}
+
+        return [
+            (loop, connector)
+            for (loop, __), connector in connectors.items()
+            if not (connector.closed or loop.is_closed())
+        ]
+
+    @staticmethod
+    async def _close_connector(connector):
+        await connector.close()
+
+    def _emit_stats(self):
+        """
+        Emit the stats, at most once every `STATS_EMIT_INTERVAL`.
+
+        Updates that come before that are delayed until the interval is over,
+        so the last stats are always emitted.
+        """
+        if self._on_stats_updated is None:
+            return
+
+        with self._lock:
+            if self._stats_emit_scheduled:
+                return
+            self._stats_emit_scheduled = True
+            delay = (
+                self._last_stats_emit + STATS_EMIT_INTERVAL - time.monotonic()
+            )
+
+        if delay > 0:
+            asyncio.get_running_loop().call_later(delay, self._send_stats)
+        else:
+            self._send_stats()
+
+    def _send_stats(self):
+        with self._lock:
+            self._stats_emit_scheduled = False
+            self._last_stats_emit = time.monotonic()
+        self._on_stats_updated(self.stats)
+
+    async def _on_request_start(self, session, context, params):
+        context.start = time.monotonic()
+
+    async def _on_request_end(self, session, context, params):
+        latency = (time.monotonic() - context.start) * 1000
+        with self._lock:
+            stats = self._stats
+            if stats["requests"] == 0:
+                stats["latency"] = latency
+            else:
+                stats["latency"] += LATENCY_SMOOTHING * (
+                    latency - stats["latency"]
+                )
+            stats["last_latency"] = latency
+            stats["requests"] += 1
+        self._emit_stats()
+
+    async def _on_request_exception(self, session, context, params):
+        with self._lock:
+            self._stats["errors"] += 1
+        self._emit_stats()
+
+    async def _on_connection_created(self, session, context, params):
+        with self._lock:
+            self._stats["connections"] += 1
+        self._emit_stats()
@@ -76,3 +76,13 @@ class RemoteClientLog(typing.TypedDict):
         | logging.CRITICAL
     )
     created: float
+
+
+class ConnectionStats(typing.TypedDict):
+    id: str
+    requests: int
+    errors: int
+    latency: float
+    last_latency: float
+    connections: int
+    reconnects: int
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright © Spyder Project Contributors
+#
+# Licensed under the terms of the MIT License
+# ----------------------------------------------------------------------------
+
+"""Tests for the pool of connections to remote servers."""
+
+# Standard library imports
+import asyncio
+import socket
+
+# Third party imports
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+
+# Local imports
+from spyder.plugins.remoteclient.api import pool as pool_module
+from spyder.plugins.remoteclient.api.pool import SpyderRemoteConnectionPool
+
+
+@pytest.fixture
+def pool():
+    return SpyderRemoteConnectionPool('server')
+
+
+def get_closed_port():
+    """Get a local port where nothing is listening."""
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def make_session(pool):
+    return aiohttp.ClientSession(
+        connector=pool.get_connector(),
+        connector_owner=False,
+        trace_configs=[pool.trace_config],
+    )
+
+
+async def serve():
+    """Start a local server that counts the requests it receives."""
+    requests = []
+
+    async def handler(request):
+        requests.append(request.path)
+        return web.Response(text='ok')
+
+    app = web.Application()
+    app.router.add_get('/', handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server, requests
+
+
+def test_get_connector(pool):
+    """There's a connector per loop, which is opened again if closed."""
+    async def get_connectors():
+        connector = pool.get_connector()
+        assert pool.get_connector() is connector
+        assert pool.get_connector(verify_ssl=False) is not connector
+
+        await connector.close()
+        new_connector = pool.get_connector()
+        assert new_connector is not connector
+        assert not new_connector.closed
+        return new_connector
+
+    first = asyncio.run(get_connectors())
+    second = asyncio.run(get_connectors())
+    assert first is not second
+    assert len(pool._connectors) == 4
+
+
+def test_check_health(pool):
+    """Health checks are only done again after their interval."""
+    async def check():
+        server, requests = await serve()
+        url = str(server.make_url('/'))
+        try:
+            async with make_session(pool) as session:
+                assert await pool.check_health(session, url)
+                assert await pool.check_health(session, url)
+                assert requests == ['/']
+
+                pool._last_health_checks[asyncio.get_running_loop()] -= (
+                    pool_module.HEALTH_CHECK_INTERVAL
+                )
+                assert await pool.check_health(session, url)
+                assert requests == ['/', '/']
+        finally:
+            await server.close()
+            await pool.close()
+
+    asyncio.run(check())
+    assert pool.stats['requests'] == 2
+    assert pool.stats['reconnects'] == 0
+
+
+def test_check_health_failed(pool):
+    """Failed health checks are tried again once and not remembered."""
+    async def check():
+        url = f'http://127.0.0.1:{get_closed_port()}/'
+        try:
+            async with make_session(pool) as session:
+                assert not await pool.check_health(session, url)
+                assert not pool._last_health_checks
+        finally:
+            await pool.close()
+
+    asyncio.run(check())
+    assert pool.stats['errors'] == 2
+
+
+def test_close(pool):
+    """Closing and resetting the pool forgets its connections."""
+    async def close():
+        server, __ = await serve()
+        url = str(server.make_url('/'))
+        try:
+            async with make_session(pool) as session:
+                assert await pool.check_health(session, url)
+
+            connector = pool.get_connector()
+            await pool.close()
+            assert connector.closed
+            assert not pool._connectors
+            assert not pool._last_health_checks
+
+            connector = pool.get_connector()
+            pool._last_health_checks[asyncio.get_running_loop()] = 0
+            pool.reset()
+            assert not pool._connectors
+            assert not pool._last_health_checks
+            await asyncio.sleep(0.1)
+            assert connector.closed
+        finally:
+            await server.close()
+
+    asyncio.run(close())
+
+
+def test_stats_throttled(monkeypatch):
+    """Stats are emitted at most once per interval, but never lost."""
+    monkeypatch.setattr(pool_module, 'STATS_EMIT_INTERVAL', 0.2)
+    emitted = []
+    pool = SpyderRemoteConnectionPool('server', emitted.append)
+
+    async def record():
+        for __ in range(5):
+            pool.record_reconnect()
+        assert [stats['reconnects'] for stats in emitted] == [1]
+        await asyncio.sleep(0.3)
+        assert [stats['reconnects'] for stats in emitted] == [1, 5]
+
+    asyncio.run(record())
@@ -85,6 +85,7 @@ class RemoteClient(SpyderPluginV2):
     sig_connection_established = Signal(str)
     sig_connection_lost = Signal(str)
     sig_connection_status_changed = Signal(dict)
+    sig_connection_stats_updated = Signal(dict)
 
     sig_version_mismatch = Signal(str, str)
 
@@ -126,6 +127,9 @@ def on_initialize(self):
         self.sig_client_message_logged.connect(
             container.sig_client_message_logged
         )
+        self.sig_connection_stats_updated.connect(
+            container.sig_connection_stats_updated
+        )
         self.sig_version_mismatch.connect(container.on_server_version_mismatch)
 
     def on_first_registration(self):
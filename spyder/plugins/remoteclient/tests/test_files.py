@@ -7,12 +7,20 @@
 
 """Tests for the remote files API."""
 
+# Standard library imports
+import asyncio
+import os
+
 # Third party imports
 import pytest
 
 from spyder.api.asyncdispatcher import AsyncDispatcher
 from spyder.plugins.remoteclient.plugin import RemoteClient
-from spyder.plugins.remoteclient.api.modules.file_services import RemoteOSError
+from spyder.plugins.remoteclient.api.modules.file_services import (
+    PARTIAL_DOWNLOAD_SUFFIX,
+    TRANSFER_CHUNK_SIZE,
+    RemoteOSError,
+)
 from spyder.plugins.remoteclient.tests.conftest import mark_remote_test
 
 
@@ -108,6 +116,60 @@ async def test_copy_file(
             )
             assert ls_content[0]["size"] == ls_content[1]["size"]
 
+    @AsyncDispatcher(early_return=False)
+    async def test_batch_info(
+        self,
+        remote_client: RemoteClient,
+        remote_client_id: str,
+    ):
+        """Test that the info of several paths can be got at once."""
+        file_api_class = remote_client.get_file_api(remote_client_id)
+        assert file_api_class is not None
+
+        paths = [
+            self.remote_temp_dir + "/test.txt",
+            self.remote_temp_dir + "/missing.txt",
+            self.remote_temp_dir,
+        ]
+        async with file_api_class() as file_api:
+            infos = await file_api.info_batch(paths)
+            assert infos[0]["name"] == paths[0]
+            assert infos[0]["size"] == 13
+            assert isinstance(infos[1], RemoteOSError)
+            assert infos[2]["type"] == "directory"
+
+            assert await file_api.exists_batch(paths) == [True, False, True]
+            assert await file_api.is_file_batch(paths) == [True, False, False]
+            assert await file_api.is_dir_batch(paths) == [False, False, True]
+
+    @AsyncDispatcher(early_return=False)
+    async def test_watch(
+        self,
+        remote_client: RemoteClient,
+        remote_client_id: str,
+    ):
+        """Test that changes in a remote directory are streamed."""
+        file_api_class = remote_client.get_file_api(remote_client_id)
+        assert file_api_class is not None
+
+        path = self.remote_temp_dir + "/watched.txt"
+        async with file_api_class() as file_api:
+            watch = file_api.watch(self.remote_temp_dir, recursive=False)
+            changes = asyncio.ensure_future(watch.__anext__())
+
+            # Give the server time to start watching
+            await asyncio.sleep(1)
+            await file_api.touch(path)
+            assert ("created", path, None, False) in await asyncio.wait_for(
+                changes, timeout=10
+            )
+
+            await file_api.unlink(path)
+            assert ("deleted", path, None, False) in await asyncio.wait_for(
+                watch.__anext__(), timeout=10
+            )
+            await watch.aclose()
+
     @AsyncDispatcher(early_return=False)
     async def test_rm_file(
         self,
@@ -126,6 +188,55 @@ async def test_rm_file(
                 self.remote_temp_dir + "/test2.txt"
             ) == {"success": True}
 
+    @AsyncDispatcher(early_return=False)
+    async def test_transfer_file(
+        self,
+        remote_client: RemoteClient,
+        remote_client_id: str,
+        tmp_path,
+    ):
+        """Test that files can be uploaded and downloaded in chunks."""
+        file_api_class = remote_client.get_file_api(remote_client_id)
+        assert file_api_class is not None
+
+        data = os.urandom(2 * TRANSFER_CHUNK_SIZE + 1)
+        local_path = tmp_path / "data.bin"
+        local_path.write_bytes(data)
+        remote_path = self.remote_temp_dir + "/data.bin"
+
+        async with file_api_class() as file_api:
+            progress = []
+            await file_api.copy_from_local(
+                str(local_path),
+                remote_path,
+                callback=lambda transferred, total: progress.append(
+                    (transferred, total)
+                ),
+            )
+            assert len(progress) == 3
+            assert progress[-1] == (len(data), len(data))
+
+            # Only the missing part is downloaded when resuming
+            download_path = tmp_path / "download.bin"
+            part_path = tmp_path / ("download.bin" + PARTIAL_DOWNLOAD_SUFFIX)
+            part_path.write_bytes(data[:TRANSFER_CHUNK_SIZE])
+            progress = []
+            await file_api.copy_to_local(
+                remote_path,
+                str(download_path),
+                callback=lambda transferred, total: progress.append(
+                    (transferred, total)
+                ),
+            )
+            assert progress == [
+                (2 * TRANSFER_CHUNK_SIZE, len(data)),
+                (len(data), len(data)),
+            ]
+            assert download_path.read_bytes() == data
+            assert not part_path.exists()
+
+            assert await file_api.unlink(remote_path) == {"success": True}
+
     @AsyncDispatcher(early_return=False)
     async def test_rm_dir(
         self,
@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Local mirror of remote files.
+
+Downloaded files are stored by the checksum of their contents, so identical
+files in different paths or servers are only kept once. An index maps each
+remote file to its contents and to the mtime and size it had on the server
+when it was downloaded, which are used to tell if it changed since then.
+"""
+
+# Standard library imports
+import hashlib
+import json
+import logging
+import os
+import os.path as osp
+import threading
+import time
+
+# Local imports
+from spyder.config.base import get_conf_path
+
+
+logger = logging.getLogger(__name__)
+
+
+# ---- Constants
+# ----------------------------------------------------------------------------
+# Bump this when the format of the index changes.
+INDEX_VERSION = 1
+
+# Maximum size of the mirrored files. The least recently used ones are
+# removed when it's exceeded.
+MAX_MIRROR_SIZE = 1024 ** 3  # 1 GiB
+
+# Size of the blocks read to compute checksums.
+CHECKSUM_BLOCK_SIZE = 1024 ** 2
+
+
+# ---- Mirror
+# ----------------------------------------------------------------------------
+class RemoteFileMirror:
+    """
+    Content-addressed local mirror of remote files.
+
+    Mirrored files are shared between remote files with the same contents,
+    so they must not be modified.
+    """
+
+    def __init__(self, root_path=None, max_size=MAX_MIRROR_SIZE):
+        """
+        Parameters
+        ----------
+        root_path: str, optional
+            Directory where files are mirrored. By default, it's in Spyder's
+            config directory.
+        max_size: int, optional
+            Maximum size in bytes of the mirrored files.
+        """
+        self._root_path = root_path
+        self.max_size = max_size
+
+        # "server_id:path" -> {"sha256", "mtime", "size", "accessed"}
+        self._entries = None
+
+        self._lock = threading.Lock()
+
+    @property
+    def root_path(self):
+        # This is computed on first use to not create the config directory
+        # when importing this module.
+        if self._root_path is None:
+            self._root_path = get_conf_path('remote_files')
+        return self._root_path
+
+    @property
+    def index_path(self):
+        return osp.join(self.root_path, 'index.json')
+
+    def _get_key(self, server_id, path):
+        return f"{server_id}:{path}"
+
+    # ---- Persistence
+    # ------------------------------------------------------------------------
+    def _load(self):
+        """Load the index the first time it's needed."""
+        if self._entries is not None:
+            return
+
+        self._entries = {}
+        try:
+            with open(self.index_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get('version') == INDEX_VERSION:
+            self._entries = data['entries']
+
+    def _save(self):
+        data = {'version': INDEX_VERSION, 'entries': self._entries}
+        try:
+            os.makedirs(self.root_path, exist_ok=True)
+            temp_path = self.index_path + '.tmp'
+            with open(temp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.index_path)
+        except OSError:
+            logger.debug("Could not save remote file mirror index",
+                         exc_info=True)
+
+    # ---- Queries
+    # ------------------------------------------------------------------------
+    def get_object_path(self, sha256):
+        """Get the path of the mirrored file with checksum `sha256`."""
+        return osp.join(self.root_path, 'objects', sha256[:2], sha256)
+
+    def get_download_path(self, server_id, path):
+        """
+        Get the path where a remote file is downloaded before adding it.
+
+        It only depends on the remote file, so interrupted downloads can be
+        resumed.
+        """
+        key_hash = hashlib.sha256(
+            self._get_key(server_id, path).encode('utf-8')
+        ).hexdigest()
+        return osp.join(self.root_path, 'downloads', key_hash)
+
+    def get(self, server_id, path, info=None):
+        """
+        Get the mirrored copy of a remote file.
+
+        Parameters
+        ----------
+        server_id: str
+            Id of the server where the file is.
+        path: str
+            Path of the file in the server.
+        info: dict, optional
+            Current info of the file, as returned by
+            `SpyderRemoteFileServicesAPI.info`. If given, the copy is only
+            returned if the mtime and size in it are the same as when it was
+            mirrored.
+
+        Returns
+        -------
+        str or None
+            Path of the mirrored copy or None if there isn't a valid one.
+        """
+        key = self._get_key(server_id, path)
+        with self._lock:
+            self._load()
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            if info is not None and (
+                entry['mtime'] != info['mtime']
+                or entry['size'] != info['size']
+            ):
+                return None
+
+            object_path = self.get_object_path(entry['sha256'])
+            if not osp.isfile(object_path):
+                del self._entries[key]
+                self._save()
+                return None
+
+            # Access times are only needed to evict files, so they're saved
+            # with the next change to the index instead of on every access.
+            entry['accessed'] = time.time()
+
+        return object_path
+
+    # ---- Updates
+    # ------------------------------------------------------------------------
+    def add(self, server_id, path, local_path, info):
+        """
+        Add a downloaded remote file to the mirror.
+
+        Parameters
+        ----------
+        server_id: str
+            Id of the server where the file is.
+        path: str
+            Path of the file in the server.
+        local_path: str
+            Path of the downloaded file. It's moved to the mirror.
+        info: dict
+            Info of the remote file when it was downloaded.
+
+        Returns
+        -------
+        str
+            Path of the mirrored copy.
+
+        Notes
+        -----
+        This reads the whole file to compute its checksum, so it needs to be
+        called in a thread for big files.
+        """
+        checksum = hashlib.sha256()
+        with open(local_path, 'rb') as f:
+            while block := f.read(CHECKSUM_BLOCK_SIZE):
+                checksum.update(block)
+        sha256 = checksum.hexdigest()
+
+        object_path = self.get_object_path(sha256)
+        os.makedirs(osp.dirname(object_path), exist_ok=True)
+        os.replace(local_path, object_path)
+
+        with self._lock:
+            self._load()
+            self._entries[self._get_key(server_id, path)] = {
+                'sha256': sha256,
+                'mtime': info['mtime'],
+                'size': info['size'],
+                'accessed': time.time(),
+            }
+            self._evict()
+            self._save()
+
+        return object_path
+
+    def remove(self, server_id, path):
+        """Remove the mirrored copy of a remote file."""
+        with self._lock:
+            self._load()
+            if self._entries.pop(self._get_key(server_id, path), None):
+                self._remove_unused_objects()
+                self._save()
+
+    def _evict(self):
+        """Remove the least recently used files until they fit."""
+        sizes = {
+            entry['sha256']: entry['size'] for entry in self._entries.values()
+        }
+        total_size = sum(sizes.values())
+        if total_size <= self.max_size:
+            return
+
+        for key, entry in sorted(
+            self._entries.items(), key=lambda item: item[1]['accessed']
+        ):
+            if total_size <= self.max_size:
+                break
+
+            del self._entries[key]
+            sha256 = entry['sha256']
+            if sha256 in sizes and not any(
+                other['sha256'] == sha256
+                for other in self._entries.values()
+            ):
+                total_size -= sizes.pop(sha256)
+
+        self._remove_unused_objects()
+
+    def _remove_unused_objects(self):
+        """Remove mirrored files that are not in the index anymore."""
+        used = {entry['sha256'] for entry in self._entries.values()}
+        objects_path = osp.join(self.root_path, 'objects')
+        try:
+            dirs = list(os.scandir(objects_path))
+        except OSError:
+            return
+
+        for dir_entry in dirs:
+            try:
+                for entry in os.scandir(dir_entry.path):
+                    if entry.name not in used:
+                        os.remove(entry.path)
+            except OSError:
+                continue
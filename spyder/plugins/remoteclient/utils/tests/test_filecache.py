@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright © Spyder Project Contributors
+#
+# Licensed under the terms of the MIT License
+# ----------------------------------------------------------------------------
+
+"""Tests for the local mirror of remote files."""
+
+# Standard library imports
+import os
+import os.path as osp
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.remoteclient.utils.filecache import RemoteFileMirror
+
+
+def download(tmp_path, name, data):
+    """Simulate the download of a file."""
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    return RemoteFileMirror(str(tmp_path / 'mirror'), max_size=10)
+
+
+def test_get(tmp_path, mirror):
+    """Copies are only valid while the remote file doesn't change."""
+    info = {'mtime': 1, 'size': 4}
+    local_path = mirror.add(
+        'server', '/a.txt', download(tmp_path, 'a', b'spam'), info
+    )
+    with open(local_path, 'rb') as f:
+        assert f.read() == b'spam'
+
+    assert mirror.get('server', '/a.txt', info) == local_path
+    assert mirror.get('server', '/a.txt', {'mtime': 2, 'size': 4}) is None
+    assert mirror.get('other', '/a.txt', info) is None
+
+    # Copies are returned without info when offline
+    assert mirror.get('server', '/a.txt') == local_path
+
+    # The index is saved, but not rewritten on every access
+    new_mirror = RemoteFileMirror(mirror.root_path)
+    mtime = os.stat(new_mirror.index_path).st_mtime_ns
+    assert new_mirror.get('server', '/a.txt', info) == local_path
+    assert os.stat(new_mirror.index_path).st_mtime_ns == mtime
+
+
+def test_shared_contents(tmp_path, mirror):
+    """Files with the same contents are only stored once."""
+    info = {'mtime': 1, 'size': 4}
+    a_path = mirror.add(
+        'server', '/a.txt', download(tmp_path, 'a', b'spam'), info
+    )
+    b_path = mirror.add(
+        'server', '/b.txt', download(tmp_path, 'b', b'spam'), info
+    )
+    assert a_path == b_path
+
+    mirror.remove('server', '/a.txt')
+    assert osp.isfile(b_path)
+
+    mirror.remove('server', '/b.txt')
+    assert not osp.isfile(b_path)
+
+
+def test_evict(tmp_path, mirror):
+    """The least recently used files are removed when the mirror is full."""
+    info = {'mtime': 1, 'size': 4}
+    a_path = mirror.add(
+        'server', '/a.txt', download(tmp_path, 'a', b'spam'), info
+    )
+    mirror.add('server', '/b.txt', download(tmp_path, 'b', b'eggs'), info)
+    mirror.get('server', '/a.txt', info)
+    mirror.add('server', '/c.txt', download(tmp_path, 'c', b'hams'), info)
+
+    assert mirror.get('server', '/a.txt', info) == a_path
+    assert mirror.get('server', '/b.txt', info) is None
+    assert mirror.get('server', '/c.txt', info) is not None
+
+
+if __name__ == "__main__":
+    pytest.main()
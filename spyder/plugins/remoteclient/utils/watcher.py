@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Watcher to detect filesystem changes in remote directories.
+
+Changes are detected by the server and streamed to us in batches, so there's
+no need to list the watched directories again to find them.
+"""
+
+# Standard library imports
+import asyncio
+import logging
+
+# Third-party imports
+import aiohttp
+from qtpy.QtCore import QObject, Signal
+
+# Local imports
+from spyder.api.asyncdispatcher import AsyncDispatcher
+from spyder.plugins.remoteclient.api.modules.base import (
+    SpyderRemoteSessionClosed,
+)
+from spyder.plugins.remoteclient.api.modules.file_services import (
+    RemoteFileServicesError,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+# ---- Constants
+# ----------------------------------------------------------------------------
+# Number of times watching is restarted after losing the connection.
+WATCH_MAX_RETRIES = 3
+
+# Time to wait before restarting to watch after losing the connection.
+WATCH_RETRY_DELAY = 2  # In seconds
+
+
+# ---- Watcher
+# ----------------------------------------------------------------------------
+class RemoteWorkspaceWatcher(QObject):
+    """
+    Watcher for directories in remote servers.
+
+    It reports changes with the same signal and in the same format as
+    `WorkspaceWatcher`, so it can be used in its place for remote
+    directories. Unlike it, changes to files of all types are reported.
+    """
+
+    sig_files_changed = Signal(list)
+    """
+    This signal is emitted with the changes detected in the watched folder.
+
+    Parameters
+    ----------
+    changes: list
+        List of (event_type, src_path, dest_path, is_dir) tuples, where
+        event_type is one of the values of `WorkspaceEventType` and
+        dest_path is only set for moves. There is at most one creation,
+        deletion or modification per path.
+    """
+
+    def __init__(self, files_api, recursive=True, parent=None):
+        """
+        Parameters
+        ----------
+        files_api: SpyderRemoteFileServicesAPI
+            Connected file services API of the server.
+        recursive: bool, optional
+            Whether to watch the subdirectories of the watched folder too.
+        parent: QObject, optional
+            Parent of the watcher.
+        """
+        super().__init__(parent)
+        self.files_api = files_api
+        self.recursive = recursive
+        self.folder = None
+
+        self._future = None
+
+    def connect_signals(self, project):
+        self.sig_files_changed.connect(project.files_changed)
+
+    def start(self, workspace_folder):
+        self.stop()
+        self.folder = workspace_folder
+        self._future = AsyncDispatcher(
+            loop=self.files_api.session._loop
+        )(self._watch)(workspace_folder)
+
+    def stop(self):
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+        self.folder = None
+
+    async def _watch(self, folder):
+        """Report the changes in `folder` until it's not watched anymore."""
+        retries = 0
+        while retries <= WATCH_MAX_RETRIES:
+            try:
+                async for changes in self.files_api.watch(
+                    folder, recursive=self.recursive
+                ):
+                    retries = 0
+
+                    # Changes of a previous folder could arrive after
+                    # starting to watch another one.
+                    if folder != self.folder:
+                        return
+
+                    logger.debug(
+                        f"Reporting {len(changes)} changes in remote "
+                        f"folder {folder}"
+                    )
+                    self.sig_files_changed.emit(changes)
+            except (RemoteFileServicesError, SpyderRemoteSessionClosed) as e:
+                logger.debug(f"Could not watch remote folder {folder}: {e}")
+                return
+            except (aiohttp.ClientError, ConnectionError):
+                retries += 1
+                logger.debug(
+                    f"Connection lost while watching remote folder {folder}",
+                    exc_info=True,
+                )
+                await asyncio.sleep(WATCH_RETRY_DELAY)
@@ -35,6 +35,7 @@
 from spyder.api.widgets.dialogs import SpyderDialogButtonBox
 from spyder.plugins.remoteclient.api.protocol import (
     ConnectionInfo,
+    ConnectionStats,
     ConnectionStatus,
     RemoteClientLog,
     SSHClientOptions,
@@ -676,6 +677,10 @@ def add_log(self, log: RemoteClientLog):
     def add_logs(self, logs: Iterable):
         self.status_widget.add_logs(logs)
 
+    def update_stats(self, stats: ConnectionStats):
+        if stats["id"] == self.host_id:
+            self.status_widget.update_stats(stats)
+
     def has_new_name(self):
         """Check if users changed the connection name."""
         current_auth_method = self.auth_method(from_gui=True)
@@ -927,15 +932,20 @@ def _add_connection_page(self, host_id: str, new: bool):
 
         self.add_page(page)
 
-        # Add saved logs to the page
+        # Add saved logs and statistics to the page
         if self._container is not None:
             page.add_logs(self._container.client_logs.get(host_id, []))
+            if host_id in self._container.client_stats:
+                page.update_stats(self._container.client_stats[host_id])
 
             # This updates the info shown in the "Connection info" tab of pages
             self._container.sig_connection_status_changed.connect(
                 page.update_status
             )
             self._container.sig_client_message_logged.connect(page.add_log)
+            self._container.sig_connection_stats_updated.connect(
+                page.update_stats
+            )
 
     def _add_saved_connection_pages(self):
         """Add a connection page for each server saved in our config system."""
@@ -27,6 +27,7 @@
 from spyder.plugins.remoteclient.api import MAX_CLIENT_MESSAGES
 from spyder.plugins.remoteclient.api.protocol import (
     ConnectionInfo,
+    ConnectionStats,
     ConnectionStatus,
     RemoteClientLog,
 )
@@ -111,6 +112,7 @@ def __init__(self, parent, host_id):
         self._connection_label = QLabel(self)
         self._status_label = QLabel(self)
         self._user_label = QLabel(_("Username: {}").format(username), self)
+        self._stats_label = QLabel(_("Requests: None yet"), self)
         self._message_label = QLabel(self)
         self._message_label.setWordWrap(True)
         self._image_label = QLabel(self)
@@ -137,6 +139,7 @@ def __init__(self, parent, host_id):
         info_layout.addWidget(self._connection_label)
         info_layout.addWidget(self._status_label)
         info_layout.addWidget(self._user_label)
+        info_layout.addWidget(self._stats_label)
         info_layout.addSpacing(4 * AppStyle.MarginSize)
         info_layout.addWidget(self._message_label)
         info_layout.addStretch()
@@ -208,6 +211,20 @@ def add_logs(self, logs: Iterable):
         for log in logs:
             self.add_log(log)
 
+    def update_stats(self, stats: ConnectionStats):
+        """Show the statistics of the requests done to the server."""
+        self._stats_label.setText(
+            _(
+                "Requests: {} (average latency: {:.0f} ms, last: {:.0f} ms)"
+                " - Reconnections: {}"
+            ).format(
+                stats["requests"],
+                stats["latency"],
+                stats["last_latency"],
+                stats["reconnects"],
+            )
+        )
+
     # ---- Private API
     # -------------------------------------------------------------------------
     def _set_stylesheet(self):
@@ -230,7 +247,11 @@ def _set_stylesheet(self):
         other_info_labels_css.setValues(
             marginLeft=f"{9 * AppStyle.MarginSize}px"
         )
-        for label in [self._status_label, self._user_label]:
+        for label in [
+            self._status_label,
+            self._user_label,
+            self._stats_label,
+        ]:
             label.setStyleSheet(other_info_labels_css.toString())
 
         # -- Style of log widgets
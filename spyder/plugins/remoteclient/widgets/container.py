@@ -24,7 +24,10 @@
     MAX_CLIENT_MESSAGES,
     RemoteClientActions,
 )
-from spyder.plugins.remoteclient.api.protocol import ConnectionInfo
+from spyder.plugins.remoteclient.api.protocol import (
+    ConnectionInfo,
+    ConnectionStats,
+)
 from spyder.plugins.remoteclient.widgets.connectiondialog import (
     ConnectionDialog,
 )
@@ -88,11 +91,23 @@ class RemoteClientContainer(PluginMainContainer):
         Dictionary that contains the log message and its metadata.
     """
 
+    sig_connection_stats_updated = Signal(dict)
+    """
+    This signal is used to inform that the statistics of the requests done
+    to a server changed.
+
+    Parameters
+    ----------
+    stats: ConnectionStats
+        Dictionary with the statistics and the id of the server.
+    """
+
     # ---- PluginMainContainer API
     # -------------------------------------------------------------------------
     def setup(self):
         # Attributes
         self.client_logs: dict[str, deque] = {}
+        self.client_stats: dict[str, ConnectionStats] = {}
 
         # Widgets
         self.create_action(
@@ -107,6 +122,9 @@ def setup(self):
             self._on_connection_status_changed
         )
         self.sig_client_message_logged.connect(self._on_client_message_logged)
+        self.sig_connection_stats_updated.connect(
+            self._on_connection_stats_updated
+        )
 
     def update_actions(self):
         pass
@@ -177,3 +195,8 @@ def _on_client_message_logged(self, message: dict):
 
         # Add message to deque
         self.client_logs[msg_id].append(message)
+
+    def _on_connection_stats_updated(self, stats: ConnectionStats):
+        """Save the last statistics of a connection."""
+        # They're shown when the connection dialog is opened again.
+        self.client_stats[stats["id"]] = stats
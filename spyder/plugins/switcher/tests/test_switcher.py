@@ -124,6 +124,94 @@ def test_switcher_filter_unicode(dlg_switcher, qtbot):
     assert dlg_switcher.count() == 2
 
 
+def test_switcher_narrowing(dlg_switcher, qtbot):
+    """Test that only the best results are shown when typing a query."""
+    from spyder.utils.stringmatching import FuzzyMatcher
+
+    edit = dlg_switcher.edit
+    max_results = dlg_switcher._MAX_RESULTS
+    titles = ['item_{}'.format(i) for i in range(2 * max_results)]
+    for title in titles:
+        dlg_switcher.add_item(title=title, last_item=False)
+
+    # Only the best results are shown, plus the action item
+    edit.setText("item")
+    qtbot.wait(1000)
+    assert dlg_switcher.count() == max_results + 1
+    assert dlg_switcher.current_item().is_action_item()
+
+    # Extending the query only checks the previous matches and gives the
+    # same results as a new search
+    edit.setText("item_99")
+    qtbot.wait(1000)
+    expected = FuzzyMatcher(titles).get_matches("item_99")
+    assert dlg_switcher.count() == len(expected) + 1
+    assert len(dlg_switcher._last_matches) == len(expected)
+
+    # The best match is shown first after the action item
+    dlg_switcher.set_current_row(1)
+    assert dlg_switcher.current_item().get_title() == 'item_99'
+
+    # Removing letters searches all items again
+    edit.setText("item_9")
+    qtbot.wait(1000)
+    expected = FuzzyMatcher(titles).get_matches("item_9")
+    assert len(dlg_switcher._last_matches) == len(expected)
+
+
+def test_switcher_narrowing_with_project(dlg_switcher, qtbot, monkeypatch):
+    """
+    Test that results are narrowed when the items of the Projects section
+    are updated on every keystroke.
+    """
+    from spyder.utils.stringmatching import FuzzyMatcher
+
+    edit = dlg_switcher.edit
+    max_results = dlg_switcher._MAX_RESULTS
+    titles = ['item_{}'.format(i) for i in range(2 * max_results)]
+    for title in titles:
+        dlg_switcher.add_item(title=title, last_item=False)
+
+    # Simulate the Projects plugin, which replaces its items for every query
+    def show_project_files(text):
+        dlg_switcher.remove_section('Projects')
+        for i in range(3):
+            dlg_switcher.add_item(
+                title='project_file_{}'.format(i),
+                section='Projects',
+                score=1e10,
+                use_score=False,
+                last_item=False,
+            )
+        dlg_switcher.setup()
+
+    dlg_switcher.sig_search_text_available.connect(show_project_files)
+
+    searched = []
+    get_scores = FuzzyMatcher.get_scores
+
+    def get_scores_spy(self, query, indices=None):
+        searched.append(indices)
+        return get_scores(self, query, indices=indices)
+
+    monkeypatch.setattr(FuzzyMatcher, 'get_scores', get_scores_spy)
+
+    edit.setText("item")
+    qtbot.wait(1000)
+    assert len(dlg_switcher._last_matches) == len(titles)
+
+    # Only the previous matches are searched for the extended query and the
+    # project files are still shown
+    searched.clear()
+    edit.setText("item_99")
+    qtbot.wait(1000)
+    expected = FuzzyMatcher(titles).get_matches("item_99")
+    assert searched
+    assert all(indices is not None for indices in searched)
+    assert len(dlg_switcher._last_matches) == len(expected)
+    assert dlg_switcher.count() == len(expected) + 1 + 3
+
+
 # --- Helper functions for tests
 # -----------------------------------------------------------------------------
 def create_vcs_example_switcher(sw):
@@ -20,6 +20,8 @@ def __init__(self, parent=None):
         self.setSortCaseSensitivity(Qt.CaseInsensitive)
         self.setDynamicSortFilter(True)
         self.__filter_by_score = False
+        self.__sort_by = None
+        self.__ranks = None
 
     def set_filter_by_score(self, value):
         """
@@ -34,8 +36,42 @@ def set_filter_by_score(self, value):
         self.__filter_by_score = value
         self.invalidateFilter()
 
+    def setSourceModel(self, model):
+        """Override Qt method to discard ranks when rows change."""
+        super().setSourceModel(model)
+
+        # Ranks refer to source rows, so they are no longer valid when rows
+        # are added or removed.
+        model.rowsAboutToBeInserted.connect(self._discard_ranks)
+        model.rowsAboutToBeRemoved.connect(self._discard_ranks)
+        model.modelAboutToBeReset.connect(self._discard_ranks)
+
+    def _discard_ranks(self, *args):
+        """Go back to filter and sort items by their attributes."""
+        self.__ranks = None
+
+    def set_ranks(self, ranks):
+        """
+        Show only the ranked items, in the order given by their ranks.
+
+        This avoids looking up the score of every item in the source model
+        when filtering and sorting, which is slow for lots of items.
+
+        Parameters
+        ----------
+        ranks : dict or None
+           Maps the source rows to show to a value used to sort them. If
+           None, items are filtered and sorted by their attributes again.
+        """
+        self.__ranks = ranks
+        self.invalidate()
+        self.sort(0, Qt.AscendingOrder)
+
     def filterAcceptsRow(self, source_row, source_parent):
         """Override Qt method to filter items by their score result."""
+        if self.__ranks is not None:
+            return source_row in self.__ranks
+
         item = self.sourceModel().item(source_row)
         if self.__filter_by_score is False or item.is_action_item():
             return True
@@ -50,18 +86,17 @@ def sortBy(self, attr):
 
     def lessThan(self, left, right):
         """Override Qt method."""
+        if self.__ranks is not None:
+            return self.__ranks[left.row()] < self.__ranks[right.row()]
+
         left_item = self.sourceModel().itemFromIndex(left)
         right_item = self.sourceModel().itemFromIndex(right)
 
         # Check for attribute, otherwise, check for data
-        if (
-            hasattr(left_item, self.__sort_by)
-            and getattr(left_item, self.__sort_by) is not None
-            and hasattr(right_item, self.__sort_by)
-            and getattr(right_item, self.__sort_by) is not None
-        ):
-            left_data = getattr(left_item, self.__sort_by)
-            right_data = getattr(right_item, self.__sort_by)
-            return left_data < right_data
+        if self.__sort_by is not None:
+            left_data = getattr(left_item, self.__sort_by, None)
+            right_data = getattr(right_item, self.__sort_by, None)
+            if left_data is not None and right_data is not None:
+                return left_data < right_data
 
         return super().lessThan(left, right)
@@ -6,6 +6,8 @@
 
 """Switcher Main Widget."""
 
+# Standard library imports
+import heapq
 
 # Third party imports
 from qtpy.QtCore import (
@@ -31,7 +33,7 @@
 from spyder.py3compat import to_text_string
 from spyder.utils.palette import SpyderPalette
 from spyder.widgets.helperwidgets import HTMLDelegate
-from spyder.utils.stringmatching import get_search_scores
+from spyder.utils.stringmatching import FuzzyMatcher
 from spyder.plugins.switcher.utils import clean_string
 
 
@@ -131,6 +133,7 @@ class Switcher(QDialog, SpyderFontsMixin):
     """
 
     _MAX_NUM_ITEMS = 15
+    _MAX_RESULTS = 500
     _MIN_WIDTH = 580
     _MIN_HEIGHT = 200
     _MAX_HEIGHT = 390
@@ -143,6 +146,12 @@ def __init__(self, parent, help_text=None):
         # Attributes
         self._modes = {}
         self._mode_on = ''
+        self._matcher = None
+        self._fixed_rows = []
+        self._scored_rows_end = 0
+        self._ranked_rows = set()
+        self._last_query = ''
+        self._last_matches = None
 
         font_size = self.get_font(SpyderFontType.Interface).pointSize()
         self._item_styles = {
@@ -206,6 +215,11 @@ def __init__(self, parent, help_text=None):
         self.list.selectionModel().currentChanged.connect(
             self.current_item_changed)
 
+        # Titles are scored again only when items change
+        self.model.rowsInserted.connect(self._on_rows_inserted)
+        self.model.rowsRemoved.connect(self._on_rows_removed)
+        self.model.modelReset.connect(self._reset_matcher)
+
         # Gives focus to text edit
         self.edit.setFocus()
 
@@ -223,6 +237,79 @@ def _add_item(self, item, last_item=True):
             self.set_current_row(0)
             self.set_height()
 
+    def _is_fixed_item(self, item):
+        """Check if item is shown regardless of its title."""
+        return isinstance(item, SwitcherItem) and (
+            item.is_action_item()
+            or (not item._use_score and item.get_score() != -1)
+        )
+
+    def _reset_matcher(self, *args):
+        """Discard the matcher of the current item titles."""
+        self._matcher = None
+        self._fixed_rows = []
+        self._scored_rows_end = 0
+        self._ranked_rows = set()
+        self._last_query = ''
+        self._last_matches = None
+
+    def _update_matcher(self, first):
+        """
+        Update the matcher after the rows from `first` changed.
+
+        Items with a fixed score (e.g. the ones of the Projects section, which
+        are replaced on every keystroke) are added after the scored ones and
+        are not matched by title. So, if only they changed, the matches of the
+        last query are still valid and narrowing them can go on.
+        """
+        if first < self._scored_rows_end:
+            self._reset_matcher()
+        else:
+            self._matcher = None
+            self._ranked_rows = {
+                row for row in self._ranked_rows if row < first
+            }
+
+    def _on_rows_inserted(self, parent, first, last):
+        if all(
+            self._is_fixed_item(self.model.item(row))
+            for row in range(first, last + 1)
+        ):
+            self._update_matcher(first)
+        else:
+            self._reset_matcher()
+
+    def _on_rows_removed(self, parent, first, last):
+        self._update_matcher(first)
+
+    def _get_matcher(self):
+        """Get a matcher for the titles of the current items."""
+        if self._matcher is None:
+            titles = []
+            fixed_rows = []
+            scored_rows_end = 0
+            for row in range(self.model.rowCount()):
+                item = self.model.item(row)
+                if isinstance(item, SwitcherItem):
+                    title = item.get_title()
+
+                    # These items are shown regardless of their title
+                    if self._is_fixed_item(item):
+                        fixed_rows.append(row)
+                    else:
+                        scored_rows_end = row + 1
+                else:
+                    title = ''
+
+                titles.append(title)
+
+            self._fixed_rows = fixed_rows
+            self._scored_rows_end = scored_rows_end
+
+            self._matcher = FuzzyMatcher(titles)
+
+        return self._matcher
+
     # ---- API
     # -------------------------------------------------------------------------
     def clear(self):
@@ -291,6 +378,7 @@ def setup(self):
         if self.search_text() == '':
             self._mode_on = ''
             self.clear()
+            self.proxy.set_ranks(None)
             self.proxy.set_filter_by_score(False)
             self.sig_mode_selected.emit(self._mode_on)
 
@@ -307,30 +395,55 @@ def setup(self):
             return
 
         # Filter by text
-        titles = []
-        for row in range(self.model.rowCount()):
-            item = self.model.item(row)
-            if isinstance(item, SwitcherItem):
-                title = item.get_title()
-            else:
-                title = ''
-
-            titles.append(title)
-
-        search_text = clean_string(search_text)
-        scores = get_search_scores(to_text_string(search_text),
-                                   titles, template=u"<b>{0}</b>")
-
-        for idx, (title, rich_title, score_value) in enumerate(scores):
-            item = self.model.item(idx)
-            if not self._is_separator(item) and not item.is_action_item():
-                rich_title = rich_title.replace(" ", "&nbsp;")
-                item.set_rich_title(rich_title)
-
-            item.set_score(score_value)
-
-        self.proxy.set_filter_by_score(True)
-        self.proxy.sortBy('_score')
+        search_text = to_text_string(clean_string(search_text))
+        matcher = self._get_matcher()
+
+        # When the query extends the previous one, only the items that
+        # matched it can match the new one.
+        query = search_text.replace(' ', '').lower()
+        indices = None
+        if (
+            self._last_matches is not None
+            and query.startswith(self._last_query)
+        ):
+            indices = self._last_matches
+
+        scores = matcher.get_scores(search_text, indices=indices)
+        self._last_query = query
+        self._last_matches = [idx for __, idx in scores]
+
+        # Only the best results are shown and highlighted, since rendering
+        # items is expensive. Action items and items with a fixed score are
+        # always shown.
+        top_scores = heapq.nsmallest(self._MAX_RESULTS, scores)
+        ranked = {idx: score_value for score_value, idx in top_scores}
+        for idx in self._fixed_rows:
+            ranked.setdefault(idx, -1)
+
+        ranks = {}
+        with signals_blocked(self.model):
+            for idx in self._ranked_rows - ranked.keys():
+                item = self.model.item(idx)
+                if not self._is_separator(item):
+                    item.set_rich_title('')
+                item.set_score(-1)
+
+            for idx, score_value in ranked.items():
+                item = self.model.item(idx)
+                if not self._is_separator(item) and not item.is_action_item():
+                    if score_value == -1:
+                        rich_title = ''
+                    else:
+                        rich_title = matcher.get_rich_text(
+                            idx, search_text, template=u"<b>{0}</b>")
+                        rich_title = rich_title.replace(" ", "&nbsp;")
+                    item.set_rich_title(rich_title)
+
+                item.set_score(score_value)
+                ranks[idx] = (item.get_score(), idx)
+
+        self._ranked_rows = set(ranked)
+        self.proxy.set_ranks(ranks)
 
         # Graphical setup
         self.setup_sections()
@@ -347,7 +460,14 @@ def setup_sections(self):
         sections = []
         search_text = self.search_text_without_mode()
 
-        for row in range(self.model.rowCount()):
+        # When there is search_text, only the rows shown by the proxy model
+        # need to be checked.
+        if search_text:
+            num_rows = self.proxy.rowCount()
+        else:
+            num_rows = self.model.rowCount()
+
+        for row in range(num_rows):
             item_row = row
 
             # When there is search_text, we need to use the proxy model to get
@@ -490,9 +610,10 @@ def _on_search_text_changed(self):
                     self.sig_mode_selected.emit(key)
                     break
 
-            # Emit this signal only for the files mode for now. We'll see if
-            # it's necessary for other modes later.
-            if self._mode_on == "":
+            # Emit this signal only for the files and symbol modes, which
+            # can search the current project. Other modes only need to filter
+            # their items.
+            if self._mode_on in ["", "@"]:
                 self.sig_search_text_available.emit(clean_string(search_text))
             else:
                 self.setup()
@@ -469,15 +469,31 @@ def icon(self, name, scale_factor=None, resample=False):
                 icon = QIcon(self.get_icon(name))
                 return icon if icon is not None else QIcon()
 
-    def get_icon_by_extension_or_type(self, fname, scale_factor):
-        """Return the icon depending on the file extension"""
+    def get_icon_by_extension_or_type(self, fname, scale_factor,
+                                      is_dir=None):
+        """
+        Return the icon depending on the file extension
+
+        Pass `is_dir` if it's already known to avoid checking it on disk.
+        Icons are cached by extension, so only the first file with a given
+        extension needs to be inspected.
+        """
+        basename = osp.basename(fname)
+        if is_dir is None:
+            is_dir = osp.isdir(fname)
+
+        if is_dir:
+            extension = "Folder"
+        else:
+            __, extension = osp.splitext(basename.lower())
+
+        if (extension, scale_factor) in self.ICONS_BY_EXTENSION:
+            return self.ICONS_BY_EXTENSION[(extension, scale_factor)]
+
         application_icons = {}
         application_icons.update(self.BIN_FILES)
         application_icons.update(self.DOCUMENT_FILES)
 
-        basename = osp.basename(fname)
-        __, extension = osp.splitext(basename.lower())
-
         # Catch error when it's not possible to access the Windows registry to
         # check for this.
         # Fixes spyder-ide/spyder#21304
@@ -486,13 +502,7 @@ def get_icon_by_extension_or_type(self, fname, scale_factor):
         except PermissionError:
             mime_type = None
 
-        if osp.isdir(fname):
-            extension = "Folder"
-
-        if (extension, scale_factor) in self.ICONS_BY_EXTENSION:
-            return self.ICONS_BY_EXTENSION[(extension, scale_factor)]
-
-        if osp.isdir(fname):
+        if is_dir:
             icon_by_extension = self.icon('DirClosedIcon', scale_factor)
         else:
             icon_by_extension = self.icon('GenericFileIcon')
@@ -574,8 +584,8 @@ def icon(name, scale_factor=None, resample=False):
     return ima.icon(name, scale_factor=scale_factor, resample=resample)
 
 
-def get_icon_by_extension_or_type(fname, scale_factor):
-    return ima.get_icon_by_extension_or_type(fname, scale_factor)
+def get_icon_by_extension_or_type(fname, scale_factor, is_dir=None):
+    return ima.get_icon_by_extension_or_type(fname, scale_factor, is_dir)
 
 
 def base64_from_icon(icon_name, width, height):
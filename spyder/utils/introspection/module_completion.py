@@ -11,11 +11,18 @@
 Module completion auxiliary functions.
 """
 
+import bisect
+import hashlib
+import json
+import os
+import os.path as osp
 import pkgutil
+import site
+import sys
 
 from pickleshare import PickleShareDB
 
-from spyder.config.base import get_conf_path
+from spyder.config.base import get_conf_path, get_module_path
 
 
 # List of preferred modules
@@ -30,6 +37,16 @@
                      'zlib', 'pytest', 'PyQt4', 'PyQt5', 'PySide',
                      'PySide2', 'os.path']
 
+# Version of the module index format. Increase it when changing how
+# directories are scanned so that old indexes are rebuilt.
+MODULE_INDEX_VERSION = 2
+
+# Suffixes of files that can be imported as modules
+MODULE_SUFFIXES = ('.py', '.pyw', '.pyc', '.so', '.pyd')
+
+# Directories that never contain importable modules
+SKIP_DIRS = {'__pycache__'}
+
 
 def get_submodules(mod):
     """Get all submodules of a given module"""
@@ -73,3 +90,304 @@ def get_preferred_submodules():
 
     modules_db['submodules'] = submodules
     return submodules
+
+
+# ---- Persistent module index
+# -----------------------------------------------------------------------------
+def _module_name(filename):
+    """Return the module name for `filename` or None if it's not a module."""
+    if not filename.endswith(MODULE_SUFFIXES):
+        return None
+
+    # Extension modules have names like foo.cpython-311-x86_64-linux-gnu.so
+    name = filename.split('.', 1)[0]
+    if not name.isidentifier() or name == '__init__':
+        return None
+    return name
+
+
+def scan_directory(path, prefix=''):
+    """
+    Return the names of all modules and packages found in `path`.
+
+    This only lists files, so, unlike `get_submodules`, nothing is imported.
+    Namespace packages (i.e. directories without an `__init__.py` file) are
+    only taken into account if they contain modules.
+    """
+    modules = []
+
+    try:
+        entries = list(os.scandir(path))
+    except OSError:
+        return modules
+
+    for entry in entries:
+        name = entry.name
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            continue
+
+        if is_dir:
+            if not name.isidentifier() or name in SKIP_DIRS:
+                continue
+
+            submodules = scan_directory(entry.path, prefix + name + '.')
+            if submodules or osp.isfile(osp.join(entry.path, '__init__.py')):
+                modules.append(prefix + name)
+                modules += submodules
+        else:
+            module_name = _module_name(name)
+            if module_name is not None:
+                modules.append(prefix + module_name)
+
+    return modules
+
+
+def _normpath(path):
+    return osp.normcase(osp.normpath(path))
+
+
+def _get_spyder_path():
+    """
+    Return the directory added to `PYTHONPATH` by Spyder so that its
+    subprocesses can import it.
+    """
+    return _normpath(osp.dirname(get_module_path('spyder')))
+
+
+def _get_interpreter_env():
+    """
+    Return the environment to run other interpreters with.
+
+    It's the current one without Spyder's own variables, so that things like
+    conda or venv activations and the user's PYTHONPATH are preserved.
+    """
+    env = {
+        key: value for key, value in os.environ.items()
+        if not key.startswith('SPYDER_')
+    }
+
+    spyder_path = _get_spyder_path()
+    pythonpath = [
+        path for path in env.get('PYTHONPATH', '').split(os.pathsep)
+        if path and _normpath(path) != spyder_path
+    ]
+    if pythonpath:
+        env['PYTHONPATH'] = os.pathsep.join(pythonpath)
+    else:
+        env.pop('PYTHONPATH', None)
+
+    return env
+
+
+def _get_interpreter_modules_info(interpreter=None):
+    """
+    Return the `sys.path` and the names of the builtin modules of
+    `interpreter`.
+    """
+    if interpreter is None or interpreter == sys.executable:
+        return sys.path, list(sys.builtin_module_names)
+
+    from spyder.utils.programs import run_program
+
+    cmd = (
+        'import sys, json; '
+        'print(json.dumps([sys.path, list(sys.builtin_module_names)]))'
+    )
+    try:
+        proc = run_program(
+            interpreter, ['-c', cmd], env=_get_interpreter_env()
+        )
+        stdout, __ = proc.communicate()
+        paths, builtin_modules = json.loads(stdout.decode())
+    except Exception:
+        paths, builtin_modules = [], []
+
+    return paths, builtin_modules
+
+
+def get_module_directories(interpreter=None):
+    """Return the directories in `sys.path` of `interpreter`."""
+    paths, __ = _get_interpreter_modules_info(interpreter)
+    return _filter_module_directories(paths)
+
+
+def _filter_module_directories(paths):
+    """Return the directories in `paths` that need to be indexed."""
+    # The current directory changes between sessions, so we don't index it.
+    # Spyder's own directory is not available to user code either, unless
+    # Spyder is installed in site-packages.
+    excluded = {_normpath(os.getcwd()), _get_spyder_path()}
+    site_paths = site.getsitepackages() + [site.getusersitepackages()]
+    excluded.difference_update(_normpath(path) for path in site_paths)
+
+    directories = []
+    for path in paths:
+        if not path or not osp.isdir(path):
+            continue
+        path = osp.normpath(path)
+        if osp.normcase(path) not in excluded and path not in directories:
+            directories.append(path)
+
+    return directories
+
+
+def _get_mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+class ModuleIndex:
+    """
+    Persistent index of the modules available for an interpreter.
+
+    The index is saved in Spyder's database and consists of the list of
+    modules found in each directory of the interpreter's `sys.path`, together
+    with the modification time of that directory. This allows to update it
+    incrementally, rescanning only the directories that changed (e.g. after
+    installing or removing a package in site-packages).
+    """
+
+    def __init__(self, interpreter=None, db_path=None):
+        self.interpreter = interpreter or sys.executable
+        self.db_path = db_path or get_conf_path('db')
+        self.directories = {}
+        self.builtin_modules = self._get_default_builtin_modules()
+        self._levels = {}
+
+    @property
+    def key(self):
+        """Key of the index in the database."""
+        interpreter = osp.normcase(osp.abspath(self.interpreter))
+        digest = hashlib.sha1(interpreter.encode('utf-8')).hexdigest()
+        return 'module_index/' + digest
+
+    def load(self):
+        """Load the index from disk. Return True if it was available."""
+        db = PickleShareDB(self.db_path)
+        try:
+            data = db[self.key]
+        except Exception:
+            data = None
+
+        if not data or data.get('version') != MODULE_INDEX_VERSION:
+            self.directories = {}
+            self.builtin_modules = self._get_default_builtin_modules()
+            self._build_levels()
+            return False
+
+        self.directories = data['directories']
+        self.builtin_modules = data['builtin_modules']
+        self._build_levels()
+        return True
+
+    def save(self):
+        """Save the index to disk."""
+        db = PickleShareDB(self.db_path)
+        db[self.key] = {
+            'version': MODULE_INDEX_VERSION,
+            'interpreter': self.interpreter,
+            'directories': self.directories,
+            'builtin_modules': self.builtin_modules,
+        }
+
+    def update(self, directories=None):
+        """
+        Rescan the directories that changed since the last update.
+
+        Parameters
+        ----------
+        directories: list of str, optional
+            Directories to index. By default, these are the directories in the
+            `sys.path` of the index interpreter, whose builtin modules are
+            updated too.
+
+        Returns
+        -------
+        bool
+            True if the index changed, False otherwise.
+        """
+        changed = False
+        if directories is None:
+            paths, builtin_modules = _get_interpreter_modules_info(
+                self.interpreter
+            )
+            directories = _filter_module_directories(paths)
+            if builtin_modules != self.builtin_modules:
+                self.builtin_modules = builtin_modules
+                changed = True
+
+        changed = changed or set(self.directories) != set(directories)
+        new_directories = {}
+        for path in directories:
+            mtime = _get_mtime(path)
+            entry = self.directories.get(path)
+            if entry is None or entry['mtime'] != mtime:
+                entry = {'mtime': mtime, 'modules': scan_directory(path)}
+                changed = True
+            new_directories[path] = entry
+
+        self.directories = new_directories
+        if changed:
+            self._build_levels()
+        return changed
+
+    def get_modules(self, prefix=''):
+        """
+        Return the modules that start with `prefix`.
+
+        Only modules at the same nesting level as `prefix` are returned,
+        e.g. `numpy.li` gives `numpy.lib` and `numpy.linalg`, but not
+        `numpy.linalg.tests`.
+        """
+        names = self._levels.get(prefix.count('.'), [])
+        start = bisect.bisect_left(names, prefix)
+        end = bisect.bisect_left(names, prefix + '\U0010ffff', lo=start)
+        return names[start:end]
+
+    def _get_default_builtin_modules(self):
+        """
+        Return the builtin modules of the index interpreter if known without
+        running it.
+        """
+        if self.interpreter == sys.executable:
+            return list(sys.builtin_module_names)
+        return []
+
+    def _build_levels(self):
+        """Build sorted lists of modules per nesting level for lookups."""
+        levels = {}
+        for entry in self.directories.values():
+            for name in entry['modules']:
+                levels.setdefault(name.count('.'), set()).add(name)
+
+        # Builtin modules are not found in any directory
+        levels.setdefault(0, set()).update(self.builtin_modules)
+
+        self._levels = {
+            level: sorted(names) for level, names in levels.items()
+        }
+
+
+def update_module_index(interpreter=None):
+    """Update the persistent module index of `interpreter`."""
+    index = ModuleIndex(interpreter)
+    index.load()
+    if index.update():
+        index.save()
+    return index
+
+
+def get_module_index_command(interpreter):
+    """
+    Return the command to update the module index of `interpreter` in a
+    separate process.
+    """
+    return [sys.executable, '-m', __name__, interpreter]
+
+
+if __name__ == '__main__':
+    update_module_index(sys.argv[1] if len(sys.argv) > 1 else None)
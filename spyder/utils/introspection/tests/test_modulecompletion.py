@@ -9,13 +9,16 @@
 """
 
 # Stdlib imports
+import os
 import sys
 
 # Test library imports
 import pytest
 
 # Local imports
-from spyder.utils.introspection.module_completion import get_preferred_submodules
+from spyder.utils.introspection.module_completion import (
+    get_module_directories, get_preferred_submodules, ModuleIndex,
+    scan_directory)
 
 
 @pytest.mark.skipif(sys.platform == 'darwin',
@@ -25,5 +28,91 @@ def test_module_completion():
     assert 'numpy.linalg' in get_preferred_submodules()
 
 
+@pytest.fixture
+def site_packages(tmp_path):
+    """Create a fake site-packages directory."""
+    site = tmp_path / 'site-packages'
+    package = site / 'foo'
+    (package / 'bar').mkdir(parents=True)
+    (package / '__init__.py').write_text('')
+    (package / 'bar' / '__init__.py').write_text('')
+    (package / 'bar' / 'baz.py').write_text('')
+    (package / '_ext.cpython-311-x86_64-linux-gnu.so').write_text('')
+    (package / '__pycache__').mkdir()
+    (package / '__pycache__' / 'spam.cpython-311.pyc').write_text('')
+    (site / 'foo-1.0.dist-info').mkdir()
+    (site / 'single.py').write_text('')
+    (site / 'empty_dir').mkdir()
+    return site
+
+
+def test_scan_directory(site_packages):
+    """Test that modules are listed without importing them."""
+    modules = scan_directory(str(site_packages))
+    assert sorted(modules) == [
+        'foo', 'foo._ext', 'foo.bar', 'foo.bar.baz', 'single'
+    ]
+
+
+def test_module_index(site_packages, tmp_path):
+    """Test the persistent module index and its incremental updates."""
+    db_path = str(tmp_path / 'db')
+    site = str(site_packages)
+
+    index = ModuleIndex('python', db_path=db_path)
+    assert not index.load()
+    assert index.update([site])
+    assert index.get_modules('fo') == ['foo']
+    assert index.get_modules('foo.') == ['foo._ext', 'foo.bar']
+    assert index.get_modules('foo.bar.b') == ['foo.bar.baz']
+    index.save()
+
+    # Nothing changed, so nothing is rescanned
+    index = ModuleIndex('python', db_path=db_path)
+    assert index.load()
+    assert index.get_modules('s') == ['single']
+    assert not index.update([site])
+
+    # Installing a new module changes the directory mtime
+    (site_packages / 'new_module.py').write_text('')
+    mtime = os.stat(site).st_mtime + 10
+    os.utime(site, (mtime, mtime))
+    assert index.update([site])
+    assert index.get_modules('new') == ['new_module']
+
+
+def test_module_directories(site_packages, tmp_path, monkeypatch):
+    """Test that the current and Spyder's directories are not indexed."""
+    import spyder
+    spyder_path = os.path.dirname(os.path.dirname(spyder.__file__))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        sys, 'path',
+        ['', str(tmp_path), spyder_path, str(site_packages), 'missing']
+    )
+
+    assert get_module_directories() == [str(site_packages)]
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="Symlinks need privileges")
+def test_module_index_builtins(tmp_path):
+    """Test that builtin modules are taken from the index interpreter."""
+    interpreter = tmp_path / 'python'
+    interpreter.symlink_to(sys.executable)
+    db_path = str(tmp_path / 'db')
+
+    index = ModuleIndex(str(interpreter), db_path=db_path)
+    assert not index.load()
+    assert index.get_modules('sys') == []
+
+    assert index.update()
+    assert 'sys' in index.get_modules('sys')
+    index.save()
+
+    index = ModuleIndex(str(interpreter), db_path=db_path)
+    assert index.load()
+    assert 'sys' in index.get_modules('sys')
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -8,6 +8,8 @@
 String search and match utilities useful when filtering a list of texts.
 """
 
+from array import array
+import heapq
 import re
 
 from spyder.py3compat import to_text_string
@@ -15,6 +17,11 @@
 NOT_FOUND_SCORE = -1
 NO_SCORE = 0
 
+# Characters used to represent choices when computing their scores. See
+# get_search_score.
+_SEP = u'-'
+_LET = u'x'
+
 
 def get_search_regex(query, ignore_case=True):
     """Returns a compiled regex pattern to search for query letters in order.
@@ -209,19 +216,24 @@ def get_search_scores(query, choices, ignore_case=True, template='{}',
     """
     # First remove spaces from query
     query = query.replace(' ', '')
-    pattern = get_search_regex(query, ignore_case)
+    choices = list(choices)
     results = []
 
-    for choice in choices:
-        r = re.search(pattern, choice)
-        if query and r:
+    # Only choices with the query letters in order need to be scored
+    if query:
+        matcher = FuzzyMatcher(choices, ignore_case=ignore_case)
+        matches = set(matcher.get_matches(query))
+    else:
+        matches = set()
+
+    for index, choice in enumerate(choices):
+        if index in matches:
             result = get_search_score(query, choice, ignore_case=ignore_case,
                                       apply_regex=False, template=template)
+        elif query:
+            result = (choice, choice, NOT_FOUND_SCORE)
         else:
-            if query:
-                result = (choice, choice, NOT_FOUND_SCORE)
-            else:
-                result = (choice, choice, NO_SCORE)
+            result = (choice, choice, NO_SCORE)
 
         if valid_only:
             if result[-1] != NOT_FOUND_SCORE:
@@ -235,6 +247,309 @@ def get_search_scores(query, choices, ignore_case=True, template='{}',
     return results
 
 
+def _get_char_mask(text):
+    """Return a bitmask of the characters in `text`."""
+    mask = 0
+    for char in set(text):
+        mask |= 1 << (ord(char) & 63)
+    return mask
+
+
+def _get_skeleton(text):
+    """
+    Return `text` with all characters replaced by `_LET`, except for spaces
+    and `_SEP`.
+    """
+    return u''.join(
+        char if char == u' ' or char == _SEP else _LET for char in text
+    )
+
+
+class FuzzyMatcher:
+    """
+    Fuzzy matcher for a fixed set of choices.
+
+    It gives the same scores as `get_search_score`, but choices are
+    preprocessed only once and then scored in batches, so it's much faster
+    when the same choices are filtered on every keystroke.
+
+    Notes
+    -----
+    For each choice, this keeps its searched (i.e. lowercase) version and a
+    bitmask of its characters in flat arrays. Choices whose bitmask doesn't
+    contain all the bits of the query can't match it, so they are discarded
+    without searching for the query letters in them. Enriched texts are
+    only computed on demand with `get_rich_text`, so that they can be
+    restricted to the results that are displayed.
+    """
+
+    def __init__(self, choices, ignore_case=True):
+        """
+        Parameters
+        ----------
+        choices : list of str
+            Sentences/words in which to search.
+        ignore_case : bool, optional
+            Perform case insensitive searches (True by default).
+        """
+        self.choices = [to_text_string(choice, encoding='utf-8')
+                        for choice in choices]
+        self.ignore_case = ignore_case
+
+        if ignore_case:
+            self._search_choices = [choice.lower() for choice in self.choices]
+        else:
+            self._search_choices = self.choices
+
+        self._masks = array(
+            'Q', [_get_char_mask(choice) for choice in self._search_choices]
+        )
+
+        # Computed lazily because only matched choices need it
+        self._skeletons = {}
+
+    def __len__(self):
+        return len(self.choices)
+
+    def _prepare_query(self, query):
+        """Remove spaces from `query` and adjust its case."""
+        query = to_text_string(query, encoding='utf-8').replace(u' ', u'')
+        if self.ignore_case:
+            query = query.lower()
+        return query
+
+    def _find_letters(self, query, index):
+        """
+        Return the positions of the `query` letters in the choice at
+        `index`, or None if they are not in it in order.
+        """
+        choice = self._search_choices[index]
+        positions = []
+        position = -1
+        for char in query:
+            position = choice.find(char, position + 1)
+            if position == -1:
+                return None
+            positions.append(position)
+        return positions
+
+    def _get_score(self, query, index, positions):
+        """
+        Return the score of the choice at `index`, given the `positions`
+        of the query letters in it.
+        """
+        choice = self._search_choices[index]
+        start = positions[0]
+
+        skeleton = self._skeletons.get(index)
+        if skeleton is None:
+            skeleton = self._skeletons[index] = _get_skeleton(choice)
+
+        length = len(query)
+        if query in choice:
+            # Letters in one word. Query doesn't contain spaces, so it can't
+            # be in several words.
+            start = choice.find(query)
+            if query in choice.split(u' '):
+                score = start + 1
+            else:
+                score = start + 100
+            patterns_text = (
+                skeleton[:start] + _SEP * length + skeleton[start + length:]
+            )
+        else:
+            # Letters spread in the choice
+            score = start
+            patterns_text = list(skeleton)
+            for position in positions:
+                patterns_text[position] = _SEP
+            patterns_text = u''.join(patterns_text)
+
+        for i in range(1, length + 1):
+            score += (length - patterns_text.count(_SEP * i)) * 100000
+
+        temp = [pat for pat in patterns_text.split(_SEP) if pat]
+        if not patterns_text.startswith(_SEP):
+            temp = temp[1:]
+        if not patterns_text.endswith(_SEP):
+            temp = temp[:-1]
+
+        for pat in temp:
+            score += pat.count(u' ') * 10000
+            score += pat.count(_LET) * 100
+
+        return score
+
+    def _iter_matches(self, query, indices):
+        """Generate (index, positions) tuples for the choices that match."""
+        query_mask = _get_char_mask(query)
+        masks = self._masks
+        find_letters = self._find_letters
+
+        for index in indices:
+            if masks[index] & query_mask != query_mask:
+                continue
+
+            positions = find_letters(query, index)
+            if positions is not None:
+                yield index, positions
+
+    def get_matches(self, query, indices=None):
+        """
+        Get the choices that have the letters of `query` in order.
+
+        Parameters
+        ----------
+        query : str
+            String with letters to search in each choice (in order of
+            appearance). Spaces are ignored.
+        indices : iterable of int, optional
+            Only check the choices at these positions. This allows to narrow
+            the results of a previous query.
+
+        Returns
+        -------
+        list of int
+            Positions of the matched choices, in the order of `indices`.
+        """
+        query = self._prepare_query(query)
+        if indices is None:
+            indices = range(len(self.choices))
+
+        if not query:
+            return list(indices)
+
+        return [index for index, __ in self._iter_matches(query, indices)]
+
+    def get_scores(self, query, indices=None):
+        """
+        Score the choices that match `query`.
+
+        Parameters
+        ----------
+        query, indices :
+            See `get_matches`.
+
+        Returns
+        -------
+        list of tuples
+            (score, index) tuples for the matched choices, in the order of
+            `indices`. Lower scores means better match.
+        """
+        query = self._prepare_query(query)
+        if indices is None:
+            indices = range(len(self.choices))
+
+        if not query:
+            return [(NO_SCORE, index) for index in indices]
+
+        get_score = self._get_score
+        return [
+            (get_score(query, index, positions), index)
+            for index, positions in self._iter_matches(query, indices)
+        ]
+
+    def get_top(self, query, n, indices=None):
+        """
+        Get the `n` choices that match `query` best.
+
+        Parameters
+        ----------
+        query, indices :
+            See `get_matches`.
+        n : int
+            Number of results.
+
+        Returns
+        -------
+        list of tuples
+            (score, index) tuples, sorted by score. Choices with the same
+            score keep their order.
+        """
+        return heapq.nsmallest(n, self.get_scores(query, indices))
+
+    def get_rich_text(self, index, query, template=u'{}'):
+        """
+        Get the choice at `index` with the letters of `query` enriched with
+        `template`.
+
+        Parameters
+        ----------
+        index : int
+            Position of the choice.
+        query : str
+            Searched string.
+        template : str, optional
+            Template string to surround letters found in the choice.
+            Examples: '<b>{}</b>', '<code>{}</code>', '<i>{}</i>'
+
+        Returns
+        -------
+        str
+            The enriched text, or the choice as it is if it doesn't match
+            `query`.
+        """
+        choice = self.choices[index]
+        query = self._prepare_query(query)
+        if not query or self._find_letters(query, index) is None:
+            return choice
+
+        result = get_search_score(query, choice, ignore_case=self.ignore_case,
+                                  apply_regex=False, template=template)
+        return result[1]
+
+
+def get_fuzzy_score(query, choice):
+    """Return a score for how well `choice` matches `query` as an identifier.
+
+    This is a fast scorer intended to filter and re-rank completion lists
+    on every keystroke, so it doesn't use regular expressions nor enrich the
+    matched text.
+
+    Parameters
+    ----------
+    query : str
+        Text typed by the user.
+    choice : str
+        Text to match against `query`.
+
+    Returns
+    -------
+    score : int or None
+        None if `choice` doesn't match `query`. Otherwise, 0 if `choice`
+        starts with `query` and the number of gaps between the query letters
+        found in `choice` plus one if not. Lower scores imply a better match.
+
+    Notes
+    -----
+    The comparison is case insensitive and the first letter of `query` must
+    be the first letter of `choice`, as it's usual for code completions.
+    """
+    if not query:
+        return NO_SCORE
+
+    query = query.lower()
+    choice = choice.lower()
+
+    if choice.startswith(query):
+        return 0
+
+    if not choice or choice[0] != query[0]:
+        return None
+
+    gaps = 0
+    position = 0
+    for char in query[1:]:
+        index = choice.find(char, position + 1)
+        if index == -1:
+            return None
+        if index != position + 1:
+            gaps += 1
+        position = index
+
+    return gaps + 1
+
+
 def test():
     template = '<b>{0}</b>'
     names = ['close pane', 'debug continue', 'debug exit', 'debug step into',
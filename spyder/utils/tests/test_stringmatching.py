@@ -10,12 +10,16 @@
 
 # Standard library imports
 import os
+import re
+import time
 
 # Test library imports
 import pytest
 
 # Local imports
-from spyder.utils.stringmatching import get_search_scores
+from spyder.utils.stringmatching import (
+    FuzzyMatcher, get_fuzzy_score, get_search_regex, get_search_score,
+    get_search_scores)
 
 TEST_FILE = os.path.join(os.path.dirname(__file__), 'data/example.py')
 
@@ -216,5 +220,113 @@ def test_stringmatching_order_filter():
                                      'use previous <b>lay</b>out', 400113)]
 
 
+def test_fuzzy_score():
+    """Test the fuzzy scorer used to filter completions."""
+    # Prefix matches are the best ones, regardless of case
+    assert get_fuzzy_score('app', 'append') == 0
+    assert get_fuzzy_score('App', 'append') == 0
+    assert get_fuzzy_score('', 'append') == 0
+
+    # Letters in order with gaps between them
+    assert get_fuzzy_score('apd', 'append') == 2
+    assert get_fuzzy_score('apnd', 'append') == 2
+    assert get_fuzzy_score('ad', 'append') == 2
+    assert get_fuzzy_score('aed', 'append') == 3
+
+    # No match
+    assert get_fuzzy_score('pp', 'append') is None
+    assert get_fuzzy_score('ax', 'append') is None
+    assert get_fuzzy_score('append_', 'append') is None
+
+
+MATCHER_CHOICES = [
+    'layout preferences', 'save current layout', 'use next layout',
+    'lock unlock panes', 'close all', 'Run Cell', 'run cell and advance',
+    'go to line', 'go-to-definition', 'debug step return', 'switcher.py',
+    'spyder/plugins/switcher/widgets/switcher.py', '', 'aaa bbb', 'a-b-c'
+]
+
+
+@pytest.mark.parametrize(
+    'query', ['lay', 'lyt', 'run', 'RC', 'gtd', 'go to', 'sw.py', 'a', 'ab',
+              'xyz', '-', 'runcell']
+)
+@pytest.mark.parametrize('ignore_case', [True, False])
+def test_fuzzy_matcher(query, ignore_case):
+    """FuzzyMatcher gives the same results as get_search_score."""
+    matcher = FuzzyMatcher(MATCHER_CHOICES, ignore_case=ignore_case)
+    scores = dict(
+        (index, score) for score, index in matcher.get_scores(query)
+    )
+
+    query = query.replace(' ', '')
+    pattern = get_search_regex(query, ignore_case)
+    for index, choice in enumerate(MATCHER_CHOICES):
+        if re.search(pattern, choice):
+            __, rich_text, score = get_search_score(
+                query, choice, ignore_case=ignore_case, apply_regex=False,
+                template='<b>{}</b>')
+            assert scores[index] == score
+            assert matcher.get_rich_text(index, query, '<b>{}</b>') == (
+                rich_text)
+        else:
+            assert index not in scores
+            assert matcher.get_rich_text(index, query) == choice
+
+
+def test_fuzzy_matcher_narrowing():
+    """Results can be narrowed and only the best ones retrieved."""
+    matcher = FuzzyMatcher(MATCHER_CHOICES)
+
+    matches = matcher.get_matches('la')
+    assert matcher.get_matches('lay', indices=matches) == (
+        matcher.get_matches('lay'))
+    assert matcher.get_matches('') == list(range(len(MATCHER_CHOICES)))
+
+    top = matcher.get_top('lay', 2)
+    assert top == sorted(matcher.get_scores('lay'))[:2]
+    assert [MATCHER_CHOICES[index] for __, index in top] == [
+        'layout preferences', 'use next layout']
+
+
+@pytest.mark.slow
+def test_benchmark_fuzzy_matcher():
+    """
+    Benchmark FuzzyMatcher against scoring every choice with regexps, as
+    get_search_scores used to do.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    paths = []
+    for dirpath, __, filenames in os.walk(root):
+        paths.extend(os.path.join(dirpath, name) for name in filenames)
+    choices = (paths * (50000 // len(paths) + 1))[:50000]
+
+    for query in ['swi', 'switcherpy', 'plgedit']:
+        t0 = time.perf_counter()
+        pattern = get_search_regex(query)
+        expected = []
+        for index, choice in enumerate(choices):
+            if re.search(pattern, choice):
+                score = get_search_score(query, choice, apply_regex=False,
+                                         template='<b>{}</b>')[-1]
+                expected.append((score, index))
+        regex_time = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        matcher = FuzzyMatcher(choices)
+        init_time = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        scores = matcher.get_scores(query)
+        matcher_time = time.perf_counter() - t0
+
+        print("{}: {} matches, regexps {:.3f}s, matcher {:.3f}s (plus "
+              "{:.3f}s to build it)".format(query, len(scores), regex_time,
+                                            matcher_time, init_time))
+
+        assert scores == expected
+        assert matcher_time < regex_time
+
+
 if __name__ == "__main__":
     pytest.main()
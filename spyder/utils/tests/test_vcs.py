@@ -11,6 +11,7 @@
 # Standard library imports
 import os
 import os.path as osp
+import subprocess
 import sys
 
 # Test library imports
@@ -19,9 +20,10 @@
 
 # Local imports
 from spyder.config.base import running_in_ci
-from spyder.utils.vcs import (ActionToolNotFound, get_git_refs,
-                              get_git_remotes, get_git_revision, get_vcs_root,
-                              remote_to_url, run_vcs_tool)
+from spyder.utils.vcs import (ActionToolNotFound, GitStatusCache,
+                              get_git_refs, get_git_remotes, get_git_revision,
+                              get_vcs_root, parse_git_status, remote_to_url,
+                              run_vcs_tool)
 
 
 HERE = os.path.abspath(os.path.dirname(__file__))
@@ -97,5 +99,58 @@ def test_remote_to_url(input_text, expected_output):
     assert expected_output == output
 
 
+def test_parse_git_status():
+    """Test that the porcelain v2 output of git status is parsed."""
+    output = '\0'.join([
+        '# branch.oid 4c2f6cbd1f2d4c1c8d2b5e0f1e0b5a7b0b1f4c2e',
+        '# branch.head main',
+        '1 .M N... 100644 100644 100644 3f2a 3f2a spam/eggs.py',
+        '1 A. N... 000000 100644 100644 0000 9d1b new file.py',
+        '2 R. N... 100644 100644 100644 5e6f 5e6f R100 renamed.py',
+        'original.py',
+        '? untracked.py',
+        '',
+    ])
+
+    branch, statuses = parse_git_status(output)
+    assert branch == 'main'
+    assert statuses == {
+        osp.join('spam', 'eggs.py'): ' M',
+        'new file.py': 'A ',
+        'renamed.py': 'R ',
+        'untracked.py': '??',
+    }
+
+
+@pytest.mark.skipif(not programs.find_git(), reason="Git is not available")
+def test_git_status_cache(tmpdir):
+    """Test that the status of a repository is cached and invalidated."""
+    repo = str(tmpdir)
+    subprocess.run(['git', 'init', '-q', '-b', 'main', repo], check=True)
+    os.mkdir(osp.join(repo, 'spam'))
+    filename = osp.join(repo, 'spam', 'eggs.py')
+    with open(filename, 'w') as f:
+        f.write('')
+
+    cache = GitStatusCache()
+    assert cache.get_path_status(filename) is None
+
+    root, branch, statuses = cache.get_status(filename)
+    assert root == repo
+    assert branch == 'main'
+    assert cache.get_path_status(filename) == '??'
+
+    # Staging files changes the index, so the status is computed again
+    subprocess.run(['git', 'add', '.'], cwd=repo, check=True)
+    assert cache.get_status(filename)[2] == {
+        osp.join('spam', 'eggs.py'): 'A '
+    }
+    assert cache.get_path_status(osp.join(repo, 'spam')) == ' M'
+
+    # Changes to files need to be notified
+    cache.invalidate(filename)
+    assert cache.get_path_status(filename) is None
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -10,6 +10,7 @@
 import os.path as osp
 import subprocess
 import sys
+import threading
 
 # Local imports
 from spyder.config.base import running_under_pytest
@@ -203,6 +204,211 @@ def get_git_refs(repopath):
     return branches + tags, branch, files_modifed
 
 
+def parse_git_status(output):
+    """
+    Parse the output of `git status --porcelain=v2 --branch -z`.
+
+    Returns
+    -------
+    tuple
+        (branch, statuses) tuple, where statuses maps the paths of the
+        changed files, relative to the repository root, to their two-letter
+        status code (e.g. ' M' or '??').
+    """
+    branch = ''
+    statuses = {}
+
+    entries = iter(output.split('\0'))
+    for entry in entries:
+        if not entry:
+            continue
+
+        if entry.startswith('# branch.head '):
+            branch = entry[len('# branch.head '):]
+        elif entry[0] in '12u':
+            # Changed, renamed or unmerged entries, which have 8, 9 and 10
+            # space-separated fields before the path, respectively.
+            nfields = {'1': 8, '2': 9, 'u': 10}[entry[0]]
+            fields = entry.split(' ', nfields)
+            statuses[osp.normpath(fields[-1])] = fields[1].replace('.', ' ')
+
+            # Renamed entries are followed by their original path
+            if entry[0] == '2':
+                next(entries, None)
+        elif entry[0] in '?!':
+            statuses[osp.normpath(entry[2:])] = entry[0] * 2
+
+    return branch, statuses
+
+
+class GitStatusCache:
+    """
+    Cache of the status of the files in Git repositories.
+
+    The status of a repository is computed with a single `git status` call
+    and reused until the repository's index or HEAD change or until its
+    files are reported as changed with `invalidate`.
+
+    Notes
+    -----
+    This class is thread-safe. Computing the status of a repository can take
+    a while, so `get_status` needs to be called in a thread. The other
+    methods only read the cache, so they can be used in the main thread.
+    """
+
+    # Files in the Git folder that change after commits, checkouts and
+    # staging.
+    STAMP_FILES = ['index', 'HEAD', osp.join('logs', 'HEAD')]
+
+    def __init__(self):
+        # Repository root -> (stamp, branch, statuses, changed directories)
+        self._repos = {}
+
+        # Directory -> repository root or None
+        self._roots = {}
+
+        self._git = None
+        self._lock = threading.Lock()
+
+    def _is_in_root(self, path, root):
+        """Check if `path` is `root` or is inside it."""
+        return path == root or path.startswith(osp.join(root, ''))
+
+    def _get_stamp(self, root):
+        """Get the modification times of the files in `STAMP_FILES`."""
+        stamp = []
+        for name in self.STAMP_FILES:
+            try:
+                stamp.append(os.stat(osp.join(root, '.git', name)).st_mtime)
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def get_root(self, path):
+        """Get the root of the Git repository where `path` is, if any."""
+        if osp.isfile(path):
+            path = osp.dirname(path)
+        path = osp.normpath(path)
+
+        with self._lock:
+            if path in self._roots:
+                return self._roots[path]
+
+        root = get_vcs_root(path)
+        if root is not None and not osp.isdir(osp.join(root, '.git')):
+            root = None
+
+        with self._lock:
+            self._roots[path] = root
+        return root
+
+    def get_status(self, path):
+        """
+        Get the status of the Git repository where `path` is.
+
+        Returns
+        -------
+        tuple or None
+            (root, branch, statuses) tuple, where statuses maps relative
+            paths to their status code, as returned by `parse_git_status`,
+            or None if `path` is not in a Git repository or Git is not
+            available.
+        """
+        root = self.get_root(path)
+        if root is None:
+            return None
+
+        stamp = self._get_stamp(root)
+        with self._lock:
+            entry = self._repos.get(root)
+        if entry is not None and entry[0] == stamp:
+            return root, entry[1], entry[2]
+
+        if self._git is None:
+            self._git = programs.find_git() or ''
+        if not self._git:
+            return None
+
+        try:
+            out, __ = programs.run_program(
+                self._git,
+                ['status', '--porcelain=v2', '--branch', '-z'],
+                cwd=root,
+            ).communicate()
+        except (subprocess.CalledProcessError, AttributeError, OSError):
+            return None
+
+        branch, statuses = parse_git_status(
+            out.decode(sys.getdefaultencoding(), errors='replace')
+        )
+
+        dirs = set()
+        for relpath in statuses:
+            relpath = osp.dirname(relpath)
+            while relpath and relpath not in dirs:
+                dirs.add(relpath)
+                relpath = osp.dirname(relpath)
+
+        with self._lock:
+            self._repos[root] = (stamp, branch, statuses, dirs)
+        return root, branch, statuses
+
+    def get_path_status(self, path):
+        """
+        Get the cached status code of a file or directory.
+
+        Directories with changed files have an ' M' status and files in
+        untracked directories a '??' one. Returns None if the path has no
+        changes or its repository status is not cached.
+        """
+        path = osp.normpath(path)
+        with self._lock:
+            # Check inner repositories (e.g. submodules) first
+            roots = sorted(self._repos, key=len, reverse=True)
+            for root in roots:
+                if not self._is_in_root(path, root):
+                    continue
+
+                __, __, statuses, dirs = self._repos[root]
+                relpath = osp.relpath(path, root)
+                if relpath in statuses:
+                    return statuses[relpath]
+                elif relpath in dirs:
+                    return ' M'
+
+                # Git only lists untracked and ignored directories, not
+                # their files.
+                parent = osp.dirname(relpath)
+                while parent:
+                    if statuses.get(parent) in ['??', '!!']:
+                        return statuses[parent]
+                    parent = osp.dirname(parent)
+                return None
+
+        return None
+
+    def invalidate(self, path=None):
+        """
+        Forget the status of the repository where `path` is.
+
+        If `path` is None, the status of all repositories is forgotten.
+        """
+        if path is None:
+            with self._lock:
+                self._repos.clear()
+                self._roots.clear()
+            return
+
+        path = osp.normpath(path)
+        with self._lock:
+            for root in list(self._repos):
+                if self._is_in_root(path, root):
+                    del self._repos[root]
+
+
+GIT_STATUS_CACHE = GitStatusCache()
+
+
 def get_git_remotes(fpath):
     """Return git remotes for repo on fpath."""
     remote_data = {}